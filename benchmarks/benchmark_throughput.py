@@ -22,11 +22,14 @@ from let_it_ride.config.models import (
     StopConditionsConfig,
     StrategyConfig,
 )
+from let_it_ride.config.paytables import bonus_paytable_a, standard_main_paytable
+from let_it_ride.core.batch_engine import BatchGameEngine
 from let_it_ride.core.card import Card, Rank, Suit
 from let_it_ride.core.deck import Deck
 from let_it_ride.core.hand_evaluator import evaluate_five_card_hand
 from let_it_ride.core.three_card_evaluator import evaluate_three_card_hand
 from let_it_ride.simulation import SimulationController
+from let_it_ride.strategy import BasicStrategy
 
 
 @dataclass
@@ -99,13 +102,19 @@ def benchmark_three_card_evaluation(iterations: int = 100_000) -> BenchmarkResul
     )
 
 
-def benchmark_deck_operations(iterations: int = 100_000) -> BenchmarkResult:
+def benchmark_deck_operations(
+    iterations: int = 100_000, partial_shuffle: bool = False
+) -> BenchmarkResult:
     """Benchmark deck shuffle and deal operations.
 
     Simulates a typical hand: reset, shuffle, deal 3+2 cards.
     Target: >200,000 hands/second (deck operations only)
+
+    Args:
+        iterations: Number of hands to deal.
+        partial_shuffle: Shuffle only the dealt cards (partial_fisher_yates).
     """
-    deck = Deck()
+    deck = Deck(partial_shuffle=partial_shuffle)
     rng = random.Random(42)
 
     start = time.perf_counter()
@@ -117,7 +126,11 @@ def benchmark_deck_operations(iterations: int = 100_000) -> BenchmarkResult:
     elapsed = time.perf_counter() - start
 
     return BenchmarkResult(
-        name="Deck Operations (reset/shuffle/deal)",
+        name=(
+            "Deck Operations (partial shuffle/deal)"
+            if partial_shuffle
+            else "Deck Operations (reset/shuffle/deal)"
+        ),
         iterations=iterations,
         elapsed_seconds=elapsed,
         throughput=iterations / elapsed,
@@ -212,12 +225,38 @@ def benchmark_sequential_simulation(
     )
 
 
+def benchmark_batch_engine(num_hands: int = 2_000_000) -> BenchmarkResult:
+    """Benchmark the vectorized batch engine on a single core.
+
+    Deals, evaluates and settles hands with NumPy array operations.
+    Target: >500,000 hands/second
+    """
+    # Strategy compilation happens once, outside the timed section
+    engine = BatchGameEngine(
+        BasicStrategy(), standard_main_paytable(), bonus_paytable_a()
+    )
+
+    start = time.perf_counter()
+    engine.play_hands(num_hands, seed=42)
+    elapsed = time.perf_counter() - start
+
+    return BenchmarkResult(
+        name="Batch Engine (vectorized, single core)",
+        iterations=num_hands,
+        elapsed_seconds=elapsed,
+        throughput=num_hands / elapsed,
+        target=500_000,
+    )
+
+
 def run_all_benchmarks() -> list[BenchmarkResult]:
     """Run all throughput benchmarks and return results."""
     results = [
         benchmark_hand_evaluation(),
         benchmark_three_card_evaluation(),
         benchmark_deck_operations(),
+        benchmark_deck_operations(partial_shuffle=True),
+        benchmark_batch_engine(),
         benchmark_sequential_simulation(),
         benchmark_full_simulation(),
     ]
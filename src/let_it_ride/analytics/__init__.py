@@ -3,6 +3,7 @@
 This module contains analytics and export functionality:
 - Core statistics calculator
 - Statistical validation
+- Exact expected value by full enumeration
 - Chair position analytics
 - Strategy comparison analytics
 - Export formats (CSV, JSON, HTML)
@@ -22,6 +23,11 @@ from let_it_ride.analytics.comparison import (
     compare_strategies,
     format_comparison_report,
 )
+from let_it_ride.analytics.exact_ev import (
+    ExactEVResult,
+    calculate_exact_ev,
+    format_exact_ev_report,
+)
 from let_it_ride.analytics.export_csv import (
     CSVExporter,
     export_aggregate_csv,
@@ -44,6 +50,7 @@ from let_it_ride.analytics.export_json import (
 from let_it_ride.analytics.risk_of_ruin import (
     RiskOfRuinReport,
     RiskOfRuinResult,
+    calculate_markov_risk_of_ruin,
     calculate_risk_of_ruin,
     format_risk_of_ruin_report,
 )
@@ -88,6 +95,11 @@ __all__ = [
     "compare_multiple_strategies",
     "compare_strategies",
     "format_comparison_report",
+    # Exact EV types
+    "ExactEVResult",
+    # Exact EV functions
+    "calculate_exact_ev",
+    "format_exact_ev_report",
     # CSV export
     "CSVExporter",
     "export_aggregate_csv",
@@ -108,6 +120,7 @@ __all__ = [
     "RiskOfRuinReport",
     "RiskOfRuinResult",
     # Risk of ruin functions
+    "calculate_markov_risk_of_ruin",
     "calculate_risk_of_ruin",
     "format_risk_of_ruin_report",
     # Statistics types
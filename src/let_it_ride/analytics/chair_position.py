@@ -20,9 +20,12 @@ from typing import TYPE_CHECKING
 from scipy import stats as scipy_stats
 
 from let_it_ride.analytics.validation import calculate_wilson_confidence_interval
+from let_it_ride.simulation.result_table import SessionResultTable
 from let_it_ride.simulation.session import SessionOutcome
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from let_it_ride.simulation.session import SessionResult
     from let_it_ride.simulation.table_session import TableSessionResult
 
@@ -294,18 +297,29 @@ def analyze_chair_positions(
 
 
 def _aggregate_session_results_by_seat(
-    results: list[SessionResult],
+    results: Sequence[SessionResult],
 ) -> dict[int, _SeatAggregation]:
     """Aggregate session outcomes by seat number from flattened results.
 
     Args:
-        results: List of SessionResult with seat_number populated.
+        results: SessionResults with seat_number populated. A
+            SessionResultTable is tallied column-wise.
 
     Returns:
         Dictionary mapping seat number to aggregated data.
     """
     aggregations: dict[int, _SeatAggregation] = {}
 
+    if isinstance(results, SessionResultTable):
+        for seat_num, (wins, losses, pushes, profit) in results.seat_tallies().items():
+            tally = _SeatAggregation()
+            tally.wins = wins
+            tally.losses = losses
+            tally.pushes = pushes
+            tally.total_profit = profit
+            aggregations[seat_num] = tally
+        return aggregations
+
     for result in results:
         if result.seat_number is None:
             continue
@@ -329,7 +343,7 @@ def _aggregate_session_results_by_seat(
 
 
 def analyze_session_results_by_seat(
-    results: list[SessionResult],
+    results: Sequence[SessionResult],
     confidence_level: float = 0.95,
     significance_level: float = 0.05,
 ) -> ChairPositionAnalysis:
@@ -340,7 +354,8 @@ def analyze_session_results_by_seat(
     instead of TableSessionResult objects.
 
     Args:
-        results: List of SessionResult with seat_number populated.
+        results: SessionResults (or a SessionResultTable) with seat_number
+            populated.
         confidence_level: Confidence level for Wilson CI (default 0.95).
         significance_level: P-value threshold for chi-square test (default 0.05).
 
@@ -17,7 +17,11 @@ from typing import TYPE_CHECKING
 
 from scipy import stats
 
+from let_it_ride.simulation.result_table import SessionResultTable
+
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from let_it_ride.simulation.session import SessionResult
 
 # Cohen's d effect size thresholds (per Cohen, 1988)
@@ -325,16 +329,26 @@ def _determine_confidence(
 
 
 def _extract_metrics(
-    results: list[SessionResult],
+    results: Sequence[SessionResult],
 ) -> tuple[tuple[float, ...], int, float, int]:
     """Extract all needed metrics from session results in a single pass.
 
     Args:
-        results: List of SessionResult to extract metrics from.
+        results: SessionResults to extract metrics from. A
+            SessionResultTable is read column-wise.
 
     Returns:
         Tuple of (profits, winning_count, total_profit, total_hands).
     """
+    if isinstance(results, SessionResultTable):
+        profit_column = results.column("session_profit")
+        return (
+            tuple(profit_column.tolist()),
+            int((profit_column > 0).sum()),
+            float(profit_column.sum()),
+            int(results.column("hands_played").sum(dtype="int64")),
+        )
+
     profits: list[float] = []
     winning_count = 0
     total_profit = 0.0
@@ -351,8 +365,8 @@ def _extract_metrics(
 
 
 def compare_strategies(
-    results_a: list[SessionResult],
-    results_b: list[SessionResult],
+    results_a: Sequence[SessionResult],
+    results_b: Sequence[SessionResult],
     name_a: str,
     name_b: str,
     significance_level: float = 0.05,
@@ -367,8 +381,8 @@ def compare_strategies(
     - Cohen's d effect size calculation
 
     Args:
-        results_a: List of SessionResult for strategy A.
-        results_b: List of SessionResult for strategy B.
+        results_a: SessionResults (or a SessionResultTable) for strategy A.
+        results_b: SessionResults (or a SessionResultTable) for strategy B.
         name_a: Name for strategy A.
         name_b: Name for strategy B.
         significance_level: P-value threshold for significance (default 0.05).
@@ -455,7 +469,7 @@ def compare_strategies(
 
 
 def compare_multiple_strategies(
-    results_dict: dict[str, list[SessionResult]],
+    results_dict: dict[str, Sequence[SessionResult]],
     significance_level: float = 0.05,
 ) -> list[StrategyComparison]:
     """Compare multiple strategies pairwise.
@@ -0,0 +1,287 @@
+"""Exact expected value of a strategy by full enumeration of the deals.
+
+This module computes ground-truth results for a Strategy and paytable
+combination without sampling:
+- Enumeration of every starting hand and ordered pair of community cards
+  (22,100 x 49 x 48 deals)
+- Suit-isomorphic canonicalization of the starting hands (1,755 classes)
+- Optional process pool to spread the classes across workers
+
+Every deal is equally likely, so the returned hand-rank distribution,
+ride rates, average bets at risk and EV are exact ratios of deal counts.
+"""
+
+from __future__ import annotations
+
+import itertools
+from collections import Counter
+from dataclasses import dataclass
+from fractions import Fraction
+from functools import cache
+from multiprocessing import Pool
+from typing import TYPE_CHECKING, Literal
+
+from let_it_ride.core.hand_analysis import (
+    analyze_four_card_codes,
+    analyze_three_card_codes,
+)
+from let_it_ride.core.hand_evaluator import (
+    FiveCardHandRank,
+    evaluate_five_card_rank_codes,
+)
+from let_it_ride.simulation.parallel import get_effective_worker_count
+from let_it_ride.strategy.base import Decision, StrategyContext
+
+if TYPE_CHECKING:
+    from let_it_ride.config.paytables import BonusPaytable, MainGamePaytable
+    from let_it_ride.strategy import Strategy
+
+# Ordered deals: 3-card starting hand, then the two community cards in turn
+TOTAL_DEALS: int = 22100 * 49 * 48
+
+# Enumeration chunks handed to each worker (more chunks balance the load)
+_CHUNKS_PER_WORKER = 4
+
+# All 24 relabelings of the four suits, as code -> code translation tables
+_SUIT_PERMUTATIONS: tuple[tuple[int, ...], ...] = tuple(
+    tuple((code & ~3) | permutation[code & 3] for code in range(52))
+    for permutation in itertools.permutations(range(4))
+)
+
+# Deal counts keyed by (bet 1 rides, bet 2 rides, final hand rank)
+_DealCounts = Counter[tuple[bool, bool, FiveCardHandRank]]
+
+
+@dataclass(frozen=True, slots=True)
+class ExactEVResult:
+    """Exact results of a strategy over every possible deal.
+
+    Bet amounts are in units of the base bet; the bonus EV is per unit of
+    bonus bet.
+
+    Attributes:
+        total_deals: Number of equally likely deals enumerated.
+        hand_rank_counts: Number of deals ending in each final hand rank.
+        hand_rank_probabilities: Probability of each final hand rank.
+        bet1_ride_rate: Probability that Bet 1 is left riding.
+        bet2_ride_rate: Probability that Bet 2 is left riding.
+        average_bets_at_risk: Expected number of base bets at risk (1-3).
+        expected_value: Main game expected net result per hand.
+        element_of_risk: Expected loss per unit actually at risk
+            (-expected_value / average_bets_at_risk).
+        bonus_expected_value: Expected net result per unit of bonus bet, or
+            None if no bonus paytable was given.
+    """
+
+    total_deals: int
+    hand_rank_counts: dict[FiveCardHandRank, int]
+    hand_rank_probabilities: dict[FiveCardHandRank, float]
+    bet1_ride_rate: float
+    bet2_ride_rate: float
+    average_bets_at_risk: float
+    expected_value: float
+    element_of_risk: float
+    bonus_expected_value: float | None
+
+
+@dataclass(frozen=True, slots=True)
+class _EnumerationTask:
+    """Picklable unit of work for an enumeration worker.
+
+    Attributes:
+        strategy: Strategy deciding Bet 1 and Bet 2.
+        context: Context passed to every decision.
+        starting_hands: (codes, weight) pairs of canonical starting hands,
+            where weight is the number of hands in the suit class.
+    """
+
+    strategy: Strategy
+    context: StrategyContext
+    starting_hands: tuple[tuple[tuple[int, int, int], int], ...]
+
+
+@cache
+def canonical_starting_hands() -> tuple[tuple[tuple[int, int, int], int], ...]:
+    """Group all 22,100 three-card hands into suit-isomorphic classes.
+
+    Hands that differ only by a relabeling of suits have the same hand
+    analysis and, for every completion, a correspondingly relabeled final
+    hand of the same rank, so one representative per class is enough.
+
+    Returns:
+        (codes, weight) pairs: the smallest relabeling of each class as
+        sorted card codes, and the number of hands in the class.
+    """
+    weights: Counter[tuple[int, ...]] = Counter(
+        min(tuple(sorted(table[code] for code in hand)) for table in _SUIT_PERMUTATIONS)
+        for hand in itertools.combinations(range(52), 3)
+    )
+    return tuple(
+        ((codes[0], codes[1], codes[2]), weight) for codes, weight in weights.items()
+    )
+
+
+def _enumerate_deals(task: _EnumerationTask) -> _DealCounts:
+    """Count the deals of a chunk of starting hands by decisions and rank.
+
+    This is a top-level function (not a method) to support pickling
+    for multiprocessing.
+
+    Args:
+        task: Starting hands to enumerate, with the strategy and context.
+
+    Returns:
+        Weighted deal counts by (bet 1 rides, bet 2 rides, final rank).
+    """
+    strategy = task.strategy
+    context = task.context
+    counts: _DealCounts = Counter()
+
+    for (c0, c1, c2), weight in task.starting_hands:
+        bet1_rides = (
+            strategy.decide_bet1(analyze_three_card_codes((c0, c1, c2)), context)
+            == Decision.RIDE
+        )
+        remaining = [code for code in range(52) if code not in (c0, c1, c2)]
+
+        for c3 in remaining:
+            bet2_rides = (
+                strategy.decide_bet2(analyze_four_card_codes((c0, c1, c2, c3)), context)
+                == Decision.RIDE
+            )
+            ranks = Counter(
+                evaluate_five_card_rank_codes((c0, c1, c2, c3, c4))
+                for c4 in remaining
+                if c4 != c3
+            )
+            for rank, count in ranks.items():
+                counts[(bet1_rides, bet2_rides, rank)] += count * weight
+
+    return counts
+
+
+def _bonus_expected_value(bonus_paytable: BonusPaytable) -> Fraction:
+    """Exact net result per unit of bonus bet over all three-card hands."""
+    ratios = bonus_paytable.payout_ratios_by_hand_index()
+    return Fraction(sum(ratio if ratio > 0 else -1 for ratio in ratios), len(ratios))
+
+
+def calculate_exact_ev(
+    strategy: Strategy,
+    main_paytable: MainGamePaytable,
+    bonus_paytable: BonusPaytable | None = None,
+    workers: int | Literal["auto"] = 1,
+    context: StrategyContext | None = None,
+) -> ExactEVResult:
+    """Calculate the exact EV of a strategy by enumerating every deal.
+
+    Each of the 22,100 starting hands is played against every ordered pair
+    of community cards from the remaining 49. Starting hands are reduced to
+    suit-isomorphic classes, so each class is played out only once.
+
+    Args:
+        strategy: Strategy to evaluate. It must be picklable when
+            workers > 1.
+        main_paytable: Paytable for the main game.
+        bonus_paytable: Optional paytable for the three-card bonus.
+        workers: Number of worker processes or "auto" for CPU count.
+        context: Context passed to every decision. Defaults to the start of
+            a session (no profit, hands played or streak) with zero bankroll.
+            Strategies that adapt to the session are evaluated as if every
+            hand were played in this context.
+
+    Returns:
+        ExactEVResult for the strategy and paytables.
+
+    Raises:
+        KeyError: If a paytable is missing a hand rank.
+    """
+    if context is None:
+        context = StrategyContext(
+            session_profit=0.0, hands_played=0, streak=0, bankroll=0.0
+        )
+
+    starting_hands = canonical_starting_hands()
+    num_workers = get_effective_worker_count(workers)
+    num_chunks = num_workers * _CHUNKS_PER_WORKER if num_workers > 1 else 1
+    tasks = [
+        _EnumerationTask(strategy, context, starting_hands[i::num_chunks])
+        for i in range(num_chunks)
+    ]
+
+    if num_workers > 1:
+        with Pool(processes=num_workers) as pool:
+            chunk_counts = pool.map(_enumerate_deals, tasks)
+    else:
+        chunk_counts = [_enumerate_deals(task) for task in tasks]
+
+    counts: _DealCounts = Counter()
+    for chunk in chunk_counts:
+        counts.update(chunk)
+
+    hand_rank_counts = dict.fromkeys(FiveCardHandRank, 0)
+    bet1_rides = 0
+    bet2_rides = 0
+    units_at_risk = 0
+    net_units = 0
+    for (bet1_ride, bet2_ride, rank), count in counts.items():
+        units = 1 + bet1_ride + bet2_ride
+        ratio = main_paytable.payouts[rank]
+        hand_rank_counts[rank] += count
+        bet1_rides += count if bet1_ride else 0
+        bet2_rides += count if bet2_ride else 0
+        units_at_risk += units * count
+        net_units += (units * ratio if ratio > 0 else -units) * count
+
+    expected_value = Fraction(net_units, TOTAL_DEALS)
+    average_bets_at_risk = Fraction(units_at_risk, TOTAL_DEALS)
+
+    return ExactEVResult(
+        total_deals=TOTAL_DEALS,
+        hand_rank_counts=hand_rank_counts,
+        hand_rank_probabilities={
+            rank: count / TOTAL_DEALS for rank, count in hand_rank_counts.items()
+        },
+        bet1_ride_rate=bet1_rides / TOTAL_DEALS,
+        bet2_ride_rate=bet2_rides / TOTAL_DEALS,
+        average_bets_at_risk=float(average_bets_at_risk),
+        expected_value=float(expected_value),
+        element_of_risk=float(-expected_value / average_bets_at_risk),
+        bonus_expected_value=(
+            float(_bonus_expected_value(bonus_paytable))
+            if bonus_paytable is not None
+            else None
+        ),
+    )
+
+
+def format_exact_ev_report(result: ExactEVResult) -> str:
+    """Format an exact EV result as human-readable text.
+
+    Args:
+        result: ExactEVResult to format.
+
+    Returns:
+        Formatted string representation of the result.
+    """
+    lines = [
+        "Exact Expected Value",
+        "=" * 50,
+        f"Deals Enumerated: {result.total_deals:,}",
+        f"Expected Value: {result.expected_value:+.6f} base bets per hand",
+        f"House Edge: {-result.expected_value:.4%}",
+        f"Element of Risk: {result.element_of_risk:.4%}",
+        f"Average Bets at Risk: {result.average_bets_at_risk:.4f}",
+        f"Bet 1 Ride Rate: {result.bet1_ride_rate:.4%}",
+        f"Bet 2 Ride Rate: {result.bet2_ride_rate:.4%}",
+    ]
+    if result.bonus_expected_value is not None:
+        lines.append(
+            f"Bonus Expected Value: {result.bonus_expected_value:+.6f} per unit"
+        )
+
+    lines.extend(["", "Final Hand Distribution:", "-" * 50])
+    for rank, probability in result.hand_rank_probabilities.items():
+        lines.append(f"  {rank.name.lower():<22} {probability:>12.8f}")
+
+    return "\n".join(lines)
@@ -5,6 +5,7 @@ and per-hand detail records:
 - export_sessions_csv(): Export list of SessionResult to CSV
 - export_aggregate_csv(): Export AggregateStatistics to CSV
 - export_hands_csv(): Export list of HandRecord to CSV
+- SessionCSVWriter: Append batches of SessionResult to a CSV as they arrive
 - CSVExporter: Class to orchestrate all exports to a directory
 """
 
@@ -14,16 +15,28 @@ import csv
 from dataclasses import fields
 from typing import TYPE_CHECKING, Any
 
+from let_it_ride.simulation.result_table import session_result_dicts
+
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Sequence
     from pathlib import Path
+    from types import TracebackType
 
     from let_it_ride.analytics.chair_position import (
         ChairPositionAnalysis,
         SeatStatistics,
     )
-    from let_it_ride.simulation.aggregation import AggregateStatistics
-    from let_it_ride.simulation.controller import SimulationResults
+    from let_it_ride.analytics.chair_position import (
+        _SeatAggregation as ChairSeatAggregation,
+    )
+    from let_it_ride.simulation.aggregation import (
+        AggregateStatistics,
+        _SeatAggregation,
+    )
+    from let_it_ride.simulation.controller import (
+        AggregatedSimulationResults,
+        SimulationResults,
+    )
     from let_it_ride.simulation.results import HandRecord
     from let_it_ride.simulation.session import SessionResult
 
@@ -67,14 +80,17 @@ HAND_RECORD_FIELDS = [
 
 # Fields to exclude from AggregateStatistics export (internal fields)
 # NOTE: Must stay in sync with AggregateStatistics dataclass in simulation/aggregation.py
-EXCLUDED_AGGREGATE_FIELDS = frozenset({"session_profits"})
+EXCLUDED_AGGREGATE_FIELDS = frozenset(
+    {"session_profits", "profit_moments", "profit_sketch"}
+)
 
 
 def _aggregate_stats_to_dict(stats: AggregateStatistics) -> dict[str, Any]:
     """Convert AggregateStatistics to dictionary for CSV export.
 
     Nested dictionaries (hand_frequencies, hand_frequency_pct) are flattened
-    with prefixed keys. Internal fields (session_profits) are excluded.
+    with prefixed keys. Internal fields (session_profits and the profit
+    summaries) are excluded.
 
     Args:
         stats: AggregateStatistics to convert.
@@ -100,7 +116,7 @@ def _aggregate_stats_to_dict(stats: AggregateStatistics) -> dict[str, Any]:
 
 
 def export_sessions_csv(
-    results: list[SessionResult],
+    results: Sequence[SessionResult],
     path: Path,
     fields_to_export: list[str] | None = None,
     include_bom: bool = True,
@@ -108,7 +124,7 @@ def export_sessions_csv(
     """Export session results to CSV file.
 
     Args:
-        results: List of SessionResult objects to export.
+        results: SessionResult objects (or a SessionResultTable) to export.
         path: Output file path.
         fields_to_export: List of field names to include. None exports all fields.
         include_bom: If True, include UTF-8 BOM for Excel compatibility.
@@ -119,20 +135,88 @@ def export_sessions_csv(
     if not results:
         raise ValueError("Cannot export empty results list")
 
-    field_names = fields_to_export or SESSION_RESULT_FIELDS
+    with SessionCSVWriter(path, fields_to_export, include_bom) as writer:
+        writer(results)
 
-    # Validate field names
-    invalid_fields = set(field_names) - set(SESSION_RESULT_FIELDS)
-    if invalid_fields:
-        raise ValueError(f"Invalid field names: {invalid_fields}")
 
-    encoding = "utf-8-sig" if include_bom else "utf-8"
-    with path.open("w", encoding=encoding, newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=field_names, extrasaction="ignore")
-        writer.writeheader()
-        for result in results:
-            row = result.to_dict()
-            writer.writerow(row)
+class SessionCSVWriter:
+    """Writes session results to a CSV file in batches as they arrive.
+
+    Instances are callable with a list of SessionResult, so they can be
+    passed as the session_sink of SimulationController.run_aggregated()
+    to stream rows to disk without keeping them in memory. The header is
+    written on open; close the writer (or use it as a context manager) to
+    flush the file.
+    """
+
+    __slots__ = ("_path", "_file", "_writer", "_rows_written")
+
+    def __init__(
+        self,
+        path: Path,
+        fields_to_export: list[str] | None = None,
+        include_bom: bool = True,
+    ) -> None:
+        """Open the file and write the header row.
+
+        Args:
+            path: Output file path.
+            fields_to_export: List of field names to include. None exports all fields.
+            include_bom: If True, include UTF-8 BOM for Excel compatibility.
+
+        Raises:
+            ValueError: If invalid field names are provided.
+        """
+        field_names = fields_to_export or SESSION_RESULT_FIELDS
+
+        # Validate field names
+        invalid_fields = set(field_names) - set(SESSION_RESULT_FIELDS)
+        if invalid_fields:
+            raise ValueError(f"Invalid field names: {invalid_fields}")
+
+        encoding = "utf-8-sig" if include_bom else "utf-8"
+        self._path = path
+        self._file = path.open("w", encoding=encoding, newline="")
+        self._writer = csv.DictWriter(
+            self._file, fieldnames=field_names, extrasaction="ignore"
+        )
+        self._writer.writeheader()
+        self._rows_written = 0
+
+    @property
+    def path(self) -> Path:
+        """Return the path of the file being written."""
+        return self._path
+
+    @property
+    def rows_written(self) -> int:
+        """Return the number of session rows written so far."""
+        return self._rows_written
+
+    def __call__(self, results: Sequence[SessionResult]) -> None:
+        """Append session results to the file.
+
+        Args:
+            results: Session results (or a SessionResultTable) to write,
+                in order.
+        """
+        self._writer.writerows(session_result_dicts(results))
+        self._rows_written += len(results)
+
+    def close(self) -> None:
+        """Close the underlying file."""
+        self._file.close()
+
+    def __enter__(self) -> SessionCSVWriter:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
 
 
 def export_aggregate_csv(
@@ -259,7 +343,7 @@ class CSVExporter:
 
     def export_sessions(
         self,
-        results: list[SessionResult],
+        results: Sequence[SessionResult],
         fields_to_export: list[str] | None = None,
     ) -> Path:
         """Export session results to CSV.
@@ -276,6 +360,21 @@ class CSVExporter:
         export_sessions_csv(results, path, fields_to_export, self._include_bom)
         return path
 
+    def open_sessions_writer(
+        self, fields_to_export: list[str] | None = None
+    ) -> SessionCSVWriter:
+        """Open the session results CSV for incremental writing.
+
+        Args:
+            fields_to_export: Fields to include. None for all fields.
+
+        Returns:
+            SessionCSVWriter for the sessions file; the caller closes it.
+        """
+        self._ensure_output_dir()
+        path = self._output_dir / f"{self._prefix}_sessions.csv"
+        return SessionCSVWriter(path, fields_to_export, self._include_bom)
+
     def export_aggregate(self, stats: AggregateStatistics) -> Path:
         """Export aggregate statistics to CSV.
 
@@ -352,12 +451,6 @@ class CSVExporter:
                 include_seat_aggregate is True but results lack seat_number data.
         """
         # Deferred imports to avoid circular dependencies
-        from let_it_ride.analytics.chair_position import (
-            _build_analysis_from_aggregations,
-        )
-        from let_it_ride.analytics.chair_position import (
-            _SeatAggregation as ChairSeatAggregation,
-        )
         from let_it_ride.simulation.aggregation import (
             aggregate_results,
             aggregate_with_seats,
@@ -379,15 +472,7 @@ class CSVExporter:
         if need_seat_aggregate:
             # Single pass: compute both aggregate stats and seat aggregations
             stats, seat_aggregations_raw = aggregate_with_seats(results.session_results)
-            # Convert to chair_position's _SeatAggregation type for compatibility
-            seat_aggregations = {}
-            for seat_num, agg in seat_aggregations_raw.items():
-                chair_agg = ChairSeatAggregation()
-                chair_agg.wins = agg.wins
-                chair_agg.losses = agg.losses
-                chair_agg.pushes = agg.pushes
-                chair_agg.total_profit = agg.total_profit
-                seat_aggregations[seat_num] = chair_agg
+            seat_aggregations = _to_chair_seat_aggregations(seat_aggregations_raw)
         else:
             # Standard path: just compute aggregate stats
             stats = aggregate_results(results.session_results)
@@ -406,18 +491,101 @@ class CSVExporter:
 
         # Optionally export seat aggregate (multi-seat only)
         if need_seat_aggregate:
-            if not seat_aggregations:
-                raise ValueError("No seat data found in results")
-            analysis = _build_analysis_from_aggregations(
-                seat_aggregations,
-                confidence_level=0.95,
-                significance_level=0.05,
+            created_files.append(self._export_seat_aggregations(seat_aggregations))
+
+        return created_files
+
+    def export_aggregated(
+        self,
+        results: AggregatedSimulationResults,
+        include_seat_aggregate: bool = False,
+        num_seats: int = 1,
+    ) -> list[Path]:
+        """Export the summaries of an aggregated simulation run to CSV files.
+
+        Session rows are not part of an aggregated run; stream them with
+        open_sessions_writer() while the simulation runs if they are needed.
+
+        Args:
+            results: AggregatedSimulationResults from run_aggregated().
+            include_seat_aggregate: If True and num_seats > 1, export per-seat
+                aggregate statistics.
+            num_seats: Number of seats in the simulation (for seat aggregate).
+
+        Returns:
+            List of paths to created files.
+
+        Raises:
+            ValueError: If no sessions were aggregated, or if
+                include_seat_aggregate is True but there is no seat data.
+        """
+        self._ensure_output_dir()
+        created_files = [self.export_aggregate(results.aggregate.to_statistics())]
+
+        if include_seat_aggregate and num_seats > 1:
+            created_files.append(
+                self._export_seat_aggregations(
+                    _to_chair_seat_aggregations(results.aggregate.seat_aggregations)
+                )
             )
-            seat_aggregate_path = self.export_seat_aggregate(analysis)
-            created_files.append(seat_aggregate_path)
 
         return created_files
 
+    def _export_seat_aggregations(
+        self, seat_aggregations: dict[int, ChairSeatAggregation] | None
+    ) -> Path:
+        """Analyze per-seat tallies and export the seat aggregate CSV.
+
+        Args:
+            seat_aggregations: Tallies keyed by seat number.
+
+        Returns:
+            Path to the created file.
+
+        Raises:
+            ValueError: If there is no seat data.
+        """
+        # Deferred import to avoid circular dependencies
+        from let_it_ride.analytics.chair_position import (
+            _build_analysis_from_aggregations,
+        )
+
+        if not seat_aggregations:
+            raise ValueError("No seat data found in results")
+        analysis = _build_analysis_from_aggregations(
+            seat_aggregations,
+            confidence_level=0.95,
+            significance_level=0.05,
+        )
+        return self.export_seat_aggregate(analysis)
+
+
+def _to_chair_seat_aggregations(
+    seat_aggregations: dict[int, _SeatAggregation],
+) -> dict[int, ChairSeatAggregation]:
+    """Convert aggregation seat tallies to chair_position's type.
+
+    Args:
+        seat_aggregations: Tallies from the simulation aggregation module.
+
+    Returns:
+        Equivalent chair_position tallies keyed by seat number.
+    """
+    # Deferred import to avoid circular dependencies
+    from let_it_ride.analytics.chair_position import (
+        _SeatAggregation as ChairSeatAggregation,
+    )
+
+    converted: dict[int, ChairSeatAggregation] = {}
+    for seat_num, agg in seat_aggregations.items():
+        chair_agg = ChairSeatAggregation()
+        chair_agg.wins = agg.wins
+        chair_agg.losses = agg.losses
+        chair_agg.pushes = agg.pushes
+        chair_agg.total_profit = agg.total_profit
+        converted[seat_num] = chair_agg
+    return converted
+
 
 # Label for summary row in seat aggregate CSV export
 SUMMARY_ROW_LABEL = "SUMMARY"
@@ -19,6 +19,7 @@ from pydantic import BaseModel
 
 from let_it_ride import __version__
 from let_it_ride.analytics.export_csv import EXCLUDED_AGGREGATE_FIELDS
+from let_it_ride.simulation.result_table import session_result_dicts
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
@@ -95,7 +96,8 @@ def _aggregate_stats_to_dict(stats: AggregateStatistics) -> dict[str, Any]:
     """Convert AggregateStatistics to dictionary for JSON export.
 
     Unlike CSV export, nested dictionaries (hand_frequencies, hand_frequency_pct)
-    are preserved as nested structures. Internal fields (session_profits) are excluded.
+    are preserved as nested structures. Internal fields (session_profits and the
+    profit summaries) are excluded.
 
     Args:
         stats: AggregateStatistics to convert.
@@ -176,7 +178,7 @@ def export_json(
     output["aggregate_statistics"] = _aggregate_stats_to_dict(stats)
 
     # Add session results
-    output["session_results"] = [r.to_dict() for r in results.session_results]
+    output["session_results"] = list(session_result_dicts(results.session_results))
 
     # Optionally add hands
     if include_hands:
@@ -1,7 +1,11 @@
 """Risk of Ruin analysis for Let It Ride sessions.
 
 This module provides risk of ruin calculation capabilities:
-- Monte Carlo risk of ruin estimation with confidence intervals
+- Monte Carlo risk of ruin estimation with confidence intervals, streamed
+  through memory-bounded chunks that can be spread over worker processes
+- Absorbing Markov chain solver over a discretized bankroll grid, with a
+  sparse transition kernel and memory bounded by the grid instead of the
+  number of simulations
 - Analytical gambler's ruin formula for validation
 - Probability of losing X% of bankroll at various bankroll levels
 - Risk curves for different bankroll multiples of base bet
@@ -11,9 +15,11 @@ from __future__ import annotations
 
 import math
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any
+from multiprocessing import Pool
+from typing import TYPE_CHECKING, Any, Literal
 
 import numpy as np
+from scipy import sparse
 
 from let_it_ride.analytics.statistics import ConfidenceInterval
 from let_it_ride.analytics.validation import calculate_wilson_confidence_interval
@@ -31,6 +37,12 @@ DEFAULT_SIMULATIONS_PER_LEVEL: int = 10_000
 DEFAULT_BANKROLL_UNITS: tuple[int, ...] = (20, 40, 60, 80, 100)
 MAX_SIMULATIONS_PER_LEVEL: int = 1_000_000
 MAX_BANKROLL_LEVELS: int = 100
+DEFAULT_MARKOV_TOLERANCE: float = 1e-9
+DEFAULT_MONTE_CARLO_MEMORY_BUDGET: int = 64 * 1024 * 1024
+MONTE_CARLO_BLOCK_SESSIONS: int = 256
+MAX_MARKOV_STATES: int = 1_000_000
+MAX_MARKOV_TRANSITIONS: int = 20_000_000
+ROUNDED_MARKOV_STATES: int = 16_384
 
 
 @dataclass(frozen=True, slots=True)
@@ -44,7 +56,8 @@ class RiskOfRuinResult:
         half_bankroll_risk: Probability of bankroll dropping to 50% of starting value.
         quarter_bankroll_risk: Probability of bankroll dropping to 75% of starting value
             (i.e., 25% cumulative loss).
-        sessions_simulated: Number of Monte Carlo simulations run.
+        sessions_simulated: Number of Monte Carlo simulations run (0 for the
+            Markov solver, whose confidence interval is the point estimate).
     """
 
     bankroll_units: int
@@ -66,6 +79,16 @@ class RiskOfRuinReport:
         mean_session_profit: Average profit per session.
         session_profit_std: Standard deviation of session profits.
         analytical_estimates: Optional analytical ruin estimates for comparison.
+        method: How the probabilities were computed.
+        convergence_tolerance: Largest per-session change in any probability
+            when the Markov solver stopped iterating (None for Monte Carlo).
+        grid_step: Spacing of the Markov solver's bankroll grid (None for
+            Monte Carlo).
+        grid_rounded: Whether the Markov solver rounded session profits or
+            loss thresholds to its grid, so that its probabilities are
+            approximate for the given distribution. Profits and thresholds
+            in whole cents are solved exactly unless the grid would exceed
+            MAX_MARKOV_STATES or MAX_MARKOV_TRANSITIONS.
     """
 
     base_bet: float
@@ -74,6 +97,27 @@ class RiskOfRuinReport:
     mean_session_profit: float
     session_profit_std: float
     analytical_estimates: tuple[float, ...] | None
+    method: Literal["monte_carlo", "markov"] = "monte_carlo"
+    convergence_tolerance: float | None = None
+    grid_step: float | None = None
+    grid_rounded: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class _MarkovSolution:
+    """Absorption probabilities computed by the Markov solver.
+
+    Attributes:
+        probabilities: Probability of reaching each loss threshold.
+        change: Largest change of any probability in the last iteration.
+        grid_step: Spacing of the bankroll grid.
+        grid_rounded: Whether profits or thresholds were rounded to the grid.
+    """
+
+    probabilities: NDArray[np.float64]
+    change: float
+    grid_step: float
+    grid_rounded: bool
 
 
 def _validate_bankroll_units(bankroll_units: Sequence[int]) -> None:
@@ -171,18 +215,88 @@ def _calculate_analytical_ruin_probability(
     return math.exp(exponent)
 
 
+def _run_ruin_chunk(
+    session_profits: NDArray[np.floating[Any]],
+    bankroll: float,
+    simulations: int,
+    seed: np.random.SeedSequence,
+    max_sessions_per_sim: int,
+    block_sessions: int,
+) -> tuple[int, int, int]:
+    """Simulate one chunk of bankroll trajectories, a block of sessions at a time.
+
+    Trajectories that are ruined have crossed every threshold and are
+    dropped, so later blocks only draw sessions for surviving ones.
+
+    Args:
+        session_profits: Array of session profit values to sample from.
+        bankroll: Starting bankroll for simulation.
+        simulations: Number of trajectories in the chunk.
+        seed: Seed of the chunk's own random stream.
+        max_sessions_per_sim: Maximum sessions per simulation before stopping.
+        block_sessions: Sessions drawn per trajectory at a time.
+
+    Returns:
+        Tuple of (ruin_count, half_loss_count, quarter_loss_count).
+    """
+    rng = np.random.default_rng(seed)
+    # Threshold values: 50% remaining (50% loss), 75% remaining (25% loss)
+    loss_50pct_threshold = bankroll * 0.5
+    loss_25pct_threshold = bankroll * 0.75
+
+    balances = np.full(simulations, bankroll, dtype=np.float64)
+    half_loss = np.zeros(simulations, dtype=bool)
+    quarter_loss = np.zeros(simulations, dtype=bool)
+    ruin_count = half_loss_count = quarter_loss_count = 0
+
+    sessions_played = 0
+    while sessions_played < max_sessions_per_sim and len(balances) > 0:
+        block = min(block_sessions, max_sessions_per_sim - sessions_played)
+        samples = rng.choice(session_profits, size=(len(balances), block))
+        lowest = (balances[:, np.newaxis] + np.cumsum(samples, axis=1)).min(axis=1)
+        balances = balances + samples.sum(axis=1)
+        half_loss |= lowest <= loss_50pct_threshold
+        quarter_loss |= lowest <= loss_25pct_threshold
+        sessions_played += block
+
+        ruined = lowest <= 0
+        ruin_count += int(np.sum(ruined))
+        half_loss_count += int(np.sum(ruined))
+        quarter_loss_count += int(np.sum(ruined))
+        balances = balances[~ruined]
+        half_loss = half_loss[~ruined]
+        quarter_loss = quarter_loss[~ruined]
+
+    half_loss_count += int(np.sum(half_loss))
+    quarter_loss_count += int(np.sum(quarter_loss))
+    return ruin_count, half_loss_count, quarter_loss_count
+
+
+def _run_ruin_chunk_task(
+    task: tuple[
+        NDArray[np.floating[Any]], float, int, np.random.SeedSequence, int, int
+    ],
+) -> tuple[int, int, int]:
+    """Run _run_ruin_chunk() with packed arguments in a worker process."""
+    return _run_ruin_chunk(*task)
+
+
 def _run_monte_carlo_ruin_simulation(
     session_profits: NDArray[np.floating[Any]],
     bankroll: float,
     simulations: int,
     rng: np.random.Generator,
     max_sessions_per_sim: int = DEFAULT_MAX_SESSIONS_PER_SIM,
+    memory_budget: int = DEFAULT_MONTE_CARLO_MEMORY_BUDGET,
+    workers: int = 1,
 ) -> tuple[int, int, int, int]:
     """Run Monte Carlo simulation to estimate ruin probability.
 
     Simulates bankroll trajectories by sampling session profits and
-    tracks how many hit various loss thresholds. Uses vectorized NumPy
-    operations for performance.
+    tracks how many hit various loss thresholds. Simulations run in chunks
+    whose working arrays fit in memory_budget bytes, each chunk with its
+    own random stream spawned from rng, so results depend on the seed and
+    memory_budget but not on workers.
 
     Args:
         session_profits: Array of session profit values to sample from.
@@ -190,32 +304,34 @@ def _run_monte_carlo_ruin_simulation(
         simulations: Number of Monte Carlo simulations to run.
         rng: NumPy random generator for reproducibility.
         max_sessions_per_sim: Maximum sessions per simulation before stopping.
+        memory_budget: Approximate bytes of working memory per chunk.
+        workers: Number of processes to spread chunks over.
 
     Returns:
         Tuple of (ruin_count, half_loss_count, quarter_loss_count, total_sims).
     """
-    # Threshold values: 50% remaining (50% loss), 75% remaining (25% loss)
-    loss_50pct_threshold = bankroll * 0.5
-    loss_25pct_threshold = bankroll * 0.75
-
-    # Vectorized sampling: shape (simulations, max_sessions_per_sim)
-    all_samples = rng.choice(
-        session_profits, size=(simulations, max_sessions_per_sim), replace=True
-    )
-
-    # Compute cumulative bankroll trajectories for all simulations
-    trajectories = bankroll + np.cumsum(all_samples, axis=1)
-
-    # Find threshold crossings using vectorized operations
-    # For each simulation, check if any point crosses the threshold
-    ruin_mask = np.any(trajectories <= 0, axis=1)
-    half_loss_mask = np.any(trajectories <= loss_50pct_threshold, axis=1)
-    quarter_loss_mask = np.any(trajectories <= loss_25pct_threshold, axis=1)
+    # Samples, running balances and comparisons take ~3 floats per session
+    block_sessions = min(max_sessions_per_sim, MONTE_CARLO_BLOCK_SESSIONS)
+    chunk_simulations = max(1, memory_budget // (block_sessions * 8 * 3))
+    chunk_sizes = [
+        min(chunk_simulations, simulations - start)
+        for start in range(0, simulations, chunk_simulations)
+    ]
+    seeds = np.random.SeedSequence(int(rng.integers(2**63))).spawn(len(chunk_sizes))
+    tasks = [
+        (session_profits, bankroll, size, seed, max_sessions_per_sim, block_sessions)
+        for size, seed in zip(chunk_sizes, seeds, strict=True)
+    ]
 
-    ruin_count = int(np.sum(ruin_mask))
-    half_loss_count = int(np.sum(half_loss_mask))
-    quarter_loss_count = int(np.sum(quarter_loss_mask))
+    if workers > 1 and len(tasks) > 1:
+        with Pool(processes=min(workers, len(tasks))) as pool:
+            counts = pool.map(_run_ruin_chunk_task, tasks)
+    else:
+        counts = [_run_ruin_chunk_task(task) for task in tasks]
 
+    ruin_count = sum(count[0] for count in counts)
+    half_loss_count = sum(count[1] for count in counts)
+    quarter_loss_count = sum(count[2] for count in counts)
     return ruin_count, half_loss_count, quarter_loss_count, simulations
 
 
@@ -226,6 +342,8 @@ def _calculate_ruin_for_bankroll_level(
     simulations_per_level: int,
     confidence_level: float,
     rng: np.random.Generator,
+    memory_budget: int = DEFAULT_MONTE_CARLO_MEMORY_BUDGET,
+    workers: int = 1,
 ) -> RiskOfRuinResult:
     """Calculate risk of ruin for a single bankroll level.
 
@@ -236,6 +354,8 @@ def _calculate_ruin_for_bankroll_level(
         simulations_per_level: Number of Monte Carlo simulations.
         confidence_level: Confidence level for intervals.
         rng: NumPy random generator.
+        memory_budget: Approximate bytes of working memory per chunk.
+        workers: Number of processes to spread chunks over.
 
     Returns:
         RiskOfRuinResult for this bankroll level.
@@ -248,6 +368,8 @@ def _calculate_ruin_for_bankroll_level(
             bankroll=bankroll,
             simulations=simulations_per_level,
             rng=rng,
+            memory_budget=memory_budget,
+            workers=workers,
         )
     )
 
@@ -276,6 +398,230 @@ def _calculate_ruin_for_bankroll_level(
     )
 
 
+def _markov_grid_step(
+    profit_values: NDArray[np.floating[Any]], distances: Sequence[float]
+) -> float | None:
+    """Return the largest whole-cent amount dividing every profit and distance.
+
+    Args:
+        profit_values: Session profit values.
+        distances: Loss thresholds below the starting bankroll.
+
+    Returns:
+        The step, or None if some amount is not a whole number of cents.
+    """
+    cents = np.concatenate([profit_values, distances]) * 100
+    rounded = np.rint(cents)
+    if not np.allclose(cents, rounded, rtol=0, atol=1e-6):
+        return None
+    return float(np.gcd.reduce(np.abs(rounded).astype(np.int64))) / 100
+
+
+def _lundberg_exponent(
+    profit_values: NDArray[np.floating[Any]],
+    probabilities: NDArray[np.floating[Any]],
+) -> float:
+    """Return the decay rate of ruin probability with bankroll.
+
+    For a positive mean profit, the probability of ever losing a distance d
+    decays as exp(-theta * d), where theta > 0 solves
+    E[exp(-theta * profit)] = 1 (the Cramer-Lundberg adjustment
+    coefficient). Without a positive mean, or without any losing session,
+    0 and infinity are returned respectively.
+
+    Args:
+        profit_values: Possible session profits.
+        probabilities: Probability of each profit value.
+
+    Returns:
+        The exponent theta.
+    """
+    if float(np.dot(profit_values, probabilities)) <= 0:
+        return 0.0
+    if not np.any((profit_values < 0) & (probabilities > 0)):
+        return math.inf
+
+    def log_mgf(theta: float) -> float:
+        exponents = -theta * profit_values
+        peak = float(np.max(exponents))
+        return peak + math.log(float(np.dot(probabilities, np.exp(exponents - peak))))
+
+    # log E[exp(-theta * profit)] is convex, negative just above 0 and
+    # positive for large theta; bracket its root and bisect
+    upper = 1.0 / float(np.max(np.abs(profit_values)))
+    while log_mgf(upper) < 0:
+        upper *= 2
+    lower = 0.0
+    for _ in range(100):
+        middle = (lower + upper) / 2
+        if log_mgf(middle) < 0:
+            lower = middle
+        else:
+            upper = middle
+    return upper
+
+
+def _solve_markov_drop_probabilities(
+    profit_values: NDArray[np.floating[Any]],
+    probabilities: NDArray[np.floating[Any]],
+    distances: Sequence[float],
+    max_sessions: int,
+    tolerance: float,
+) -> _MarkovSolution:
+    """Compute the probability of cumulative profit falling to -d for each d.
+
+    Each state of the chain is the distance left to a loss threshold, on a
+    grid up to twice the largest distance; states at or below zero absorb.
+    Because the distance to any threshold moves by the same session profits,
+    one solve covers every bankroll level and loss fraction. The grid step
+    is the largest whole-cent amount dividing every profit and distance, so
+    the chain is exact for amounts in whole cents. Only if that grid is
+    too large (MAX_MARKOV_STATES states or MAX_MARKOV_TRANSITIONS kernel
+    entries), or some amount is not in whole cents, are profits rounded to
+    a grid of ROUNDED_MARKOV_STATES states; the solution reports this.
+    Above the top of the grid, the risk is extrapolated from the top state
+    with the exponential tail exp(-theta * extra distance) (see
+    _lundberg_exponent()). The kernel is banded with one diagonal per
+    distinct profit and is stored sparse; the absorption probabilities
+    within n sessions are iterated as p_n = r + Q p_(n-1) until no state
+    changes by more than tolerance or n reaches max_sessions, as in the
+    Monte Carlo horizon.
+
+    Args:
+        profit_values: Possible session profits.
+        probabilities: Probability of each profit value.
+        distances: Positive loss thresholds below the starting bankroll.
+        max_sessions: Maximum sessions played.
+        tolerance: Convergence tolerance of the iteration.
+
+    Returns:
+        The probability for each distance, with the achieved tolerance and
+        the grid used.
+    """
+    top_distance = 2 * max(distances)
+    # At most one kernel entry per state and distinct profit
+    max_states = min(MAX_MARKOV_STATES, MAX_MARKOV_TRANSITIONS // len(profit_values))
+    exact_step = _markov_grid_step(profit_values, distances)
+    if exact_step and top_distance / exact_step <= max_states:
+        step, rounded = exact_step, False
+    else:
+        step, rounded = top_distance / min(max_states, ROUNDED_MARKOV_STATES), True
+    num_states = math.ceil(top_distance / step - 1e-9)
+
+    moves, inverse = np.unique(
+        np.rint(profit_values / step).astype(np.int64), return_inverse=True
+    )
+    move_probabilities = np.bincount(inverse, weights=probabilities)
+
+    # Transition kernel between live states and one-session absorption
+    theta = _lundberg_exponent(profit_values, probabilities)
+    states = np.arange(1, num_states + 1)
+    rows: list[NDArray[np.int64]] = []
+    columns: list[NDArray[np.int64]] = []
+    entries: list[NDArray[np.float64]] = []
+    absorb = np.zeros(num_states, dtype=np.float64)
+    for move, probability in zip(
+        moves.tolist(), move_probabilities.tolist(), strict=True
+    ):
+        targets = states + move
+        live = targets > 0
+        absorb[~live] += probability
+        beyond_top = np.maximum(targets[live] - num_states, 0) * step
+        if math.isinf(theta):
+            tail = (beyond_top == 0).astype(np.float64)
+        else:
+            tail = np.exp(-theta * beyond_top)
+        rows.append(states[live] - 1)
+        columns.append(np.minimum(targets[live], num_states) - 1)
+        entries.append(probability * tail)
+    # Duplicate entries (moves past the top of the grid) are summed
+    kernel = sparse.csr_matrix(
+        (np.concatenate(entries), (np.concatenate(rows), np.concatenate(columns))),
+        shape=(num_states, num_states),
+    )
+
+    hit = np.zeros(num_states, dtype=np.float64)
+    change = 0.0
+    for _ in range(max_sessions):
+        updated = absorb + kernel @ hit
+        change = float(np.max(np.abs(updated - hit)))
+        hit = updated
+        if change < tolerance:
+            break
+
+    indices = np.maximum(np.rint(np.asarray(distances) / step).astype(np.int64), 1)
+    return _MarkovSolution(
+        probabilities=hit[indices - 1],
+        change=change,
+        grid_step=step,
+        grid_rounded=rounded,
+    )
+
+
+def _calculate_markov_ruin_results(
+    profit_values: NDArray[np.floating[Any]],
+    probabilities: NDArray[np.floating[Any]],
+    base_bet: float,
+    bankroll_units: Sequence[int],
+    max_sessions: int,
+    tolerance: float,
+) -> tuple[list[RiskOfRuinResult], _MarkovSolution]:
+    """Calculate risk of ruin at every bankroll level with the Markov solver.
+
+    Args:
+        profit_values: Possible session profits.
+        probabilities: Probability of each profit value.
+        base_bet: Base bet amount.
+        bankroll_units: Bankroll levels as multiples of base bet.
+        max_sessions: Maximum sessions played.
+        tolerance: Convergence tolerance of the iteration.
+
+    Returns:
+        Tuple of (results sorted by bankroll level, solver solution).
+    """
+    levels = sorted(bankroll_units)
+    distances = [
+        base_bet * units * fraction for units in levels for fraction in (1.0, 0.5, 0.25)
+    ]
+    solution = _solve_markov_drop_probabilities(
+        profit_values, probabilities, distances, max_sessions, tolerance
+    )
+    hit = solution.probabilities
+
+    results = []
+    for i, units in enumerate(levels):
+        ruin, half, quarter = (float(p) for p in hit[3 * i : 3 * i + 3])
+        results.append(
+            RiskOfRuinResult(
+                bankroll_units=units,
+                ruin_probability=ruin,
+                confidence_interval=ConfidenceInterval(
+                    lower=ruin, upper=ruin, level=1.0
+                ),
+                half_bankroll_risk=half,
+                quarter_bankroll_risk=quarter,
+                sessions_simulated=0,
+            )
+        )
+    return results, solution
+
+
+def _validate_markov_parameters(max_sessions: int, tolerance: float) -> None:
+    """Validate Markov solver parameters.
+
+    Args:
+        max_sessions: Maximum sessions played.
+        tolerance: Convergence tolerance of the iteration.
+
+    Raises:
+        ValueError: If max_sessions or tolerance is not positive.
+    """
+    if max_sessions <= 0:
+        raise ValueError("max_sessions must be a positive integer")
+    if tolerance <= 0:
+        raise ValueError(f"tolerance must be positive, got {tolerance}")
+
+
 def _validate_simulations_per_level(simulations_per_level: int) -> None:
     """Validate simulations_per_level parameter.
 
@@ -301,12 +647,25 @@ def calculate_risk_of_ruin(
     confidence_level: float = 0.95,
     random_seed: int | None = None,
     include_analytical: bool = True,
+    method: Literal["monte_carlo", "markov"] = "monte_carlo",
+    tolerance: float = DEFAULT_MARKOV_TOLERANCE,
+    memory_budget: int = DEFAULT_MONTE_CARLO_MEMORY_BUDGET,
+    workers: int = 1,
 ) -> RiskOfRuinReport:
     """Calculate risk of ruin across multiple bankroll levels.
 
     Performs Monte Carlo simulation to estimate the probability of losing
     the entire bankroll for various bankroll sizes. Also calculates the
     probability of hitting intermediate loss thresholds (25%, 50%).
+    Simulations stream through chunks that fit in memory_budget and can be
+    spread over worker processes; results for a seed do not depend on the
+    number of workers.
+
+    With method "markov", the same probabilities are computed as absorption
+    probabilities of a Markov chain over a bankroll grid, using the
+    empirical session profit distribution (see
+    calculate_markov_risk_of_ruin()). Memory is bounded by the grid rather
+    than by simulations_per_level, which is then unused.
 
     Args:
         session_results: List of SessionResult objects from simulation.
@@ -320,6 +679,11 @@ def calculate_risk_of_ruin(
         confidence_level: Confidence level for intervals (default 0.95).
         random_seed: Optional seed for reproducibility.
         include_analytical: Whether to include analytical estimates.
+        method: "monte_carlo" to simulate, "markov" to solve the chain.
+        tolerance: Convergence tolerance of the Markov solver.
+        memory_budget: Approximate bytes of Monte Carlo working memory per
+            chunk of simulations.
+        workers: Number of processes for Monte Carlo chunks.
 
     Returns:
         RiskOfRuinReport with results for each bankroll level.
@@ -331,6 +695,14 @@ def calculate_risk_of_ruin(
     _validate_session_results(session_results)
     _validate_confidence_level(confidence_level)
     _validate_simulations_per_level(simulations_per_level)
+    if method not in ("monte_carlo", "markov"):
+        raise ValueError(f"method must be 'monte_carlo' or 'markov', got {method!r}")
+    if method == "markov":
+        _validate_markov_parameters(DEFAULT_MAX_SESSIONS_PER_SIM, tolerance)
+    if memory_budget <= 0:
+        raise ValueError("memory_budget must be a positive number of bytes")
+    if workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}")
 
     # Set default bankroll units
     if bankroll_units is None:
@@ -359,33 +731,132 @@ def calculate_risk_of_ruin(
         float(np.std(session_profits, ddof=1)) if len(session_profits) > 1 else 0.0
     )
 
-    # Initialize RNG
-    rng = np.random.default_rng(random_seed)
-
     # Calculate risk for each bankroll level
     results: list[RiskOfRuinResult] = []
-    analytical_estimates: list[float] = []
-
-    for units in sorted(bankroll_units):
-        result = _calculate_ruin_for_bankroll_level(
-            session_profits=session_profits,
+    solution: _MarkovSolution | None = None
+    if method == "markov":
+        profit_values, counts = np.unique(session_profits, return_counts=True)
+        results, solution = _calculate_markov_ruin_results(
+            profit_values=profit_values,
+            probabilities=counts / len(session_profits),
             base_bet=base_bet,
-            bankroll_units=units,
-            simulations_per_level=simulations_per_level,
-            confidence_level=confidence_level,
-            rng=rng,
+            bankroll_units=bankroll_units,
+            max_sessions=DEFAULT_MAX_SESSIONS_PER_SIM,
+            tolerance=tolerance,
+        )
+    else:
+        rng = np.random.default_rng(random_seed)
+        for units in sorted(bankroll_units):
+            result = _calculate_ruin_for_bankroll_level(
+                session_profits=session_profits,
+                base_bet=base_bet,
+                bankroll_units=units,
+                simulations_per_level=simulations_per_level,
+                confidence_level=confidence_level,
+                rng=rng,
+                memory_budget=memory_budget,
+                workers=workers,
+            )
+            results.append(result)
+
+    # Calculate analytical estimates if requested
+    analytical_estimates = None
+    if include_analytical:
+        analytical_estimates = tuple(
+            _calculate_analytical_ruin_probability(
+                mean_profit=mean_profit,
+                std_profit=std_profit,
+                bankroll=base_bet * units,
+            )
+            for units in sorted(bankroll_units)
+        )
+
+    return RiskOfRuinReport(
+        base_bet=base_bet,
+        starting_bankroll=starting_bankroll,
+        results=tuple(results),
+        mean_session_profit=mean_profit,
+        session_profit_std=std_profit,
+        analytical_estimates=analytical_estimates,
+        method=method,
+        convergence_tolerance=solution.change if solution is not None else None,
+        grid_step=solution.grid_step if solution is not None else None,
+        grid_rounded=solution is not None and solution.grid_rounded,
+    )
+
+
+def calculate_markov_risk_of_ruin(
+    profit_values: Sequence[float],
+    profit_probabilities: Sequence[float],
+    base_bet: float,
+    starting_bankroll: float,
+    bankroll_units: Sequence[int] | None = None,
+    max_sessions: int = DEFAULT_MAX_SESSIONS_PER_SIM,
+    tolerance: float = DEFAULT_MARKOV_TOLERANCE,
+    include_analytical: bool = True,
+) -> RiskOfRuinReport:
+    """Calculate risk of ruin from a session profit distribution.
+
+    Solves the absorbing Markov chain of the bankroll over repeated
+    sessions, for example with the exact profit distribution from
+    simulation.calculate_session_distribution().
+
+    Args:
+        profit_values: Possible session profits.
+        profit_probabilities: Probability of each profit value.
+        base_bet: Base bet amount.
+        starting_bankroll: Bankroll each session starts with (reported only).
+        bankroll_units: Bankroll levels as multiples of base bet.
+            Defaults to [20, 40, 60, 80, 100] if not specified.
+        max_sessions: Maximum sessions played per bankroll.
+        tolerance: Stop iterating once no probability changes by more than
+            this in a session.
+        include_analytical: Whether to include analytical estimates.
+
+    Returns:
+        RiskOfRuinReport with method "markov".
+
+    Raises:
+        ValueError: If inputs are invalid.
+    """
+    if len(profit_values) == 0 or len(profit_values) != len(profit_probabilities):
+        raise ValueError(
+            "profit_values must be non-empty and match profit_probabilities"
         )
-        results.append(result)
+    probabilities = np.asarray(profit_probabilities, dtype=np.float64)
+    if np.any(probabilities < 0) or not math.isclose(
+        float(probabilities.sum()), 1.0, abs_tol=1e-6
+    ):
+        raise ValueError("profit_probabilities must be non-negative and sum to 1")
+    if base_bet <= 0:
+        raise ValueError("base_bet must be positive")
+    if bankroll_units is None:
+        bankroll_units = list(DEFAULT_BANKROLL_UNITS)
+    _validate_bankroll_units(bankroll_units)
+    _validate_markov_parameters(max_sessions, tolerance)
+
+    values = np.asarray(profit_values, dtype=np.float64)
+    mean_profit = float(np.dot(values, probabilities))
+    std_profit = math.sqrt(float(np.dot((values - mean_profit) ** 2, probabilities)))
 
-        # Calculate analytical estimate if requested
-        if include_analytical:
-            bankroll = base_bet * units
-            analytical = _calculate_analytical_ruin_probability(
+    results, solution = _calculate_markov_ruin_results(
+        profit_values=values,
+        probabilities=probabilities,
+        base_bet=base_bet,
+        bankroll_units=bankroll_units,
+        max_sessions=max_sessions,
+        tolerance=tolerance,
+    )
+    analytical_estimates = None
+    if include_analytical:
+        analytical_estimates = tuple(
+            _calculate_analytical_ruin_probability(
                 mean_profit=mean_profit,
                 std_profit=std_profit,
-                bankroll=bankroll,
+                bankroll=base_bet * units,
             )
-            analytical_estimates.append(analytical)
+            for units in sorted(bankroll_units)
+        )
 
     return RiskOfRuinReport(
         base_bet=base_bet,
@@ -393,9 +864,11 @@ def calculate_risk_of_ruin(
         results=tuple(results),
         mean_session_profit=mean_profit,
         session_profit_std=std_profit,
-        analytical_estimates=tuple(analytical_estimates)
-        if include_analytical
-        else None,
+        analytical_estimates=analytical_estimates,
+        method="markov",
+        convergence_tolerance=solution.change,
+        grid_step=solution.grid_step,
+        grid_rounded=solution.grid_rounded,
     )
 
 
@@ -419,19 +892,28 @@ def format_risk_of_ruin_report(report: RiskOfRuinReport) -> str:
         "Risk by Bankroll Level:",
         "-" * 50,
     ]
+    if report.convergence_tolerance is not None:
+        lines.insert(-3, f"Markov Solver Tolerance: {report.convergence_tolerance:.1e}")
+    if report.grid_step is not None:
+        accuracy = "profits rounded, approximate" if report.grid_rounded else "exact"
+        lines.insert(-3, f"Markov Grid Step: ${report.grid_step:.4g} ({accuracy})")
 
     for i, result in enumerate(report.results):
         bankroll = report.base_bet * result.bankroll_units
         lines.append(f"\nBankroll: {result.bankroll_units} units (${bankroll:.2f})")
-        ci_level_pct = int(result.confidence_interval.level * 100)
-        lines.append(
-            f"  Ruin Probability: {result.ruin_probability:.2%} "
-            f"({ci_level_pct}% CI: {result.confidence_interval.lower:.2%} - "
-            f"{result.confidence_interval.upper:.2%})"
-        )
+        if report.method == "markov":
+            lines.append(f"  Ruin Probability: {result.ruin_probability:.2%}")
+        else:
+            ci_level_pct = int(result.confidence_interval.level * 100)
+            lines.append(
+                f"  Ruin Probability: {result.ruin_probability:.2%} "
+                f"({ci_level_pct}% CI: {result.confidence_interval.lower:.2%} - "
+                f"{result.confidence_interval.upper:.2%})"
+            )
         lines.append(f"  50% Loss Risk: {result.half_bankroll_risk:.2%}")
         lines.append(f"  25% Loss Risk: {result.quarter_bankroll_risk:.2%}")
-        lines.append(f"  Simulations: {result.sessions_simulated:,}")
+        if report.method != "markov":
+            lines.append(f"  Simulations: {result.sessions_simulated:,}")
 
         if report.analytical_estimates is not None:
             analytical = report.analytical_estimates[i]
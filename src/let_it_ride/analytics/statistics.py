@@ -6,6 +6,11 @@ This module calculates detailed statistics from simulation results:
 - Distribution statistics (variance, skewness, kurtosis)
 - Percentile calculations
 - Risk metrics (probability of specific loss levels)
+
+Statistics are exact when the aggregate retains every session profit.
+Streamed aggregates keep only mergeable summaries (RunningMoments and a
+QuantileSketch); the moments stay exact, while percentiles and loss
+probabilities carry the sketch's relative error (0.1% by default).
 """
 
 from __future__ import annotations
@@ -18,11 +23,14 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
+import numpy as np
 from scipy import stats
 
 from let_it_ride.analytics.validation import calculate_wilson_confidence_interval
+from let_it_ride.simulation.result_table import SessionResultTable
 
 if TYPE_CHECKING:
+    from let_it_ride.simulation.accumulators import QuantileSketch, RunningMoments
     from let_it_ride.simulation.aggregation import AggregateStatistics
     from let_it_ride.simulation.session import SessionResult
 
@@ -258,6 +266,48 @@ def _calculate_distribution_stats(
     )
 
 
+def _calculate_distribution_stats_from_summaries(
+    moments: RunningMoments,
+    sketch: QuantileSketch,
+    percentile_list: tuple[int, ...] = DEFAULT_PERCENTILES,
+) -> DistributionStats:
+    """Calculate distribution statistics from mergeable summaries.
+
+    Moments are exact. Percentiles are within the sketch's relative
+    accuracy of the order statistic at rank floor(p / 100 * (n - 1)),
+    which differs from the interpolated values of statistics.quantiles
+    by at most one order statistic.
+
+    Args:
+        moments: Running moments of the data.
+        sketch: Quantile sketch of the same data.
+        percentile_list: Tuple of percentiles to calculate.
+
+    Returns:
+        DistributionStats with all computed statistics.
+
+    Raises:
+        ValueError: If the summaries are empty.
+    """
+    if moments.count == 0:
+        raise ValueError("Cannot calculate distribution statistics for empty data")
+
+    percentiles = {p: sketch.quantile(p / 100) for p in percentile_list}
+    iqr = percentiles.get(75, 0.0) - percentiles.get(25, 0.0)
+
+    return DistributionStats(
+        mean=moments.mean,
+        std=moments.std,
+        variance=moments.variance,
+        skewness=moments.skewness,
+        kurtosis=moments.kurtosis,
+        min=moments.min,
+        max=moments.max,
+        percentiles=percentiles,
+        iqr=iqr,
+    )
+
+
 def _validate_confidence_level(confidence_level: float) -> None:
     """Validate that confidence_level is in the valid range (0, 1).
 
@@ -297,8 +347,29 @@ def _calculate_mean_confidence_interval(
         value = data[0] if n == 1 else 0.0
         return ConfidenceInterval(lower=value, upper=value, level=confidence_level)
 
-    data_mean = mean(data)
-    data_std = stdev(data)
+    return _mean_confidence_interval_from_summary(
+        mean(data), stdev(data), n, confidence_level
+    )
+
+
+def _mean_confidence_interval_from_summary(
+    data_mean: float, data_std: float, n: int, confidence_level: float = 0.95
+) -> ConfidenceInterval:
+    """Calculate a t-distribution confidence interval from summary values.
+
+    Args:
+        data_mean: Sample mean.
+        data_std: Sample standard deviation.
+        n: Sample size.
+        confidence_level: Confidence level (default 0.95 for 95% CI).
+
+    Returns:
+        ConfidenceInterval for the mean (a point estimate if n < 2).
+    """
+    if n < 2:
+        return ConfidenceInterval(
+            lower=data_mean, upper=data_mean, level=confidence_level
+        )
 
     # Get t critical value for two-tailed test
     alpha = 1 - confidence_level
@@ -315,6 +386,7 @@ def _calculate_risk_metrics(
     session_results: Sequence[SessionResult] | None = None,
     session_profits: tuple[float, ...] | None = None,
     starting_bankroll: float = 0.0,
+    profit_sketch: QuantileSketch | None = None,
 ) -> RiskMetrics:
     """Calculate risk-related metrics from session results.
 
@@ -322,12 +394,20 @@ def _calculate_risk_metrics(
         session_results: Sequence of SessionResult objects (preferred if available).
         session_profits: Tuple of session profits (used if session_results not provided).
         starting_bankroll: Starting bankroll for loss percentage calculations.
+        profit_sketch: Quantile sketch of session profits (used if neither
+            session_results nor session_profits is available). The
+            probability of any loss is exact; the bankroll-fraction loss
+            probabilities only misclassify profits within the sketch's
+            relative accuracy of the threshold.
 
     Returns:
         RiskMetrics with calculated risk statistics.
-        Returns all-zero RiskMetrics if neither session_results nor session_profits
-        is provided, or if the provided data is empty.
+        Returns all-zero RiskMetrics if no profit data is provided, or if
+        the provided data is empty.
     """
+    if isinstance(session_results, SessionResultTable) and len(session_results) > 0:
+        return _calculate_risk_metrics_from_table(session_results, starting_bankroll)
+
     # Define default zeroed RiskMetrics for empty/None cases
     default_metrics = RiskMetrics(
         prob_any_loss=0.0,
@@ -347,6 +427,8 @@ def _calculate_risk_metrics(
     elif session_profits is not None and len(session_profits) > 0:
         profits = session_profits
         drawdowns = ()  # Not available without SessionResult
+    elif profit_sketch is not None and profit_sketch.count > 0:
+        return _calculate_risk_metrics_from_sketch(profit_sketch, starting_bankroll)
     else:
         return default_metrics
 
@@ -391,10 +473,99 @@ def _calculate_risk_metrics(
     )
 
 
+def _calculate_risk_metrics_from_table(
+    table: SessionResultTable, starting_bankroll: float = 0.0
+) -> RiskMetrics:
+    """Calculate risk metrics from the columns of a non-empty table.
+
+    Args:
+        table: Session results.
+        starting_bankroll: Starting bankroll for loss percentage calculations.
+            Defaults to that of the first row.
+
+    Returns:
+        RiskMetrics with calculated risk statistics.
+    """
+    profits = table.column("session_profit")
+    drawdowns = table.column("max_drawdown")
+    n = len(profits)
+    if starting_bankroll == 0.0:
+        starting_bankroll = float(table.column("starting_bankroll")[0])
+
+    prob_loss_50pct = 0.0
+    prob_loss_100pct = 0.0
+    if starting_bankroll > 0:
+        prob_loss_50pct = np.count_nonzero(profits <= -0.5 * starting_bankroll) / n
+        prob_loss_100pct = np.count_nonzero(profits <= -starting_bankroll) / n
+
+    return RiskMetrics(
+        prob_any_loss=np.count_nonzero(profits < 0) / n,
+        prob_loss_50pct=prob_loss_50pct,
+        prob_loss_100pct=prob_loss_100pct,
+        max_drawdown_mean=float(drawdowns.mean()),
+        max_drawdown_std=float(drawdowns.std(ddof=1)) if n > 1 else 0.0,
+    )
+
+
+def _calculate_ev_confidence_interval_from_table(
+    table: SessionResultTable, confidence_level: float
+) -> ConfidenceInterval:
+    """Calculate the per-session EV confidence interval from table columns.
+
+    Args:
+        table: Non-empty session results.
+        confidence_level: Confidence level for the interval.
+
+    Returns:
+        ConfidenceInterval for the mean per-hand EV of a session.
+    """
+    profits = table.column("session_profit")
+    hands = table.column("hands_played")
+    evs = np.divide(profits, hands, out=np.zeros(len(profits)), where=hands > 0)
+    if len(evs) < 2:
+        value = float(evs[0])
+        return ConfidenceInterval(lower=value, upper=value, level=confidence_level)
+    return _mean_confidence_interval_from_summary(
+        float(evs.mean()), float(evs.std(ddof=1)), len(evs), confidence_level
+    )
+
+
+def _calculate_risk_metrics_from_sketch(
+    sketch: QuantileSketch, starting_bankroll: float
+) -> RiskMetrics:
+    """Calculate loss probabilities from a quantile sketch of session profits.
+
+    Args:
+        sketch: Non-empty quantile sketch of session profits.
+        starting_bankroll: Starting bankroll for loss percentage calculations.
+
+    Returns:
+        RiskMetrics without drawdown statistics, which a profit sketch
+        does not carry.
+    """
+    n = sketch.count
+    prob_loss_50pct = 0.0
+    prob_loss_100pct = 0.0
+    if starting_bankroll > 0:
+        prob_loss_50pct = (
+            sketch.count_below(-0.5 * starting_bankroll, inclusive=True) / n
+        )
+        prob_loss_100pct = sketch.count_below(-starting_bankroll, inclusive=True) / n
+
+    return RiskMetrics(
+        prob_any_loss=sketch.count_below(0.0) / n,
+        prob_loss_50pct=prob_loss_50pct,
+        prob_loss_100pct=prob_loss_100pct,
+        max_drawdown_mean=0.0,
+        max_drawdown_std=0.0,
+    )
+
+
 def calculate_statistics(
     aggregate_stats: AggregateStatistics,
-    session_results: list[SessionResult] | None = None,
+    session_results: Sequence[SessionResult] | None = None,
     confidence_level: float = 0.95,
+    starting_bankroll: float | None = None,
 ) -> DetailedStatistics:
     """Calculate detailed statistics from simulation results.
 
@@ -403,17 +574,28 @@ def calculate_statistics(
     comprehensive statistics including confidence intervals, distribution
     metrics, and risk analysis.
 
+    Aggregates that retain session profits give exact statistics.
+    Streamed aggregates (empty session_profits) are summarized from their
+    profit moments and quantile sketch instead, so runs of any size can be
+    analyzed without holding every profit in memory.
+
     Args:
         aggregate_stats: Aggregate statistics from simulation.
-        session_results: Optional list of SessionResult for additional metrics.
+        session_results: Optional SessionResults for additional metrics.
             If provided, enables risk metric calculations with drawdown data.
+            A SessionResultTable is read column-wise.
         confidence_level: Confidence level for intervals (default 0.95).
+        starting_bankroll: Starting bankroll for the loss-level risk
+            metrics. Defaults to that of the first session result; without
+            either, those metrics are zero.
 
     Returns:
         DetailedStatistics with all computed metrics.
 
     Raises:
-        ValueError: If aggregate_stats has no sessions or confidence_level is invalid.
+        ValueError: If aggregate_stats has no sessions, carries neither
+            session profits nor profit summaries, or confidence_level is
+            invalid.
     """
     _validate_confidence_level(confidence_level)
     if aggregate_stats.total_sessions <= 0:
@@ -433,14 +615,26 @@ def calculate_statistics(
 
     # Session profit distribution
     session_profits = aggregate_stats.session_profits
-    if not session_profits:
+    profit_moments = aggregate_stats.profit_moments
+    profit_sketch = aggregate_stats.profit_sketch
+    if session_profits:
+        session_profit_distribution = _calculate_distribution_stats(session_profits)
+        profit_count = len(session_profits)
+    elif profit_moments is not None and profit_sketch is not None:
+        session_profit_distribution = _calculate_distribution_stats_from_summaries(
+            profit_moments, profit_sketch
+        )
+        profit_count = profit_moments.count
+    else:
         raise ValueError("No session profit data available for statistics calculation")
 
-    session_profit_distribution = _calculate_distribution_stats(session_profits)
-
     # EV per hand confidence interval
     # Calculate per-session EV values for CI estimation
-    if session_results:
+    if isinstance(session_results, SessionResultTable) and session_results:
+        ev_ci = _calculate_ev_confidence_interval_from_table(
+            session_results, confidence_level
+        )
+    elif session_results:
         per_session_evs = tuple(
             r.session_profit / r.hands_played if r.hands_played > 0 else 0.0
             for r in session_results
@@ -449,7 +643,12 @@ def calculate_statistics(
     else:
         # Without per-session data, use session profits as proxy
         # This is less accurate but still provides useful bounds
-        ev_ci = _calculate_mean_confidence_interval(session_profits, confidence_level)
+        ev_ci = _mean_confidence_interval_from_summary(
+            session_profit_distribution.mean,
+            session_profit_distribution.std,
+            profit_count,
+            confidence_level,
+        )
         # Scale by average hands per session
         avg_hands = aggregate_stats.total_hands / aggregate_stats.total_sessions
         if avg_hands > 0:
@@ -460,11 +659,15 @@ def calculate_statistics(
             )
 
     # Risk metrics
-    starting_bankroll = session_results[0].starting_bankroll if session_results else 0.0
+    if starting_bankroll is None:
+        starting_bankroll = (
+            session_results[0].starting_bankroll if session_results else 0.0
+        )
     risk_metrics = _calculate_risk_metrics(
         session_results=session_results,
         session_profits=session_profits,
         starting_bankroll=starting_bankroll,
+        profit_sketch=profit_sketch,
     )
 
     return DetailedStatistics(
@@ -482,7 +685,7 @@ def calculate_statistics(
 
 
 def calculate_statistics_from_results(
-    results: list[SessionResult],
+    results: Sequence[SessionResult],
     confidence_level: float = 0.95,
 ) -> DetailedStatistics:
     """Calculate detailed statistics directly from session results.
@@ -492,7 +695,7 @@ def calculate_statistics_from_results(
     and want comprehensive statistics.
 
     Args:
-        results: List of SessionResult objects.
+        results: SessionResult objects or a SessionResultTable.
         confidence_level: Confidence level for intervals (default 0.95).
 
     Returns:
@@ -209,6 +209,7 @@ def validate_simulation(
     aggregate_stats: AggregateStatistics,
     significance_level: float = 0.05,
     base_bet: float = 1.0,
+    ev_per_unit: float | None = None,
 ) -> ValidationReport:
     """Validate simulation results against theoretical expectations.
 
@@ -221,6 +222,9 @@ def validate_simulation(
         aggregate_stats: Aggregate statistics from simulation.
         significance_level: P-value threshold for chi-square test (default 0.05).
         base_bet: Base bet amount for EV calculation (default 1.0).
+        ev_per_unit: Theoretical EV per hand in base-bet units, e.g. the
+            expected_value of calculate_exact_ev() for the simulated strategy
+            and paytable. Defaults to the negative of THEORETICAL_HOUSE_EDGE.
 
     Returns:
         ValidationReport with all test results and warnings.
@@ -273,8 +277,10 @@ def validate_simulation(
             observed_frequencies[hand_type] = 0.0
 
     # EV convergence testing
-    # Theoretical EV per unit bet is negative house edge
-    ev_theoretical = -THEORETICAL_HOUSE_EDGE * base_bet
+    # Theoretical EV per unit bet is negative house edge unless given exactly
+    if ev_per_unit is None:
+        ev_per_unit = -THEORETICAL_HOUSE_EDGE
+    ev_theoretical = ev_per_unit * base_bet
     ev_actual = aggregate_stats.expected_value_per_hand
 
     # Calculate deviation percentage (avoid division by zero)
@@ -4,6 +4,7 @@ This module contains bankroll tracking and betting systems:
 - Bankroll tracker with high water mark and drawdown
 - Flat betting system
 - Progressive betting systems (Martingale, Paroli, etc.)
+- Array-based betting systems for lockstep session simulation
 """
 
 from let_it_ride.bankroll.betting_systems import (
@@ -17,6 +18,12 @@ from let_it_ride.bankroll.betting_systems import (
     ReverseMartingaleBetting,
 )
 from let_it_ride.bankroll.tracker import BankrollTracker
+from let_it_ride.bankroll.vectorized import (
+    StateTableBetting,
+    VectorizedBettingSystem,
+    VectorizedDAlembertBetting,
+    vectorize_betting_system,
+)
 
 __all__ = [
     "BankrollTracker",
@@ -28,4 +35,8 @@ __all__ = [
     "MartingaleBetting",
     "ParoliBetting",
     "ReverseMartingaleBetting",
+    "StateTableBetting",
+    "VectorizedBettingSystem",
+    "VectorizedDAlembertBetting",
+    "vectorize_betting_system",
 ]
@@ -0,0 +1,317 @@
+"""Betting systems that size the bets of many sessions at once.
+
+The lockstep session simulator advances thousands of sessions together, so
+betting state is kept in NumPy arrays indexed by session:
+- VectorizedBettingSystem: Protocol for array-based betting systems
+- StateTableBetting: Systems whose state is a small integer (flat,
+  Martingale, Reverse Martingale, Paroli, Fibonacci) as a state machine
+  with a precomputed bet per state
+- VectorizedDAlembertBetting: D'Alembert, whose state is the bet itself
+- vectorize_betting_system(): Array-based equivalent of a BettingSystem
+
+Bet tables are computed with the same Python arithmetic as the scalar
+systems, so every bet matches the scalar system to the last bit.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Protocol
+
+import numpy as np
+
+from let_it_ride.bankroll.betting_systems import (
+    DAlembertBetting,
+    FibonacciBetting,
+    FlatBetting,
+    MartingaleBetting,
+    ParoliBetting,
+    ReverseMartingaleBetting,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from numpy.typing import NDArray
+
+    from let_it_ride.bankroll.betting_systems import BettingSystem
+
+
+class VectorizedBettingSystem(Protocol):
+    """Protocol for betting systems that track many sessions in arrays.
+
+    Sessions are identified by their index in 0..num_sessions-1. Each call
+    covers the subset of sessions still playing.
+    """
+
+    def reset(self, num_sessions: int) -> None:
+        """Reset the state of every session for a new batch.
+
+        Args:
+            num_sessions: Number of sessions to track.
+        """
+        ...
+
+    def get_bets(
+        self, sessions: NDArray[np.intp], bankrolls: NDArray[np.float64]
+    ) -> NDArray[np.float64]:
+        """Determine the bet amounts for the next hand of some sessions.
+
+        Args:
+            sessions: Indices of the sessions to bet for.
+            bankrolls: Current bankroll of each of those sessions.
+
+        Returns:
+            The bet of each session, 0 where the bankroll is exhausted and
+            never exceeding the bankroll.
+        """
+        ...
+
+    def record_results(
+        self, sessions: NDArray[np.intp], results: NDArray[np.float64]
+    ) -> None:
+        """Record the results of the hands just played by some sessions.
+
+        Args:
+            sessions: Indices of the sessions that played.
+            results: Net result of each of those hands.
+        """
+        ...
+
+
+class StateTableBetting:
+    """Betting system driven by a small integer state per session.
+
+    A session in state s bets bets[s] (capped at its bankroll) and moves to
+    next_on_win[s] after a win or next_on_loss[s] after a loss. A push
+    leaves the state unchanged. All sessions start in state 0.
+
+    Implements the VectorizedBettingSystem protocol.
+    """
+
+    __slots__ = ("_bets", "_next_on_win", "_next_on_loss", "_states")
+
+    def __init__(
+        self,
+        bets: Sequence[float],
+        next_on_win: Sequence[int],
+        next_on_loss: Sequence[int],
+    ) -> None:
+        """Initialize the state machine.
+
+        Args:
+            bets: Bet amount of each state, already capped at any table
+                limit.
+            next_on_win: State after a win, for each state.
+            next_on_loss: State after a loss, for each state.
+
+        Raises:
+            ValueError: If the tables are empty, differ in length, contain
+                a non-positive bet or refer to a state that does not exist.
+        """
+        num_states = len(bets)
+        if num_states == 0:
+            raise ValueError("bets must not be empty")
+        if len(next_on_win) != num_states or len(next_on_loss) != num_states:
+            raise ValueError("State tables must all have the same length")
+        if min(bets) <= 0:
+            raise ValueError("Bets must be positive")
+        for state in (*next_on_win, *next_on_loss):
+            if not 0 <= state < num_states:
+                raise ValueError(f"Transition to unknown state {state}")
+
+        self._bets = np.array(bets, dtype=np.float64)
+        self._next_on_win = np.array(next_on_win, dtype=np.intp)
+        self._next_on_loss = np.array(next_on_loss, dtype=np.intp)
+        self._states = np.zeros(0, dtype=np.intp)
+
+    @property
+    def states(self) -> NDArray[np.intp]:
+        """Return the current state of every session."""
+        return self._states
+
+    def reset(self, num_sessions: int) -> None:
+        """Put every session in state 0."""
+        self._states = np.zeros(num_sessions, dtype=np.intp)
+
+    def get_bets(
+        self, sessions: NDArray[np.intp], bankrolls: NDArray[np.float64]
+    ) -> NDArray[np.float64]:
+        """Return the bet of each session's state, capped at its bankroll."""
+        bets = np.minimum(self._bets[self._states[sessions]], bankrolls)
+        bets[bankrolls <= 0] = 0.0
+        return bets
+
+    def record_results(
+        self, sessions: NDArray[np.intp], results: NDArray[np.float64]
+    ) -> None:
+        """Move each session to its next state by the sign of its result."""
+        states = self._states[sessions]
+        self._states[sessions] = np.where(
+            results > 0,
+            self._next_on_win[states],
+            np.where(results < 0, self._next_on_loss[states], states),
+        )
+
+    def __repr__(self) -> str:
+        """Return a string representation of the betting system."""
+        return f"StateTableBetting(num_states={len(self._bets)})"
+
+
+class VectorizedDAlembertBetting:
+    """D'Alembert betting over arrays of sessions.
+
+    Each session's current bet moves down one unit after a win (to at least
+    min_bet) and up one unit after a loss (to at most max_bet), exactly as
+    DAlembertBetting.
+
+    Implements the VectorizedBettingSystem protocol.
+    """
+
+    __slots__ = ("_base_bet", "_unit", "_min_bet", "_max_bet", "_current_bets")
+
+    def __init__(
+        self, base_bet: float, unit: float, min_bet: float, max_bet: float
+    ) -> None:
+        """Initialize the system; see DAlembertBetting for the parameters.
+
+        Raises:
+            ValueError: If the parameters are invalid for DAlembertBetting.
+        """
+        # Validate through the scalar system to keep the rules in one place
+        DAlembertBetting(base_bet, unit, min_bet, max_bet)
+        self._base_bet = base_bet
+        self._unit = unit
+        self._min_bet = min_bet
+        self._max_bet = max_bet
+        self._current_bets = np.zeros(0, dtype=np.float64)
+
+    @property
+    def current_bets(self) -> NDArray[np.float64]:
+        """Return the current bet of every session."""
+        return self._current_bets
+
+    def reset(self, num_sessions: int) -> None:
+        """Reset every session's bet to base_bet."""
+        self._current_bets = np.full(num_sessions, self._base_bet, dtype=np.float64)
+
+    def get_bets(
+        self, sessions: NDArray[np.intp], bankrolls: NDArray[np.float64]
+    ) -> NDArray[np.float64]:
+        """Return each session's current bet, capped at its bankroll."""
+        bets = np.minimum(self._current_bets[sessions], bankrolls)
+        bets[bankrolls <= 0] = 0.0
+        return bets
+
+    def record_results(
+        self, sessions: NDArray[np.intp], results: NDArray[np.float64]
+    ) -> None:
+        """Move each session's bet one unit against its result."""
+        current = self._current_bets[sessions]
+        self._current_bets[sessions] = np.where(
+            results > 0,
+            np.maximum(current - self._unit, self._min_bet),
+            np.where(
+                results < 0, np.minimum(current + self._unit, self._max_bet), current
+            ),
+        )
+
+    def __repr__(self) -> str:
+        """Return a string representation of the betting system."""
+        return (
+            f"VectorizedDAlembertBetting(base_bet={self._base_bet}, "
+            f"unit={self._unit}, "
+            f"min_bet={self._min_bet}, "
+            f"max_bet={self._max_bet})"
+        )
+
+
+def _streak_reset_betting(
+    base_bet: float, win_multiplier: float, streak_limit: int, max_bet: float
+) -> StateTableBetting:
+    """Build a positive progression that resets after streak_limit wins."""
+    return StateTableBetting(
+        bets=[
+            min(base_bet * (win_multiplier**streak), max_bet)
+            for streak in range(streak_limit)
+        ],
+        next_on_win=[
+            streak + 1 if streak + 1 < streak_limit else 0
+            for streak in range(streak_limit)
+        ],
+        next_on_loss=[0] * streak_limit,
+    )
+
+
+def vectorize_betting_system(
+    system: BettingSystem,
+) -> StateTableBetting | VectorizedDAlembertBetting:
+    """Create the array-based equivalent of a betting system.
+
+    The vectorized system starts every session from the scalar system's
+    reset state, whatever state the given instance is in.
+
+    Args:
+        system: A FlatBetting, MartingaleBetting, ReverseMartingaleBetting,
+            ParoliBetting, DAlembertBetting or FibonacciBetting instance.
+
+    Returns:
+        A VectorizedBettingSystem that bets exactly as the scalar system
+        would in each session.
+
+    Raises:
+        ValueError: If there is no vectorized equivalent of the system.
+    """
+    if isinstance(system, FlatBetting):
+        return StateTableBetting([system.base_bet], [0], [0])
+
+    if isinstance(system, MartingaleBetting):
+        last = system.max_progressions - 1
+        return StateTableBetting(
+            bets=[
+                min(system.base_bet * (system.loss_multiplier**level), system.max_bet)
+                for level in range(system.max_progressions)
+            ],
+            next_on_win=[0] * system.max_progressions,
+            next_on_loss=[min(level + 1, last) for level in range(last + 1)],
+        )
+
+    if isinstance(system, ReverseMartingaleBetting):
+        return _streak_reset_betting(
+            system.base_bet,
+            system.win_multiplier,
+            system.profit_target_streak,
+            system.max_bet,
+        )
+
+    if isinstance(system, ParoliBetting):
+        return _streak_reset_betting(
+            system.base_bet,
+            system.win_multiplier,
+            system.wins_before_reset,
+            system.max_bet,
+        )
+
+    if isinstance(system, FibonacciBetting):
+        sequence = FibonacciBetting._FIBONACCI
+        positions = range(system.max_position + 1)
+        return StateTableBetting(
+            bets=[
+                min(system.base_unit * sequence[position], system.max_bet)
+                for position in positions
+            ],
+            next_on_win=[
+                max(0, position - system.win_regression) for position in positions
+            ],
+            next_on_loss=[
+                min(position + 1, system.max_position) for position in positions
+            ],
+        )
+
+    if isinstance(system, DAlembertBetting):
+        return VectorizedDAlembertBetting(
+            system.base_bet, system.unit, system.min_bet, system.max_bet
+        )
+
+    raise ValueError(
+        f"No vectorized equivalent of betting system {type(system).__name__}"
+    )
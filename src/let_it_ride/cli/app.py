@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 import typer
 from rich.console import Console
@@ -18,7 +19,8 @@ from rich.progress import (
 )
 
 from let_it_ride import __version__
-from let_it_ride.analytics.export_csv import CSVExporter
+from let_it_ride.analytics.exact_ev import calculate_exact_ev, format_exact_ev_report
+from let_it_ride.analytics.export_csv import CSVExporter, SessionCSVWriter
 from let_it_ride.cli.formatters import OutputFormatter
 from let_it_ride.config.loader import (
     ConfigFileNotFoundError,
@@ -27,8 +29,34 @@ from let_it_ride.config.loader import (
     load_config,
 )
 from let_it_ride.config.models import FullConfig  # noqa: TCH001
-from let_it_ride.simulation import SimulationController
+from let_it_ride.simulation import (
+    AggregatedSimulationResults,
+    SimulationCheckpoint,
+    SimulationController,
+)
 from let_it_ride.simulation.aggregation import aggregate_results
+from let_it_ride.simulation.controller import create_strategy
+from let_it_ride.simulation.distributed import (
+    Address,
+    DistributedExecutor,
+    parse_address,
+    run_worker,
+)
+from let_it_ride.simulation.utils import get_bonus_paytable, get_main_paytable
+from let_it_ride.strategy import StrategyContext
+
+if TYPE_CHECKING:
+    from let_it_ride.simulation import SimulationResults
+
+# Environment variable holding the shared secret of distributed runs. There
+# is deliberately no command-line option, as arguments are visible to other
+# users in the process list.
+AUTHKEY_ENVVAR = "LET_IT_RIDE_AUTHKEY"
+
+# Runs of at most this many session results (sessions * seats) keep every
+# session profit, so the reported median and standard deviation are exact.
+# Larger runs estimate them with the quantile sketch in constant memory.
+EXACT_STATISTICS_MAX_RESULTS = 1_000_000
 
 app = typer.Typer(
     name="let-it-ride",
@@ -77,6 +105,68 @@ def _load_config_with_errors(config_path: Path) -> FullConfig:
         raise typer.Exit(code=1) from e
 
 
+def _parse_address_with_errors(address: str) -> Address:
+    """Parse a socket address with a user-friendly error message.
+
+    Args:
+        address: "host:port" or "unix:/path".
+
+    Returns:
+        Parsed address for DistributedExecutor or run_worker.
+
+    Raises:
+        typer.Exit: With code 1 if the address is malformed.
+    """
+    try:
+        return parse_address(address)
+    except ValueError as e:
+        error_console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(code=1) from e
+
+
+def _require_authkey() -> bytes:
+    """Return the shared secret of a distributed run, or exit if it is unset.
+
+    Raises:
+        typer.Exit: With code 1 if the environment variable is unset or empty.
+    """
+    authkey = os.environ.get(AUTHKEY_ENVVAR)
+    if not authkey:
+        error_console.print(
+            f"[red]Error:[/red] Distributed runs need the shared secret in "
+            f"{AUTHKEY_ENVVAR}"
+        )
+        raise typer.Exit(code=1)
+    return authkey.encode()
+
+
+def _create_distributed_executor(
+    listen: str, chunk_size: int | None, timeout: float | None
+) -> DistributedExecutor:
+    """Start listening for workers, exiting with an error message on failure.
+
+    Args:
+        listen: Address to listen on.
+        chunk_size: Sessions per chunk, or None for the default.
+        timeout: Seconds to wait for a chunk to complete, or None to wait
+            indefinitely.
+
+    Raises:
+        typer.Exit: With code 1 if the address, authkey or timeout is
+            invalid or the address cannot be listened on.
+    """
+    key = _require_authkey()
+    address = _parse_address_with_errors(listen)
+    try:
+        return DistributedExecutor(address, key, chunk_size=chunk_size, timeout=timeout)
+    except ValueError as e:
+        error_console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(code=1) from e
+    except OSError as e:
+        error_console.print(f"[red]Error:[/red] Cannot listen on {listen}: {e}")
+        raise typer.Exit(code=1) from e
+
+
 @app.callback()
 def main(
     version: bool = typer.Option(  # noqa: ARG001
@@ -137,8 +227,57 @@ def run(
             help="Detailed output",
         ),
     ] = False,
+    checkpoint_dir: Annotated[
+        Path | None,
+        typer.Option(
+            "--checkpoint-dir",
+            help="Save progress to this directory so the run can be resumed",
+        ),
+    ] = None,
+    resume: Annotated[
+        bool,
+        typer.Option(
+            "--resume",
+            help=(
+                "Continue from the checkpoint of an interrupted run, if any "
+                "(default directory: <output>/checkpoint)"
+            ),
+        ),
+    ] = False,
+    listen: Annotated[
+        str | None,
+        typer.Option(
+            "--listen",
+            help=(
+                "Run sessions on `let-it-ride worker` processes connecting to "
+                "this address (host:port or unix:/path)"
+            ),
+        ),
+    ] = None,
+    chunk_size: Annotated[
+        int | None,
+        typer.Option(
+            "--chunk-size",
+            help="Sessions per chunk handed to a worker (with --listen)",
+            min=1,
+        ),
+    ] = None,
+    timeout: Annotated[
+        float | None,
+        typer.Option(
+            "--timeout",
+            help=(
+                "Fail if no chunk completes within this many seconds "
+                "(with --listen; default: wait indefinitely)"
+            ),
+        ),
+    ] = None,
 ) -> None:
-    """Run a simulation from a configuration file."""
+    """Run a simulation from a configuration file.
+
+    Distributed runs (--listen) read the secret that workers must present
+    from the LET_IT_RIDE_AUTHKEY environment variable.
+    """
     # Load and validate configuration
     cfg = _load_config_with_errors(config)
 
@@ -172,12 +311,46 @@ def run(
 
     num_sessions = cfg.simulation.num_sessions
 
+    # Reject every invalid combination before an existing checkpoint is
+    # cleared below, so a mistyped command does not discard saved progress
+    if listen is None and (chunk_size is not None or timeout is not None):
+        error_console.print(
+            "[red]Error:[/red] --chunk-size and --timeout need --listen"
+        )
+        raise typer.Exit(code=1)
+    checkpoint: SimulationCheckpoint | None = None
+    if resume and checkpoint_dir is None:
+        checkpoint_dir = Path(cfg.output.directory) / "checkpoint"
+    if checkpoint_dir is not None:
+        if listen is not None:
+            error_console.print(
+                "[red]Error:[/red] Checkpointing is not supported with --listen"
+            )
+            raise typer.Exit(code=1)
+        if cfg.simulation.lockstep:
+            error_console.print(
+                "[red]Error:[/red] Checkpointing is not supported with "
+                "simulation.lockstep"
+            )
+            raise typer.Exit(code=1)
+        checkpoint = SimulationCheckpoint(checkpoint_dir)
+
+    distributed: DistributedExecutor | None = None
+    if listen is not None:
+        distributed = _create_distributed_executor(listen, chunk_size, timeout)
+
     # Determine verbosity level: quiet (0), normal (1), or verbose (2)
     verbosity = 0 if quiet else (2 if verbose else 1)
     formatter = OutputFormatter(verbosity=verbosity, console=console)
 
     if not quiet:
         console.print(f"[green]Running simulation:[/green] {config}")
+        if resume and checkpoint is not None and checkpoint.exists:
+            console.print(
+                f"[green]Resuming from checkpoint:[/green] {checkpoint.directory}"
+            )
+        if distributed is not None:
+            console.print(f"[green]Waiting for workers on:[/green] {listen}")
         formatter.print_config_summary(cfg)
 
     # Create progress callback for SimulationController
@@ -189,12 +362,49 @@ def run(
         if progress_bar is not None and task_id is not None:
             progress_bar.update(task_id, completed=completed, total=total)
 
+    # Only verbose output lists individual sessions, so otherwise sessions
+    # are reduced to summaries as they complete and their rows are streamed
+    # to the sessions CSV if the output config asks for them. Rows streamed
+    # before an interruption cannot be resumed, so checkpointed runs that
+    # write the sessions CSV keep the full results (saved in the checkpoint).
+    include_sessions = cfg.output.formats.csv.include_sessions
+    full_run = verbose or (checkpoint is not None and include_sessions)
+    exact_profits = num_sessions * cfg.table.num_seats <= EXACT_STATISTICS_MAX_RESULTS
+    output_dir = Path(cfg.output.directory)
+    exporter = CSVExporter(output_dir, prefix=cfg.output.prefix)
+    sessions_writer: SessionCSVWriter | None = None
+    if not full_run and include_sessions:
+        try:
+            sessions_writer = exporter.open_sessions_writer()
+        except Exception as e:
+            if distributed is not None:
+                distributed.close()
+            error_console.print(f"[red]Export error:[/red] {e}")
+            raise typer.Exit(code=1) from e
+
+    # Without --resume an existing checkpoint is discarded, so the same
+    # command line can be rerun after preemption with --resume added
+    if checkpoint is not None and not resume:
+        checkpoint.clear()
+
+    def run_controller(
+        controller: SimulationController,
+    ) -> SimulationResults | AggregatedSimulationResults:
+        """Run the full simulation or its summary-only reduction."""
+        if full_run:
+            return controller.run()
+        return controller.run_aggregated(
+            session_sink=sessions_writer, exact_profits=exact_profits
+        )
+
     # Run simulation with or without progress bar
     try:
         if quiet:
             # No progress bar in quiet mode
-            controller = SimulationController(cfg)
-            results = controller.run()
+            controller = SimulationController(
+                cfg, checkpoint=checkpoint, distributed=distributed
+            )
+            results = run_controller(controller)
         else:
             # Show progress bar
             with Progress(
@@ -209,9 +419,12 @@ def run(
                     "Running sessions...", total=num_sessions
                 )
                 controller = SimulationController(
-                    cfg, progress_callback=progress_callback
+                    cfg,
+                    progress_callback=progress_callback,
+                    checkpoint=checkpoint,
+                    distributed=distributed,
                 )
-                results = controller.run()
+                results = run_controller(controller)
     except Exception as e:
         error_console.print(f"[red]Simulation error:[/red] {e}")
         if verbose:
@@ -219,6 +432,11 @@ def run(
 
             error_console.print(traceback.format_exc())
         raise typer.Exit(code=1) from e
+    finally:
+        if distributed is not None:
+            distributed.close()
+        if sessions_writer is not None:
+            sessions_writer.close()
 
     # Calculate statistics
     total_hands = results.total_hands
@@ -226,14 +444,22 @@ def run(
     duration_secs = duration.total_seconds()
 
     # Export results
-    output_dir = Path(cfg.output.directory)
+    include_seat_aggregate = cfg.output.formats.csv.include_seat_aggregate
     try:
-        exporter = CSVExporter(output_dir, prefix=cfg.output.prefix)
-        exported_files = exporter.export_all(
-            results,
-            include_seat_aggregate=cfg.output.formats.csv.include_seat_aggregate,
-            num_seats=cfg.table.num_seats,
-        )
+        if isinstance(results, AggregatedSimulationResults):
+            exported_files = exporter.export_aggregated(
+                results,
+                include_seat_aggregate=include_seat_aggregate,
+                num_seats=cfg.table.num_seats,
+            )
+            if sessions_writer is not None:
+                exported_files.insert(0, sessions_writer.path)
+        else:
+            exported_files = exporter.export_all(
+                results,
+                include_seat_aggregate=include_seat_aggregate,
+                num_seats=cfg.table.num_seats,
+            )
     except Exception as e:
         error_console.print(f"[red]Export error:[/red] {e}")
         if verbose:
@@ -248,16 +474,99 @@ def run(
         formatter.print_completion(total_hands, duration_secs)
 
         # Aggregate statistics for formatted display
-        stats = aggregate_results(results.session_results)
+        if isinstance(results, AggregatedSimulationResults):
+            stats = results.aggregate.to_statistics()
+        else:
+            stats = aggregate_results(results.session_results)
         formatter.print_statistics(stats, duration_secs)
         formatter.print_hand_frequencies(stats.hand_frequencies)
-        formatter.print_session_details(results.session_results)
+        if not isinstance(results, AggregatedSimulationResults):
+            formatter.print_session_details(results.session_results)
         formatter.print_exported_files(exported_files)
     else:
         # Quiet mode: just print essential info
         formatter.print_minimal_completion(num_sessions, total_hands, output_dir)
 
 
+@app.command()
+def ev(
+    config: Annotated[
+        Path,
+        typer.Argument(
+            help="Path to YAML configuration file",
+            exists=False,  # We handle file validation ourselves for better errors
+        ),
+    ],
+    workers: Annotated[
+        int | None,
+        typer.Option(
+            "--workers",
+            "-w",
+            help="Worker process count override",
+            min=1,
+        ),
+    ] = None,
+) -> None:
+    """Calculate the exact expected value of the configured strategy."""
+    cfg = _load_config_with_errors(config)
+
+    console.print(f"[green]Enumerating all deals:[/green] {config}")
+    try:
+        # Strategies that read their context see the start of a session
+        context = StrategyContext(
+            session_profit=0.0,
+            hands_played=0,
+            streak=0,
+            bankroll=cfg.bankroll.starting_amount,
+        )
+        result = calculate_exact_ev(
+            create_strategy(cfg.strategy),
+            get_main_paytable(cfg),
+            get_bonus_paytable(cfg),
+            workers=workers if workers is not None else cfg.simulation.workers,
+            context=context,
+        )
+    except Exception as e:
+        error_console.print(f"[red]EV calculation error:[/red] {e}")
+        raise typer.Exit(code=1) from e
+
+    console.print()
+    console.print(format_exact_ev_report(result))
+
+
+@app.command()
+def worker(
+    address: Annotated[
+        str,
+        typer.Argument(help="Coordinator address: host:port or unix:/path"),
+    ],
+    connect_timeout: Annotated[
+        float,
+        typer.Option(
+            "--connect-timeout",
+            help="Seconds to keep retrying while the coordinator is not listening",
+            min=0,
+        ),
+    ] = 30.0,
+) -> None:
+    """Run sessions for a coordinator started with `run --listen`.
+
+    The coordinator's secret is read from the LET_IT_RIDE_AUTHKEY
+    environment variable.
+    """
+    key = _require_authkey()
+    parsed = _parse_address_with_errors(address)
+
+    console.print(f"[green]Connecting to coordinator:[/green] {address}")
+    try:
+        chunks_run = run_worker(parsed, key, connect_timeout=connect_timeout)
+    except Exception as e:
+        error_console.print(f"[red]Worker error:[/red] {e}")
+        raise typer.Exit(code=1) from e
+
+    console.print(f"Ran {chunks_run} chunks of sessions")
+
+
 @app.command()
 def validate(
     config: Annotated[
@@ -41,6 +41,14 @@ class SimulationConfig(BaseModel):
         workers: Number of parallel workers or "auto" for CPU count.
         progress_interval: Report progress every N sessions.
         detailed_logging: Enable per-hand logging (warning: large output).
+        hand_model: How hands are played.
+            - dealt: Deal and evaluate cards for every hand (default)
+            - sampled: Draw each hand's settled outcome from the strategy's
+              exact outcome distribution (single seat, strategies that do
+              not depend on session state)
+        lockstep: With hand_model "sampled", advance all sessions together
+            as NumPy arrays instead of one at a time. Requires a fixed bonus
+            bet ('never', 'always', or 'static' with an amount).
     """
 
     model_config = ConfigDict(extra="forbid")
@@ -51,6 +59,8 @@ class SimulationConfig(BaseModel):
     workers: int | Literal["auto"] = "auto"
     progress_interval: Annotated[int, Field(ge=1)] = 10000
     detailed_logging: bool = False
+    hand_model: Literal["dealt", "sampled"] = "dealt"
+    lockstep: bool = False
 
     @model_validator(mode="after")
     def validate_workers(self) -> SimulationConfig:
@@ -66,12 +76,21 @@ class DeckConfig(BaseModel):
     Attributes:
         shuffle_algorithm: Algorithm for shuffling.
             - fisher_yates: Standard Fisher-Yates shuffle (fast, good quality)
+            - partial_fisher_yates: Fisher-Yates steps only for the cards
+              actually dealt (fastest, same distribution, different stream)
             - cryptographic: Use system random source (slower, better randomness)
     """
 
     model_config = ConfigDict(extra="forbid")
 
-    shuffle_algorithm: Literal["fisher_yates", "cryptographic"] = "fisher_yates"
+    shuffle_algorithm: Literal[
+        "fisher_yates", "partial_fisher_yates", "cryptographic"
+    ] = "fisher_yates"
+
+    @property
+    def partial_shuffle(self) -> bool:
+        """Whether decks should only shuffle the cards they deal."""
+        return self.shuffle_algorithm == "partial_fisher_yates"
 
 
 class DealerConfig(BaseModel):
@@ -1176,6 +1195,27 @@ class FullConfig(BaseModel):
                 f"or 'static' bonus strategy with multi-seat tables."
             )
 
+        if self.simulation.hand_model == "sampled" and self.table.num_seats > 1:
+            raise ValueError(
+                f"hand_model 'sampled' models a single seat and is not "
+                f"compatible with multi-seat tables (num_seats="
+                f"{self.table.num_seats}). Use hand_model 'dealt'."
+            )
+
+        if self.simulation.lockstep:
+            if self.simulation.hand_model != "sampled":
+                raise ValueError("lockstep requires hand_model 'sampled'")
+            bonus_type = self.bonus_strategy.type
+            static = self.bonus_strategy.static
+            if bonus_type not in ("never", "always", "static") or (
+                bonus_type == "static" and static is not None and static.amount is None
+            ):
+                raise ValueError(
+                    f"lockstep requires a fixed bonus bet; bonus strategy type "
+                    f"'{bonus_type}' is not supported. Use 'never', "
+                    f"'always', or 'static' with an amount."
+                )
+
         # Validate total results won't cause excessive memory usage
         # Each result ~500 bytes, 100M results ~50GB RAM
         max_total_results = 100_000_000
@@ -8,7 +8,10 @@ from dataclasses import dataclass
 from functools import cache
 
 from let_it_ride.core.hand_evaluator import FiveCardHandRank
-from let_it_ride.core.three_card_evaluator import ThreeCardHandRank
+from let_it_ride.core.three_card_evaluator import (
+    THREE_CARD_HAND_RANKS,
+    ThreeCardHandRank,
+)
 
 
 class PaytableValidationError(Exception):
@@ -93,6 +96,23 @@ class BonusPaytable:
         ratio = self.payouts[rank]
         return bet * ratio
 
+    def payout_ratios_by_hand_index(self) -> tuple[int, ...]:
+        """Return the payout ratio of every three-card hand.
+
+        The result is indexed by three_card_hand_index(), so a hand's ratio
+        is a single tuple lookup with no rank evaluation. Tables are cached
+        per distinct set of ratios.
+
+        Returns:
+            Tuple of 22,100 payout ratios.
+
+        Raises:
+            KeyError: If the paytable is missing a hand rank.
+        """
+        return _ratios_by_hand_index(
+            tuple(self.payouts[rank] for rank in ThreeCardHandRank)
+        )
+
     def validate(self) -> None:
         """Validate that this paytable is complete and valid.
 
@@ -115,6 +135,17 @@ class BonusPaytable:
                 )
 
 
+@cache
+def _ratios_by_hand_index(ratios: tuple[int, ...]) -> tuple[int, ...]:
+    """Map THREE_CARD_HAND_RANKS to payout ratios.
+
+    Args:
+        ratios: Payout ratios in ThreeCardHandRank declaration order.
+    """
+    ratio_by_rank = dict(zip(ThreeCardHandRank, ratios, strict=True))
+    return tuple(ratio_by_rank[rank] for rank in THREE_CARD_HAND_RANKS)
+
+
 @cache
 def standard_main_paytable() -> MainGamePaytable:
     """Create the standard main game paytable.
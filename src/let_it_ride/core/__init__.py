@@ -15,17 +15,29 @@ core.hand_evaluator. Exporting them here would create a circular import.
 Import them directly: from let_it_ride.core.game_engine import GameEngine
 """
 
-from let_it_ride.core.card import Card, Rank, Suit
+from let_it_ride.core.card import (
+    CARD_BY_CODE,
+    Card,
+    Rank,
+    Suit,
+    card_to_int,
+    int_to_card,
+)
 from let_it_ride.core.deck import Deck, DeckEmptyError
 from let_it_ride.core.hand_analysis import (
     HandAnalysis,
+    analyze_four_card_codes,
     analyze_four_cards,
+    analyze_three_card_codes,
     analyze_three_cards,
 )
 from let_it_ride.core.hand_evaluator import (
     FiveCardHandRank,
+    FiveCardRankEvaluator,
     HandResult,
     evaluate_five_card_hand,
+    evaluate_five_card_rank,
+    evaluate_five_card_rank_codes,
 )
 from let_it_ride.core.hand_state import (
     Decision,
@@ -34,24 +46,38 @@ from let_it_ride.core.hand_state import (
     InvalidPhaseError,
 )
 from let_it_ride.core.three_card_evaluator import (
+    THREE_CARD_HAND_RANKS,
     ThreeCardHandRank,
     evaluate_three_card_hand,
+    evaluate_three_card_hand_codes,
+    three_card_hand_index,
 )
 
 __all__ = [
     "Card",
     "Rank",
     "Suit",
+    "CARD_BY_CODE",
+    "card_to_int",
+    "int_to_card",
     "Deck",
     "DeckEmptyError",
     "FiveCardHandRank",
+    "FiveCardRankEvaluator",
     "HandResult",
     "evaluate_five_card_hand",
+    "evaluate_five_card_rank",
+    "evaluate_five_card_rank_codes",
     "ThreeCardHandRank",
     "evaluate_three_card_hand",
+    "evaluate_three_card_hand_codes",
+    "three_card_hand_index",
+    "THREE_CARD_HAND_RANKS",
     "HandAnalysis",
     "analyze_three_cards",
     "analyze_four_cards",
+    "analyze_three_card_codes",
+    "analyze_four_card_codes",
     "Decision",
     "HandPhase",
     "HandState",
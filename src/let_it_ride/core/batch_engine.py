@@ -0,0 +1,353 @@
+"""Vectorized Let It Ride engine that plays large batches of hands at once.
+
+BatchGameEngine is the NumPy counterpart of GameEngine for single-seat,
+context-free play. Instead of dealing Card objects one hand at a time it
+deals whole arrays of integer card codes (see card_to_int) and computes,
+with array operations:
+- the 5-card hand rank and the 3-card bonus rank of every hand
+- the Bet 1 and Bet 2 decisions of a compiled strategy
+- bets at risk and net results in units of the base and bonus bet
+
+Strategy decisions come from the canonical hand classes of hand_analysis:
+every hand is reduced to the key of its class (sorted ranks and the ranks
+of its largest suit group) and looked up in a table built from one
+strategy call per class. Strategies that read StrategyContext cannot be
+tabulated and are rejected.
+
+Dealer discards and multi-seat tables are not modeled; neither changes the
+distribution of a single seat's cards.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from let_it_ride.core.hand_analysis import (
+    HandAnalysis,
+    canonical_four_card_hands,
+    canonical_three_card_hands,
+)
+from let_it_ride.core.hand_evaluator import FiveCardHandRank
+from let_it_ride.core.three_card_evaluator import THREE_CARD_HAND_RANKS
+from let_it_ride.strategy.base import Decision, StrategyContext
+from let_it_ride.strategy.compiled import CompiledStrategy, compile_strategy
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from numpy.typing import NDArray
+
+    from let_it_ride.config.paytables import BonusPaytable, MainGamePaytable
+    from let_it_ride.strategy.base import Strategy
+
+# Hands dealt and evaluated per array operation; bounds the (n, 52) deck
+# array used for dealing to a few megabytes
+_CHUNK_SIZE = 65_536
+
+# Rank index (card code >> 2) of the ten, the lowest paying pair
+_TEN = 8
+
+# ThreeCardHandRank value of every hand, indexed by three_card_hand_index()
+_THREE_CARD_RANK_VALUES = np.array(
+    [rank.value for rank in THREE_CARD_HAND_RANKS], dtype=np.int8
+)
+
+# Context handed to compiled strategies (never read by them)
+_UNUSED_CONTEXT = StrategyContext(
+    session_profit=0.0, hands_played=0, streak=0, bankroll=0.0
+)
+
+
+@dataclass(frozen=True, slots=True)
+class HandBatch:
+    """Per-hand result columns for a batch of hands.
+
+    All arrays have one entry per hand, in dealing order.
+
+    Attributes:
+        cards: Card codes, shape (n, 5): the 3 player cards followed by the
+            2 community cards.
+        final_rank: FiveCardHandRank value of each final hand.
+        bonus_rank: ThreeCardHandRank value of each player hand.
+        bet1_rides: True where Bet 1 was left riding.
+        bet2_rides: True where Bet 2 was left riding.
+        bets_at_risk: Number of base bets at risk (1-3).
+        main_net: Main game net result in units of the base bet.
+        bonus_net: Bonus net result per unit of bonus bet (all zero without
+            a bonus paytable).
+    """
+
+    cards: NDArray[np.int8]
+    final_rank: NDArray[np.int8]
+    bonus_rank: NDArray[np.int8]
+    bet1_rides: NDArray[np.bool_]
+    bet2_rides: NDArray[np.bool_]
+    bets_at_risk: NDArray[np.int8]
+    main_net: NDArray[np.int32]
+    bonus_net: NDArray[np.int32]
+
+    def __len__(self) -> int:
+        """Return the number of hands in the batch."""
+        return len(self.final_rank)
+
+
+class BatchGameEngine:
+    """Plays batches of Let It Ride hands with NumPy array operations.
+
+    Results are reproducible from the seed (and batch sizes) and follow the
+    same distribution as GameEngine, but use a different random stream, so
+    individual hands differ from a GameEngine run with the same seed.
+    """
+
+    def __init__(
+        self,
+        strategy: Strategy,
+        main_paytable: MainGamePaytable,
+        bonus_paytable: BonusPaytable | None = None,
+    ) -> None:
+        """Tabulate the strategy and paytables.
+
+        Args:
+            strategy: Strategy deciding Bet 1 and Bet 2. It is compiled with
+                compile_strategy() (about a second of work).
+            main_paytable: Paytable for the main game.
+            bonus_paytable: Optional paytable for the three-card bonus.
+
+        Raises:
+            ValueError: If the strategy reads StrategyContext.
+            KeyError: If a paytable is missing a hand rank.
+        """
+        compiled = compile_strategy(strategy)
+        if not isinstance(compiled, CompiledStrategy):
+            raise ValueError(
+                "BatchGameEngine requires a strategy that does not read StrategyContext"
+            )
+        self._bet1_keys, self._bet1_rides = _decision_table(
+            canonical_three_card_hands(), compiled.decide_bet1
+        )
+        self._bet2_keys, self._bet2_rides = _decision_table(
+            canonical_four_card_hands(), compiled.decide_bet2
+        )
+
+        # Net result per unit of bet, indexed by hand rank value
+        self._main_net_by_rank = np.zeros(len(FiveCardHandRank), dtype=np.int32)
+        for rank in FiveCardHandRank:
+            ratio = main_paytable.payouts[rank]
+            self._main_net_by_rank[rank.value] = ratio if ratio > 0 else -1
+
+        self._bonus_net_by_index: NDArray[np.int32] | None = None
+        if bonus_paytable is not None:
+            ratios = np.array(bonus_paytable.payout_ratios_by_hand_index())
+            self._bonus_net_by_index = np.where(ratios > 0, ratios, -1).astype(np.int32)
+
+    def play_hands(self, num_hands: int, seed: int | None = None) -> HandBatch:
+        """Deal and play a number of hands.
+
+        Args:
+            num_hands: Number of hands to play.
+            seed: Seed for the NumPy random generator. None for a random seed.
+
+        Returns:
+            HandBatch with the results of every hand.
+
+        Raises:
+            ValueError: If num_hands is negative.
+        """
+        if num_hands < 0:
+            raise ValueError(f"num_hands must be non-negative, got {num_hands}")
+
+        rng = np.random.default_rng(seed)
+        chunks = [
+            self.play(deal_hands(min(_CHUNK_SIZE, num_hands - start), rng))
+            for start in range(0, num_hands, _CHUNK_SIZE)
+        ]
+        if not chunks:
+            return self.play(np.empty((0, 5), dtype=np.int8))
+        return HandBatch(
+            *(
+                np.concatenate([getattr(chunk, name) for chunk in chunks])
+                for name in HandBatch.__slots__
+            )
+        )
+
+    def play(self, cards: NDArray[np.int8]) -> HandBatch:
+        """Play already dealt hands.
+
+        Args:
+            cards: Card codes, shape (n, 5): 3 player cards, then the
+                community cards in the order they are revealed.
+
+        Returns:
+            HandBatch with the results of every hand.
+        """
+        cards = np.asarray(cards, dtype=np.int8)
+        codes = cards.astype(np.int64)
+
+        bet1_rides = self._bet1_rides[
+            np.searchsorted(self._bet1_keys, _class_keys(codes[:, :3]))
+        ]
+        bet2_rides = self._bet2_rides[
+            np.searchsorted(self._bet2_keys, _class_keys(codes[:, :4]))
+        ]
+        final_rank = five_card_rank_values(codes)
+        bets_at_risk = (1 + bet1_rides + bet2_rides).astype(np.int8)
+        main_net = self._main_net_by_rank[final_rank] * bets_at_risk
+
+        hand_index = _three_card_hand_indices(codes[:, :3])
+        bonus_rank = _THREE_CARD_RANK_VALUES[hand_index]
+        if self._bonus_net_by_index is not None:
+            bonus_net = self._bonus_net_by_index[hand_index]
+        else:
+            bonus_net = np.zeros(len(cards), dtype=np.int32)
+
+        return HandBatch(
+            cards=cards,
+            final_rank=final_rank,
+            bonus_rank=bonus_rank,
+            bet1_rides=bet1_rides,
+            bet2_rides=bet2_rides,
+            bets_at_risk=bets_at_risk,
+            main_net=main_net,
+            bonus_net=bonus_net,
+        )
+
+
+def deal_hands(num_hands: int, rng: np.random.Generator) -> NDArray[np.int8]:
+    """Deal 5 cards to each of a number of freshly shuffled decks.
+
+    Performs the first 5 steps of a Fisher-Yates shuffle on every deck,
+    which deals each hand uniformly at random without replacement.
+
+    Args:
+        num_hands: Number of hands to deal.
+        rng: NumPy random generator.
+
+    Returns:
+        Card codes, shape (num_hands, 5), in dealing order.
+    """
+    decks = np.tile(np.arange(52, dtype=np.int8), (num_hands, 1))
+    rows = np.arange(num_hands)
+    for position in range(5):
+        swap = rng.integers(position, 52, size=num_hands)
+        picked = decks[rows, swap]
+        decks[rows, swap] = decks[:, position]
+        decks[:, position] = picked
+    hands: NDArray[np.int8] = decks[:, :5].copy()
+    return hands
+
+
+def five_card_rank_values(cards: NDArray[np.integer]) -> NDArray[np.int8]:
+    """Evaluate many five-card hands at once.
+
+    Vectorized counterpart of evaluate_five_card_rank_codes().
+
+    Args:
+        cards: Card codes, shape (n, 5), in any order.
+
+    Returns:
+        FiveCardHandRank value of each hand.
+    """
+    ranks = np.sort(cards >> 2, axis=1)
+    suits = cards & 3
+    flush = (suits == suits[:, :1]).all(axis=1)
+
+    # Equal neighbours in sorted order identify pairs, trips and quads
+    equal = ranks[:, 1:] == ranks[:, :-1]
+    num_equal = equal.sum(axis=1)
+    quads = equal[:, :3].all(axis=1) | equal[:, 1:].all(axis=1)
+    trips = (
+        (equal[:, 0] & equal[:, 1])
+        | (equal[:, 1] & equal[:, 2])
+        | (equal[:, 2] & equal[:, 3])
+    )
+    pair_rank = np.where(equal, ranks[:, 1:], -1).max(axis=1)
+
+    wheel = (ranks[:, 3] == 3) & (ranks[:, 4] == 12)
+    straight = (num_equal == 0) & ((ranks[:, 4] - ranks[:, 0] == 4) | wheel)
+    straight_flush = straight & flush
+
+    conditions = [
+        straight_flush & (ranks[:, 0] == _TEN),
+        straight_flush,
+        quads,
+        num_equal == 3,
+        flush,
+        straight,
+        trips,
+        num_equal == 2,
+        (num_equal == 1) & (pair_rank >= _TEN),
+        num_equal == 1,
+    ]
+    choices = [
+        FiveCardHandRank.ROYAL_FLUSH.value,
+        FiveCardHandRank.STRAIGHT_FLUSH.value,
+        FiveCardHandRank.FOUR_OF_A_KIND.value,
+        FiveCardHandRank.FULL_HOUSE.value,
+        FiveCardHandRank.FLUSH.value,
+        FiveCardHandRank.STRAIGHT.value,
+        FiveCardHandRank.THREE_OF_A_KIND.value,
+        FiveCardHandRank.TWO_PAIR.value,
+        FiveCardHandRank.PAIR_TENS_OR_BETTER.value,
+        FiveCardHandRank.PAIR_BELOW_TENS.value,
+    ]
+    return np.select(
+        conditions, choices, default=FiveCardHandRank.HIGH_CARD.value
+    ).astype(np.int8)
+
+
+def _three_card_hand_indices(codes: NDArray[np.int64]) -> NDArray[np.int64]:
+    """Vectorized three_card_hand_index() for an (n, 3) array of codes."""
+    a, b, c = np.sort(codes, axis=1).T
+    indices: NDArray[np.int64] = a + b * (b - 1) // 2 + c * (c - 1) * (c - 2) // 6
+    return indices
+
+
+def _class_keys(codes: NDArray[np.int64]) -> NDArray[np.int64]:
+    """Compute the canonical hand class key of each row of card codes.
+
+    Encodes the key of hand_analysis._canonical_key as an integer: the
+    sorted ranks in base 13, followed by a 13-bit mask of the ranks in the
+    largest suit group. Ties between equally large groups go to the group
+    of the earliest card, as in _get_max_suited.
+
+    Args:
+        codes: Card codes, shape (n, 3) or (n, 4), in dealing order.
+    """
+    ranks = codes >> 2
+    suits = codes & 3
+    suit_counts = (suits[:, :, None] == suits[:, None, :]).sum(axis=2)
+    first_of_largest = np.argmax(
+        suit_counts == suit_counts.max(axis=1, keepdims=True), axis=1
+    )
+    chosen_suit = suits[np.arange(len(codes)), first_of_largest]
+    suited_mask = np.where(suits == chosen_suit[:, None], 1 << ranks, 0).sum(axis=1)
+
+    rank_code = np.zeros(len(codes), dtype=np.int64)
+    for column in np.sort(ranks, axis=1).T:
+        rank_code = rank_code * 13 + column
+    keys: NDArray[np.int64] = (rank_code << 13) | suited_mask
+    return keys
+
+
+def _decision_table(
+    hands: Sequence[tuple[tuple[int, ...], HandAnalysis]],
+    decide: Callable[[HandAnalysis, StrategyContext], Decision],
+) -> tuple[NDArray[np.int64], NDArray[np.bool_]]:
+    """Build sorted class keys and ride flags for _class_keys lookups.
+
+    Args:
+        hands: (codes, analysis) pair of every canonical hand class.
+        decide: Compiled decide_bet1 or decide_bet2.
+
+    Returns:
+        Tuple of (sorted class keys, ride flag of each key).
+    """
+    keys = _class_keys(np.array([codes for codes, _ in hands], dtype=np.int64))
+    rides = np.array(
+        [decide(analysis, _UNUSED_CONTEXT) == Decision.RIDE for _, analysis in hands]
+    )
+    order = np.argsort(keys)
+    return keys[order], rides[order]
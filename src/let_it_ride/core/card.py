@@ -133,3 +133,47 @@ class Card:
     def __repr__(self) -> str:
         """Return detailed representation for debugging."""
         return f"Card({self.rank.name}, {self.suit.name})"
+
+
+# Compact integer card encoding for the allocation-free simulation hot path.
+# A card code packs the rank into bits 2-5 and the suit into bits 0-1:
+#     code = (rank.value - 2) << 2 | suit_index
+# so the rank value is (code >> 2) + 2 and the suit index is code & 3.
+# Codes run 0..51; suit indices follow Suit declaration order (c, d, h, s).
+_SUITS: tuple[Suit, ...] = tuple(Suit)
+_SUIT_INDEX: dict[Suit, int] = {suit: index for index, suit in enumerate(_SUITS)}
+
+# Canonical Card instance for each code. Materializing cards through this
+# table is a tuple lookup, so no Card objects are allocated per hand.
+CARD_BY_CODE: tuple[Card, ...] = tuple(
+    Card(Rank((code >> 2) + 2), _SUITS[code & 3]) for code in range(52)
+)
+
+
+def card_to_int(card: Card) -> int:
+    """Encode a card as a compact integer code (0..51).
+
+    Args:
+        card: The card to encode.
+
+    Returns:
+        Integer code with the rank in bits 2-5 and the suit in bits 0-1.
+    """
+    return (card.rank.value - 2) << 2 | _SUIT_INDEX[card.suit]
+
+
+def int_to_card(code: int) -> Card:
+    """Decode a compact integer code back to its Card.
+
+    Args:
+        code: Integer card code in the range 0..51.
+
+    Returns:
+        The shared canonical Card instance for the code.
+
+    Raises:
+        ValueError: If code is outside the range 0..51.
+    """
+    if not 0 <= code < 52:
+        raise ValueError(f"Card code must be between 0 and 51, got {code}")
+    return CARD_BY_CODE[code]
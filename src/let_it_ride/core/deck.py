@@ -2,15 +2,27 @@
 
 This module provides the Deck class for managing a standard 52-card deck
 with shuffling and card tracking for statistical validation.
+
+Internally the deck holds compact integer card codes (see card_to_int).
+deal() materializes the shared canonical Card instances, while deal_codes()
+hands the codes straight to the integer fast path.
+
+With partial_shuffle=True, shuffle() only records the RNG and each dealt
+card is drawn by one step of Fisher-Yates at deal time. A hand then costs
+one random draw per card dealt instead of 51 for the whole deck.
 """
 
 import random
 
-from let_it_ride.core.card import Card, Rank, Suit
+from let_it_ride.core.card import CARD_BY_CODE, Card, Rank, Suit, card_to_int
 
-# Canonical deck created once at module load - reused via shallow copy
-# since Card objects are immutable (frozen dataclass)
-_CANONICAL_DECK: list[Card] = [Card(rank, suit) for suit in Suit for rank in Rank]
+# Canonical deck order created once at module load - reused via shallow copy.
+# The order (suit-major, then rank) is unchanged from the Card-based deck, and
+# random.shuffle() permutes by position only, so a given seed deals exactly
+# the same cards whether they are consumed as Cards or as integer codes.
+_CANONICAL_DECK: list[int] = [
+    card_to_int(Card(rank, suit)) for suit in Suit for rank in Rank
+]
 
 
 class DeckEmptyError(Exception):
@@ -24,10 +36,21 @@ class Deck:
     and tracks dealt cards for statistical validation.
     """
 
-    def __init__(self) -> None:
-        """Initialize a new deck with all 52 cards."""
-        self._cards: list[Card] = list(_CANONICAL_DECK)
-        self._dealt: list[Card] = []
+    def __init__(self, partial_shuffle: bool = False) -> None:
+        """Initialize a new deck with all 52 cards.
+
+        Args:
+            partial_shuffle: If True, shuffle() defers the work to deal time
+                and randomizes only the cards actually dealt. Every deal is
+                still uniform over the remaining cards, and the first deal
+                after a shuffle matches the full shuffle for the same RNG
+                state; later deals differ because fewer draws are consumed.
+        """
+        self._cards: list[int] = list(_CANONICAL_DECK)
+        self._dealt: list[int] = []
+        self._partial_shuffle = partial_shuffle
+        # RNG for deal-time Fisher-Yates steps (partial mode, after shuffle())
+        self._deal_rng: random.Random | None = None
 
     def shuffle(self, rng: random.Random) -> None:
         """Shuffle the remaining cards using the provided RNG.
@@ -40,9 +63,13 @@ class Deck:
 
         Note:
             Only shuffles cards that haven't been dealt. Dealt cards
-            remain in the dealt pile until reset() is called.
+            remain in the dealt pile until reset() is called. In partial
+            mode the remaining cards are drawn from rng as they are dealt.
         """
-        rng.shuffle(self._cards)
+        if self._partial_shuffle:
+            self._deal_rng = rng
+        else:
+            rng.shuffle(self._cards)
 
     def deal(self, count: int = 1) -> list[Card]:
         """Deal cards from the top of the deck.
@@ -53,6 +80,24 @@ class Deck:
         Returns:
             List of dealt cards.
 
+        Raises:
+            DeckEmptyError: If there are not enough cards remaining.
+            ValueError: If count is less than 1.
+        """
+        return [CARD_BY_CODE[code] for code in self.deal_codes(count)]
+
+    def deal_codes(self, count: int = 1) -> list[int]:
+        """Deal cards from the top of the deck as integer card codes.
+
+        Behaves exactly like deal() but skips Card materialization, for use
+        with the integer-code evaluators and hand analysis.
+
+        Args:
+            count: Number of cards to deal (default: 1).
+
+        Returns:
+            List of dealt card codes (0..51).
+
         Raises:
             DeckEmptyError: If there are not enough cards remaining.
             ValueError: If count is less than 1.
@@ -64,8 +109,17 @@ class Deck:
                 f"Cannot deal {count} cards, only {len(self._cards)} remaining"
             )
 
+        cards = self._cards
+        rng = self._deal_rng
+        if rng is not None:
+            # The same swaps random.shuffle() makes for the last positions:
+            # swap a random remaining card to the end, then pop it
+            for size in range(len(cards), len(cards) - count, -1):
+                j = rng.randrange(size)
+                cards[j], cards[size - 1] = cards[size - 1], cards[j]
+
         # Use pop() for O(1) removal from end, avoiding list slice allocation
-        dealt = [self._cards.pop() for _ in range(count)]
+        dealt = [cards.pop() for _ in range(count)]
         self._dealt.extend(dealt)
         return dealt
 
@@ -78,7 +132,7 @@ class Deck:
 
         Returns a copy to prevent external modification.
         """
-        return self._dealt.copy()
+        return [CARD_BY_CODE[code] for code in self._dealt]
 
     def reset(self) -> None:
         """Return all dealt cards to the deck.
@@ -91,6 +145,7 @@ class Deck:
         self._cards.clear()
         self._cards.extend(_CANONICAL_DECK)
         self._dealt.clear()
+        self._deal_rng = None
 
     def __len__(self) -> int:
         """Return the number of cards remaining in the deck."""
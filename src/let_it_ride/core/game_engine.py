@@ -6,13 +6,18 @@ strategy decisions, and payout calculation for a single hand.
 
 import random
 from dataclasses import dataclass
+from typing import Protocol
 
 from let_it_ride.config.models import DealerConfig
 from let_it_ride.config.paytables import BonusPaytable, MainGamePaytable
-from let_it_ride.core.card import Card
+from let_it_ride.core.card import CARD_BY_CODE, Card
 from let_it_ride.core.deck import Deck
-from let_it_ride.core.hand_evaluator import FiveCardHandRank
-from let_it_ride.core.hand_processing import process_hand_decisions_and_payouts
+from let_it_ride.core.hand_evaluator import FiveCardHandRank, FiveCardRankEvaluator
+from let_it_ride.core.hand_processing import (
+    HandProcessingResult,
+    process_hand_code_decisions_and_payouts,
+    process_hand_decisions_and_payouts,
+)
 from let_it_ride.core.three_card_evaluator import ThreeCardHandRank
 from let_it_ride.strategy.base import Decision, Strategy, StrategyContext
 
@@ -56,6 +61,34 @@ class GameHandResult:
     net_result: float
 
 
+class HandEngine(Protocol):
+    """Protocol for engines that play one hand at a time for a Session.
+
+    GameEngine deals and plays real cards; OutcomeSamplingEngine (in
+    let_it_ride.simulation.outcome_sampling) samples settled outcomes.
+    """
+
+    def play_hand(
+        self,
+        hand_id: int,
+        base_bet: float,
+        bonus_bet: float = 0.0,
+        context: StrategyContext | None = None,
+    ) -> GameHandResult:
+        """Play a complete hand and return its result.
+
+        Args:
+            hand_id: Unique identifier for this hand.
+            base_bet: The bet amount per circle (3 circles total).
+            bonus_bet: Optional bonus bet amount.
+            context: Strategy context for decision making.
+
+        Returns:
+            GameHandResult with complete hand details and payouts.
+        """
+        ...
+
+
 class GameEngine:
     """Orchestrates a single Let It Ride hand.
 
@@ -71,6 +104,8 @@ class GameEngine:
         bonus_paytable: BonusPaytable | None,
         rng: random.Random,
         dealer_config: DealerConfig | None = None,
+        rank_evaluator: FiveCardRankEvaluator | None = None,
+        compact_cards: bool = False,
     ) -> None:
         """Initialize the game engine.
 
@@ -81,6 +116,14 @@ class GameEngine:
             bonus_paytable: Paytable for bonus bet payouts (None if no bonus).
             rng: Random number generator for shuffling.
             dealer_config: Optional dealer configuration for discard mechanics.
+            rank_evaluator: Optional rank-only 5-card evaluator. Pass
+                evaluate_five_card_rank to use the lookup-table evaluator.
+                If None, evaluate_five_card_hand is used. Ignored when
+                compact_cards is True.
+            compact_cards: If True, deal and evaluate hands as integer card
+                codes (see card_to_int), materializing the shared canonical
+                Card instances only for the returned GameHandResult. Results
+                are identical to the Card path for the same RNG.
         """
         self._deck = deck
         self._strategy = strategy
@@ -90,6 +133,8 @@ class GameEngine:
         self._dealer_config = (
             dealer_config if dealer_config is not None else _DEFAULT_DEALER_CONFIG
         )
+        self._rank_evaluator = rank_evaluator
+        self._compact_cards = compact_cards
         self._last_discarded_cards: list[Card] = []
 
     def play_hand(
@@ -134,38 +179,58 @@ class GameEngine:
         self._deck.shuffle(self._rng)
 
         # Step 2: Deal 3 cards to player (player receives cards first)
-        player_cards = self._deck.deal(3)
+        deck = self._deck
+        if self._compact_cards:
+            player_codes = deck.deal_codes(3)
+        else:
+            player_cards = deck.deal(3)
 
         # Step 3: Dealer discard (if enabled)
         # In casino play, the shuffling machine dispenses 3 cards at a time.
         # When dealing the 2 community cards, the dealer receives 3 but discards 1.
         self._last_discarded_cards = []
         if self._dealer_config.discard_enabled:
-            self._last_discarded_cards = self._deck.deal(
-                self._dealer_config.discard_cards
-            )
-
-        # Step 4: Deal 2 community cards
-        community_cards = self._deck.deal(2)
-
-        player_tuple: tuple[Card, Card, Card] = (
-            player_cards[0],
-            player_cards[1],
-            player_cards[2],
-        )
-        community_tuple: tuple[Card, Card] = (community_cards[0], community_cards[1])
+            self._last_discarded_cards = deck.deal(self._dealer_config.discard_cards)
 
-        # Step 5: Process hand decisions and calculate payouts
-        result = process_hand_decisions_and_payouts(
-            player_cards=player_tuple,
-            community_cards=community_tuple,
-            strategy=self._strategy,
-            main_paytable=self._main_paytable,
-            bonus_paytable=self._bonus_paytable,
-            base_bet=base_bet,
-            bonus_bet=bonus_bet,
-            context=context,
-        )
+        # Steps 4-5: Deal 2 community cards, then process hand decisions and
+        # calculate payouts
+        result: HandProcessingResult
+        if self._compact_cards:
+            community_codes = deck.deal_codes(2)
+            p0, p1, p2 = player_codes
+            m0, m1 = community_codes
+            result = process_hand_code_decisions_and_payouts(
+                player_codes=(p0, p1, p2),
+                community_codes=(m0, m1),
+                strategy=self._strategy,
+                main_paytable=self._main_paytable,
+                bonus_paytable=self._bonus_paytable,
+                base_bet=base_bet,
+                bonus_bet=bonus_bet,
+                context=context,
+            )
+            # Cards are looked up, not allocated, so the result stays cheap
+            player_tuple: tuple[Card, Card, Card] = (
+                CARD_BY_CODE[p0],
+                CARD_BY_CODE[p1],
+                CARD_BY_CODE[p2],
+            )
+            community_tuple: tuple[Card, Card] = (CARD_BY_CODE[m0], CARD_BY_CODE[m1])
+        else:
+            community_cards = deck.deal(2)
+            player_tuple = (player_cards[0], player_cards[1], player_cards[2])
+            community_tuple = (community_cards[0], community_cards[1])
+            result = process_hand_decisions_and_payouts(
+                player_cards=player_tuple,
+                community_cards=community_tuple,
+                strategy=self._strategy,
+                main_paytable=self._main_paytable,
+                bonus_paytable=self._bonus_paytable,
+                base_bet=base_bet,
+                bonus_bet=bonus_bet,
+                context=context,
+                rank_evaluator=self._rank_evaluator,
+            )
 
         return GameHandResult(
             hand_id=hand_id,
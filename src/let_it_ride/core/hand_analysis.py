@@ -10,10 +10,17 @@ Key features detected:
 - Straight draws (open-ended vs inside/gutshot)
 - Royal flush draws and straight flush draws
 - High card counting (10, J, Q, K, A)
+
+Each analysis has a Card-based entry point (analyze_three_cards,
+analyze_four_cards) and an integer-code counterpart (analyze_three_card_codes,
+analyze_four_card_codes) for the compact card encoding; both share the same
+rank-value/suit-key implementation.
 """
 
-from collections.abc import Sequence
+from collections.abc import Callable, Hashable, Iterator, Sequence
 from dataclasses import dataclass
+from functools import cache
+from itertools import combinations_with_replacement
 
 from let_it_ride.core.card import Card, Rank
 
@@ -95,30 +102,62 @@ class HandAnalysis:
     straight_flush_spread: int
 
 
+# HandAnalysis instances memoized by canonical hand class (see _canonical_key).
+# HandAnalysis is frozen, so instances are shared between hands. The caches
+# are bounded by the number of classes: 2,483 for 3 cards, 17,446 for 4 cards.
+_THREE_CARD_ANALYSES: dict[tuple[tuple[int, ...], tuple[int, ...]], HandAnalysis] = {}
+_FOUR_CARD_ANALYSES: dict[tuple[tuple[int, ...], tuple[int, ...]], HandAnalysis] = {}
+
+
+def _canonical_key(
+    rank_values: Sequence[int], suit_keys: Sequence[Hashable]
+) -> tuple[tuple[int, ...], tuple[int, ...]]:
+    """Reduce a hand to its suit-isomorphic canonical class.
+
+    Every HandAnalysis field is a function of the rank multiset and of the
+    rank values in the most frequent suit group (as chosen by
+    _get_max_suited, which breaks ties by first appearance). Suit identity
+    and card order are otherwise irrelevant, so hands sharing this key share
+    one analysis.
+
+    Returns:
+        Tuple of (sorted rank values, sorted rank values of the most
+        frequent suit).
+    """
+    _, suited_values = _get_max_suited(rank_values, suit_keys)
+    return tuple(sorted(rank_values)), tuple(sorted(suited_values))
+
+
 def _count_high_cards(rank_values: Sequence[int]) -> int:
     """Count high cards (10, J, Q, K, A) in the given rank values."""
     return sum(1 for v in rank_values if v in _HIGH_CARD_VALUES)
 
 
-def _get_max_suited(cards: Sequence[Card]) -> tuple[int, list[Card]]:
-    """Get the maximum suited count and the cards of that suit.
+def _get_max_suited(
+    rank_values: Sequence[int], suit_keys: Sequence[Hashable]
+) -> tuple[int, list[int]]:
+    """Get the maximum suited count and the rank values of that suit.
 
     Uses a single pass through the cards for efficiency.
 
+    Args:
+        rank_values: Rank values (2-14) of the cards.
+        suit_keys: Suit of each card, in the same order as rank_values. Any
+            hashable key works (Suit members or integer suit indices).
+
     Returns:
-        Tuple of (max_count, suited_cards) where suited_cards are the cards
-        of the most frequent suit.
+        Tuple of (max_count, suited_values) where suited_values are the rank
+        values of the cards of the most frequent suit.
     """
-    if not cards:
+    if not rank_values:
         return 0, []
 
     # Single-pass grouping by suit
-    suit_groups: dict[str, list[Card]] = {}
-    for card in cards:
-        suit_key = card.suit.value
+    suit_groups: dict[Hashable, list[int]] = {}
+    for value, suit_key in zip(rank_values, suit_keys, strict=True):
         if suit_key not in suit_groups:
             suit_groups[suit_key] = []
-        suit_groups[suit_key].append(card)
+        suit_groups[suit_key].append(value)
 
     # Find the suit with maximum count
     max_group = max(suit_groups.values(), key=len)
@@ -218,23 +257,22 @@ def _analyze_straight_potential(
     return best_connected, best_gaps, is_open_ended, is_inside
 
 
-def _is_royal_draw(suited_cards: Sequence[Card]) -> bool:
+def _is_royal_draw(suited_values: Sequence[int]) -> bool:
     """Check if suited cards form a royal flush draw.
 
     A royal draw requires 3+ suited cards that are all royal values
     (10, J, Q, K, A) and includes the Ace.
     """
-    if len(suited_cards) < 3:
+    if len(suited_values) < 3:
         return False
 
-    suited_values = [c.rank.value for c in suited_cards]
     royal_suited = [v for v in suited_values if v in _ROYAL_VALUES]
 
     # Need 3+ royal cards and must include Ace for a true royal draw
     return len(royal_suited) >= 3 and 14 in royal_suited
 
 
-def _calculate_sf_spread(suited_cards: Sequence[Card]) -> int:
+def _calculate_sf_spread(suited_values: Sequence[int]) -> int:
     """Calculate the spread (span) of suited cards for straight flush potential.
 
     Spread is the range of values: (max - min + 1).
@@ -246,15 +284,15 @@ def _calculate_sf_spread(suited_cards: Sequence[Card]) -> int:
     For hands with an Ace that could be low (wheel draws), uses the lower spread.
 
     Args:
-        suited_cards: The suited cards to analyze.
+        suited_values: Rank values of the suited cards to analyze.
 
     Returns:
         The spread value (0 if no SF draw potential, otherwise 3-5 typically).
     """
-    if len(suited_cards) < 3:
+    if len(suited_values) < 3:
         return 0
 
-    values = sorted([c.rank.value for c in suited_cards])
+    values = sorted(suited_values)
     regular_spread = values[-1] - values[0] + 1
 
     # Check for ace-low (wheel) spread
@@ -269,7 +307,7 @@ def _calculate_sf_spread(suited_cards: Sequence[Card]) -> int:
     return regular_spread
 
 
-def _is_excluded_sf_consecutive(suited_cards: Sequence[Card]) -> bool:
+def _is_excluded_sf_consecutive(suited_values: Sequence[int]) -> bool:
     """Check if suited cards form an excluded consecutive straight flush draw.
 
     The basic strategy specifically excludes A-2-3 and 2-3-4 suited from
@@ -277,15 +315,15 @@ def _is_excluded_sf_consecutive(suited_cards: Sequence[Card]) -> bool:
     value than other consecutive suited hands.
 
     Args:
-        suited_cards: The suited cards to check.
+        suited_values: Rank values of the suited cards to check.
 
     Returns:
         True if the cards form A-2-3 or 2-3-4 suited, False otherwise.
     """
-    if len(suited_cards) != 3:
+    if len(suited_values) != 3:
         return False
 
-    values = sorted([c.rank.value for c in suited_cards])
+    values = sorted(suited_values)
 
     # Check for A-2-3 (values would be [2, 3, 14] when sorted by standard values)
     if values == [2, 3, 14]:
@@ -298,16 +336,16 @@ def _is_excluded_sf_consecutive(suited_cards: Sequence[Card]) -> bool:
     return False
 
 
-def _is_straight_flush_draw(suited_cards: Sequence[Card]) -> bool:
+def _is_straight_flush_draw(suited_values: Sequence[int]) -> bool:
     """Check if suited cards form a straight flush draw.
 
     Requires 3+ suited cards that are consecutive or nearly consecutive
     (within a 5-card window with at most 1 gap).
     """
-    if len(suited_cards) < 3:
+    if len(suited_values) < 3:
         return False
 
-    suited_values = sorted([c.rank.value for c in suited_cards])
+    suited_values = sorted(suited_values)
 
     # Check if the cards fit within a 5-card window (potential straight)
     # Also handle ace-low wheel draws
@@ -348,13 +386,51 @@ def analyze_three_cards(cards: Sequence[Card]) -> HandAnalysis:
     if len(cards) != 3:
         raise ValueError(f"Expected 3 cards, got {len(cards)}")
 
-    rank_values = [c.rank.value for c in cards]
+    return _analyze_three([c.rank.value for c in cards], [c.suit for c in cards])
+
+
+def analyze_three_card_codes(codes: Sequence[int]) -> HandAnalysis:
+    """Analyze a 3-card hand given as integer card codes.
+
+    Integer-code counterpart of analyze_three_cards() (see card_to_int for
+    the encoding), producing the same HandAnalysis for the equivalent cards.
+
+    Args:
+        codes: Exactly 3 integer card codes (0..51).
+
+    Returns:
+        HandAnalysis with all relevant hand characteristics.
+
+    Raises:
+        ValueError: If not exactly 3 codes provided.
+    """
+    if len(codes) != 3:
+        raise ValueError(f"Expected 3 cards, got {len(codes)}")
+
+    return _analyze_three([(c >> 2) + 2 for c in codes], [c & 3 for c in codes])
+
+
+def _analyze_three(
+    rank_values: list[int], suit_keys: Sequence[Hashable]
+) -> HandAnalysis:
+    """Return the cached 3-card HandAnalysis for rank values and suit keys."""
+    key = _canonical_key(rank_values, suit_keys)
+    analysis = _THREE_CARD_ANALYSES.get(key)
+    if analysis is None:
+        analysis = _build_three_card_analysis(*key)
+        _THREE_CARD_ANALYSES[key] = analysis
+    return analysis
+
 
+def _build_three_card_analysis(
+    rank_values: tuple[int, ...], suited_values: tuple[int, ...]
+) -> HandAnalysis:
+    """Build the 3-card HandAnalysis for a canonical hand class."""
     # Count high cards
     high_cards = _count_high_cards(rank_values)
 
-    # Get suit information
-    suited_count, suited_cards = _get_max_suited(cards)
+    # Suit information: only the most frequent suit's cards matter
+    suited_count = len(suited_values)
 
     # Analyze straight potential
     connected, gaps, is_open, is_inside = _analyze_straight_potential(rank_values)
@@ -391,20 +467,18 @@ def analyze_three_cards(cards: Sequence[Card]) -> HandAnalysis:
     is_straight_draw = connected >= 3
 
     # Check special draws
-    is_straight_flush_draw = is_flush_draw and _is_straight_flush_draw(suited_cards)
-    is_royal_draw = is_flush_draw and _is_royal_draw(suited_cards)
+    is_straight_flush_draw = is_flush_draw and _is_straight_flush_draw(suited_values)
+    is_royal_draw = is_flush_draw and _is_royal_draw(suited_values)
 
     # Check for excluded consecutive SF draws (A-2-3, 2-3-4 suited)
     # Only check when we have a straight flush draw, not just any flush draw
-    is_excluded = is_straight_flush_draw and _is_excluded_sf_consecutive(suited_cards)
+    is_excluded = is_straight_flush_draw and _is_excluded_sf_consecutive(suited_values)
 
     # Calculate SF spread for strategy decisions
-    sf_spread = _calculate_sf_spread(suited_cards) if is_straight_flush_draw else 0
+    sf_spread = _calculate_sf_spread(suited_values) if is_straight_flush_draw else 0
 
     # Count suited high cards
-    suited_high_cards = sum(
-        1 for c in suited_cards if c.rank.value in _HIGH_CARD_VALUES
-    )
+    suited_high_cards = sum(1 for v in suited_values if v in _HIGH_CARD_VALUES)
 
     return HandAnalysis(
         high_cards=high_cards,
@@ -447,13 +521,51 @@ def analyze_four_cards(cards: Sequence[Card]) -> HandAnalysis:
     if len(cards) != 4:
         raise ValueError(f"Expected 4 cards, got {len(cards)}")
 
-    rank_values = [c.rank.value for c in cards]
+    return _analyze_four([c.rank.value for c in cards], [c.suit for c in cards])
+
+
+def analyze_four_card_codes(codes: Sequence[int]) -> HandAnalysis:
+    """Analyze a 4-card hand given as integer card codes.
+
+    Integer-code counterpart of analyze_four_cards() (see card_to_int for
+    the encoding), producing the same HandAnalysis for the equivalent cards.
 
+    Args:
+        codes: Exactly 4 integer card codes (0..51).
+
+    Returns:
+        HandAnalysis with all relevant hand characteristics.
+
+    Raises:
+        ValueError: If not exactly 4 codes provided.
+    """
+    if len(codes) != 4:
+        raise ValueError(f"Expected 4 cards, got {len(codes)}")
+
+    return _analyze_four([(c >> 2) + 2 for c in codes], [c & 3 for c in codes])
+
+
+def _analyze_four(
+    rank_values: list[int], suit_keys: Sequence[Hashable]
+) -> HandAnalysis:
+    """Return the cached 4-card HandAnalysis for rank values and suit keys."""
+    key = _canonical_key(rank_values, suit_keys)
+    analysis = _FOUR_CARD_ANALYSES.get(key)
+    if analysis is None:
+        analysis = _build_four_card_analysis(*key)
+        _FOUR_CARD_ANALYSES[key] = analysis
+    return analysis
+
+
+def _build_four_card_analysis(
+    rank_values: tuple[int, ...], suited_values: tuple[int, ...]
+) -> HandAnalysis:
+    """Build the 4-card HandAnalysis for a canonical hand class."""
     # Count high cards
     high_cards = _count_high_cards(rank_values)
 
-    # Get suit information
-    suited_count, suited_cards = _get_max_suited(cards)
+    # Suit information: only the most frequent suit's cards matter
+    suited_count = len(suited_values)
 
     # Analyze straight potential
     connected, gaps, is_open, is_inside = _analyze_straight_potential(rank_values)
@@ -496,13 +608,11 @@ def analyze_four_cards(cards: Sequence[Card]) -> HandAnalysis:
     is_straight_draw = connected >= 4
 
     # Check special draws
-    is_straight_flush_draw = is_flush_draw and _is_straight_flush_draw(suited_cards)
-    is_royal_draw = is_flush_draw and _is_royal_draw(suited_cards)
+    is_straight_flush_draw = is_flush_draw and _is_straight_flush_draw(suited_values)
+    is_royal_draw = is_flush_draw and _is_royal_draw(suited_values)
 
     # Count suited high cards
-    suited_high_cards = sum(
-        1 for c in suited_cards if c.rank.value in _HIGH_CARD_VALUES
-    )
+    suited_high_cards = sum(1 for v in suited_values if v in _HIGH_CARD_VALUES)
 
     # Note: is_excluded_sf_consecutive and straight_flush_spread only apply
     # to 3-card hands (Bet 1). For 4-card hands, these are not used.
@@ -526,3 +636,92 @@ def analyze_four_cards(cards: Sequence[Card]) -> HandAnalysis:
         is_excluded_sf_consecutive=False,
         straight_flush_spread=0,
     )
+
+
+@cache
+def canonical_three_card_analyses() -> tuple[HandAnalysis, ...]:
+    """Return the analysis of every canonical 3-card hand class.
+
+    Each of the 2,483 classes appears exactly once, as the shared instance
+    that analyze_three_cards() returns for hands in that class. Computed on
+    first call and cached.
+    """
+    return tuple(analysis for _, analysis in canonical_three_card_hands())
+
+
+@cache
+def canonical_four_card_analyses() -> tuple[HandAnalysis, ...]:
+    """Return the analysis of every canonical 4-card hand class.
+
+    Each of the 17,446 classes appears exactly once, as the shared instance
+    that analyze_four_cards() returns for hands in that class. Computed on
+    first call and cached (roughly a second of work).
+    """
+    return tuple(analysis for _, analysis in canonical_four_card_hands())
+
+
+@cache
+def canonical_three_card_hands() -> tuple[tuple[tuple[int, ...], HandAnalysis], ...]:
+    """Return a representative hand for every canonical 3-card hand class.
+
+    Returns:
+        (codes, analysis) pairs in the order of canonical_three_card_analyses(),
+        where codes is one hand (integer card codes) of the class.
+    """
+    return _canonical_hands(3, analyze_three_card_codes)
+
+
+@cache
+def canonical_four_card_hands() -> tuple[tuple[tuple[int, ...], HandAnalysis], ...]:
+    """Return a representative hand for every canonical 4-card hand class.
+
+    Returns:
+        (codes, analysis) pairs in the order of canonical_four_card_analyses(),
+        where codes is one hand (integer card codes) of the class.
+    """
+    return _canonical_hands(4, analyze_four_card_codes)
+
+
+def _canonical_hands(
+    num_cards: int, analyze: Callable[[Sequence[int]], HandAnalysis]
+) -> tuple[tuple[tuple[int, ...], HandAnalysis], ...]:
+    """Analyze representative hands and keep the first hand of each class."""
+    seen: dict[int, tuple[tuple[int, ...], HandAnalysis]] = {}
+    for codes in _representative_hand_codes(num_cards):
+        analysis = analyze(codes)
+        seen.setdefault(id(analysis), (codes, analysis))
+    return tuple(seen.values())
+
+
+def _representative_hand_codes(num_cards: int) -> Iterator[tuple[int, ...]]:
+    """Yield integer-code hands covering every canonical class.
+
+    Analyses are invariant under suit relabeling, so it suffices to take
+    each rank multiset with every suit pattern in first-appearance form.
+    Card order only matters for which of several equally large suit groups
+    is chosen, so each hand is also yielded once with the first card of
+    each suit group moved to the front.
+    """
+    patterns = _suit_patterns(num_cards)
+    for ranks in combinations_with_replacement(range(13), num_cards):
+        for suits in patterns:
+            codes = tuple(
+                rank << 2 | suit for rank, suit in zip(ranks, suits, strict=True)
+            )
+            if len(set(codes)) != num_cards:
+                continue  # Same rank dealt twice in one suit
+            for i, code in enumerate(codes):
+                if suits[i] not in suits[:i]:
+                    yield (code, *codes[:i], *codes[i + 1 :])
+
+
+def _suit_patterns(num_cards: int) -> list[tuple[int, ...]]:
+    """Return suit index sequences with suits numbered by first appearance."""
+    patterns: list[tuple[int, ...]] = [()]
+    for _ in range(num_cards):
+        patterns = [
+            (*pattern, suit)
+            for pattern in patterns
+            for suit in range(min(len(set(pattern)) + 1, 4))
+        ]
+    return patterns
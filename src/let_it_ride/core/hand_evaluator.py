@@ -5,11 +5,19 @@ identifying all poker hand types from Royal Flush through High Card.
 
 Let It Ride specific: Pairs are distinguished between PAIR_TENS_OR_BETTER
 (which pays 1:1) and PAIR_BELOW_TENS (which loses).
+
+Two evaluators are provided:
+- evaluate_five_card_hand(): Full evaluation returning a HandResult with
+  primary cards and kickers for tiebreaking.
+- evaluate_five_card_rank(): Lookup-table evaluation returning only the
+  FiveCardHandRank, which is all payout calculation needs.
 """
 
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
 from enum import Enum
+from itertools import combinations_with_replacement
+from math import prod
 
 from let_it_ride.core.card import Card, Rank
 
@@ -274,3 +282,179 @@ def evaluate_five_card_hand(cards: Sequence[Card]) -> HandResult:
         primary_cards=sorted_by_rank[:1],
         kickers=sorted_by_rank[1:],
     )
+
+
+# Type alias for evaluators that return only the hand rank.
+# GameEngine and Table accept one of these to select the 5-card evaluator.
+FiveCardRankEvaluator = Callable[[Sequence[Card]], FiveCardHandRank]
+
+# One prime per rank value (indexed by value 2-14). The product of five rank
+# primes uniquely identifies a rank multiset independent of card order, so it
+# can be used directly as a lookup key.
+_RANK_PRIMES: tuple[int, ...] = (0, 0, 2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+
+def _classify_rank_multiset(
+    values: tuple[int, ...], is_flush: bool
+) -> FiveCardHandRank:
+    """Classify a sorted multiset of five rank values.
+
+    This mirrors the rules in evaluate_five_card_hand() but works on rank
+    values alone, so it can be run once per multiset to build lookup tables.
+
+    Args:
+        values: Five rank values (2-14) in ascending order.
+        is_flush: Whether all five cards share a suit.
+
+    Returns:
+        The FiveCardHandRank for the multiset.
+    """
+    counts = sorted((values.count(v) for v in set(values)), reverse=True)
+
+    if counts[0] == 4:
+        return FiveCardHandRank.FOUR_OF_A_KIND
+    if counts[0] == 3:
+        if counts[1] == 2:
+            return FiveCardHandRank.FULL_HOUSE
+        return FiveCardHandRank.THREE_OF_A_KIND
+    if counts[0] == 2:
+        if counts[1] == 2:
+            return FiveCardHandRank.TWO_PAIR
+        pair_value = next(v for v in values if values.count(v) == 2)
+        if pair_value in _TENS_OR_BETTER_VALUES:
+            return FiveCardHandRank.PAIR_TENS_OR_BETTER
+        return FiveCardHandRank.PAIR_BELOW_TENS
+
+    # Five distinct ranks: straight and/or flush, or high card
+    is_wheel = values == _WHEEL_VALUES
+    is_straight = values[4] - values[0] == 4 or is_wheel
+
+    if is_straight and is_flush:
+        if values[4] == 14 and not is_wheel:
+            return FiveCardHandRank.ROYAL_FLUSH
+        return FiveCardHandRank.STRAIGHT_FLUSH
+    if is_flush:
+        return FiveCardHandRank.FLUSH
+    if is_straight:
+        return FiveCardHandRank.STRAIGHT
+    return FiveCardHandRank.HIGH_CARD
+
+
+def _build_rank_lookup_tables() -> tuple[
+    dict[int, FiveCardHandRank], dict[int, FiveCardHandRank]
+]:
+    """Build prime-product lookup tables for every five-card rank multiset.
+
+    There are 6,175 possible rank multisets (no rank can appear five times)
+    and 1,287 of them have five distinct ranks and can therefore be flushes.
+    Building both tables takes a few milliseconds, so they are computed once
+    at import rather than cached on disk.
+
+    Returns:
+        Tuple of (unsuited_table, suited_table) mapping prime products to
+        hand ranks. The suited table only contains five-distinct-rank keys.
+    """
+    unsuited: dict[int, FiveCardHandRank] = {}
+    suited: dict[int, FiveCardHandRank] = {}
+
+    for values in combinations_with_replacement(range(2, 15), 5):
+        if values[0] == values[4]:
+            # Five of a kind is impossible with a single deck
+            continue
+        product = prod(_RANK_PRIMES[v] for v in values)
+        unsuited[product] = _classify_rank_multiset(values, is_flush=False)
+        if len(set(values)) == 5:
+            suited[product] = _classify_rank_multiset(values, is_flush=True)
+
+    return unsuited, suited
+
+
+_UNSUITED_RANK_TABLE, _SUITED_RANK_TABLE = _build_rank_lookup_tables()
+
+
+def evaluate_five_card_rank(cards: Sequence[Card]) -> FiveCardHandRank:
+    """Evaluate the rank of a five-card hand using precomputed lookup tables.
+
+    Produces exactly the same FiveCardHandRank as evaluate_five_card_hand()
+    for every one of the 2,598,960 five-card hands, but without building
+    rank counts, sorting, or allocating a HandResult. Use this on hot paths
+    where only the rank is needed (payout calculation).
+
+    Args:
+        cards: Exactly 5 Card objects.
+
+    Returns:
+        The FiveCardHandRank of the hand.
+
+    Raises:
+        ValueError: If not exactly 5 cards provided, or if the cards cannot
+            form a valid hand (e.g., five cards of the same rank).
+
+    Note:
+        Unlike evaluate_five_card_hand(), duplicate cards are not checked
+        explicitly. Duplicates that produce an impossible hand are rejected,
+        but others (e.g., the same pair card twice) are evaluated as dealt.
+    """
+    if len(cards) != 5:
+        raise ValueError(f"Expected 5 cards, got {len(cards)}")
+
+    c0, c1, c2, c3, c4 = cards
+    product = (
+        _RANK_PRIMES[c0.rank.value]
+        * _RANK_PRIMES[c1.rank.value]
+        * _RANK_PRIMES[c2.rank.value]
+        * _RANK_PRIMES[c3.rank.value]
+        * _RANK_PRIMES[c4.rank.value]
+    )
+
+    suit = c0.suit
+    try:
+        if c1.suit is suit and c2.suit is suit and c3.suit is suit and c4.suit is suit:
+            return _SUITED_RANK_TABLE[product]
+        return _UNSUITED_RANK_TABLE[product]
+    except KeyError:
+        raise ValueError("Duplicate cards detected in hand") from None
+
+
+# Rank prime indexed directly by compact card code (see card_to_int), so the
+# integer fast path needs no shift or enum access per card.
+_CODE_PRIMES: tuple[int, ...] = tuple(
+    _RANK_PRIMES[(code >> 2) + 2] for code in range(52)
+)
+
+
+def evaluate_five_card_rank_codes(codes: Sequence[int]) -> FiveCardHandRank:
+    """Evaluate the rank of a five-card hand given as integer card codes.
+
+    Integer-code counterpart of evaluate_five_card_rank(), producing the
+    same result for the equivalent Card hand.
+
+    Args:
+        codes: Exactly 5 integer card codes (0..51).
+
+    Returns:
+        The FiveCardHandRank of the hand.
+
+    Raises:
+        ValueError: If not exactly 5 codes provided, or if the codes cannot
+            form a valid hand (e.g., five cards of the same rank).
+    """
+    if len(codes) != 5:
+        raise ValueError(f"Expected 5 cards, got {len(codes)}")
+
+    c0, c1, c2, c3, c4 = codes
+    product = (
+        _CODE_PRIMES[c0]
+        * _CODE_PRIMES[c1]
+        * _CODE_PRIMES[c2]
+        * _CODE_PRIMES[c3]
+        * _CODE_PRIMES[c4]
+    )
+
+    # All five suit fields equal <=> every XOR with c0 has zero low bits
+    try:
+        if ((c0 ^ c1) | (c0 ^ c2) | (c0 ^ c3) | (c0 ^ c4)) & 3 == 0:
+            return _SUITED_RANK_TABLE[product]
+        return _UNSUITED_RANK_TABLE[product]
+    except KeyError:
+        raise ValueError("Duplicate cards detected in hand") from None
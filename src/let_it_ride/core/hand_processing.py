@@ -4,19 +4,35 @@ This module contains the common logic for processing a single hand through
 strategy decisions, hand evaluation, and payout calculation. It is used by
 both GameEngine (single-player) and Table (multi-player) to avoid code
 duplication.
+
+process_hand_code_decisions_and_payouts() is the integer-code counterpart used
+by GameEngine's compact card mode; both variants share the payout settlement
+in settle_hand(), which outcome-sampling engines also use directly.
 """
 
 from dataclasses import dataclass
 
 from let_it_ride.config.paytables import BonusPaytable, MainGamePaytable
 from let_it_ride.core.card import Card
-from let_it_ride.core.hand_analysis import analyze_four_cards, analyze_three_cards
-from let_it_ride.core.hand_evaluator import FiveCardHandRank, evaluate_five_card_hand
+from let_it_ride.core.hand_analysis import (
+    analyze_four_card_codes,
+    analyze_four_cards,
+    analyze_three_card_codes,
+    analyze_three_cards,
+)
+from let_it_ride.core.hand_evaluator import (
+    FiveCardHandRank,
+    FiveCardRankEvaluator,
+    evaluate_five_card_hand,
+    evaluate_five_card_rank_codes,
+)
 from let_it_ride.core.three_card_evaluator import (
     ThreeCardHandRank,
     evaluate_three_card_hand,
+    evaluate_three_card_hand_codes,
 )
 from let_it_ride.strategy.base import Decision, Strategy, StrategyContext
+from let_it_ride.strategy.compiled import CompiledStrategy
 
 
 @dataclass(frozen=True, slots=True)
@@ -56,6 +72,7 @@ def process_hand_decisions_and_payouts(
     base_bet: float,
     bonus_bet: float,
     context: StrategyContext,
+    rank_evaluator: FiveCardRankEvaluator | None = None,
 ) -> HandProcessingResult:
     """Process a single hand through all strategy decisions and payouts.
 
@@ -77,6 +94,8 @@ def process_hand_decisions_and_payouts(
         base_bet: The bet amount per circle.
         bonus_bet: The bonus bet amount (0 if no bonus).
         context: Strategy context for decision making.
+        rank_evaluator: Optional rank-only 5-card evaluator (e.g.,
+            evaluate_five_card_rank). If None, evaluate_five_card_hand is used.
 
     Returns:
         HandProcessingResult with all calculated values.
@@ -92,10 +111,105 @@ def process_hand_decisions_and_payouts(
 
     # Step 3: Evaluate final 5-card hand
     final_cards = (*player_cards, *community_cards)
-    hand_result = evaluate_five_card_hand(final_cards)
-    final_hand_rank = hand_result.rank
+    if rank_evaluator is None:
+        final_hand_rank = evaluate_five_card_hand(final_cards).rank
+    else:
+        final_hand_rank = rank_evaluator(final_cards)
+
+    # Step 4: Evaluate bonus hand if a bonus bet is in play
+    bonus_hand_rank: ThreeCardHandRank | None = None
+    if bonus_bet > 0 and bonus_paytable is not None:
+        bonus_hand_rank = evaluate_three_card_hand(player_cards)
+
+    # Steps 5-7: Settle bets at risk, payouts and net result
+    return settle_hand(
+        decision_bet1=decision_bet1,
+        decision_bet2=decision_bet2,
+        final_hand_rank=final_hand_rank,
+        bonus_hand_rank=bonus_hand_rank,
+        main_paytable=main_paytable,
+        bonus_paytable=bonus_paytable,
+        base_bet=base_bet,
+        bonus_bet=bonus_bet,
+    )
+
 
-    # Step 4: Calculate bets at risk and main game payout
+def process_hand_code_decisions_and_payouts(
+    player_codes: tuple[int, int, int],
+    community_codes: tuple[int, int],
+    strategy: Strategy,
+    main_paytable: MainGamePaytable,
+    bonus_paytable: BonusPaytable | None,
+    base_bet: float,
+    bonus_bet: float,
+    context: StrategyContext,
+) -> HandProcessingResult:
+    """Process a hand dealt as integer card codes.
+
+    Integer-code counterpart of process_hand_decisions_and_payouts(): the
+    same decisions and payouts, computed with the code-based analysis and
+    lookup evaluators so no Card objects are touched. A CompiledStrategy
+    decides straight from the card codes, skipping hand analysis.
+
+    Args:
+        player_codes: Player's 3 dealt card codes (see card_to_int).
+        community_codes: The 2 community card codes.
+        strategy: Strategy for making pull/ride decisions.
+        main_paytable: Paytable for main game payouts.
+        bonus_paytable: Paytable for bonus bet payouts (None if no bonus).
+        base_bet: The bet amount per circle.
+        bonus_bet: The bonus bet amount (0 if no bonus).
+        context: Strategy context for decision making.
+
+    Returns:
+        HandProcessingResult with all calculated values.
+    """
+    four_codes = (*player_codes, community_codes[0])
+    if isinstance(strategy, CompiledStrategy):
+        # Decision tables are indexed by card codes directly, no analysis needed
+        decision_bet1 = strategy.decide_bet1_codes(player_codes, context)
+        decision_bet2 = strategy.decide_bet2_codes(four_codes, context)
+    else:
+        decision_bet1 = strategy.decide_bet1(
+            analyze_three_card_codes(player_codes), context
+        )
+        decision_bet2 = strategy.decide_bet2(
+            analyze_four_card_codes(four_codes), context
+        )
+    final_hand_rank = evaluate_five_card_rank_codes((*player_codes, *community_codes))
+
+    bonus_hand_rank: ThreeCardHandRank | None = None
+    if bonus_bet > 0 and bonus_paytable is not None:
+        bonus_hand_rank = evaluate_three_card_hand_codes(player_codes)
+
+    return settle_hand(
+        decision_bet1=decision_bet1,
+        decision_bet2=decision_bet2,
+        final_hand_rank=final_hand_rank,
+        bonus_hand_rank=bonus_hand_rank,
+        main_paytable=main_paytable,
+        bonus_paytable=bonus_paytable,
+        base_bet=base_bet,
+        bonus_bet=bonus_bet,
+    )
+
+
+def settle_hand(
+    decision_bet1: Decision,
+    decision_bet2: Decision,
+    final_hand_rank: FiveCardHandRank,
+    bonus_hand_rank: ThreeCardHandRank | None,
+    main_paytable: MainGamePaytable,
+    bonus_paytable: BonusPaytable | None,
+    base_bet: float,
+    bonus_bet: float,
+) -> HandProcessingResult:
+    """Calculate bets at risk, payouts and net result for an evaluated hand.
+
+    bonus_hand_rank must be None unless a bonus bet was placed against a
+    configured bonus paytable.
+    """
+    # Calculate bets at risk and main game payout
     bet1_active = decision_bet1 == Decision.RIDE
     bet2_active = decision_bet2 == Decision.RIDE
     # Bet 3 is always active
@@ -104,15 +218,13 @@ def process_hand_decisions_and_payouts(
 
     main_payout = main_paytable.calculate_payout(final_hand_rank, bets_at_risk)
 
-    # Step 5: Evaluate bonus if applicable
-    bonus_hand_rank: ThreeCardHandRank | None = None
+    # Calculate bonus payout if applicable
     bonus_payout = 0.0
 
-    if bonus_bet > 0 and bonus_paytable is not None:
-        bonus_hand_rank = evaluate_three_card_hand(player_cards)
+    if bonus_hand_rank is not None and bonus_paytable is not None:
         bonus_payout = bonus_paytable.calculate_payout(bonus_hand_rank, bonus_bet)
 
-    # Step 6: Calculate net result
+    # Calculate net result
     # main_payout is pure profit (0 for losing hands)
     # If payout > 0, player wins; if 0, player loses their stake
     main_net = main_payout if main_payout > 0 else -bets_at_risk
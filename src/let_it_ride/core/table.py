@@ -11,7 +11,7 @@ from let_it_ride.config.models import DealerConfig, TableConfig
 from let_it_ride.config.paytables import BonusPaytable, MainGamePaytable
 from let_it_ride.core.card import Card
 from let_it_ride.core.deck import Deck
-from let_it_ride.core.hand_evaluator import FiveCardHandRank
+from let_it_ride.core.hand_evaluator import FiveCardHandRank, FiveCardRankEvaluator
 from let_it_ride.core.hand_processing import process_hand_decisions_and_payouts
 from let_it_ride.core.three_card_evaluator import ThreeCardHandRank
 from let_it_ride.strategy.base import Decision, Strategy, StrategyContext
@@ -88,6 +88,7 @@ class Table:
         rng: random.Random,
         table_config: TableConfig | None = None,
         dealer_config: DealerConfig | None = None,
+        rank_evaluator: FiveCardRankEvaluator | None = None,
     ) -> None:
         """Initialize the table.
 
@@ -99,6 +100,9 @@ class Table:
             rng: Random number generator for shuffling.
             table_config: Optional table configuration. Defaults to single seat.
             dealer_config: Optional dealer configuration for discard mechanics.
+            rank_evaluator: Optional rank-only 5-card evaluator. Pass
+                evaluate_five_card_rank to use the lookup-table evaluator.
+                If None, evaluate_five_card_hand is used.
         """
         self._deck = deck
         self._strategy = strategy
@@ -111,6 +115,7 @@ class Table:
         self._dealer_config = (
             dealer_config if dealer_config is not None else _DEFAULT_DEALER_CONFIG
         )
+        self._rank_evaluator = rank_evaluator
         self._last_discarded_cards: list[Card] = []
 
     def play_round(
@@ -233,6 +238,7 @@ class Table:
             base_bet=base_bet,
             bonus_bet=bonus_bet,
             context=context,
+            rank_evaluator=self._rank_evaluator,
         )
 
         return PlayerSeat(
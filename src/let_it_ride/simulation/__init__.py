@@ -4,25 +4,50 @@ This module contains session and simulation management:
 - Session state management with stop conditions
 - Table session for multi-player management
 - Simulation controller for running multiple sessions
+- Common-random-numbers runner for paired comparisons of configurations
 - Parallel execution support
-- Results aggregation
+- Results aggregation with mergeable streaming accumulators
+- Exact session statistics without sampling
+- Paytable what-if reweighting of recorded runs
 - Hand records and result data structures
+- Columnar session result tables
+- Checkpointing and resuming of long runs
 """
 
+from let_it_ride.simulation.accumulators import (
+    ExactSum,
+    QuantileSketch,
+    RunningMoments,
+)
 from let_it_ride.simulation.aggregation import (
+    AggregateAccumulator,
     AggregateStatistics,
     aggregate_results,
     aggregate_with_hand_frequencies,
     merge_aggregates,
 )
+from let_it_ride.simulation.checkpoint import SimulationCheckpoint
+from let_it_ride.simulation.common_random import (
+    SharedDealEngine,
+    SharedDealer,
+    run_common_random_sessions,
+)
 from let_it_ride.simulation.controller import (
+    AggregatedSimulationResults,
     ControllerHandCallback,
     ProgressCallback,
+    SessionSink,
     SimulationController,
     SimulationResults,
     create_betting_system,
     create_strategy,
 )
+from let_it_ride.simulation.exact_session import (
+    ExactSessionStatistics,
+    calculate_exact_session_statistics,
+    calculate_session_distribution,
+)
+from let_it_ride.simulation.result_table import SessionResultTable
 from let_it_ride.simulation.results import (
     HandRecord,
     count_hand_distribution,
@@ -31,6 +56,12 @@ from let_it_ride.simulation.results import (
     count_hand_distribution_from_records,
     get_decision_from_string,
 )
+from let_it_ride.simulation.reweighting import (
+    PaytableHistogramRecorder,
+    PaytableHistograms,
+    record_paytable_histograms,
+    reweight_paytables,
+)
 from let_it_ride.simulation.rng import (
     RNGManager,
     RNGQualityResult,
@@ -54,18 +85,31 @@ from let_it_ride.simulation.table_session import (
 )
 
 __all__ = [
+    "AggregateAccumulator",
     "AggregateStatistics",
+    "AggregatedSimulationResults",
     "ControllerHandCallback",
+    "ExactSessionStatistics",
+    "ExactSum",
     "HandCallback",
     "HandRecord",
+    "PaytableHistogramRecorder",
+    "PaytableHistograms",
     "ProgressCallback",
+    "QuantileSketch",
     "RNGManager",
     "RNGQualityResult",
+    "RunningMoments",
     "SeatSessionResult",
     "Session",
     "SessionConfig",
     "SessionOutcome",
     "SessionResult",
+    "SessionResultTable",
+    "SessionSink",
+    "SharedDealEngine",
+    "SharedDealer",
+    "SimulationCheckpoint",
     "SimulationController",
     "SimulationResults",
     "StopReason",
@@ -74,7 +118,9 @@ __all__ = [
     "TableSessionResult",
     "aggregate_results",
     "aggregate_with_hand_frequencies",
+    "calculate_exact_session_statistics",
     "calculate_new_streak",
+    "calculate_session_distribution",
     "count_hand_distribution",
     "count_hand_distribution_from_game_results",
     "count_hand_distribution_from_ranks",
@@ -83,6 +129,9 @@ __all__ = [
     "create_strategy",
     "get_decision_from_string",
     "merge_aggregates",
+    "record_paytable_histograms",
+    "reweight_paytables",
+    "run_common_random_sessions",
     "validate_rng_quality",
     "validate_session_config",
 ]
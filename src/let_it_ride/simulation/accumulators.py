@@ -0,0 +1,613 @@
+"""Mergeable online accumulators for session statistics.
+
+This module provides constant-memory summaries that can be updated one
+value at a time, fed NumPy arrays, and merged across workers:
+- ExactSum: Sum of floats, kept exactly and rounded once when read
+- RunningMoments: Count, mean, variance, skewness, kurtosis, min and max
+  (from exact power sums)
+- QuantileSketch: Relative-error quantile sketch (DDSketch-style
+  logarithmic buckets) for medians and percentiles
+
+All are deterministic: the same values give the same summary, bit for bit,
+regardless of how they were batched or in which order partial summaries
+were merged. Every finite float is an integer multiple of a power of two,
+so ExactSum and RunningMoments hold integer multiples of 2**-scale, where
+scale is the largest number of fractional binary digits seen, and never
+round until a statistic is read.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from numpy.typing import NDArray
+
+# Default relative accuracy of QuantileSketch quantile estimates (0.1%)
+DEFAULT_RELATIVE_ACCURACY: float = 0.001
+
+# Magnitudes below this are counted as zero by QuantileSketch
+_MIN_INDEXABLE_VALUE: float = 1e-9
+
+
+def _scaled_numerator(value: float) -> tuple[int, int]:
+    """Return (numerator, scale) with value == numerator * 2**-scale.
+
+    Raises:
+        ValueError: If value is NaN.
+        OverflowError: If value is infinite.
+    """
+    numerator, denominator = value.as_integer_ratio()
+    return numerator, denominator.bit_length() - 1
+
+
+class ExactSum:
+    """Exact running sum of floats.
+
+    The sum is an integer multiple of 2**-scale, so adding and merging
+    never round and the result does not depend on the order of the values.
+    The value is rounded to the nearest float when read.
+    """
+
+    __slots__ = ("_numerator", "_scale")
+
+    def __init__(self) -> None:
+        """Initialize a zero sum."""
+        self._numerator = 0
+        self._scale = 0
+
+    @property
+    def value(self) -> float:
+        """Return the sum, correctly rounded to a float."""
+        return self._numerator / (1 << self._scale)
+
+    def add(self, value: float) -> None:
+        """Add one finite value.
+
+        Args:
+            value: The value to add.
+        """
+        self._add_scaled(*_scaled_numerator(value))
+
+    def add_array(self, values: NDArray[np.floating[Any]]) -> None:
+        """Add every value of an array.
+
+        Args:
+            values: One-dimensional array of finite values.
+        """
+        for value in values.tolist():
+            self._add_scaled(*_scaled_numerator(value))
+
+    def merge(self, other: ExactSum) -> None:
+        """Add another sum to this one.
+
+        Args:
+            other: The sum to merge. It is not modified.
+        """
+        self._add_scaled(other._numerator, other._scale)
+
+    def _add_scaled(self, numerator: int, scale: int) -> None:
+        """Add numerator * 2**-scale."""
+        if scale > self._scale:
+            self._numerator <<= scale - self._scale
+            self._scale = scale
+        self._numerator += numerator << (self._scale - scale)
+
+    def copy(self) -> ExactSum:
+        """Return an independent copy."""
+        duplicate = ExactSum()
+        duplicate.merge(self)
+        return duplicate
+
+    def __eq__(self, other: object) -> bool:
+        """Return True if both sums are equal."""
+        if not isinstance(other, ExactSum):
+            return NotImplemented
+        return (self._numerator << other._scale) == (other._numerator << self._scale)
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+class RunningMoments:
+    """Running count, mean, central moments, min and max of a stream.
+
+    Memory is constant. The sums of the values and of their squares, cubes
+    and fourth powers are kept exactly (see ExactSum), and the moments are
+    derived from them when read, so they are the same however the values
+    were batched or merged. Skewness and kurtosis are sample-adjusted,
+    matching scipy.stats.skew(bias=False) and scipy.stats.kurtosis(bias=False).
+    """
+
+    __slots__ = ("_count", "_scale", "_sum1", "_sum2", "_sum3", "_sum4", "_min", "_max")
+
+    def __init__(self) -> None:
+        """Initialize an empty accumulator."""
+        self._count = 0
+        # _sumP is the sum of (value * 2**_scale)**P
+        self._scale = 0
+        self._sum1 = 0
+        self._sum2 = 0
+        self._sum3 = 0
+        self._sum4 = 0
+        self._min = math.inf
+        self._max = -math.inf
+
+    @classmethod
+    def from_values(cls, values: Iterable[float] | NDArray[Any]) -> RunningMoments:
+        """Create an accumulator holding the given values.
+
+        Args:
+            values: Values to summarize.
+
+        Returns:
+            A new RunningMoments.
+        """
+        moments = cls()
+        moments.add_array(np.asarray(values, dtype=np.float64))
+        return moments
+
+    @property
+    def count(self) -> int:
+        """Return the number of values seen."""
+        return self._count
+
+    @property
+    def mean(self) -> float:
+        """Return the mean (0.0 if empty)."""
+        if self._count == 0:
+            return 0.0
+        return self._sum1 / (self._count << self._scale)
+
+    @property
+    def variance(self) -> float:
+        """Return the sample variance (0.0 with fewer than 2 values)."""
+        n = self._count
+        if n < 2:
+            return 0.0
+        return self._central_sums()[0] / (n * (n - 1) << 2 * self._scale)
+
+    @property
+    def std(self) -> float:
+        """Return the sample standard deviation (0.0 with fewer than 2 values)."""
+        return math.sqrt(self.variance)
+
+    @property
+    def skewness(self) -> float:
+        """Return the sample-adjusted skewness (0.0 if undefined)."""
+        n = self._count
+        if n < 3:
+            return 0.0
+        m2, m3, _ = self._central_moments()
+        if m2 <= 0:
+            return 0.0
+        g1 = math.sqrt(n) * m3 / math.pow(m2, 1.5)
+        return g1 * math.sqrt(n * (n - 1)) / (n - 2)
+
+    @property
+    def kurtosis(self) -> float:
+        """Return the sample-adjusted excess kurtosis (0.0 if undefined)."""
+        n = self._count
+        if n < 4:
+            return 0.0
+        m2, _, m4 = self._central_moments()
+        if m2 <= 0:
+            return 0.0
+        g2 = n * m4 / m2**2 - 3.0
+        return ((n + 1) * g2 + 6.0) * (n - 1) / ((n - 2) * (n - 3))
+
+    @property
+    def min(self) -> float:
+        """Return the smallest value (0.0 if empty)."""
+        return self._min if self._count else 0.0
+
+    @property
+    def max(self) -> float:
+        """Return the largest value (0.0 if empty)."""
+        return self._max if self._count else 0.0
+
+    def _central_sums(self) -> tuple[int, int, int]:
+        """Return exact scaled sums of squared, cubed and fourth deviations.
+
+        With n values, the sums of deviations from the mean to the 2nd, 3rd
+        and 4th power are these integers divided by n * 4**scale,
+        n**2 * 8**scale and n**3 * 16**scale respectively.
+        """
+        n = self._count
+        s1, s2, s3, s4 = self._sum1, self._sum2, self._sum3, self._sum4
+        s1_squared = s1 * s1
+        c2 = n * s2 - s1_squared
+        c3 = n * n * s3 - 3 * n * s1 * s2 + 2 * s1_squared * s1
+        c4 = (
+            n * n * n * s4
+            - 4 * n * n * s1 * s3
+            + 6 * n * s1_squared * s2
+            - 3 * s1_squared * s1_squared
+        )
+        return c2, c3, c4
+
+    def _central_moments(self) -> tuple[float, float, float]:
+        """Return the sums of deviations to the 2nd, 3rd and 4th power."""
+        n = self._count
+        scale = self._scale
+        c2, c3, c4 = self._central_sums()
+        return (
+            c2 / (n << 2 * scale),
+            c3 / (n * n << 3 * scale),
+            c4 / (n * n * n << 4 * scale),
+        )
+
+    def _rescale(self, scale: int) -> None:
+        """Raise the common scale of the power sums to scale."""
+        shift = scale - self._scale
+        if shift <= 0:
+            return
+        self._sum1 <<= shift
+        self._sum2 <<= 2 * shift
+        self._sum3 <<= 3 * shift
+        self._sum4 <<= 4 * shift
+        self._scale = scale
+
+    def add(self, value: float) -> None:
+        """Add one finite value.
+
+        Args:
+            value: The value to add.
+        """
+        numerator, scale = _scaled_numerator(value)
+        if scale > self._scale:
+            self._rescale(scale)
+        else:
+            numerator <<= self._scale - scale
+        square = numerator * numerator
+        self._sum1 += numerator
+        self._sum2 += square
+        self._sum3 += square * numerator
+        self._sum4 += square * square
+        self._count += 1
+        if value < self._min:
+            self._min = value
+        if value > self._max:
+            self._max = value
+
+    def add_array(self, values: NDArray[np.floating[Any]]) -> None:
+        """Add every value of an array.
+
+        Args:
+            values: One-dimensional array of finite values.
+        """
+        for value in values.tolist():
+            self.add(value)
+
+    def merge(self, other: RunningMoments) -> None:
+        """Fold another accumulator's values into this one.
+
+        Args:
+            other: The accumulator to merge. It is not modified.
+        """
+        if other._count == 0:
+            return
+        self._rescale(other._scale)
+        shift = self._scale - other._scale
+        self._sum1 += other._sum1 << shift
+        self._sum2 += other._sum2 << 2 * shift
+        self._sum3 += other._sum3 << 3 * shift
+        self._sum4 += other._sum4 << 4 * shift
+        self._count += other._count
+        self._min = min(self._min, other._min)
+        self._max = max(self._max, other._max)
+
+    def copy(self) -> RunningMoments:
+        """Return an independent copy."""
+        duplicate = RunningMoments()
+        duplicate.merge(self)
+        return duplicate
+
+    def __eq__(self, other: object) -> bool:
+        """Return True if both accumulators hold the same summary."""
+        if not isinstance(other, RunningMoments):
+            return NotImplemented
+        return all(
+            getattr(self, slot) == getattr(other, slot) for slot in self.__slots__
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+class QuantileSketch:
+    """Mergeable quantile sketch with a relative error guarantee.
+
+    Values are counted in logarithmic buckets (DDSketch): a positive value
+    x falls in bucket ceil(log(x) / log(gamma)) with
+    gamma = (1 + relative_accuracy) / (1 - relative_accuracy), negative
+    values in a mirrored set of buckets, and magnitudes below 1e-9 in a
+    zero bucket. Any quantile estimate q_hat of a value q satisfies
+    |q_hat - q| <= relative_accuracy * |q|, where q is the exact value of
+    rank floor(quantile * (count - 1)).
+
+    Memory grows with the logarithm of the value range, not with the
+    number of values: at most about ln(max|x| / min|x|) / (2 *
+    relative_accuracy) buckets per sign (about 12,000 per sign for
+    magnitudes between 0.01 and one million at the default 0.1%).
+    Merging adds bucket counts, so merged sketches are identical to a
+    sketch built from all the values at once.
+    """
+
+    __slots__ = (
+        "_relative_accuracy",
+        "_log_gamma",
+        "_positive",
+        "_negative",
+        "_zero_count",
+        "_count",
+        "_min",
+        "_max",
+    )
+
+    def __init__(self, relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY) -> None:
+        """Initialize an empty sketch.
+
+        Args:
+            relative_accuracy: Relative error bound of quantile estimates,
+                between 0 and 1 (exclusive).
+
+        Raises:
+            ValueError: If relative_accuracy is not between 0 and 1.
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError(
+                f"relative_accuracy must be between 0 and 1, got {relative_accuracy}"
+            )
+        self._relative_accuracy = relative_accuracy
+        gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(gamma)
+        self._positive: dict[int, int] = {}
+        self._negative: dict[int, int] = {}
+        self._zero_count = 0
+        self._count = 0
+        self._min = math.inf
+        self._max = -math.inf
+
+    @classmethod
+    def from_values(
+        cls,
+        values: Iterable[float] | NDArray[Any],
+        relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+    ) -> QuantileSketch:
+        """Create a sketch of the given values.
+
+        Args:
+            values: Values to summarize.
+            relative_accuracy: Relative error bound of quantile estimates.
+
+        Returns:
+            A new QuantileSketch.
+        """
+        sketch = cls(relative_accuracy)
+        sketch.add_array(np.asarray(values, dtype=np.float64))
+        return sketch
+
+    @property
+    def relative_accuracy(self) -> float:
+        """Return the relative error bound of quantile estimates."""
+        return self._relative_accuracy
+
+    @property
+    def count(self) -> int:
+        """Return the number of values seen."""
+        return self._count
+
+    @property
+    def min(self) -> float:
+        """Return the smallest value (0.0 if empty)."""
+        return self._min if self._count else 0.0
+
+    @property
+    def max(self) -> float:
+        """Return the largest value (0.0 if empty)."""
+        return self._max if self._count else 0.0
+
+    @property
+    def num_buckets(self) -> int:
+        """Return the number of non-empty buckets."""
+        return len(self._positive) + len(self._negative) + (self._zero_count > 0)
+
+    def _key(self, magnitude: float) -> int:
+        """Return the bucket index of a positive magnitude."""
+        return math.ceil(math.log(magnitude) / self._log_gamma)
+
+    def _bucket_value(self, key: int) -> float:
+        """Return the representative magnitude of a bucket."""
+        # Midpoint (in relative terms) of (gamma^(key - 1), gamma^key]
+        gamma = math.exp(self._log_gamma)
+        return 2.0 * math.exp(key * self._log_gamma) / (gamma + 1.0)
+
+    def add(self, value: float, count: int = 1) -> None:
+        """Add a value, optionally several times.
+
+        Args:
+            value: The value to add.
+            count: Number of times to add it.
+        """
+        if count <= 0:
+            return
+        if value > _MIN_INDEXABLE_VALUE:
+            key = self._key(value)
+            self._positive[key] = self._positive.get(key, 0) + count
+        elif value < -_MIN_INDEXABLE_VALUE:
+            key = self._key(-value)
+            self._negative[key] = self._negative.get(key, 0) + count
+        else:
+            self._zero_count += count
+        self._count += count
+        if value < self._min:
+            self._min = value
+        if value > self._max:
+            self._max = value
+
+    def add_array(self, values: NDArray[np.floating[Any]]) -> None:
+        """Add every value of an array.
+
+        Args:
+            values: One-dimensional array of values.
+        """
+        if len(values) == 0:
+            return
+        for sign, store in ((1.0, self._positive), (-1.0, self._negative)):
+            magnitudes = values[sign * values > _MIN_INDEXABLE_VALUE] * sign
+            if len(magnitudes) == 0:
+                continue
+            keys, counts = np.unique(
+                np.ceil(np.log(magnitudes) / self._log_gamma).astype(np.int64),
+                return_counts=True,
+            )
+            for key, count in zip(keys.tolist(), counts.tolist(), strict=True):
+                store[key] = store.get(key, 0) + count
+        self._zero_count += int(
+            np.count_nonzero(np.abs(values) <= _MIN_INDEXABLE_VALUE)
+        )
+        self._count += len(values)
+        self._min = min(self._min, float(values.min()))
+        self._max = max(self._max, float(values.max()))
+
+    def merge(self, other: QuantileSketch) -> None:
+        """Fold another sketch's values into this one.
+
+        Args:
+            other: The sketch to merge. It is not modified.
+
+        Raises:
+            ValueError: If the sketches use different relative accuracies.
+        """
+        if other._relative_accuracy != self._relative_accuracy:
+            raise ValueError(
+                "Cannot merge sketches with different relative accuracies "
+                f"({self._relative_accuracy} and {other._relative_accuracy})"
+            )
+        for store, other_store in (
+            (self._positive, other._positive),
+            (self._negative, other._negative),
+        ):
+            for key, count in other_store.items():
+                store[key] = store.get(key, 0) + count
+        self._zero_count += other._zero_count
+        self._count += other._count
+        self._min = min(self._min, other._min)
+        self._max = max(self._max, other._max)
+
+    def copy(self) -> QuantileSketch:
+        """Return an independent copy."""
+        duplicate = QuantileSketch(self._relative_accuracy)
+        duplicate.merge(self)
+        return duplicate
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile.
+
+        Args:
+            q: Quantile between 0 and 1 (0.5 for the median).
+
+        Returns:
+            Estimated value, clamped to the observed [min, max]. Returns 0.0
+            for an empty sketch.
+
+        Raises:
+            ValueError: If q is not between 0 and 1.
+        """
+        if not 0 <= q <= 1:
+            raise ValueError(f"q must be between 0 and 1, got {q}")
+        if self._count == 0:
+            return 0.0
+        if q == 0:
+            return self._min
+        if q == 1:
+            return self._max
+
+        rank = math.floor(q * (self._count - 1))
+        seen = 0
+        # Ascending order: large negative magnitudes first, then zero, then
+        # positive magnitudes
+        for key in sorted(self._negative, reverse=True):
+            seen += self._negative[key]
+            if seen > rank:
+                return self._clamp(-self._bucket_value(key))
+        seen += self._zero_count
+        if seen > rank:
+            return self._clamp(0.0)
+        for key in sorted(self._positive):
+            seen += self._positive[key]
+            if seen > rank:
+                return self._clamp(self._bucket_value(key))
+        return self._max
+
+    def quantiles(self, qs: Iterable[float]) -> list[float]:
+        """Estimate several quantiles.
+
+        Args:
+            qs: Quantiles between 0 and 1.
+
+        Returns:
+            Estimated values in the same order.
+        """
+        return [self.quantile(q) for q in qs]
+
+    def count_below(self, value: float, inclusive: bool = False) -> int:
+        """Estimate how many values are below a threshold.
+
+        Buckets entirely on one side of the threshold are counted exactly;
+        the bucket containing the threshold is counted only if inclusive,
+        so values equal to the threshold are classified correctly and only
+        values within relative_accuracy of it can be misclassified. Signs
+        are kept exactly, so count_below(0.0) is exact (magnitudes below
+        1e-9 count as zero).
+
+        Args:
+            value: The threshold.
+            inclusive: Also count values equal to the threshold.
+
+        Returns:
+            Estimated number of values < value (<= value if inclusive).
+        """
+        if self._count == 0 or value < self._min:
+            return 0
+        if value > self._max or (inclusive and value == self._max):
+            return self._count
+
+        if value > _MIN_INDEXABLE_VALUE:
+            threshold = self._key(value)
+            return (
+                sum(self._negative.values())
+                + self._zero_count
+                + sum(
+                    count
+                    for key, count in self._positive.items()
+                    if key < threshold or (inclusive and key == threshold)
+                )
+            )
+        if value >= -_MIN_INDEXABLE_VALUE:
+            zeros = self._zero_count if inclusive else 0
+            return sum(self._negative.values()) + zeros
+        threshold = self._key(-value)
+        return sum(
+            count
+            for key, count in self._negative.items()
+            if key > threshold or (inclusive and key == threshold)
+        )
+
+    def _clamp(self, value: float) -> float:
+        """Clamp an estimate to the observed range."""
+        return min(max(value, self._min), self._max)
+
+    def __eq__(self, other: object) -> bool:
+        """Return True if both sketches hold the same counts."""
+        if not isinstance(other, QuantileSketch):
+            return NotImplemented
+        return all(
+            getattr(self, slot) == getattr(other, slot) for slot in self.__slots__
+        )
+
+    __hash__ = None  # type: ignore[assignment]
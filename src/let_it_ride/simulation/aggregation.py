@@ -2,8 +2,14 @@
 
 This module provides aggregation of results across multiple sessions:
 - AggregateStatistics: Summary statistics across all sessions
-- aggregate_results(): Process list of SessionResults into statistics
+- AggregateAccumulator: Constant-memory, mergeable per-session accumulator
+- aggregate_results(): Process SessionResults (or a SessionResultTable) into statistics
 - merge_aggregates(): Combine two aggregates for parallel execution support
+
+Session profit statistics come either from the raw profits (exact mode) or
+from RunningMoments and a QuantileSketch, which take constant memory and
+merge without the raw profits; the median is then accurate to the sketch's
+relative accuracy (0.1% by default).
 """
 
 from __future__ import annotations
@@ -11,8 +17,21 @@ from __future__ import annotations
 from collections import Counter
 from dataclasses import dataclass, replace
 from statistics import mean, median, stdev
+from typing import TYPE_CHECKING
+
+import numpy as np
 
-from let_it_ride.simulation.session import SessionOutcome, SessionResult
+from let_it_ride.simulation.accumulators import (
+    DEFAULT_RELATIVE_ACCURACY,
+    ExactSum,
+    QuantileSketch,
+    RunningMoments,
+)
+from let_it_ride.simulation.result_table import SessionResultTable
+from let_it_ride.simulation.session import SessionOutcome, SessionResult, StopReason
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
 
 
 def _calculate_frequency_percentages(frequencies: dict[str, int]) -> dict[str, float]:
@@ -65,8 +84,12 @@ class AggregateStatistics:
         session_profit_min: Minimum session profit.
         session_profit_max: Maximum session profit.
 
-        session_profits: Tuple of individual session profits (for merge support).
-            Note: Retained for accurate statistics when merging aggregates.
+        session_profits: Tuple of individual session profits in exact mode,
+            empty when aggregated with constant memory.
+        profit_moments: Running moments of session profits (for merging).
+        profit_sketch: Quantile sketch of session profits (for merging).
+            Both are None only for instances built by hand, in which case
+            merges rebuild them from session_profits.
     """
 
     # Session metrics
@@ -106,11 +129,353 @@ class AggregateStatistics:
     session_profit_min: float
     session_profit_max: float
 
-    # Internal: keep session profits for merge support
+    # Internal: session profits in exact mode, and mergeable summaries
     session_profits: tuple[float, ...]
+    profit_moments: RunningMoments | None = None
+    profit_sketch: QuantileSketch | None = None
+
+    @property
+    def is_exact(self) -> bool:
+        """Return True if every session profit is retained."""
+        return len(self.session_profits) == self.total_sessions
+
+    def profit_summaries(self) -> tuple[RunningMoments, QuantileSketch]:
+        """Return the mergeable summaries of session profits.
+
+        Returns:
+            Tuple of (RunningMoments, QuantileSketch), built from
+            session_profits when the instance does not carry them.
+
+        Raises:
+            ValueError: If the summaries are missing and the session
+                profits were not retained.
+        """
+        if self.profit_moments is not None and self.profit_sketch is not None:
+            return self.profit_moments, self.profit_sketch
+        if not self.is_exact:
+            raise ValueError(
+                "AggregateStatistics has neither profit summaries nor session profits"
+            )
+        return (
+            RunningMoments.from_values(self.session_profits),
+            QuantileSketch.from_values(self.session_profits),
+        )
+
+
+def _profit_statistics(
+    moments: RunningMoments,
+    sketch: QuantileSketch,
+    exact_profits: tuple[float, ...] | None,
+) -> tuple[float, float, float, float, float]:
+    """Return (mean, std, median, min, max) of session profits.
+
+    Exact profits, when given, are used in preference to the summaries.
+    """
+    if exact_profits is not None:
+        if not exact_profits:
+            return 0.0, 0.0, 0.0, 0.0, 0.0
+        return (
+            mean(exact_profits),
+            stdev(exact_profits) if len(exact_profits) > 1 else 0.0,
+            median(exact_profits),
+            min(exact_profits),
+            max(exact_profits),
+        )
+    return (
+        moments.mean,
+        moments.std,
+        sketch.quantile(0.5),
+        moments.min,
+        moments.max,
+    )
+
+
+class _SeatAggregation:
+    """Mutable accumulator for per-seat data during aggregation.
+
+    This is a lightweight class used internally by AggregateAccumulator
+    and aggregate_with_seats().
+    """
+
+    __slots__ = ("wins", "losses", "pushes", "profit")
+
+    def __init__(self) -> None:
+        self.wins: int = 0
+        self.losses: int = 0
+        self.pushes: int = 0
+        self.profit = ExactSum()
+
+    @property
+    def total_rounds(self) -> int:
+        """Total rounds (sessions) played at this seat."""
+        return self.wins + self.losses + self.pushes
+
+    @property
+    def total_profit(self) -> float:
+        """Total profit across all rounds at this seat."""
+        return self.profit.value
+
+    def merge(self, other: _SeatAggregation) -> None:
+        """Fold another seat's tallies into this one."""
+        self.wins += other.wins
+        self.losses += other.losses
+        self.pushes += other.pushes
+        self.profit.merge(other.profit)
+
+
+class AggregateAccumulator:
+    """Accumulates AggregateStatistics one session at a time.
+
+    Memory is constant unless exact_profits is set, in which case every
+    session profit is also kept so that the median and standard deviation
+    are exact. Alongside the statistics, the accumulator tallies stop
+    reasons and per-seat outcomes (for chair position analysis).
+    Accumulators can be merged, e.g. one per worker. Money totals and
+    profit moments are kept exactly, so the statistics do not depend on
+    how the sessions were split between accumulators or the merge order.
+    """
+
+    __slots__ = (
+        "_winning_sessions",
+        "_losing_sessions",
+        "_push_sessions",
+        "_total_hands",
+        "_main_wagered",
+        "_bonus_wagered",
+        "_net_result",
+        "_moments",
+        "_sketch",
+        "_profits",
+        "_stop_reasons",
+        "_seats",
+    )
+
+    def __init__(
+        self,
+        exact_profits: bool = False,
+        relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+    ) -> None:
+        """Initialize an empty accumulator.
+
+        Args:
+            exact_profits: Keep every session profit for exact statistics.
+            relative_accuracy: Relative accuracy of the profit sketch.
+        """
+        self._winning_sessions = 0
+        self._losing_sessions = 0
+        self._push_sessions = 0
+        self._total_hands = 0
+        self._main_wagered = ExactSum()
+        self._bonus_wagered = ExactSum()
+        self._net_result = ExactSum()
+        self._moments = RunningMoments()
+        self._sketch = QuantileSketch(relative_accuracy)
+        self._profits: list[float] | None = [] if exact_profits else None
+        self._stop_reasons: Counter[StopReason] = Counter()
+        self._seats: dict[int, _SeatAggregation] = {}
+
+    @property
+    def total_sessions(self) -> int:
+        """Return the number of sessions accumulated."""
+        return self._winning_sessions + self._losing_sessions + self._push_sessions
+
+    @property
+    def total_hands(self) -> int:
+        """Return the number of hands played across accumulated sessions."""
+        return self._total_hands
 
+    @property
+    def stop_reason_counts(self) -> dict[StopReason, int]:
+        """Return the number of sessions that ended for each stop reason."""
+        return dict(self._stop_reasons)
 
-def aggregate_results(results: list[SessionResult]) -> AggregateStatistics:
+    @property
+    def seat_aggregations(self) -> dict[int, _SeatAggregation]:
+        """Return per-seat tallies keyed by seat number.
+
+        Empty unless the sessions carried seat numbers (multi-seat tables).
+        The tallies are live; callers must not modify them.
+        """
+        return dict(self._seats)
+
+    def add(self, result: SessionResult) -> None:
+        """Add one session result.
+
+        Args:
+            result: The session result to add.
+        """
+        if result.outcome == SessionOutcome.WIN:
+            self._winning_sessions += 1
+        elif result.outcome == SessionOutcome.LOSS:
+            self._losing_sessions += 1
+        else:
+            self._push_sessions += 1
+        self._total_hands += result.hands_played
+        self._main_wagered.add(result.total_wagered)
+        self._bonus_wagered.add(result.total_bonus_wagered)
+        profit = result.session_profit
+        self._net_result.add(profit)
+        self._moments.add(profit)
+        self._sketch.add(profit)
+        if self._profits is not None:
+            self._profits.append(profit)
+        self._stop_reasons[result.stop_reason] += 1
+        if result.seat_number is not None:
+            seat = self._seats.get(result.seat_number)
+            if seat is None:
+                seat = _SeatAggregation()
+                self._seats[result.seat_number] = seat
+            if result.outcome == SessionOutcome.WIN:
+                seat.wins += 1
+            elif result.outcome == SessionOutcome.LOSS:
+                seat.losses += 1
+            else:
+                seat.pushes += 1
+            seat.profit.add(profit)
+
+    def add_results(self, results: Iterable[SessionResult]) -> None:
+        """Add several session results.
+
+        Args:
+            results: The session results to add, in order. A
+                SessionResultTable is added column-wise (see add_table()).
+        """
+        if isinstance(results, SessionResultTable):
+            self.add_table(results)
+            return
+        for result in results:
+            self.add(result)
+
+    def add_table(self, table: SessionResultTable) -> None:
+        """Add every row of a SessionResultTable using its columns.
+
+        Args:
+            table: The session results to add.
+        """
+        outcomes = table.outcome_counts()
+        self._winning_sessions += outcomes[SessionOutcome.WIN]
+        self._losing_sessions += outcomes[SessionOutcome.LOSS]
+        self._push_sessions += outcomes[SessionOutcome.PUSH]
+        self._total_hands += int(table.column("hands_played").sum(dtype=np.int64))
+        self._main_wagered.add_array(table.column("total_wagered"))
+        self._bonus_wagered.add_array(table.column("total_bonus_wagered"))
+        profits = table.column("session_profit")
+        self._net_result.add_array(profits)
+        self._moments.add_array(profits)
+        self._sketch.add_array(profits)
+        if self._profits is not None:
+            self._profits.extend(profits.tolist())
+        self._stop_reasons.update(table.stop_reason_counts())
+        seat_numbers = table.column("seat_number")
+        for seat_number, (wins, losses, pushes, _) in table.seat_tallies().items():
+            seat = self._seats.get(seat_number)
+            if seat is None:
+                seat = _SeatAggregation()
+                self._seats[seat_number] = seat
+            seat.wins += wins
+            seat.losses += losses
+            seat.pushes += pushes
+            seat.profit.add_array(profits[seat_numbers == seat_number])
+
+    def merge(self, other: AggregateAccumulator) -> None:
+        """Fold another accumulator into this one.
+
+        The merged accumulator keeps exact profits only if both did.
+
+        Args:
+            other: The accumulator to merge. It is not modified.
+        """
+        self._winning_sessions += other._winning_sessions
+        self._losing_sessions += other._losing_sessions
+        self._push_sessions += other._push_sessions
+        self._total_hands += other._total_hands
+        self._main_wagered.merge(other._main_wagered)
+        self._bonus_wagered.merge(other._bonus_wagered)
+        self._net_result.merge(other._net_result)
+        self._moments.merge(other._moments)
+        self._sketch.merge(other._sketch)
+        if self._profits is not None and other._profits is not None:
+            self._profits.extend(other._profits)
+        else:
+            self._profits = None
+        self._stop_reasons.update(other._stop_reasons)
+        for seat_number, other_seat in other._seats.items():
+            seat = self._seats.get(seat_number)
+            if seat is None:
+                seat = _SeatAggregation()
+                self._seats[seat_number] = seat
+            seat.merge(other_seat)
+
+    def to_statistics(self) -> AggregateStatistics:
+        """Return the statistics of the sessions accumulated so far.
+
+        Note: SessionResult does not track main game and bonus payouts
+        separately, so bonus is assumed break-even (see aggregate_results).
+
+        Returns:
+            AggregateStatistics with computed summary metrics.
+
+        Raises:
+            ValueError: If no sessions were accumulated.
+        """
+        total_sessions = self.total_sessions
+        if total_sessions == 0:
+            raise ValueError("Cannot aggregate empty results list")
+
+        total_hands = self._total_hands
+        main_wagered = self._main_wagered.value
+        bonus_wagered = self._bonus_wagered.value
+        total_wagered = main_wagered + bonus_wagered
+        net_result = self._net_result.value
+        total_won = net_result + total_wagered
+        bonus_won = bonus_wagered
+        main_won = total_won - bonus_won
+        main_profit = main_won - main_wagered
+
+        session_profits = tuple(self._profits) if self._profits is not None else ()
+        profit_mean, profit_std, profit_median, profit_min, profit_max = (
+            _profit_statistics(
+                self._moments,
+                self._sketch,
+                session_profits if self._profits is not None else None,
+            )
+        )
+
+        return AggregateStatistics(
+            total_sessions=total_sessions,
+            winning_sessions=self._winning_sessions,
+            losing_sessions=self._losing_sessions,
+            push_sessions=self._push_sessions,
+            session_win_rate=self._winning_sessions / total_sessions,
+            total_hands=total_hands,
+            total_wagered=total_wagered,
+            total_won=total_won,
+            net_result=net_result,
+            expected_value_per_hand=(
+                net_result / total_hands if total_hands > 0 else 0.0
+            ),
+            main_wagered=main_wagered,
+            main_won=main_won,
+            main_ev_per_hand=main_profit / total_hands if total_hands > 0 else 0.0,
+            bonus_wagered=bonus_wagered,
+            bonus_won=bonus_won,
+            bonus_ev_per_hand=0.0,  # Break-even assumption
+            hand_frequencies={},
+            hand_frequency_pct={},
+            session_profit_mean=profit_mean,
+            session_profit_std=profit_std,
+            session_profit_median=profit_median,
+            session_profit_min=profit_min,
+            session_profit_max=profit_max,
+            session_profits=session_profits,
+            profit_moments=self._moments.copy(),
+            profit_sketch=self._sketch.copy(),
+        )
+
+
+def aggregate_results(
+    results: Sequence[SessionResult], exact_profits: bool = True
+) -> AggregateStatistics:
     """Aggregate multiple session results into summary statistics.
 
     Note: SessionResult does not track main game and bonus payouts separately.
@@ -119,7 +484,12 @@ def aggregate_results(results: list[SessionResult]) -> AggregateStatistics:
     breakdown, use HandRecord data with aggregate_with_hand_frequencies().
 
     Args:
-        results: List of SessionResult objects to aggregate.
+        results: SessionResult objects to aggregate; a SessionResultTable
+            is aggregated column-wise.
+        exact_profits: Keep every session profit so the median and standard
+            deviation are exact. If False, session_profits is empty and
+            profit statistics come from constant-memory summaries; use
+            AggregateAccumulator directly to avoid materializing results.
 
     Returns:
         AggregateStatistics with computed summary metrics.
@@ -130,79 +500,9 @@ def aggregate_results(results: list[SessionResult]) -> AggregateStatistics:
     if not results:
         raise ValueError("Cannot aggregate empty results list")
 
-    # Count session outcomes
-    winning_sessions = sum(1 for r in results if r.outcome == SessionOutcome.WIN)
-    losing_sessions = sum(1 for r in results if r.outcome == SessionOutcome.LOSS)
-    push_sessions = sum(1 for r in results if r.outcome == SessionOutcome.PUSH)
-    total_sessions = len(results)
-
-    # Session win rate (total_sessions guaranteed > 0 due to empty check above)
-    session_win_rate = winning_sessions / total_sessions
-
-    # Total hands
-    total_hands = sum(r.hands_played for r in results)
-
-    # Financial metrics
-    main_wagered = sum(r.total_wagered for r in results)
-    bonus_wagered = sum(r.total_bonus_wagered for r in results)
-    total_wagered = main_wagered + bonus_wagered
-
-    # Net result is sum of session profits
-    net_result = sum(r.session_profit for r in results)
-
-    # Total won = net_result + total_wagered (since net = won - wagered)
-    total_won = net_result + total_wagered
-
-    # Main/bonus breakdown: without separate payout tracking in SessionResult,
-    # we assume bonus is break-even and attribute all profit/loss to main game
-    bonus_won = bonus_wagered
-    main_won = total_won - bonus_won
-
-    # Expected value per hand
-    expected_value_per_hand = net_result / total_hands if total_hands > 0 else 0.0
-    main_profit = main_won - main_wagered
-    main_ev_per_hand = main_profit / total_hands if total_hands > 0 else 0.0
-    bonus_ev_per_hand = 0.0  # Break-even assumption
-
-    # Hand frequencies - not available from SessionResult alone
-    # Would need HandRecord data; return empty for now
-    hand_frequencies: dict[str, int] = {}
-    hand_frequency_pct: dict[str, float] = {}
-
-    # Session profit statistics
-    session_profits = tuple(r.session_profit for r in results)
-    session_profit_mean = mean(session_profits)
-    session_profit_std = stdev(session_profits) if len(session_profits) > 1 else 0.0
-    session_profit_median = median(session_profits)
-    session_profit_min = min(session_profits)
-    session_profit_max = max(session_profits)
-
-    return AggregateStatistics(
-        total_sessions=total_sessions,
-        winning_sessions=winning_sessions,
-        losing_sessions=losing_sessions,
-        push_sessions=push_sessions,
-        session_win_rate=session_win_rate,
-        total_hands=total_hands,
-        total_wagered=total_wagered,
-        total_won=total_won,
-        net_result=net_result,
-        expected_value_per_hand=expected_value_per_hand,
-        main_wagered=main_wagered,
-        main_won=main_won,
-        main_ev_per_hand=main_ev_per_hand,
-        bonus_wagered=bonus_wagered,
-        bonus_won=bonus_won,
-        bonus_ev_per_hand=bonus_ev_per_hand,
-        hand_frequencies=hand_frequencies,
-        hand_frequency_pct=hand_frequency_pct,
-        session_profit_mean=session_profit_mean,
-        session_profit_std=session_profit_std,
-        session_profit_median=session_profit_median,
-        session_profit_min=session_profit_min,
-        session_profit_max=session_profit_max,
-        session_profits=session_profits,
-    )
+    accumulator = AggregateAccumulator(exact_profits=exact_profits)
+    accumulator.add_results(results)
+    return accumulator.to_statistics()
 
 
 def merge_aggregates(
@@ -212,6 +512,9 @@ def merge_aggregates(
 
     This supports incremental aggregation for parallel execution where
     different workers produce separate aggregates that need to be combined.
+    Session profits are concatenated when both aggregates are exact;
+    otherwise profit statistics come from the merged summaries and the
+    result keeps no raw profits.
 
     Args:
         agg1: First aggregate statistics.
@@ -254,13 +557,24 @@ def merge_aggregates(
     )
     hand_frequency_pct = _calculate_frequency_percentages(hand_frequencies)
 
-    # Combine session profits for statistics
-    combined_profits = agg1.session_profits + agg2.session_profits
-    session_profit_mean = mean(combined_profits) if combined_profits else 0.0
-    session_profit_std = stdev(combined_profits) if len(combined_profits) > 1 else 0.0
-    session_profit_median = median(combined_profits) if combined_profits else 0.0
-    session_profit_min = min(combined_profits) if combined_profits else 0.0
-    session_profit_max = max(combined_profits) if combined_profits else 0.0
+    # Combine session profit summaries, and raw profits when both are exact
+    moments1, sketch1 = agg1.profit_summaries()
+    moments2, sketch2 = agg2.profit_summaries()
+    profit_moments = moments1.copy()
+    profit_moments.merge(moments2)
+    profit_sketch = sketch1.copy()
+    profit_sketch.merge(sketch2)
+    exact = agg1.is_exact and agg2.is_exact
+    combined_profits = agg1.session_profits + agg2.session_profits if exact else ()
+    (
+        session_profit_mean,
+        session_profit_std,
+        session_profit_median,
+        session_profit_min,
+        session_profit_max,
+    ) = _profit_statistics(
+        profit_moments, profit_sketch, combined_profits if exact else None
+    )
 
     return AggregateStatistics(
         total_sessions=total_sessions,
@@ -287,11 +601,13 @@ def merge_aggregates(
         session_profit_min=session_profit_min,
         session_profit_max=session_profit_max,
         session_profits=combined_profits,
+        profit_moments=profit_moments,
+        profit_sketch=profit_sketch,
     )
 
 
 def aggregate_with_hand_frequencies(
-    results: list[SessionResult],
+    results: Sequence[SessionResult],
     hand_frequencies: dict[str, int],
 ) -> AggregateStatistics:
     """Aggregate session results with provided hand frequency data.
@@ -319,28 +635,8 @@ def aggregate_with_hand_frequencies(
     )
 
 
-class _SeatAggregation:
-    """Mutable accumulator for per-seat data during aggregation.
-
-    This is a lightweight class used internally by aggregate_with_seats().
-    """
-
-    __slots__ = ("wins", "losses", "pushes", "total_profit")
-
-    def __init__(self) -> None:
-        self.wins: int = 0
-        self.losses: int = 0
-        self.pushes: int = 0
-        self.total_profit: float = 0.0
-
-    @property
-    def total_rounds(self) -> int:
-        """Total rounds (sessions) played at this seat."""
-        return self.wins + self.losses + self.pushes
-
-
 def aggregate_with_seats(
-    results: list[SessionResult],
+    results: Sequence[SessionResult],
 ) -> tuple[AggregateStatistics, dict[int, _SeatAggregation]]:
     """Aggregate session results and seat data in a single pass.
 
@@ -361,99 +657,6 @@ def aggregate_with_seats(
     if not results:
         raise ValueError("Cannot aggregate empty results list")
 
-    # Initialize accumulators
-    winning_sessions = 0
-    losing_sessions = 0
-    push_sessions = 0
-    total_hands = 0
-    main_wagered = 0.0
-    bonus_wagered = 0.0
-    net_result = 0.0
-    session_profits: list[float] = []
-    seat_aggregations: dict[int, _SeatAggregation] = {}
-
-    # Single pass over results
-    for r in results:
-        # Session outcome counts
-        if r.outcome == SessionOutcome.WIN:
-            winning_sessions += 1
-        elif r.outcome == SessionOutcome.LOSS:
-            losing_sessions += 1
-        elif r.outcome == SessionOutcome.PUSH:
-            push_sessions += 1
-
-        # Accumulate metrics
-        total_hands += r.hands_played
-        main_wagered += r.total_wagered
-        bonus_wagered += r.total_bonus_wagered
-        net_result += r.session_profit
-        session_profits.append(r.session_profit)
-
-        # Seat aggregation (if seat_number is set)
-        if r.seat_number is not None:
-            seat_num = r.seat_number
-            agg = seat_aggregations.get(seat_num)
-            if agg is None:
-                agg = _SeatAggregation()
-                seat_aggregations[seat_num] = agg
-
-            if r.outcome == SessionOutcome.WIN:
-                agg.wins += 1
-            elif r.outcome == SessionOutcome.LOSS:
-                agg.losses += 1
-            elif r.outcome == SessionOutcome.PUSH:
-                agg.pushes += 1
-            agg.total_profit += r.session_profit
-
-    # Compute derived statistics
-    total_sessions = len(results)
-    session_win_rate = winning_sessions / total_sessions
-    total_wagered = main_wagered + bonus_wagered
-    total_won = net_result + total_wagered
-
-    # Main/bonus breakdown (bonus break-even assumption)
-    bonus_won = bonus_wagered
-    main_won = total_won - bonus_won
-
-    # Expected value per hand
-    expected_value_per_hand = net_result / total_hands if total_hands > 0 else 0.0
-    main_profit = main_won - main_wagered
-    main_ev_per_hand = main_profit / total_hands if total_hands > 0 else 0.0
-    bonus_ev_per_hand = 0.0
-
-    # Session profit statistics
-    session_profits_tuple = tuple(session_profits)
-    session_profit_mean = mean(session_profits) if session_profits else 0.0
-    session_profit_std = stdev(session_profits) if len(session_profits) > 1 else 0.0
-    session_profit_median = median(session_profits) if session_profits else 0.0
-    session_profit_min = min(session_profits) if session_profits else 0.0
-    session_profit_max = max(session_profits) if session_profits else 0.0
-
-    stats = AggregateStatistics(
-        total_sessions=total_sessions,
-        winning_sessions=winning_sessions,
-        losing_sessions=losing_sessions,
-        push_sessions=push_sessions,
-        session_win_rate=session_win_rate,
-        total_hands=total_hands,
-        total_wagered=total_wagered,
-        total_won=total_won,
-        net_result=net_result,
-        expected_value_per_hand=expected_value_per_hand,
-        main_wagered=main_wagered,
-        main_won=main_won,
-        main_ev_per_hand=main_ev_per_hand,
-        bonus_wagered=bonus_wagered,
-        bonus_won=bonus_won,
-        bonus_ev_per_hand=bonus_ev_per_hand,
-        hand_frequencies={},
-        hand_frequency_pct={},
-        session_profit_mean=session_profit_mean,
-        session_profit_std=session_profit_std,
-        session_profit_median=session_profit_median,
-        session_profit_min=session_profit_min,
-        session_profit_max=session_profit_max,
-        session_profits=session_profits_tuple,
-    )
-
-    return stats, seat_aggregations
+    accumulator = AggregateAccumulator(exact_profits=True)
+    accumulator.add_results(results)
+    return accumulator.to_statistics(), accumulator.seat_aggregations
@@ -0,0 +1,332 @@
+"""Checkpointing of long simulation runs.
+
+This module provides:
+- SimulationCheckpoint: Directory that persists the progress of a run so a
+  killed or preempted run can be resumed
+
+A checkpoint directory holds a JSON manifest and the completed work:
+- checkpoint.json: Config fingerprint, run mode, RNG state (RNGManager
+  get_state()) and the number of completed sessions
+- sessions-<start>-<stop>.npy: SessionResultTable rows of each saved range
+  of sessions (SimulationController.run)
+- aggregate-<completed>.pkl: Pickled AggregateAccumulator over the
+  completed sessions (SimulationController.run_aggregated)
+
+Work is always saved for a contiguous prefix of sessions, and session
+seeds are regenerated from the saved RNG state, so a resumed run computes
+exactly the sessions an uninterrupted run would have. The manifest is
+written to a temporary name and then renamed, and a segment or aggregate
+file only counts once the manifest lists it, so a run killed while saving
+leaves the previous checkpoint intact.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal
+
+import numpy as np
+
+from let_it_ride.simulation.result_table import SessionResultTable
+from let_it_ride.simulation.rng import RNGManager
+
+if TYPE_CHECKING:
+    from let_it_ride.config.models import FullConfig
+    from let_it_ride.simulation.aggregation import AggregateAccumulator
+
+# Kind of work a checkpoint holds
+CheckpointMode = Literal["sessions", "aggregate"]
+
+# Default minimum time between saves
+DEFAULT_CHECKPOINT_INTERVAL_SECONDS = 60.0
+
+_CHECKPOINT_VERSION = 1
+_MANIFEST_NAME = "checkpoint.json"
+
+
+def config_fingerprint(config: FullConfig) -> str:
+    """Return a hash of the configuration settings that affect results.
+
+    The metadata and output sections do not change the sessions that are
+    run, so they are excluded; a run may be resumed into another directory.
+
+    Args:
+        config: Full simulation configuration.
+
+    Returns:
+        Hex SHA-256 digest of the canonical JSON of the settings.
+    """
+    settings = config.model_dump(mode="json", exclude={"metadata", "output"})
+    canonical = json.dumps(settings, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def _rng_state_from_json(state: dict[str, Any]) -> dict[str, Any]:
+    """Restore the tuples of an RNGManager state read back from JSON.
+
+    Args:
+        state: State from RNGManager.get_state() after a JSON round trip.
+
+    Returns:
+        State accepted by RNGManager.from_state().
+    """
+    version, internal_state, gauss_next = state["master_rng_state"]
+    return {
+        **state,
+        "master_rng_state": (version, tuple(internal_state), gauss_next),
+    }
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write a file so that readers see either the old or the new contents.
+
+    Args:
+        path: Destination file.
+        data: Complete file contents.
+    """
+    temporary = path.with_name(f".{path.name}.tmp")
+    with temporary.open("wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    temporary.replace(path)
+
+
+class SimulationCheckpoint:
+    """Persistent progress of a simulation run.
+
+    Pass an instance to SimulationController to have runs save their
+    completed sessions at most every interval_seconds and at the end. If
+    the directory already holds a checkpoint of the same configuration and
+    run mode, the run resumes from it; call clear() first to start over.
+
+    Example:
+        >>> checkpoint = SimulationCheckpoint("runs/big/checkpoint")
+        >>> results = SimulationController(config, checkpoint=checkpoint).run()
+    """
+
+    __slots__ = (
+        "_directory",
+        "_interval_seconds",
+        "_fingerprint",
+        "_mode",
+        "_rng_state",
+        "_completed_sessions",
+        "_segments",
+        "_aggregate",
+        "_last_save",
+    )
+
+    def __init__(
+        self,
+        directory: Path | str,
+        interval_seconds: float = DEFAULT_CHECKPOINT_INTERVAL_SECONDS,
+    ) -> None:
+        """Initialize the checkpoint.
+
+        Args:
+            directory: Directory for the checkpoint files; created when the
+                run starts.
+            interval_seconds: Minimum time between saves. 0 saves after
+                every completed session (sequential) or chunk (parallel).
+
+        Raises:
+            ValueError: If interval_seconds is negative.
+        """
+        if interval_seconds < 0:
+            raise ValueError(
+                f"interval_seconds must be non-negative, got {interval_seconds}"
+            )
+        self._directory = Path(directory)
+        self._interval_seconds = interval_seconds
+        self._fingerprint: str | None = None
+        self._mode: CheckpointMode | None = None
+        self._rng_state: dict[str, Any] | None = None
+        self._completed_sessions = 0
+        self._segments: list[str] = []
+        self._aggregate: str | None = None
+        self._last_save = 0.0
+
+    @property
+    def directory(self) -> Path:
+        """Return the checkpoint directory."""
+        return self._directory
+
+    @property
+    def completed_sessions(self) -> int:
+        """Return the number of leading sessions saved in the checkpoint."""
+        return self._completed_sessions
+
+    @property
+    def exists(self) -> bool:
+        """Return whether the directory holds a checkpoint."""
+        return (self._directory / _MANIFEST_NAME).is_file()
+
+    def clear(self) -> None:
+        """Delete the checkpoint files so the next run starts from scratch."""
+        if self._directory.is_dir():
+            for path in self._directory.iterdir():
+                if (
+                    path.name == _MANIFEST_NAME
+                    or (path.name.startswith("sessions-") and path.suffix == ".npy")
+                    or (path.name.startswith("aggregate-") and path.suffix == ".pkl")
+                ):
+                    path.unlink()
+        self._fingerprint = None
+        self._mode = None
+        self._rng_state = None
+        self._completed_sessions = 0
+        self._segments = []
+        self._aggregate = None
+
+    def start(self, config: FullConfig, mode: CheckpointMode) -> RNGManager:
+        """Begin a run of config, resuming from the saved progress if any.
+
+        Args:
+            config: Full simulation configuration of the run.
+            mode: "sessions" to save session rows, "aggregate" to save a
+                mergeable aggregate.
+
+        Returns:
+            RNGManager in the state the run's session seeds are drawn from.
+            For an unseeded configuration the base seed is chosen on the
+            first start and reused on resume.
+
+        Raises:
+            ValueError: If the existing checkpoint was written for another
+                configuration or run mode, or by an unsupported version.
+        """
+        fingerprint = config_fingerprint(config)
+        if self.exists:
+            manifest = json.loads((self._directory / _MANIFEST_NAME).read_text())
+            if manifest.get("version") != _CHECKPOINT_VERSION:
+                raise ValueError(
+                    f"Unsupported checkpoint version in {self._directory}: "
+                    f"{manifest.get('version')}"
+                )
+            if manifest["config_fingerprint"] != fingerprint:
+                raise ValueError(
+                    f"Checkpoint in {self._directory} was written for a "
+                    "different configuration"
+                )
+            if manifest["mode"] != mode:
+                raise ValueError(
+                    f"Checkpoint in {self._directory} holds {manifest['mode']} "
+                    f"results, but this run needs {mode} results"
+                )
+            self._fingerprint = fingerprint
+            self._mode = mode
+            self._rng_state = _rng_state_from_json(manifest["rng_state"])
+            self._completed_sessions = manifest["completed_sessions"]
+            self._segments = list(manifest["segments"])
+            self._aggregate = manifest["aggregate"]
+        else:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            self._fingerprint = fingerprint
+            self._mode = mode
+            self._rng_state = RNGManager(
+                base_seed=config.simulation.random_seed
+            ).get_state()
+            self._completed_sessions = 0
+            self._segments = []
+            self._aggregate = None
+            self._write_manifest()
+        self._last_save = time.monotonic()
+        return RNGManager.from_state(self._rng_state)
+
+    def due(self) -> bool:
+        """Return whether interval_seconds have passed since the last save."""
+        return time.monotonic() - self._last_save >= self._interval_seconds
+
+    def load_rows(self) -> SessionResultTable:
+        """Return the saved rows of the completed sessions, in order.
+
+        Raises:
+            ValueError: If a saved segment does not hold session rows.
+        """
+        self._require_mode("sessions")
+        return SessionResultTable.concatenate(
+            SessionResultTable(np.load(self._directory / name, allow_pickle=False))
+            for name in self._segments
+        )
+
+    def save_rows(self, table: SessionResultTable, completed_sessions: int) -> None:
+        """Save the rows of the sessions completed since the last save.
+
+        Args:
+            table: Rows of sessions completed_sessions (as of the last
+                save) up to, but excluding, completed_sessions.
+            completed_sessions: Number of leading sessions now completed.
+        """
+        self._require_mode("sessions")
+        if completed_sessions <= self._completed_sessions:
+            return
+        name = f"sessions-{self._completed_sessions}-{completed_sessions}.npy"
+        with (self._directory / name).open("wb") as f:
+            np.save(f, table.rows, allow_pickle=False)
+            f.flush()
+            os.fsync(f.fileno())
+        self._segments.append(name)
+        self._completed_sessions = completed_sessions
+        # The segment only counts once the manifest lists it
+        self._write_manifest()
+
+    def load_aggregate(self) -> AggregateAccumulator | None:
+        """Return the saved aggregate, or None if nothing was saved yet."""
+        self._require_mode("aggregate")
+        if self._aggregate is None:
+            return None
+        aggregate: AggregateAccumulator = pickle.loads(
+            (self._directory / self._aggregate).read_bytes()
+        )
+        return aggregate
+
+    def save_aggregate(
+        self, aggregate: AggregateAccumulator, completed_sessions: int
+    ) -> None:
+        """Save the aggregate over the leading completed sessions.
+
+        Args:
+            aggregate: Accumulator over sessions 0 to completed_sessions.
+            completed_sessions: Number of leading sessions now completed.
+        """
+        self._require_mode("aggregate")
+        if completed_sessions <= self._completed_sessions:
+            return
+        name = f"aggregate-{completed_sessions}.pkl"
+        _write_atomic(self._directory / name, pickle.dumps(aggregate))
+        previous = self._aggregate
+        self._aggregate = name
+        self._completed_sessions = completed_sessions
+        # The aggregate only counts once the manifest lists it, so the
+        # previous one is kept until then
+        self._write_manifest()
+        if previous is not None:
+            (self._directory / previous).unlink(missing_ok=True)
+
+    def _require_mode(self, mode: CheckpointMode) -> None:
+        """Raise RuntimeError unless the run was started in the given mode."""
+        if self._mode != mode:
+            raise RuntimeError(f"Checkpoint was not started in {mode} mode")
+
+    def _write_manifest(self) -> None:
+        """Write the manifest describing the saved progress."""
+        manifest = {
+            "version": _CHECKPOINT_VERSION,
+            "config_fingerprint": self._fingerprint,
+            "mode": self._mode,
+            "rng_state": self._rng_state,
+            "completed_sessions": self._completed_sessions,
+            "segments": self._segments,
+            "aggregate": self._aggregate,
+        }
+        _write_atomic(
+            self._directory / _MANIFEST_NAME,
+            json.dumps(manifest, indent=2).encode(),
+        )
+        self._last_save = time.monotonic()
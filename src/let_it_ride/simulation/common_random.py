@@ -0,0 +1,415 @@
+"""Common-random-numbers runner for comparing configurations.
+
+Every variant plays the same dealt cards: each hand is shuffled, dealt and
+evaluated once, then settled by every variant's strategy, betting system
+and bonus strategy with its own Session state. Differences between the
+variants' results therefore come from the variants, not from the cards,
+which makes paired comparisons far less noisy than independent runs.
+
+This module provides:
+- SharedDealer: Deals and evaluates one hand for several engines
+- SharedDealEngine: HandEngine that settles the shared dealer's hand
+- run_common_random_sessions: Run aligned sessions for several configs
+"""
+
+from __future__ import annotations
+
+import random
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from let_it_ride.core.card import CARD_BY_CODE
+from let_it_ride.core.deck import Deck
+from let_it_ride.core.game_engine import GameHandResult
+from let_it_ride.core.hand_analysis import (
+    HandAnalysis,
+    analyze_four_card_codes,
+    analyze_three_card_codes,
+)
+from let_it_ride.core.hand_evaluator import evaluate_five_card_rank_codes
+from let_it_ride.core.hand_processing import settle_hand
+from let_it_ride.core.three_card_evaluator import evaluate_three_card_hand_codes
+from let_it_ride.simulation.controller import (
+    ProgressCallback,
+    SimulationResults,
+    create_betting_system,
+    create_strategy,
+)
+from let_it_ride.simulation.rng import RNGManager
+from let_it_ride.simulation.session import Session, SessionResult
+from let_it_ride.simulation.utils import (
+    calculate_bonus_bet,
+    create_session_config,
+    get_bonus_paytable,
+    get_main_paytable,
+)
+from let_it_ride.strategy.base import StrategyContext
+from let_it_ride.strategy.bonus import create_bonus_strategy
+from let_it_ride.strategy.compiled import CompiledStrategy
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from let_it_ride.config.models import DealerConfig, FullConfig
+    from let_it_ride.config.paytables import BonusPaytable, MainGamePaytable
+    from let_it_ride.core.hand_evaluator import FiveCardHandRank
+    from let_it_ride.core.three_card_evaluator import ThreeCardHandRank
+    from let_it_ride.strategy.base import Strategy
+
+
+class SharedDealer:
+    """Deals one hand at a time for several SharedDealEngines.
+
+    The deck is shuffled and dealt exactly as GameEngine does in compact
+    card mode, so a single variant reproduces a GameEngine run with the
+    same RNG. Hand ranks and strategy analyses are computed once per hand
+    and shared by every engine reading the hand.
+    """
+
+    __slots__ = (
+        "_deck",
+        "_rng",
+        "_discard_cards",
+        "_player_codes",
+        "_community_codes",
+        "_final_hand_rank",
+        "_bonus_hand_rank",
+        "_three_card_analysis",
+        "_four_card_analysis",
+    )
+
+    def __init__(
+        self,
+        deck: Deck,
+        rng: random.Random,
+        dealer_config: DealerConfig,
+    ) -> None:
+        """Initialize the dealer.
+
+        Args:
+            deck: The deck to deal from.
+            rng: Random number generator for shuffling.
+            dealer_config: Dealer configuration for discard mechanics.
+        """
+        self._deck = deck
+        self._rng = rng
+        self._discard_cards = (
+            dealer_config.discard_cards if dealer_config.discard_enabled else 0
+        )
+        self._player_codes: tuple[int, int, int] | None = None
+        self._community_codes: tuple[int, int] = (0, 0)
+        self._final_hand_rank: FiveCardHandRank | None = None
+        self._bonus_hand_rank: ThreeCardHandRank | None = None
+        self._three_card_analysis: HandAnalysis | None = None
+        self._four_card_analysis: HandAnalysis | None = None
+
+    def deal(self) -> None:
+        """Shuffle and deal the next hand, replacing the current one."""
+        deck = self._deck
+        deck.reset()
+        deck.shuffle(self._rng)
+        p0, p1, p2 = deck.deal_codes(3)
+        if self._discard_cards:
+            deck.deal_codes(self._discard_cards)
+        m0, m1 = deck.deal_codes(2)
+        self._player_codes = (p0, p1, p2)
+        self._community_codes = (m0, m1)
+        self._final_hand_rank = evaluate_five_card_rank_codes((p0, p1, p2, m0, m1))
+        self._bonus_hand_rank = None
+        self._three_card_analysis = None
+        self._four_card_analysis = None
+
+    @property
+    def player_codes(self) -> tuple[int, int, int]:
+        """Return the player's 3 card codes of the current hand."""
+        if self._player_codes is None:
+            raise RuntimeError("No hand has been dealt")
+        return self._player_codes
+
+    @property
+    def community_codes(self) -> tuple[int, int]:
+        """Return the 2 community card codes of the current hand."""
+        return self._community_codes
+
+    @property
+    def final_hand_rank(self) -> FiveCardHandRank:
+        """Return the 5-card rank of the current hand."""
+        if self._final_hand_rank is None:
+            raise RuntimeError("No hand has been dealt")
+        return self._final_hand_rank
+
+    def bonus_hand_rank(self) -> ThreeCardHandRank:
+        """Return the 3-card bonus rank of the current hand."""
+        if self._bonus_hand_rank is None:
+            self._bonus_hand_rank = evaluate_three_card_hand_codes(self.player_codes)
+        return self._bonus_hand_rank
+
+    def three_card_analysis(self) -> HandAnalysis:
+        """Return the analysis of the player's 3 cards for strategies."""
+        if self._three_card_analysis is None:
+            self._three_card_analysis = analyze_three_card_codes(self.player_codes)
+        return self._three_card_analysis
+
+    def four_card_analysis(self) -> HandAnalysis:
+        """Return the analysis of the first 4 cards for strategies."""
+        if self._four_card_analysis is None:
+            self._four_card_analysis = analyze_four_card_codes(
+                (*self.player_codes, self._community_codes[0])
+            )
+        return self._four_card_analysis
+
+
+class SharedDealEngine:
+    """HandEngine that settles the current hand of a SharedDealer.
+
+    play_hand() does not deal; the runner calls SharedDealer.deal() once per
+    hand and every engine sharing the dealer then settles that hand with
+    its own strategy and paytables.
+    """
+
+    __slots__ = ("_dealer", "_strategy", "_main_paytable", "_bonus_paytable")
+
+    def __init__(
+        self,
+        dealer: SharedDealer,
+        strategy: Strategy,
+        main_paytable: MainGamePaytable,
+        bonus_paytable: BonusPaytable | None,
+    ) -> None:
+        """Initialize the engine.
+
+        Args:
+            dealer: The dealer holding the hand to play.
+            strategy: The strategy for making pull/ride decisions.
+            main_paytable: Paytable for main game payouts.
+            bonus_paytable: Paytable for bonus bet payouts (None if no bonus).
+        """
+        self._dealer = dealer
+        self._strategy = strategy
+        self._main_paytable = main_paytable
+        self._bonus_paytable = bonus_paytable
+
+    def play_hand(
+        self,
+        hand_id: int,
+        base_bet: float,
+        bonus_bet: float = 0.0,
+        context: StrategyContext | None = None,
+    ) -> GameHandResult:
+        """Settle the dealer's current hand.
+
+        Args:
+            hand_id: Unique identifier for this hand.
+            base_bet: The bet amount per circle (3 circles total).
+            bonus_bet: Optional bonus bet amount.
+            context: Strategy context for decision making.
+
+        Returns:
+            GameHandResult with complete hand details and payouts.
+
+        Raises:
+            ValueError: If base_bet is not positive or bonus_bet is negative.
+            ValueError: If bonus_bet > 0 but no bonus_paytable was configured.
+        """
+        if base_bet <= 0:
+            raise ValueError(f"base_bet must be positive, got {base_bet}")
+        if bonus_bet < 0:
+            raise ValueError(f"bonus_bet cannot be negative, got {bonus_bet}")
+        if bonus_bet > 0 and self._bonus_paytable is None:
+            raise ValueError("bonus_bet > 0 requires a bonus_paytable to be configured")
+
+        if context is None:
+            context = StrategyContext(
+                session_profit=0.0,
+                hands_played=0,
+                streak=0,
+                bankroll=0.0,
+            )
+
+        dealer = self._dealer
+        player_codes = dealer.player_codes
+        community_codes = dealer.community_codes
+        strategy = self._strategy
+        if isinstance(strategy, CompiledStrategy):
+            decision_bet1 = strategy.decide_bet1_codes(player_codes, context)
+            decision_bet2 = strategy.decide_bet2_codes(
+                (*player_codes, community_codes[0]), context
+            )
+        else:
+            decision_bet1 = strategy.decide_bet1(dealer.three_card_analysis(), context)
+            decision_bet2 = strategy.decide_bet2(dealer.four_card_analysis(), context)
+
+        bonus_hand_rank = (
+            dealer.bonus_hand_rank()
+            if bonus_bet > 0 and self._bonus_paytable is not None
+            else None
+        )
+        result = settle_hand(
+            decision_bet1=decision_bet1,
+            decision_bet2=decision_bet2,
+            final_hand_rank=dealer.final_hand_rank,
+            bonus_hand_rank=bonus_hand_rank,
+            main_paytable=self._main_paytable,
+            bonus_paytable=self._bonus_paytable,
+            base_bet=base_bet,
+            bonus_bet=bonus_bet,
+        )
+
+        return GameHandResult(
+            hand_id=hand_id,
+            player_cards=(
+                CARD_BY_CODE[player_codes[0]],
+                CARD_BY_CODE[player_codes[1]],
+                CARD_BY_CODE[player_codes[2]],
+            ),
+            community_cards=(
+                CARD_BY_CODE[community_codes[0]],
+                CARD_BY_CODE[community_codes[1]],
+            ),
+            decision_bet1=result.decision_bet1,
+            decision_bet2=result.decision_bet2,
+            final_hand_rank=result.final_hand_rank,
+            base_bet=base_bet,
+            bets_at_risk=result.bets_at_risk,
+            main_payout=result.main_payout,
+            bonus_bet=bonus_bet,
+            bonus_hand_rank=result.bonus_hand_rank,
+            bonus_payout=result.bonus_payout,
+            net_result=result.net_result,
+        )
+
+
+def _validate_variants(configs: Sequence[FullConfig]) -> None:
+    """Check that the configurations can share one dealt-card stream.
+
+    Raises:
+        ValueError: If there are no configurations or they disagree on the
+            settings that determine the cards dealt.
+    """
+    if not configs:
+        raise ValueError("At least one configuration is required")
+
+    reference = configs[0]
+    for index, config in enumerate(configs):
+        if config.table.num_seats != 1:
+            raise ValueError(
+                f"Common random numbers require a single seat, "
+                f"configuration {index} has {config.table.num_seats}"
+            )
+        if config.simulation.hand_model != "dealt":
+            raise ValueError(
+                f"Common random numbers require hand_model 'dealt', "
+                f"configuration {index} uses '{config.simulation.hand_model}'"
+            )
+        if config.simulation.num_sessions != reference.simulation.num_sessions:
+            raise ValueError(
+                "All configurations must use the same simulation.num_sessions"
+            )
+        if config.simulation.random_seed != reference.simulation.random_seed:
+            raise ValueError(
+                "All configurations must use the same simulation.random_seed"
+            )
+        if config.deck != reference.deck:
+            raise ValueError("All configurations must use the same deck settings")
+        if config.dealer != reference.dealer:
+            raise ValueError("All configurations must use the same dealer settings")
+
+
+def run_common_random_sessions(
+    configs: Sequence[FullConfig],
+    progress_callback: ProgressCallback | None = None,
+) -> tuple[SimulationResults, ...]:
+    """Run the same dealt cards through several configurations.
+
+    Sessions are seeded exactly as SimulationController's sequential mode
+    does, and within each session every hand is dealt once and played by
+    each variant whose session has not yet stopped. Variants may differ in
+    strategy, bankroll (betting system and stop conditions), bonus
+    strategy and paytables; a variant that stops early simply skips the
+    remaining hands. The i-th session result of every variant comes from
+    the same cards, so results can be compared pairwise.
+
+    Args:
+        configs: One configuration per variant. They must agree on
+            num_sessions, random_seed, deck and dealer settings, use
+            hand_model "dealt" and a single seat.
+        progress_callback: Optional callback called with
+            (completed_sessions, total_sessions) after each session.
+
+    Returns:
+        One SimulationResults per configuration, in the same order, with
+        aligned session_results.
+
+    Raises:
+        ValueError: If the configurations cannot share a dealt-card stream.
+    """
+    _validate_variants(configs)
+
+    start_time = datetime.now()
+    reference = configs[0]
+    num_sessions = reference.simulation.num_sessions
+
+    # Per-variant components that are immutable across sessions
+    strategies = [
+        create_strategy(
+            config.strategy,
+            expected_hands=num_sessions * config.simulation.hands_per_session,
+        )
+        for config in configs
+    ]
+    main_paytables = [get_main_paytable(config) for config in configs]
+    bonus_paytables = [get_bonus_paytable(config) for config in configs]
+    session_configs = [
+        create_session_config(config, calculate_bonus_bet(config)) for config in configs
+    ]
+
+    rng_manager = RNGManager(base_seed=reference.simulation.random_seed)
+    session_seeds = rng_manager.create_session_seeds(num_sessions)
+    variant_results: list[list[SessionResult]] = [[] for _ in configs]
+
+    for session_id in range(num_sessions):
+        dealer = SharedDealer(
+            Deck(partial_shuffle=reference.deck.partial_shuffle),
+            random.Random(session_seeds[session_id]),
+            reference.dealer,
+        )
+        sessions = [
+            Session(
+                session_configs[index],
+                SharedDealEngine(
+                    dealer,
+                    strategies[index],
+                    main_paytables[index],
+                    bonus_paytables[index],
+                ),
+                create_betting_system(config.bankroll),
+                bonus_strategy=create_bonus_strategy(config.bonus_strategy),
+            )
+            for index, config in enumerate(configs)
+        ]
+
+        active = [session for session in sessions if not session.should_stop()]
+        while active:
+            dealer.deal()
+            for session in active:
+                session.play_hand()
+            active = [session for session in active if not session.should_stop()]
+
+        for index, session in enumerate(sessions):
+            variant_results[index].append(session.run_to_completion())
+
+        if progress_callback is not None:
+            progress_callback(session_id + 1, num_sessions)
+
+    end_time = datetime.now()
+
+    return tuple(
+        SimulationResults(
+            config=config,
+            session_results=results,
+            start_time=start_time,
+            end_time=end_time,
+            total_hands=sum(r.hands_played for r in results),
+        )
+        for config, results in zip(configs, variant_results, strict=True)
+    )
@@ -2,22 +2,30 @@
 
 This module provides:
 - SimulationController: Orchestrates execution of multiple Let It Ride sessions
+- AggregatedSimulationResults: Summary-only results of
+  SimulationController.run_aggregated(), which never holds every session
 - create_strategy: Factory function for creating strategy instances from config
 - create_betting_system: Factory function for creating betting system instances
 
 Internal registries map strategy/betting system type names to factory functions.
 
 Parallel execution is supported via the ParallelExecutor when workers > 1.
+With simulation.lockstep, sessions instead run together as NumPy arrays
+(see lockstep.run_lockstep_sessions). Sequential and parallel runs can save
+their progress to a SimulationCheckpoint and resume from it. Given a
+DistributedExecutor, sessions run on its connected worker processes instead.
 """
 
 from __future__ import annotations
 
 import random
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass
 from datetime import datetime
 from typing import TYPE_CHECKING, Literal
 
+import numpy as np
+
 from let_it_ride.bankroll import (
     BettingSystem,
     DAlembertBetting,
@@ -26,15 +34,26 @@ from let_it_ride.bankroll import (
     MartingaleBetting,
     ParoliBetting,
     ReverseMartingaleBetting,
+    vectorize_betting_system,
 )
 from let_it_ride.core.deck import Deck
-from let_it_ride.core.game_engine import GameEngine, GameHandResult
+from let_it_ride.core.game_engine import GameEngine, GameHandResult, HandEngine
+from let_it_ride.core.hand_evaluator import evaluate_five_card_rank
 from let_it_ride.core.table import Table
+from let_it_ride.simulation.aggregation import AggregateAccumulator
+from let_it_ride.simulation.lockstep import run_lockstep_sessions
+from let_it_ride.simulation.outcome_sampling import (
+    OutcomeDistribution,
+    OutcomeSamplingEngine,
+    exact_outcome_distribution,
+)
+from let_it_ride.simulation.result_table import SessionResultTable
 from let_it_ride.simulation.rng import RNGManager
 from let_it_ride.simulation.session import Session, SessionResult
 from let_it_ride.simulation.table_session import TableSession, TableSessionConfig
 from let_it_ride.simulation.utils import (
     calculate_bonus_bet,
+    create_session_config,
     create_table_session_config,
     get_bonus_paytable,
     get_main_paytable,
@@ -47,6 +66,7 @@ from let_it_ride.strategy import (
     Strategy,
     StrategyRule,
     aggressive_strategy,
+    compile_strategy,
     conservative_strategy,
 )
 from let_it_ride.strategy.base import Decision
@@ -59,10 +79,16 @@ if TYPE_CHECKING:
         StrategyConfig,
     )
     from let_it_ride.config.paytables import BonusPaytable, MainGamePaytable
+    from let_it_ride.simulation.checkpoint import SimulationCheckpoint
+    from let_it_ride.simulation.distributed import DistributedExecutor
 
 # Minimum sessions needed to benefit from parallel overhead
 _MIN_SESSIONS_FOR_PARALLEL = 10
 
+# Minimum hands needed to amortize compiling the strategy into a decision
+# table (about one second per process)
+_MIN_HANDS_FOR_COMPILED_STRATEGY = 200_000
+
 # Type alias for progress callback
 ProgressCallback = Callable[[int, int], None]
 
@@ -71,6 +97,10 @@ ProgressCallback = Callable[[int, int], None]
 # This differs from session.HandCallback which doesn't include session_id.
 ControllerHandCallback = Callable[[int, int, GameHandResult], None]
 
+# Type alias for a consumer of per-session rows in aggregated runs.
+# Called with consecutive batches of SessionResults, in session order.
+SessionSink = Callable[[list[SessionResult]], None]
+
 
 def _action_to_decision(action: str) -> Decision:
     """Convert action string to Decision enum.
@@ -142,11 +172,37 @@ class SimulationResults:
     total_hands: int
 
 
-def create_strategy(config: StrategyConfig) -> Strategy:
+@dataclass(frozen=True, slots=True)
+class AggregatedSimulationResults:
+    """Summary-only results from a simulation run.
+
+    Attributes:
+        config: The configuration used for this simulation.
+        aggregate: Accumulated statistics, stop reason and per-seat tallies.
+        start_time: When the simulation started.
+        end_time: When the simulation completed.
+    """
+
+    config: FullConfig
+    aggregate: AggregateAccumulator
+    start_time: datetime
+    end_time: datetime
+
+    @property
+    def total_hands(self) -> int:
+        """Return the total number of hands played across all sessions."""
+        return self.aggregate.total_hands
+
+
+def create_strategy(config: StrategyConfig, expected_hands: int = 0) -> Strategy:
     """Create a strategy instance from configuration.
 
     Args:
         config: The strategy configuration.
+        expected_hands: Number of hands the strategy will play. When this
+            reaches _MIN_HANDS_FOR_COMPILED_STRATEGY the strategy is passed
+            through compile_strategy() (context-dependent strategies are
+            left as they are).
 
     Returns:
         An instance of the appropriate Strategy implementation.
@@ -158,7 +214,10 @@ def create_strategy(config: StrategyConfig) -> Strategy:
     factory = _STRATEGY_FACTORIES.get(config.type)
     if factory is None:
         raise ValueError(f"Unknown strategy type: {config.type}")
-    return factory(config)
+    strategy = factory(config)
+    if expected_hands >= _MIN_HANDS_FOR_COMPILED_STRATEGY:
+        return compile_strategy(strategy)
+    return strategy
 
 
 def _create_flat_betting(config: BankrollConfig) -> BettingSystem:
@@ -310,13 +369,22 @@ class SimulationController:
     from the overhead.
     """
 
-    __slots__ = ("_config", "_progress_callback", "_hand_callback", "_base_seed")
+    __slots__ = (
+        "_config",
+        "_progress_callback",
+        "_hand_callback",
+        "_base_seed",
+        "_checkpoint",
+        "_distributed",
+    )
 
     def __init__(
         self,
         config: FullConfig,
         progress_callback: ProgressCallback | None = None,
         hand_callback: ControllerHandCallback | None = None,
+        checkpoint: SimulationCheckpoint | None = None,
+        distributed: DistributedExecutor | None = None,
     ) -> None:
         """Initialize the simulation controller.
 
@@ -324,34 +392,182 @@ class SimulationController:
             config: Full simulation configuration.
             progress_callback: Optional callback for progress reporting.
                 Called with (completed_sessions, total_sessions) after
-                each session completes (sequential) or at completion (parallel).
+                each session completes (sequential) or as each chunk of
+                sessions completes (parallel).
             hand_callback: Optional callback for per-hand reporting.
                 Called with (session_id, hand_id, GameHandResult) after
                 each hand completes. Only available in sequential mode.
+            checkpoint: Optional checkpoint that runs save their progress
+                to and resume from. A resumed run produces the same results
+                as an uninterrupted one; callbacks are only called for the
+                sessions run after resuming.
+            distributed: Optional executor whose connected workers run the
+                sessions, regardless of the workers setting. Results match
+                a parallel run with the same seed.
         """
         self._config = config
         self._progress_callback = progress_callback
         self._hand_callback = hand_callback
         self._base_seed = config.simulation.random_seed
+        self._checkpoint = checkpoint
+        self._distributed = distributed
 
     def run(self) -> SimulationResults:
         """Execute the simulation.
 
-        Uses parallel execution when workers > 1 and there are enough sessions.
-        Otherwise runs sequentially.
+        Uses lockstep execution when simulation.lockstep is set, distributed
+        execution when a DistributedExecutor was given, parallel execution
+        when workers > 1 and there are enough sessions, and otherwise runs
+        sequentially.
 
         Returns:
             SimulationResults containing all session results and metadata.
+
+        Raises:
+            ValueError: If a checkpoint is combined with lockstep or
+                distributed execution or belongs to another configuration,
+                or a DistributedExecutor is combined with lockstep execution.
         """
         workers = self._config.simulation.workers
         num_sessions = self._config.simulation.num_sessions
 
+        if self._config.simulation.lockstep:
+            self._reject_checkpoint("lockstep execution")
+            self._reject_distributed()
+            return self._run_lockstep()
+        if self._distributed is not None:
+            self._reject_checkpoint("distributed execution")
+            return self._run_parallel()
         if _should_use_parallel(workers, num_sessions):
             return self._run_parallel()
         return self._run_sequential()
 
+    def run_aggregated(
+        self, session_sink: SessionSink | None = None, exact_profits: bool = False
+    ) -> AggregatedSimulationResults:
+        """Execute the simulation, keeping only mergeable summaries.
+
+        Sessions are folded into an AggregateAccumulator as they complete;
+        parallel workers fold their own sessions and send back only the
+        accumulators. Profit statistics therefore come from the running
+        moments and quantile sketch (see AggregateAccumulator), and memory
+        does not grow with the number of sessions.
+
+        Args:
+            session_sink: Optional consumer of the per-session rows, called
+                with consecutive batches in session order (for example to
+                stream them to disk). Without it no rows are kept or sent
+                between processes.
+            exact_profits: Also keep every session profit, so the median
+                and standard deviation are exact rather than estimated.
+                Memory then grows with the number of sessions; meant for
+                small runs.
+
+        Returns:
+            AggregatedSimulationResults with the accumulated statistics.
+
+        Raises:
+            ValueError: If a checkpoint is combined with a session_sink,
+                lockstep or distributed execution, or belongs to another
+                configuration, or a DistributedExecutor is combined with
+                lockstep execution.
+        """
+        workers = self._config.simulation.workers
+        num_sessions = self._config.simulation.num_sessions
+        start_time = datetime.now()
+        if session_sink is not None:
+            self._reject_checkpoint("a session_sink")
+
+        if self._config.simulation.lockstep:
+            self._reject_checkpoint("lockstep execution")
+            self._reject_distributed()
+            session_results = self._run_lockstep().session_results
+            aggregate = AggregateAccumulator(exact_profits=exact_profits)
+            aggregate.add_results(session_results)
+            if session_sink is not None:
+                session_sink(session_results)
+        elif self._distributed is not None:
+            self._reject_checkpoint("distributed execution")
+            aggregate = self._distributed.reduce_sessions(
+                config=self._config,
+                progress_callback=self._progress_callback,
+                session_sink=session_sink,
+                exact_profits=exact_profits,
+            )
+        elif _should_use_parallel(workers, num_sessions):
+            # Import here to avoid circular imports
+            from let_it_ride.simulation.parallel import ParallelExecutor
+
+            aggregate = ParallelExecutor(workers).reduce_sessions(
+                config=self._config,
+                progress_callback=self._progress_callback,
+                session_sink=session_sink,
+                checkpoint=self._checkpoint,
+                exact_profits=exact_profits,
+            )
+        else:
+            aggregate = self._reduce_sequential(session_sink, exact_profits)
+
+        return AggregatedSimulationResults(
+            config=self._config,
+            aggregate=aggregate,
+            start_time=start_time,
+            end_time=datetime.now(),
+        )
+
+    def _reject_checkpoint(self, feature: str) -> None:
+        """Raise ValueError if a checkpoint is set, naming the feature.
+
+        Args:
+            feature: What the checkpoint cannot be combined with.
+        """
+        if self._checkpoint is not None:
+            raise ValueError(f"Checkpointing is not supported with {feature}")
+
+    def _reject_distributed(self) -> None:
+        """Raise ValueError if a DistributedExecutor is set (lockstep runs)."""
+        if self._distributed is not None:
+            raise ValueError(
+                "Distributed execution is not supported with lockstep execution"
+            )
+
+    def _reduce_sequential(
+        self, session_sink: SessionSink | None, exact_profits: bool = False
+    ) -> AggregateAccumulator:
+        """Run sessions sequentially, folding them into an accumulator.
+
+        Args:
+            session_sink: Optional consumer of each session's rows.
+            exact_profits: Keep every session profit in the accumulator.
+
+        Returns:
+            AggregateAccumulator over all sessions (and seats).
+        """
+        checkpoint = self._checkpoint
+        if checkpoint is None:
+            aggregate = AggregateAccumulator(exact_profits=exact_profits)
+            for results in self._iter_sequential():
+                aggregate.add_results(results)
+                if session_sink is not None:
+                    session_sink(results)
+            return aggregate
+
+        rng_manager = checkpoint.start(self._config, "aggregate")
+        first_session = checkpoint.completed_sessions
+        aggregate = checkpoint.load_aggregate() or AggregateAccumulator(
+            exact_profits=exact_profits
+        )
+        for session_id, results in enumerate(
+            self._iter_sequential(rng_manager, first_session), start=first_session
+        ):
+            aggregate.add_results(results)
+            if checkpoint.due():
+                checkpoint.save_aggregate(aggregate, session_id + 1)
+        checkpoint.save_aggregate(aggregate, self._config.simulation.num_sessions)
+        return aggregate
+
     def _run_parallel(self) -> SimulationResults:
-        """Execute the simulation using parallel workers.
+        """Execute the simulation using parallel or distributed workers.
 
         Returns:
             SimulationResults containing all session results and metadata.
@@ -361,11 +577,17 @@ class SimulationController:
 
         start_time = datetime.now()
 
-        executor = ParallelExecutor(self._config.simulation.workers)
-        session_results = executor.run_sessions(
-            config=self._config,
-            progress_callback=self._progress_callback,
-        )
+        if self._distributed is not None:
+            session_results = self._distributed.run_sessions(
+                config=self._config, progress_callback=self._progress_callback
+            )
+        else:
+            executor = ParallelExecutor(self._config.simulation.workers)
+            session_results = executor.run_sessions(
+                config=self._config,
+                progress_callback=self._progress_callback,
+                checkpoint=self._checkpoint,
+            )
 
         end_time = datetime.now()
         total_hands = sum(r.hands_played for r in session_results)
@@ -378,6 +600,48 @@ class SimulationController:
             total_hands=total_hands,
         )
 
+    def _run_lockstep(self) -> SimulationResults:
+        """Execute the simulation with all sessions advancing together.
+
+        Hands are sampled from the strategy's exact outcome distribution
+        with a NumPy generator seeded from random_seed. The per-hand
+        callback is not called, and progress is reported once at the end.
+
+        Returns:
+            SimulationResults containing all session results and metadata.
+        """
+        start_time = datetime.now()
+        num_sessions = self._config.simulation.num_sessions
+
+        strategy = create_strategy(self._config.strategy)
+        lockstep_results = run_lockstep_sessions(
+            config=create_session_config(
+                self._config, calculate_bonus_bet(self._config)
+            ),
+            distribution=exact_outcome_distribution(strategy),
+            main_paytable=get_main_paytable(self._config),
+            bonus_paytable=get_bonus_paytable(self._config),
+            betting_system=vectorize_betting_system(
+                create_betting_system(self._config.bankroll)
+            ),
+            num_sessions=num_sessions,
+            rng=np.random.default_rng(self._base_seed),
+        )
+        session_results = lockstep_results.to_session_results()
+
+        if self._progress_callback is not None:
+            self._progress_callback(num_sessions, num_sessions)
+
+        end_time = datetime.now()
+
+        return SimulationResults(
+            config=self._config,
+            session_results=session_results,
+            start_time=start_time,
+            end_time=end_time,
+            total_hands=int(lockstep_results.hands_played.sum()),
+        )
+
     def _run_sequential(self) -> SimulationResults:
         """Execute the simulation sequentially.
 
@@ -385,15 +649,76 @@ class SimulationController:
             SimulationResults containing all session results and metadata.
         """
         start_time = datetime.now()
+        checkpoint = self._checkpoint
+        session_results: list[SessionResult] = []
+        if checkpoint is None:
+            for results in self._iter_sequential():
+                session_results.extend(results)
+        else:
+            rng_manager = checkpoint.start(self._config, "sessions")
+            first_session = checkpoint.completed_sessions
+            session_results.extend(checkpoint.load_rows())
+            saved = len(session_results)
+            for session_id, results in enumerate(
+                self._iter_sequential(rng_manager, first_session),
+                start=first_session,
+            ):
+                session_results.extend(results)
+                if checkpoint.due():
+                    checkpoint.save_rows(
+                        SessionResultTable.from_results(session_results[saved:]),
+                        session_id + 1,
+                    )
+                    saved = len(session_results)
+            checkpoint.save_rows(
+                SessionResultTable.from_results(session_results[saved:]),
+                self._config.simulation.num_sessions,
+            )
+
+        end_time = datetime.now()
+
+        total_hands = sum(r.hands_played for r in session_results)
+
+        return SimulationResults(
+            config=self._config,
+            session_results=session_results,
+            start_time=start_time,
+            end_time=end_time,
+            total_hands=total_hands,
+        )
+
+    def _iter_sequential(
+        self, rng_manager: RNGManager | None = None, first_session: int = 0
+    ) -> Iterator[list[SessionResult]]:
+        """Run sessions one at a time, reporting progress after each.
+
+        Args:
+            rng_manager: Manager to draw the session seeds from, instead of
+                one seeded with the configured random_seed.
+            first_session: Run only the sessions from this ID on.
+
+        Yields:
+            The results of each session in order: one per seat, in seat
+            order, for multi-seat tables.
+        """
         num_sessions = self._config.simulation.num_sessions
         num_seats = self._config.table.num_seats
-        session_results: list[SessionResult] = []
 
         # Create immutable components once and reuse across sessions
         # (Strategy, paytables, and betting system configs are identical per-session)
-        strategy = create_strategy(self._config.strategy)
+        strategy = create_strategy(
+            self._config.strategy,
+            expected_hands=num_sessions
+            * num_seats
+            * self._config.simulation.hands_per_session,
+        )
         main_paytable = get_main_paytable(self._config)
         bonus_paytable = get_bonus_paytable(self._config)
+        outcome_distribution = (
+            exact_outcome_distribution(strategy)
+            if self._config.simulation.hand_model == "sampled"
+            else None
+        )
 
         def betting_system_factory() -> BettingSystem:
             return create_betting_system(self._config.bankroll)
@@ -402,7 +727,8 @@ class SimulationController:
             return create_bonus_strategy(self._config.bonus_strategy)
 
         # Use RNGManager for centralized seed management
-        rng_manager = RNGManager(base_seed=self._base_seed)
+        if rng_manager is None:
+            rng_manager = RNGManager(base_seed=self._base_seed)
         session_seeds = rng_manager.create_session_seeds(num_sessions)
 
         # Use multi-seat table session when num_seats > 1
@@ -414,7 +740,7 @@ class SimulationController:
             bonus_bet = calculate_bonus_bet(self._config)
             table_session_config = create_table_session_config(self._config, bonus_bet)
 
-        for session_id in range(num_sessions):
+        for session_id in range(first_session, num_sessions):
             # Use pre-generated session seed for reproducibility
             session_seed = session_seeds[session_id]
             session_rng = random.Random(session_seed)
@@ -435,14 +761,13 @@ class SimulationController:
                 # Sequential processing maintains natural ordering: session 0 seats
                 # first, then session 1 seats, etc. This matches the composite ID
                 # scheme used in parallel.py (session_id * num_seats + seat_idx)
-                for seat_result in table_result.seat_results:
-                    result_with_info = (
-                        seat_result.session_result.with_table_session_info(
-                            table_session_id=session_id,
-                            seat_number=seat_result.seat_number,
-                        )
+                yield [
+                    seat_result.session_result.with_table_session_info(
+                        table_session_id=session_id,
+                        seat_number=seat_result.seat_number,
                     )
-                    session_results.append(result_with_info)
+                    for seat_result in table_result.seat_results
+                ]
             else:
                 # Single-seat: use Session for efficiency
                 session = self._create_session(
@@ -453,25 +778,13 @@ class SimulationController:
                     bonus_paytable,
                     betting_system_factory,
                     bonus_strategy_factory,
+                    outcome_distribution,
                 )
-                result = self._run_session(session)
-                session_results.append(result)
+                yield [self._run_session(session)]
 
             if self._progress_callback is not None:
                 self._progress_callback(session_id + 1, num_sessions)
 
-        end_time = datetime.now()
-
-        total_hands = sum(r.hands_played for r in session_results)
-
-        return SimulationResults(
-            config=self._config,
-            session_results=session_results,
-            start_time=start_time,
-            end_time=end_time,
-            total_hands=total_hands,
-        )
-
     def _create_session(
         self,
         session_id: int,
@@ -481,6 +794,7 @@ class SimulationController:
         bonus_paytable: BonusPaytable | None,
         betting_system_factory: Callable[[], BettingSystem],
         bonus_strategy_factory: Callable[[], BonusStrategy],
+        outcome_distribution: OutcomeDistribution | None = None,
     ) -> Session:
         """Create a new session with fresh state.
 
@@ -492,27 +806,34 @@ class SimulationController:
             bonus_paytable: Bonus paytable or None (reused across sessions).
             betting_system_factory: Factory to create fresh betting system per session.
             bonus_strategy_factory: Factory to create fresh bonus strategy per session.
+            outcome_distribution: If given, hands are sampled from this
+                distribution instead of dealt (hand_model "sampled").
 
         Returns:
             A new Session instance ready to run.
         """
         # Build SessionConfig from FullConfig using shared utilities
-        from let_it_ride.simulation.utils import create_session_config
-
         bonus_bet = calculate_bonus_bet(self._config)
         session_config = create_session_config(self._config, bonus_bet)
 
-        # Create game components - Deck must be fresh per session
-        deck = Deck()
-
-        engine = GameEngine(
-            deck=deck,
-            strategy=strategy,
-            main_paytable=main_paytable,
-            bonus_paytable=bonus_paytable,
-            rng=rng,
-            dealer_config=self._config.dealer,
-        )
+        engine: HandEngine
+        if outcome_distribution is not None:
+            engine = OutcomeSamplingEngine(
+                outcome_distribution, main_paytable, bonus_paytable, rng
+            )
+        else:
+            # Create game components - Deck must be fresh per session
+            deck = Deck(partial_shuffle=self._config.deck.partial_shuffle)
+            engine = GameEngine(
+                deck=deck,
+                strategy=strategy,
+                main_paytable=main_paytable,
+                bonus_paytable=bonus_paytable,
+                rng=rng,
+                dealer_config=self._config.dealer,
+                rank_evaluator=evaluate_five_card_rank,
+                compact_cards=True,
+            )
 
         # Betting system needs fresh state per session
         betting_system = betting_system_factory()
@@ -565,7 +886,7 @@ class SimulationController:
         """
 
         # Create game components - Deck must be fresh per session
-        deck = Deck()
+        deck = Deck(partial_shuffle=self._config.deck.partial_shuffle)
 
         table = Table(
             deck=deck,
@@ -575,6 +896,7 @@ class SimulationController:
             rng=rng,
             table_config=self._config.table,
             dealer_config=self._config.dealer,
+            rank_evaluator=evaluate_five_card_rank,
         )
 
         # Betting system needs fresh state per session
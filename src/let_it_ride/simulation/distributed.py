@@ -0,0 +1,749 @@
+"""Distributed session execution across several hosts.
+
+This module provides:
+- DistributedExecutor: Coordinator that listens on a TCP or Unix socket and
+  hands out chunks of sessions to whichever workers connect
+- run_worker: Worker loop run by `let-it-ride worker` on any host
+- parse_address: Parse "host:port" or "unix:/path" socket addresses
+
+Key design decisions:
+- The coordinator pre-generates all session seeds exactly as
+  ParallelExecutor does and splits the sessions into fixed, contiguous
+  chunks, so results do not depend on which worker runs which chunk
+- Messages are pickled objects over multiprocessing.connection. Both ends
+  are authenticated with its HMAC challenge on a shared authkey before
+  anything is unpickled
+- Each worker receives the configuration once, then runs chunks with the
+  same worker functions as ParallelExecutor and sends back session results
+  or a mergeable AggregateAccumulator per chunk
+- Every worker has up to two chunks in flight; if its connection drops, its
+  unfinished chunks go back to the front of the queue for another worker
+- Workers send heartbeats while they set up or run a chunk, so a worker
+  (or client in the handshake) that stays silent for worker_timeout
+  seconds is dropped and its chunks re-queued, even without a TCP reset
+- Aggregates are merged in chunk order and keep exact sums, so a
+  reduction equals a sequential or parallel one for the same seed
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import socket
+import threading
+import time
+from collections import deque
+from math import ceil
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import (
+    Client,
+    Connection,
+    answer_challenge,
+    deliver_challenge,
+)
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from let_it_ride.simulation.aggregation import AggregateAccumulator
+from let_it_ride.simulation.controller import SessionSink, create_strategy
+from let_it_ride.simulation.outcome_sampling import exact_outcome_distribution
+from let_it_ride.simulation.parallel import (
+    _UNWRITTEN_ROW,
+    ProgressCallback,
+    SessionChunk,
+    WorkerResult,
+    _initialize_worker,
+    _raise_missing_results,
+    _raise_worker_failures,
+    run_session_chunk,
+)
+from let_it_ride.simulation.result_table import (
+    SESSION_RESULT_DTYPE,
+    SessionResultTable,
+)
+from let_it_ride.simulation.rng import RNGManager
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from let_it_ride.config.models import FullConfig
+    from let_it_ride.simulation.session import SessionResult
+
+_logger = logging.getLogger(__name__)
+
+# Socket address: a path for a Unix socket or (host, port) for TCP
+Address = str | tuple[str, int]
+
+# Chunks per run when no chunk_size is given, and the most sessions in one
+_DEFAULT_CHUNKS = 256
+_MAX_DEFAULT_CHUNK_SESSIONS = 10_000
+
+# Chunks sent to a worker before waiting for its first result
+_CHUNKS_IN_FLIGHT_PER_WORKER = 2
+
+# Seconds between attempts of a worker to reach the coordinator
+_CONNECT_RETRY_SECONDS = 0.2
+
+# Seconds between checks of the coordinator for the end of a run while
+# waiting for workers to connect
+_ACCEPT_POLL_SECONDS = 0.2
+
+# Default seconds a connected worker may stay silent before it is dropped
+DEFAULT_WORKER_TIMEOUT_SECONDS = 60.0
+
+# Heartbeats a busy worker sends per worker timeout
+_HEARTBEATS_PER_WORKER_TIMEOUT = 4
+
+# Message kinds sent from the coordinator to a worker
+_SETUP = "setup"
+_CHUNK = "chunk"
+_STOP = "stop"
+
+# Message sent from a busy worker to the coordinator
+_HEARTBEAT = "heartbeat"
+
+
+def parse_address(text: str) -> Address:
+    """Parse a socket address given on the command line.
+
+    Args:
+        text: "host:port" for TCP, or "unix:/path" for a Unix socket.
+
+    Returns:
+        (host, port) for TCP, or the socket path.
+
+    Raises:
+        ValueError: If the address is malformed.
+    """
+    if text.startswith("unix:"):
+        path = text.removeprefix("unix:")
+        if not path:
+            raise ValueError(f"Unix socket address has no path: {text!r}")
+        return path
+    host, separator, port = text.rpartition(":")
+    if not separator or not port.isdigit() or int(port) > 65535:
+        raise ValueError(f"Address must be 'host:port' or 'unix:/path', got {text!r}")
+    return (host, int(port))
+
+
+def _default_chunk_size(num_sessions: int) -> int:
+    """Return the chunk size used when none is given.
+
+    About 256 chunks per run keep every worker busy until the end, and
+    chunks of at most 10,000 sessions bound what a lost worker costs.
+
+    Args:
+        num_sessions: Total number of sessions.
+    """
+    return max(
+        1, min(_MAX_DEFAULT_CHUNK_SESSIONS, ceil(num_sessions / _DEFAULT_CHUNKS))
+    )
+
+
+class _HandshakeConnection:
+    """View of a connection for the authentication handshake.
+
+    deliver_challenge() and answer_challenge() only send and receive bytes;
+    through this view each receive fails if no data arrives in time, so a
+    client that connects and stays silent cannot hold its thread.
+    """
+
+    __slots__ = ("_connection", "_timeout")
+
+    def __init__(self, connection: Connection, timeout: float) -> None:
+        """Initialize the view.
+
+        Args:
+            connection: Connection to the client.
+            timeout: Seconds to wait for each message of the client.
+        """
+        self._connection = connection
+        self._timeout = timeout
+
+    def send_bytes(self, data: bytes) -> None:
+        """Send a message to the client."""
+        self._connection.send_bytes(data)
+
+    def recv_bytes(self, maxlength: int | None = None) -> bytes:
+        """Receive a message from the client.
+
+        Raises:
+            TimeoutError: If the client sent nothing within the timeout.
+        """
+        if not self._connection.poll(self._timeout):
+            raise TimeoutError(f"No handshake message within {self._timeout} seconds")
+        return self._connection.recv_bytes(maxlength)
+
+
+class _Heartbeat:
+    """Context manager that sends heartbeats from a worker while it is busy.
+
+    The worker does not send anything else while the heartbeat runs, so
+    the connection is never written by two threads at once.
+    """
+
+    __slots__ = ("_connection", "_interval", "_stop", "_thread")
+
+    def __init__(self, connection: Connection, interval: float) -> None:
+        """Initialize the heartbeat.
+
+        Args:
+            connection: Connection to the coordinator.
+            interval: Seconds between heartbeats.
+        """
+        self._connection = connection
+        self._interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._beat, daemon=True)
+
+    def _beat(self) -> None:
+        """Send heartbeats until stopped or the coordinator is gone."""
+        while not self._stop.wait(self._interval):
+            try:
+                self._connection.send(_HEARTBEAT)
+            except OSError:
+                return
+
+    def __enter__(self) -> _Heartbeat:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._stop.set()
+        self._thread.join()
+
+
+class _DistributedRun:
+    """Work queue and worker connections of one distributed run.
+
+    Chunk IDs are indices into the run's chunks, in session order. Each
+    connected worker is served by its own thread (serve()), which takes
+    chunk IDs off the queue and puts completed results on results.
+    """
+
+    __slots__ = (
+        "_setup",
+        "_chunks",
+        "_session_seeds",
+        "_aggregate",
+        "_exact_profits",
+        "_return_sessions",
+        "_worker_timeout",
+        "_pending",
+        "_condition",
+        "_finished",
+        "results",
+    )
+
+    def __init__(
+        self,
+        setup: tuple[object, ...],
+        chunks: list[range],
+        session_seeds: dict[int, int],
+        aggregate: bool,
+        return_sessions: bool,
+        exact_profits: bool = False,
+        worker_timeout: float = DEFAULT_WORKER_TIMEOUT_SECONDS,
+    ) -> None:
+        """Initialize the run with every chunk queued.
+
+        Args:
+            setup: Arguments of _initialize_worker sent to each worker.
+            chunks: Ranges of session IDs, in session order.
+            session_seeds: Pre-generated seeds for all sessions.
+            aggregate: Have workers fold each chunk into an accumulator.
+            return_sessions: Have workers send back per-session results.
+            exact_profits: Have the accumulators keep every session profit.
+            worker_timeout: Seconds a connected worker may stay silent
+                before it is dropped and its chunks are re-queued.
+        """
+        self._setup = setup
+        self._chunks = chunks
+        self._session_seeds = session_seeds
+        self._aggregate = aggregate
+        self._exact_profits = exact_profits
+        self._return_sessions = return_sessions
+        self._worker_timeout = worker_timeout
+        self._pending: deque[int] = deque(range(len(chunks)))
+        self._condition = threading.Condition()
+        self._finished = False
+        self.results: queue.SimpleQueue[tuple[WorkerResult, range]] = (
+            queue.SimpleQueue()
+        )
+
+    @property
+    def finished(self) -> bool:
+        """Return whether the run has ended and no more chunks are handed out."""
+        return self._finished
+
+    def finish(self) -> None:
+        """End the run, releasing the threads waiting for chunks."""
+        with self._condition:
+            self._finished = True
+            self._condition.notify_all()
+
+    def _take(self, wait: bool) -> int | None:
+        """Return the next queued chunk ID, or None if there is none.
+
+        Args:
+            wait: Wait for a chunk to be queued (or re-queued) while the run
+                has not finished.
+        """
+        with self._condition:
+            while wait and not self._pending and not self._finished:
+                self._condition.wait()
+            if self._finished or not self._pending:
+                return None
+            return self._pending.popleft()
+
+    def _requeue(self, chunk_ids: list[int]) -> None:
+        """Put chunks of a lost worker back at the front of the queue."""
+        with self._condition:
+            self._pending.extendleft(sorted(chunk_ids, reverse=True))
+            self._condition.notify_all()
+
+    def _session_chunk(self, chunk_id: int) -> SessionChunk:
+        """Return the message describing a chunk to a worker."""
+        chunk = self._chunks[chunk_id]
+        return SessionChunk(
+            chunk_id=chunk_id,
+            session_ids=list(chunk),
+            session_seeds={sid: self._session_seeds[sid] for sid in chunk},
+            aggregate=self._aggregate,
+            exact_profits=self._exact_profits,
+            return_sessions=self._return_sessions,
+        )
+
+    def _receive(self, connection: Connection) -> object:
+        """Return the next message of a worker.
+
+        Args:
+            connection: Connection to the worker.
+
+        Raises:
+            TimeoutError: If the worker sent nothing within the worker
+                timeout.
+        """
+        if not connection.poll(self._worker_timeout):
+            raise TimeoutError(
+                f"No message from the worker within {self._worker_timeout} seconds"
+            )
+        return connection.recv()
+
+    def serve(self, connection: Connection, authkey: bytes) -> None:
+        """Feed chunks to one worker until the run ends or the worker is lost.
+
+        A worker is lost when its connection fails, it sends an unexpected
+        message, or it stays silent for the worker timeout (a busy worker
+        sends heartbeats).
+
+        Args:
+            connection: New connection from a worker.
+            authkey: Shared secret the worker must present.
+        """
+        in_flight: list[int] = []
+        heartbeat_seconds = self._worker_timeout / _HEARTBEATS_PER_WORKER_TIMEOUT
+        try:
+            # The same handshake as multiprocessing.connection.Listener,
+            # but a client that stays silent is dropped after the timeout
+            handshake = _HandshakeConnection(connection, self._worker_timeout)
+            deliver_challenge(handshake, authkey)  # type: ignore[arg-type]
+            answer_challenge(handshake, authkey)  # type: ignore[arg-type]
+            connection.send((_SETUP, heartbeat_seconds, *self._setup))
+            while True:
+                while len(in_flight) < _CHUNKS_IN_FLIGHT_PER_WORKER:
+                    chunk_id = self._take(wait=not in_flight)
+                    if chunk_id is None:
+                        break
+                    in_flight.append(chunk_id)
+                    connection.send((_CHUNK, self._session_chunk(chunk_id)))
+                if not in_flight:
+                    break
+                message = self._receive(connection)
+                if message == _HEARTBEAT:
+                    continue
+                if not isinstance(message, WorkerResult):
+                    raise TypeError(f"Unexpected message from worker: {message!r}")
+                in_flight.remove(message.worker_id)
+                self.results.put((message, self._chunks[message.worker_id]))
+            connection.send((_STOP,))
+        except (OSError, EOFError, AuthenticationError) as e:
+            # The worker died, disconnected or went silent (TimeoutError);
+            # another worker runs its chunks
+            _logger.info("Lost a worker (%r); re-queued %d chunks", e, len(in_flight))
+            self._requeue(in_flight)
+        except Exception:
+            # Anything else (e.g. a garbled or unexpected message) must not
+            # lose the chunks either; drop the worker and keep going
+            _logger.warning(
+                "Dropped a worker after an unexpected error; re-queued %d chunks",
+                len(in_flight),
+                exc_info=True,
+            )
+            self._requeue(in_flight)
+        finally:
+            connection.close()
+
+
+class DistributedExecutor:
+    """Runs simulation sessions on worker processes connected over sockets.
+
+    The executor listens on its address from creation until close(); start
+    workers with run_worker (`let-it-ride worker ADDRESS`) on any host,
+    before or during a run. Each worker serves one run and exits when it
+    ends. Results match ParallelExecutor for the same seed.
+
+    Example:
+        >>> with DistributedExecutor(("0.0.0.0", 7420), b"secret") as executor:
+        ...     results = SimulationController(config, distributed=executor).run()
+    """
+
+    __slots__ = (
+        "_socket",
+        "_address",
+        "_authkey",
+        "_chunk_size",
+        "_timeout",
+        "_worker_timeout",
+    )
+
+    def __init__(
+        self,
+        address: Address,
+        authkey: bytes,
+        chunk_size: int | None = None,
+        timeout: float | None = None,
+        worker_timeout: float = DEFAULT_WORKER_TIMEOUT_SECONDS,
+    ) -> None:
+        """Start listening for workers.
+
+        Args:
+            address: (host, port) to listen on for TCP (port 0 picks a free
+                port), or a path for a Unix socket.
+            authkey: Shared secret that workers must present.
+            chunk_size: Number of sessions per chunk, or None to split each
+                run into about 256 chunks.
+            timeout: Seconds to wait for a chunk to complete before failing
+                the run, or None to wait for workers indefinitely.
+            worker_timeout: Seconds a connected worker (or a client in the
+                handshake) may stay silent before it is dropped and its
+                chunks are re-queued. Busy workers send heartbeats four
+                times per worker_timeout.
+
+        Raises:
+            ValueError: If authkey is empty, or chunk_size, timeout or
+                worker_timeout is not positive.
+            OSError: If the address cannot be listened on.
+        """
+        if not authkey:
+            raise ValueError("authkey must not be empty")
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+        if timeout is not None and timeout <= 0:
+            raise ValueError(f"timeout must be positive, got {timeout}")
+        if worker_timeout <= 0:
+            raise ValueError(f"worker_timeout must be positive, got {worker_timeout}")
+        if isinstance(address, str):
+            self._socket = socket.socket(socket.AF_UNIX)
+            self._socket.bind(address)
+            self._socket.listen()
+        else:
+            self._socket = socket.create_server(address)
+        self._socket.settimeout(_ACCEPT_POLL_SECONDS)
+        self._address: Address = self._socket.getsockname()
+        self._authkey = authkey
+        self._chunk_size = chunk_size
+        self._timeout = timeout
+        self._worker_timeout = worker_timeout
+
+    @property
+    def address(self) -> Address:
+        """Return the address workers connect to."""
+        return self._address
+
+    def close(self) -> None:
+        """Stop listening for workers."""
+        self._socket.close()
+        if isinstance(self._address, str):
+            Path(self._address).unlink(missing_ok=True)
+
+    def __enter__(self) -> DistributedExecutor:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _accept(self, run: _DistributedRun) -> None:
+        """Accept workers and serve each in a thread until the run ends.
+
+        Args:
+            run: The run to serve connecting workers.
+        """
+        while not run.finished:
+            try:
+                client, _ = self._socket.accept()
+            except TimeoutError:
+                continue
+            connection = Connection(client.detach())
+            threading.Thread(
+                target=run.serve, args=(connection, self._authkey), daemon=True
+            ).start()
+
+    def _run_distributed(
+        self,
+        config: FullConfig,
+        progress_callback: ProgressCallback | None,
+        handle_result: Callable[[WorkerResult, range], None],
+        aggregate: bool = False,
+        return_sessions: bool = True,
+        exact_profits: bool = False,
+    ) -> None:
+        """Run the sessions of the configuration in chunks on the workers.
+
+        Args:
+            config: Full simulation configuration.
+            progress_callback: Optional callback for progress reporting.
+            handle_result: Called with each successful chunk's WorkerResult
+                and range of session IDs, in completion order.
+            aggregate: Have workers fold each chunk into an accumulator.
+            return_sessions: Have workers send back per-session results.
+            exact_profits: Have the accumulators keep every session profit.
+
+        Raises:
+            RuntimeError: If any chunk failed or no chunk completed within
+                the timeout.
+        """
+        num_sessions = config.simulation.num_sessions
+        session_seeds = RNGManager(
+            base_seed=config.simulation.random_seed
+        ).create_session_seeds(num_sessions)
+
+        # Derive the outcome distribution once rather than on every worker
+        outcome_distribution = None
+        if config.simulation.hand_model == "sampled":
+            outcome_distribution = exact_outcome_distribution(
+                create_strategy(config.strategy)
+            )
+        expected_hands = (
+            num_sessions * config.table.num_seats * config.simulation.hands_per_session
+        )
+
+        chunk_size = self._chunk_size or _default_chunk_size(num_sessions)
+        chunks = [
+            range(start, min(start + chunk_size, num_sessions))
+            for start in range(0, num_sessions, chunk_size)
+        ]
+        run = _DistributedRun(
+            (config, outcome_distribution, expected_hands),
+            chunks,
+            session_seeds,
+            aggregate=aggregate,
+            return_sessions=return_sessions,
+            exact_profits=exact_profits,
+            worker_timeout=self._worker_timeout,
+        )
+        acceptor = threading.Thread(target=self._accept, args=(run,), daemon=True)
+        acceptor.start()
+        try:
+            completed_sessions = 0
+            for _ in chunks:
+                try:
+                    result, chunk = run.results.get(timeout=self._timeout)
+                except queue.Empty:
+                    raise RuntimeError(
+                        f"No chunk completed within {self._timeout} seconds; "
+                        f"are workers connected to {self.address}?"
+                    ) from None
+                if result.error is not None:
+                    _raise_worker_failures([result])
+                handle_result(result, chunk)
+                completed_sessions += len(chunk)
+                if progress_callback is not None:
+                    progress_callback(completed_sessions, num_sessions)
+        finally:
+            # Idle workers are sent their stop message once the run finishes
+            run.finish()
+            acceptor.join()
+
+    def run_session_table(
+        self,
+        config: FullConfig,
+        progress_callback: ProgressCallback | None = None,
+    ) -> SessionResultTable:
+        """Execute sessions on the workers, collecting their rows.
+
+        Args:
+            config: Full simulation configuration.
+            progress_callback: Optional callback for progress reporting,
+                called with (completed_sessions, total_sessions) as each
+                chunk of sessions completes.
+
+        Returns:
+            SessionResultTable with one row per session (per seat for
+            multi-seat tables), in result ID order.
+
+        Raises:
+            RuntimeError: If any chunk fails, results are missing or no
+                chunk completed within the timeout.
+        """
+        num_rows = config.simulation.num_sessions * config.table.num_seats
+        rows = np.zeros(num_rows, dtype=SESSION_RESULT_DTYPE)
+        rows["outcome"] = _UNWRITTEN_ROW
+
+        def handle_result(worker_result: WorkerResult, _: range) -> None:
+            results = worker_result.session_results
+            result_ids = np.fromiter(
+                (result_id for result_id, _ in results),
+                dtype=np.intp,
+                count=len(results),
+            )
+            rows[result_ids] = SessionResultTable.from_results(
+                result for _, result in results
+            ).rows
+
+        self._run_distributed(config, progress_callback, handle_result)
+        _raise_missing_results(np.flatnonzero(rows["outcome"] == _UNWRITTEN_ROW))
+        return SessionResultTable(rows)
+
+    def run_sessions(
+        self,
+        config: FullConfig,
+        progress_callback: ProgressCallback | None = None,
+    ) -> list[SessionResult]:
+        """Execute sessions on the workers.
+
+        Args:
+            config: Full simulation configuration.
+            progress_callback: Optional callback for progress reporting.
+
+        Returns:
+            List of SessionResult objects in session order.
+            For multi-seat tables, returns num_sessions * num_seats results.
+
+        Raises:
+            RuntimeError: If any chunk fails or no chunk completed within
+                the timeout.
+        """
+        return list(self.run_session_table(config, progress_callback))
+
+    def reduce_sessions(
+        self,
+        config: FullConfig,
+        progress_callback: ProgressCallback | None = None,
+        session_sink: SessionSink | None = None,
+        exact_profits: bool = False,
+    ) -> AggregateAccumulator:
+        """Execute sessions on the workers, reducing them there.
+
+        Each worker folds a chunk into an AggregateAccumulator and sends
+        back only that summary (plus the chunk's rows if session_sink is
+        given). Summaries are merged in session order, so the result is
+        identical to ParallelExecutor.reduce_sessions with the same
+        chunk_size, whichever workers ran the chunks.
+
+        Args:
+            config: Full simulation configuration.
+            progress_callback: Optional callback for progress reporting.
+            session_sink: Optional consumer of per-session rows, called with
+                each chunk's results in session order.
+            exact_profits: Keep every session profit so the median and
+                standard deviation are exact (see AggregateAccumulator).
+
+        Returns:
+            AggregateAccumulator over all sessions (and seats).
+
+        Raises:
+            RuntimeError: If any chunk fails or no chunk completed within
+                the timeout.
+        """
+        total = AggregateAccumulator(exact_profits=exact_profits)
+        # Chunks complete out of order; hold them until their turn
+        pending: dict[int, WorkerResult] = {}
+        next_chunk_id = 0
+
+        def handle_result(worker_result: WorkerResult, _: range) -> None:
+            nonlocal next_chunk_id
+            pending[worker_result.worker_id] = worker_result
+            while next_chunk_id in pending:
+                ready = pending.pop(next_chunk_id)
+                assert ready.aggregate is not None
+                total.merge(ready.aggregate)
+                if session_sink is not None:
+                    session_sink([result for _, result in ready.session_results])
+                next_chunk_id += 1
+
+        self._run_distributed(
+            config,
+            progress_callback,
+            handle_result,
+            aggregate=True,
+            return_sessions=session_sink is not None,
+            exact_profits=exact_profits,
+        )
+        return total
+
+
+def _connect(address: Address, authkey: bytes, timeout: float) -> Connection:
+    """Connect to a coordinator, retrying until it is listening.
+
+    Args:
+        address: Address of the coordinator.
+        authkey: Shared secret of the coordinator.
+        timeout: Seconds to keep retrying.
+
+    Raises:
+        ConnectionError: If the coordinator could not be reached in time.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            connection: Connection = Client(address, authkey=authkey)
+            return connection
+        except (ConnectionRefusedError, FileNotFoundError) as e:
+            if time.monotonic() >= deadline:
+                raise ConnectionError(
+                    f"Could not reach a coordinator at {address}"
+                ) from e
+            time.sleep(_CONNECT_RETRY_SECONDS)
+
+
+def run_worker(address: Address, authkey: bytes, connect_timeout: float = 30.0) -> int:
+    """Run chunks of sessions for a coordinator until its run ends.
+
+    Args:
+        address: Address of the DistributedExecutor.
+        authkey: Shared secret of the coordinator.
+        connect_timeout: Seconds to keep retrying while the coordinator is
+            not listening yet.
+
+    Returns:
+        Number of chunks this worker ran.
+
+    Raises:
+        ConnectionError: If the coordinator could not be reached in time.
+        multiprocessing.AuthenticationError: If the authkey is wrong.
+    """
+    chunks_run = 0
+    heartbeat_seconds = 0.0
+    with _connect(address, authkey, connect_timeout) as connection:
+        while True:
+            try:
+                message = connection.recv()
+            except EOFError:
+                # The coordinator went away; its other workers carry on
+                break
+            kind = message[0]
+            if kind == _SETUP:
+                heartbeat_seconds = message[1]
+                with _Heartbeat(connection, heartbeat_seconds):
+                    _initialize_worker(*message[2:])
+            elif kind == _CHUNK:
+                with _Heartbeat(connection, heartbeat_seconds):
+                    result = run_session_chunk(message[1])
+                connection.send(result)
+                chunks_run += 1
+            else:
+                break
+    return chunks_run
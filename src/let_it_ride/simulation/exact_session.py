@@ -0,0 +1,382 @@
+"""Exact session outcome distribution by dynamic programming.
+
+With flat betting and a fixed bonus bet, every hand moves the bankroll by
+one of a few amounts with fixed probabilities, so a session is a bounded
+random walk. Instead of sampling sessions, the probability of every
+bankroll state is propagated one hand at a time:
+- Bankrolls are offsets from the start on a grid whose step divides every
+  hand result (the greatest common divisor of base_bet and bonus_bet)
+- Mass that crosses a stop condition is absorbed with that stop reason, in
+  Session.should_stop() order
+- ExactSessionStatistics carries the AggregateStatistics metrics as exact
+  per-session expectations, plus the full session profit distribution
+
+The cost grows with the number of grid states between the stop conditions
+and the number of hands, not with the number of sessions.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from fractions import Fraction
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from let_it_ride.bankroll import FlatBetting
+from let_it_ride.simulation.controller import create_betting_system, create_strategy
+from let_it_ride.simulation.outcome_sampling import exact_outcome_distribution
+from let_it_ride.simulation.session import StopReason
+from let_it_ride.simulation.utils import (
+    calculate_bonus_bet,
+    create_session_config,
+    get_bonus_paytable,
+    get_main_paytable,
+)
+
+if TYPE_CHECKING:
+    from let_it_ride.config.models import FullConfig
+    from let_it_ride.config.paytables import BonusPaytable, MainGamePaytable
+    from let_it_ride.simulation.outcome_sampling import OutcomeDistribution
+    from let_it_ride.simulation.session import SessionConfig
+
+# Largest number of bankroll states between the stop conditions
+MAX_GRID_STATES: int = 1_000_000
+
+# Codes of the stop reasons a state outside the active range stops with
+_WIN, _LOSS, _INSUFFICIENT, _MAX_HANDS = range(4)
+_REASONS = (
+    StopReason.WIN_LIMIT,
+    StopReason.LOSS_LIMIT,
+    StopReason.INSUFFICIENT_FUNDS,
+    StopReason.MAX_HANDS,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ExactSessionStatistics:
+    """Exact statistics of a session, as probabilities and expectations.
+
+    Fields mirror AggregateStatistics, with counts replaced by rates and
+    totals replaced by per-session expectations. Profit statistics are
+    over the exact distribution, so session_profit_std is the population
+    standard deviation.
+
+    Attributes:
+        session_win_rate: Probability of ending with positive profit.
+        session_loss_rate: Probability of ending with negative profit.
+        session_push_rate: Probability of ending with zero profit.
+        stop_reason_probabilities: Probability of each stop reason.
+        expected_hands: Expected number of hands per session.
+        expected_wagered: Expected main game amount wagered per session.
+        expected_bonus_wagered: Expected bonus amount wagered per session.
+        expected_value_per_hand: Expected net result per hand.
+        main_ev_per_hand: Main game expected value per hand.
+        bonus_ev_per_hand: Bonus expected value per hand.
+        session_profit_mean: Expected session profit.
+        session_profit_std: Standard deviation of session profit.
+        session_profit_median: Median session profit.
+        session_profit_min: Lowest possible session profit.
+        session_profit_max: Highest possible session profit.
+        profit_values: Every possible session profit, ascending.
+        profit_probabilities: Probability of each of profit_values.
+        residual_probability: Probability of sessions still running when
+            propagation stopped (only without max_hands, below tolerance).
+    """
+
+    session_win_rate: float
+    session_loss_rate: float
+    session_push_rate: float
+    stop_reason_probabilities: dict[StopReason, float]
+    expected_hands: float
+    expected_wagered: float
+    expected_bonus_wagered: float
+    expected_value_per_hand: float
+    main_ev_per_hand: float
+    bonus_ev_per_hand: float
+    session_profit_mean: float
+    session_profit_std: float
+    session_profit_median: float
+    session_profit_min: float
+    session_profit_max: float
+    profit_values: tuple[float, ...]
+    profit_probabilities: tuple[float, ...]
+    residual_probability: float
+
+
+def _grid_step(base_bet: float, bonus_bet: float) -> Fraction:
+    """Return the largest amount that divides every bet of a hand."""
+    step = Fraction(str(base_bet))
+    if bonus_bet > 0:
+        bonus = Fraction(str(bonus_bet))
+        denominator = (
+            step.denominator
+            * bonus.denominator
+            // math.gcd(step.denominator, bonus.denominator)
+        )
+        step = Fraction(
+            math.gcd(int(step * denominator), int(bonus * denominator)), denominator
+        )
+    return step
+
+
+def _first_offset_at_or_above(amount: float, step: Fraction) -> int:
+    """Return the smallest offset whose profit is at least amount."""
+    return math.ceil(Fraction(amount) / step)
+
+
+def _last_offset_at_or_below(amount: float, step: Fraction) -> int:
+    """Return the largest offset whose profit is at most amount."""
+    return math.floor(Fraction(amount) / step)
+
+
+def calculate_session_distribution(
+    config: SessionConfig,
+    distribution: OutcomeDistribution,
+    main_paytable: MainGamePaytable,
+    bonus_paytable: BonusPaytable | None,
+    tolerance: float = 1e-12,
+) -> ExactSessionStatistics:
+    """Calculate the exact outcome distribution of a flat-betting session.
+
+    Every hand bets config.base_bet and config.bonus_bet, as a Session
+    with FlatBetting and no bonus strategy does.
+
+    Args:
+        config: Session configuration.
+        distribution: Outcome distribution of the strategy being played.
+        main_paytable: Paytable for main game payouts.
+        bonus_paytable: Paytable for bonus payouts (None if no bonus).
+        tolerance: Without max_hands, propagation stops once the
+            probability of a session still running falls below this.
+
+    Returns:
+        ExactSessionStatistics of one session.
+
+    Raises:
+        ValueError: If config.bonus_bet > 0 without a bonus_paytable, the
+            stop conditions do not bound the bankroll, there are more than
+            MAX_GRID_STATES states between them, or a session could reach
+            a bankroll below base_bet (where flat bets would shrink).
+    """
+    if not 0 < tolerance < 1:
+        raise ValueError(f"tolerance must be between 0 and 1, got {tolerance}")
+    base_bet = config.base_bet
+    bonus_bet = config.bonus_bet
+    if bonus_bet > 0 and bonus_paytable is None:
+        raise ValueError("bonus_bet > 0 requires a bonus_paytable to be configured")
+
+    # Net result of each outcome in grid steps, merged by value
+    step = _grid_step(base_bet, bonus_bet)
+    main_units = distribution.main_net_units(main_paytable)
+    bonus_units = np.zeros(len(distribution.outcomes), dtype=np.int64)
+    if bonus_bet > 0:
+        assert bonus_paytable is not None
+        bonus_units = distribution.bonus_net_units(bonus_paytable)
+    main_steps = int(Fraction(str(base_bet)) / step)
+    bonus_steps = int(Fraction(str(bonus_bet)) / step)
+    probabilities = np.array(distribution.probabilities, dtype=np.float64)
+    deltas, inverse = np.unique(
+        main_units * main_steps + bonus_units * bonus_steps, return_inverse=True
+    )
+    delta_probabilities = np.bincount(inverse, weights=probabilities)
+    min_delta = int(deltas[0])
+    max_delta = int(deltas[-1])
+
+    # Active offsets lo..hi are those where no stop condition holds before
+    # max_hands; anything beyond them stops
+    win_offset = loss_offset = funds_offset = None
+    if config.win_limit is not None:
+        win_offset = _first_offset_at_or_above(config.win_limit, step)
+    if config.loss_limit is not None:
+        loss_offset = _last_offset_at_or_below(-config.loss_limit, step)
+    if config.stop_on_insufficient_funds:
+        min_required = (base_bet * 3) + bonus_bet
+        funds_offset = _first_offset_at_or_above(
+            min_required - config.starting_bankroll, step
+        )
+    lower_bounds = []
+    if loss_offset is not None:
+        lower_bounds.append(loss_offset + 1)
+    if funds_offset is not None:
+        lower_bounds.append(funds_offset)
+    max_hands = config.max_hands
+    if win_offset is not None:
+        hi = win_offset - 1
+    elif max_hands is not None:
+        hi = max_hands * max(max_delta, 0)
+    else:
+        raise ValueError("Exact sessions need a win_limit or max_hands")
+    if lower_bounds:
+        lo = max(lower_bounds)
+    elif max_hands is not None:
+        lo = max_hands * min(min_delta, 0)
+    else:
+        raise ValueError(
+            "Exact sessions need a loss_limit, stop_on_insufficient_funds or max_hands"
+        )
+    num_states = hi - lo + 1
+    if num_states > MAX_GRID_STATES:
+        raise ValueError(
+            f"{num_states} bankroll states exceed the maximum of "
+            f"{MAX_GRID_STATES}; use larger bets relative to the limits"
+        )
+    if config.starting_bankroll + float(lo * step) < base_bet:
+        raise ValueError(
+            "A session could continue with a bankroll below base_bet; "
+            "set stop_on_insufficient_funds or a tighter loss_limit"
+        )
+
+    # Extended grid covers every offset reachable from an active one
+    ext_lo = lo + min(min_delta, 0)
+    ext_len = hi + max(max_delta, 0) - ext_lo + 1
+    active = slice(lo - ext_lo, hi - ext_lo + 1)
+    offsets = np.arange(ext_lo, ext_lo + ext_len)
+    reasons = np.full(ext_len, _INSUFFICIENT, dtype=np.int64)
+    if loss_offset is not None:
+        reasons[offsets <= loss_offset] = _LOSS
+    if win_offset is not None:
+        reasons[offsets >= win_offset] = _WIN
+    outside = np.ones(ext_len, dtype=bool)
+    outside[active] = False
+
+    # Only the band of active states a session can have reached so far
+    # holds mass; it widens by the hand results each step
+    shift = lo - ext_lo
+    state = np.zeros(num_states, dtype=np.float64)
+    state[-lo] = 1.0
+    band_lo = band_hi = -lo
+    final = np.zeros(ext_len, dtype=np.float64)
+    reason_mass = np.zeros(len(_REASONS), dtype=np.float64)
+    expected_hands = 0.0
+    hands = 0
+    residual = 0.0
+    while band_lo <= band_hi:
+        band = state[band_lo : band_hi + 1]
+        expected_hands += band.sum()
+        window = slice(shift + band_lo + min_delta, shift + band_hi + max_delta + 1)
+        after = np.zeros(window.stop - window.start, dtype=np.float64)
+        for delta, probability in zip(
+            deltas.tolist(), delta_probabilities.tolist(), strict=True
+        ):
+            start = delta - min_delta
+            after[start : start + len(band)] += probability * band
+        hands += 1
+
+        stopped = np.where(outside[window], after, 0.0)
+        stop_codes = reasons[window]
+        if max_hands is not None and hands >= max_hands:
+            # Max hands is checked before insufficient funds
+            stop_codes = np.where(stop_codes == _INSUFFICIENT, _MAX_HANDS, stop_codes)
+        final[window] += stopped
+        reason_mass += np.bincount(stop_codes, weights=stopped, minlength=4)
+
+        state[band_lo : band_hi + 1] = 0.0
+        band_lo = max(window.start - shift, 0)
+        band_hi = min(window.stop - 1 - shift, num_states - 1)
+        band = after[
+            shift + band_lo - window.start : shift + band_hi + 1 - window.start
+        ]
+        state[band_lo : band_hi + 1] = band
+
+        if max_hands is not None and hands >= max_hands:
+            final[shift + band_lo : shift + band_hi + 1] += band
+            reason_mass[_MAX_HANDS] += band.sum()
+            break
+        if max_hands is None and band.sum() < tolerance:
+            residual = float(band.sum())
+            break
+
+    # Profit distribution over the offsets a session can end on
+    support = np.flatnonzero(final)
+    end_offsets = offsets[support]
+    end_probabilities = final[support]
+    profit_values = end_offsets * float(step)
+    total = end_probabilities.sum()
+    profit_mean = float(np.dot(profit_values, end_probabilities) / total)
+    profit_variance = float(
+        np.dot((profit_values - profit_mean) ** 2, end_probabilities) / total
+    )
+    cumulative = np.cumsum(end_probabilities)
+    median_index = int(np.searchsorted(cumulative, total / 2))
+
+    main_ev_per_hand = base_bet * float(np.dot(probabilities, main_units))
+    bonus_ev_per_hand = bonus_bet * float(np.dot(probabilities, bonus_units))
+    units_at_risk = float(
+        np.dot(
+            probabilities,
+            [outcome.bets_at_risk for outcome in distribution.outcomes],
+        )
+    )
+
+    return ExactSessionStatistics(
+        session_win_rate=float(end_probabilities[end_offsets > 0].sum()),
+        session_loss_rate=float(end_probabilities[end_offsets < 0].sum()),
+        session_push_rate=float(end_probabilities[end_offsets == 0].sum()),
+        stop_reason_probabilities={
+            reason: float(mass)
+            for reason, mass in zip(_REASONS, reason_mass.tolist(), strict=True)
+            if mass > 0
+        },
+        expected_hands=expected_hands,
+        expected_wagered=expected_hands * base_bet * units_at_risk,
+        expected_bonus_wagered=expected_hands * bonus_bet,
+        expected_value_per_hand=main_ev_per_hand + bonus_ev_per_hand,
+        main_ev_per_hand=main_ev_per_hand,
+        bonus_ev_per_hand=bonus_ev_per_hand,
+        session_profit_mean=profit_mean,
+        session_profit_std=math.sqrt(profit_variance),
+        session_profit_median=float(profit_values[median_index]),
+        session_profit_min=float(profit_values[0]),
+        session_profit_max=float(profit_values[-1]),
+        profit_values=tuple(profit_values.tolist()),
+        profit_probabilities=tuple(end_probabilities.tolist()),
+        residual_probability=residual,
+    )
+
+
+def calculate_exact_session_statistics(
+    config: FullConfig, tolerance: float = 1e-12
+) -> ExactSessionStatistics:
+    """Calculate exact session statistics for a simulation configuration.
+
+    The analytic counterpart of SimulationController.run() for
+    configurations whose sessions are bounded random walks.
+
+    Args:
+        config: Full simulation configuration with flat betting, a fixed
+            bonus bet and a strategy that does not read StrategyContext.
+        tolerance: See calculate_session_distribution().
+
+    Returns:
+        ExactSessionStatistics of one session.
+
+    Raises:
+        ValueError: If the betting system is not flat, the bonus bet is not
+            fixed, the strategy reads StrategyContext, or the stop
+            conditions are rejected by calculate_session_distribution().
+    """
+    if not isinstance(create_betting_system(config.bankroll), FlatBetting):
+        raise ValueError(
+            f"Exact sessions need flat betting, not "
+            f"'{config.bankroll.betting_system.type}'"
+        )
+    bonus_type = config.bonus_strategy.type
+    if bonus_type not in ("never", "always", "static") or (
+        bonus_type == "static"
+        and config.bonus_strategy.static is not None
+        and config.bonus_strategy.static.amount is None
+    ):
+        raise ValueError(
+            f"Exact sessions need a fixed bonus bet; bonus strategy type "
+            f"'{bonus_type}' is not supported"
+        )
+
+    return calculate_session_distribution(
+        config=create_session_config(config, calculate_bonus_bet(config)),
+        distribution=exact_outcome_distribution(create_strategy(config.strategy)),
+        main_paytable=get_main_paytable(config),
+        bonus_paytable=get_bonus_paytable(config),
+        tolerance=tolerance,
+    )
@@ -0,0 +1,264 @@
+"""Lockstep simulation of many sessions as NumPy arrays.
+
+Session.run_to_completion() plays one session at a time. For strategies
+whose hands can be sampled from an outcome distribution (see
+outcome_sampling), the sessions of a simulation can instead advance
+together, one hand per step:
+- Bankroll, peak, drawdown and wagering totals are arrays over sessions
+- Stop conditions are evaluated as masks in the same order as
+  Session.should_stop(), and stopped sessions drop out of the next step
+- Bets come from a VectorizedBettingSystem, so progressions run on arrays
+- Results are SessionResult-equivalent columns (LockstepResults)
+
+Every session follows exactly the arithmetic of Session with an
+OutcomeSamplingEngine; only the random streams differ.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from let_it_ride.simulation.outcome_sampling import AliasTable
+from let_it_ride.simulation.session import SessionOutcome, SessionResult, StopReason
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+    from let_it_ride.bankroll.vectorized import VectorizedBettingSystem
+    from let_it_ride.config.paytables import BonusPaytable, MainGamePaytable
+    from let_it_ride.simulation.outcome_sampling import OutcomeDistribution
+    from let_it_ride.simulation.session import SessionConfig
+
+# Stop reasons by the code stored in LockstepResults.stop_reason
+STOP_REASONS: tuple[StopReason, ...] = tuple(StopReason)
+
+# Codes of the stop reasons a single lockstep session can end with
+_WIN_LIMIT = STOP_REASONS.index(StopReason.WIN_LIMIT)
+_LOSS_LIMIT = STOP_REASONS.index(StopReason.LOSS_LIMIT)
+_MAX_HANDS = STOP_REASONS.index(StopReason.MAX_HANDS)
+_INSUFFICIENT_FUNDS = STOP_REASONS.index(StopReason.INSUFFICIENT_FUNDS)
+
+
+@dataclass(frozen=True, slots=True)
+class LockstepResults:
+    """Results of sessions run in lockstep, one array entry per session.
+
+    Columns carry the fields of SessionResult with the same meaning.
+
+    Attributes:
+        starting_bankroll: Initial bankroll of every session.
+        stop_reason: Index into STOP_REASONS of why each session stopped.
+        hands_played: Number of hands played.
+        final_bankroll: Bankroll at the end of the session.
+        session_profit: Net profit/loss (final - starting).
+        total_wagered: Sum of all main game bets at risk.
+        total_bonus_wagered: Sum of all bonus bets placed.
+        peak_bankroll: Highest bankroll reached.
+        max_drawdown: Maximum peak-to-trough decline.
+        max_drawdown_pct: Maximum drawdown as percentage of its peak.
+    """
+
+    starting_bankroll: float
+    stop_reason: NDArray[np.int8]
+    hands_played: NDArray[np.int64]
+    final_bankroll: NDArray[np.float64]
+    session_profit: NDArray[np.float64]
+    total_wagered: NDArray[np.float64]
+    total_bonus_wagered: NDArray[np.float64]
+    peak_bankroll: NDArray[np.float64]
+    max_drawdown: NDArray[np.float64]
+    max_drawdown_pct: NDArray[np.float64]
+
+    def __len__(self) -> int:
+        """Return the number of sessions."""
+        return len(self.hands_played)
+
+    def to_session_results(self) -> list[SessionResult]:
+        """Convert the columns to one SessionResult per session."""
+        results = []
+        for (
+            reason,
+            hands,
+            final,
+            profit,
+            wagered,
+            bonus_wagered,
+            peak,
+            drawdown,
+            drawdown_pct,
+        ) in zip(
+            self.stop_reason.tolist(),
+            self.hands_played.tolist(),
+            self.final_bankroll.tolist(),
+            self.session_profit.tolist(),
+            self.total_wagered.tolist(),
+            self.total_bonus_wagered.tolist(),
+            self.peak_bankroll.tolist(),
+            self.max_drawdown.tolist(),
+            self.max_drawdown_pct.tolist(),
+            strict=True,
+        ):
+            if profit > 0:
+                outcome = SessionOutcome.WIN
+            elif profit < 0:
+                outcome = SessionOutcome.LOSS
+            else:
+                outcome = SessionOutcome.PUSH
+            results.append(
+                SessionResult(
+                    outcome=outcome,
+                    stop_reason=STOP_REASONS[reason],
+                    hands_played=hands,
+                    starting_bankroll=self.starting_bankroll,
+                    final_bankroll=final,
+                    session_profit=profit,
+                    total_wagered=wagered,
+                    total_bonus_wagered=bonus_wagered,
+                    peak_bankroll=peak,
+                    max_drawdown=drawdown,
+                    max_drawdown_pct=drawdown_pct,
+                )
+            )
+        return results
+
+
+def run_lockstep_sessions(
+    config: SessionConfig,
+    distribution: OutcomeDistribution,
+    main_paytable: MainGamePaytable,
+    bonus_paytable: BonusPaytable | None,
+    betting_system: VectorizedBettingSystem,
+    num_sessions: int,
+    rng: np.random.Generator,
+) -> LockstepResults:
+    """Run sessions in lockstep with hands sampled from a distribution.
+
+    Each step plays one hand in every session that has not stopped. The
+    bonus bet is config.bonus_bet on every hand, as in a Session without a
+    bonus strategy.
+
+    Args:
+        config: Session configuration shared by every session.
+        distribution: Outcome distribution of the strategy being played.
+        main_paytable: Paytable for main game payouts.
+        bonus_paytable: Paytable for bonus payouts (None if no bonus).
+        betting_system: Array-based betting system; it is reset for
+            num_sessions sessions.
+        num_sessions: Number of sessions to run.
+        rng: NumPy generator for the outcome draws.
+
+    Returns:
+        LockstepResults with one entry per session.
+
+    Raises:
+        ValueError: If num_sessions is not positive, config.bonus_bet > 0
+            without a bonus_paytable, or a session has to play a hand with
+            no bankroll left to bet (GameEngine rejects such a hand too).
+    """
+    if num_sessions < 1:
+        raise ValueError(f"num_sessions must be positive, got {num_sessions}")
+    bonus_bet = config.bonus_bet
+    if bonus_bet > 0 and bonus_paytable is None:
+        raise ValueError("bonus_bet > 0 requires a bonus_paytable to be configured")
+
+    table = AliasTable(distribution.probabilities)
+    units = np.array(
+        [outcome.bets_at_risk for outcome in distribution.outcomes], dtype=np.float64
+    )
+    main_ratios = np.array(
+        [
+            main_paytable.payouts[outcome.final_hand_rank]
+            for outcome in distribution.outcomes
+        ],
+        dtype=np.float64,
+    )
+    bonus_ratios = np.zeros(len(distribution.outcomes), dtype=np.float64)
+    if bonus_bet > 0:
+        assert bonus_paytable is not None
+        bonus_ratios[:] = [
+            bonus_paytable.payouts[outcome.bonus_hand_rank]
+            for outcome in distribution.outcomes
+        ]
+    # Settled as in settle_hand(): a losing bonus loses the bonus bet
+    bonus_nets = np.where(bonus_ratios > 0, bonus_bet * bonus_ratios, -bonus_bet)
+    min_required = (config.base_bet * 3) + bonus_bet
+
+    starting = config.starting_bankroll
+    balance = np.full(num_sessions, starting, dtype=np.float64)
+    peak = balance.copy()
+    max_drawdown = np.zeros(num_sessions, dtype=np.float64)
+    peak_at_max_drawdown = balance.copy()
+    hands_played = np.zeros(num_sessions, dtype=np.int64)
+    total_wagered = np.zeros(num_sessions, dtype=np.float64)
+    total_bonus_wagered = np.zeros(num_sessions, dtype=np.float64)
+    stop_reason = np.full(num_sessions, -1, dtype=np.int8)
+    betting_system.reset(num_sessions)
+
+    active = np.arange(num_sessions, dtype=np.intp)
+    while True:
+        # Stop conditions in Session.should_stop() order; the first one
+        # that holds is the session's stop reason
+        profit = balance[active] - starting
+        reasons = np.full(len(active), -1, dtype=np.int8)
+        if config.stop_on_insufficient_funds:
+            reasons[balance[active] < min_required] = _INSUFFICIENT_FUNDS
+        if config.max_hands is not None:
+            reasons[hands_played[active] >= config.max_hands] = _MAX_HANDS
+        if config.loss_limit is not None:
+            reasons[profit <= -config.loss_limit] = _LOSS_LIMIT
+        if config.win_limit is not None:
+            reasons[profit >= config.win_limit] = _WIN_LIMIT
+        stopped = reasons >= 0
+        stop_reason[active[stopped]] = reasons[stopped]
+        active = active[~stopped]
+        if len(active) == 0:
+            break
+
+        bets = betting_system.get_bets(active, balance[active])
+        if np.any(bets <= 0):
+            raise ValueError(
+                "base_bet must be positive; a session ran out of bankroll "
+                "without a stop condition to end it"
+            )
+        outcomes = table.sample_array(rng, len(active))
+        bets_at_risk = bets * units[outcomes]
+        ratios = main_ratios[outcomes]
+        net = (
+            np.where(ratios > 0, bets_at_risk * ratios, -bets_at_risk)
+            + bonus_nets[outcomes]
+        )
+
+        session_balance = balance[active] + net
+        session_peak = np.maximum(peak[active], session_balance)
+        drawdown = session_peak - session_balance
+        deeper = drawdown > max_drawdown[active]
+        balance[active] = session_balance
+        peak[active] = session_peak
+        max_drawdown[active[deeper]] = drawdown[deeper]
+        peak_at_max_drawdown[active[deeper]] = session_peak[deeper]
+        hands_played[active] += 1
+        total_wagered[active] += bets_at_risk
+        total_bonus_wagered[active] += bonus_bet
+        betting_system.record_results(active, net)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        max_drawdown_pct = np.where(
+            peak_at_max_drawdown == 0,
+            0.0,
+            (max_drawdown / peak_at_max_drawdown) * 100,
+        )
+    return LockstepResults(
+        starting_bankroll=starting,
+        stop_reason=stop_reason,
+        hands_played=hands_played,
+        final_bankroll=balance,
+        session_profit=balance - starting,
+        total_wagered=total_wagered,
+        total_bonus_wagered=total_bonus_wagered,
+        peak_bankroll=peak,
+        max_drawdown=max_drawdown,
+        max_drawdown_pct=max_drawdown_pct,
+    )
@@ -0,0 +1,491 @@
+"""Outcome-distribution sampling of hands for stateless strategies.
+
+For a strategy that decides from the cards alone, every hand settles as one
+of about a hundred outcomes: Bet 1 and Bet 2 decisions, final 5-card rank
+and 3-card bonus rank. Bets at risk and payouts follow from the outcome and
+the bet sizes, so a session's money flow can be simulated by drawing
+outcomes instead of dealing cards:
+- OutcomeDistribution: the outcomes of a strategy and their probabilities,
+  derived exactly (exact_outcome_distribution) or from a calibration run
+  (sampled_outcome_distribution)
+- AliasTable: Walker's alias method, O(1) per draw, scalar or NumPy batches
+- OutcomeSamplingEngine: a drop-in HandEngine for Session, so stop
+  conditions, betting systems and bonus strategies behave as with
+  GameEngine
+
+The distribution does not depend on the paytables, which are applied when
+hands are settled.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from let_it_ride.config.paytables import standard_main_paytable
+from let_it_ride.core.batch_engine import BatchGameEngine
+from let_it_ride.core.card import CARD_BY_CODE
+from let_it_ride.core.game_engine import GameHandResult
+from let_it_ride.core.hand_evaluator import FiveCardHandRank
+from let_it_ride.core.hand_processing import settle_hand
+from let_it_ride.core.three_card_evaluator import ThreeCardHandRank
+from let_it_ride.strategy.base import Decision
+
+if TYPE_CHECKING:
+    import random
+    from collections.abc import Sequence
+
+    from numpy.typing import NDArray
+
+    from let_it_ride.config.paytables import BonusPaytable, MainGamePaytable
+    from let_it_ride.core.batch_engine import HandBatch
+    from let_it_ride.strategy.base import Strategy, StrategyContext
+
+# Starting-hand classes enumerated per array operation in
+# exact_outcome_distribution (32 x 1,176 community pairs per batch)
+_STARTING_HANDS_PER_BATCH = 32
+
+# Ordered (first, second) positions of two distinct community cards among
+# the 49 cards left after the starting hand, split by which comes first
+_PAIR_FIRST, _PAIR_SECOND = np.triu_indices(49, k=1)
+
+# Outcome keys combine the final rank value, the bonus rank value (1-7) and
+# the Bet 1 and Bet 2 ride flags
+_BONUS_RANK_VALUES = max(rank.value for rank in ThreeCardHandRank) + 1
+_NUM_OUTCOME_KEYS = len(FiveCardHandRank) * _BONUS_RANK_VALUES * 4
+
+
+@dataclass(frozen=True, slots=True)
+class HandOutcome:
+    """A class of hands that settle identically for any bet sizes.
+
+    Attributes:
+        decision_bet1: Decision on Bet 1.
+        decision_bet2: Decision on Bet 2.
+        final_hand_rank: The final 5-card hand rank.
+        bonus_hand_rank: The player's 3-card bonus hand rank.
+        player_codes: Card codes of the 3 player cards of one deal with
+            this outcome (reported in sampled hand results).
+        community_codes: The 2 community card codes of the same deal.
+    """
+
+    decision_bet1: Decision
+    decision_bet2: Decision
+    final_hand_rank: FiveCardHandRank
+    bonus_hand_rank: ThreeCardHandRank
+    player_codes: tuple[int, int, int]
+    community_codes: tuple[int, int]
+
+    @property
+    def bets_at_risk(self) -> int:
+        """Return the number of base bets left riding (1-3)."""
+        return (
+            1
+            + (self.decision_bet1 == Decision.RIDE)
+            + (self.decision_bet2 == Decision.RIDE)
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class OutcomeDistribution:
+    """Probability distribution of the hand outcomes of a strategy.
+
+    Attributes:
+        outcomes: Every outcome with nonzero probability.
+        probabilities: Probability of each outcome (sums to 1).
+        hands: Number of (equally likely) deals the distribution was
+            counted from.
+        exact: True if every possible deal was counted.
+    """
+
+    outcomes: tuple[HandOutcome, ...]
+    probabilities: tuple[float, ...]
+    hands: int
+    exact: bool
+
+    def main_net_units(self, main_paytable: MainGamePaytable) -> NDArray[np.int64]:
+        """Return the main game net result of each outcome in base bets.
+
+        Args:
+            main_paytable: Paytable for the main game.
+
+        Returns:
+            Array with one entry per outcome.
+        """
+        return np.array(
+            [
+                outcome.bets_at_risk * ratio if ratio > 0 else -outcome.bets_at_risk
+                for outcome in self.outcomes
+                for ratio in (main_paytable.payouts[outcome.final_hand_rank],)
+            ],
+            dtype=np.int64,
+        )
+
+    def bonus_net_units(self, bonus_paytable: BonusPaytable) -> NDArray[np.int64]:
+        """Return the bonus net result of each outcome per unit of bonus bet.
+
+        Args:
+            bonus_paytable: Paytable for the three-card bonus.
+
+        Returns:
+            Array with one entry per outcome.
+        """
+        return np.array(
+            [
+                ratio if ratio > 0 else -1
+                for outcome in self.outcomes
+                for ratio in (bonus_paytable.payouts[outcome.bonus_hand_rank],)
+            ],
+            dtype=np.int64,
+        )
+
+    def expected_value(self, main_paytable: MainGamePaytable) -> float:
+        """Return the main game expected net result per hand in base bets."""
+        return float(np.dot(self.probabilities, self.main_net_units(main_paytable)))
+
+
+class AliasTable:
+    """Walker's alias method for sampling a discrete distribution.
+
+    Each draw picks a column uniformly and keeps it or takes its alias
+    depending on one biased coin, so sampling is O(1) regardless of the
+    number of outcomes.
+    """
+
+    def __init__(self, probabilities: Sequence[float]) -> None:
+        """Build the table with Vose's algorithm.
+
+        Args:
+            probabilities: Non-negative weights; they are normalized.
+
+        Raises:
+            ValueError: If there are no weights, a weight is negative or
+                all weights are zero.
+        """
+        if not probabilities:
+            raise ValueError("probabilities must not be empty")
+        if min(probabilities) < 0:
+            raise ValueError("probabilities must be non-negative")
+        total = sum(probabilities)
+        if total <= 0:
+            raise ValueError("probabilities must not all be zero")
+
+        size = len(probabilities)
+        scaled = [p * size / total for p in probabilities]
+        keep = [1.0] * size
+        alias = list(range(size))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            low = small.pop()
+            high = large[-1]
+            keep[low] = scaled[low]
+            alias[low] = high
+            scaled[high] -= 1.0 - scaled[low]
+            if scaled[high] < 1.0:
+                small.append(large.pop())
+        # Leftovers are 1 up to rounding and keep their own column
+
+        self._size = size
+        self._keep = keep
+        self._alias = alias
+        self._keep_array = np.array(keep)
+        self._alias_array = np.array(alias, dtype=np.int64)
+
+    def __len__(self) -> int:
+        """Return the number of outcomes."""
+        return self._size
+
+    def sample(self, rng: random.Random) -> int:
+        """Draw one outcome index using a single random number.
+
+        Args:
+            rng: Random number generator.
+
+        Returns:
+            Index of the drawn outcome.
+        """
+        scaled = rng.random() * self._size
+        column = int(scaled)
+        return column if scaled - column < self._keep[column] else self._alias[column]
+
+    def sample_array(self, rng: np.random.Generator, size: int) -> NDArray[np.int64]:
+        """Draw a batch of outcome indices.
+
+        Args:
+            rng: NumPy random generator.
+            size: Number of draws.
+
+        Returns:
+            Array of outcome indices.
+        """
+        columns = rng.integers(0, self._size, size=size)
+        coins = rng.random(size)
+        indices: NDArray[np.int64] = np.where(
+            coins < self._keep_array[columns], columns, self._alias_array[columns]
+        )
+        return indices
+
+
+class OutcomeSamplingEngine:
+    """Plays hands by sampling settled outcomes instead of dealing cards.
+
+    A drop-in HandEngine for Session. Bets at risk, payouts and net results
+    are settled exactly as by GameEngine. Results report the cards of a
+    representative deal of the sampled outcome, not a random deal.
+    """
+
+    def __init__(
+        self,
+        distribution: OutcomeDistribution,
+        main_paytable: MainGamePaytable,
+        bonus_paytable: BonusPaytable | None,
+        rng: random.Random,
+        batch_size: int = 0,
+    ) -> None:
+        """Initialize the engine.
+
+        Args:
+            distribution: Outcome distribution of the strategy being played.
+            main_paytable: Paytable for main game payouts.
+            bonus_paytable: Paytable for bonus bet payouts (None if no bonus).
+            rng: Random number generator. Each hand uses one draw, or with
+                batch_size > 0 the engine seeds a NumPy generator from it.
+            batch_size: If positive, draw outcomes in NumPy batches of this
+                size instead of one at a time.
+
+        Raises:
+            ValueError: If batch_size is negative.
+        """
+        if batch_size < 0:
+            raise ValueError(f"batch_size must be non-negative, got {batch_size}")
+        self._outcomes = distribution.outcomes
+        self._table = AliasTable(distribution.probabilities)
+        self._main_paytable = main_paytable
+        self._bonus_paytable = bonus_paytable
+        self._rng = rng
+        self._batch_size = batch_size
+        self._batch_rng: np.random.Generator | None = None
+        self._batch: list[int] = []
+        self._batch_position = 0
+
+    def _next_outcome(self) -> HandOutcome:
+        """Draw the outcome of the next hand."""
+        if self._batch_size == 0:
+            return self._outcomes[self._table.sample(self._rng)]
+        if self._batch_position == len(self._batch):
+            if self._batch_rng is None:
+                self._batch_rng = np.random.default_rng(self._rng.getrandbits(64))
+            self._batch = self._table.sample_array(
+                self._batch_rng, self._batch_size
+            ).tolist()
+            self._batch_position = 0
+        index = self._batch[self._batch_position]
+        self._batch_position += 1
+        return self._outcomes[index]
+
+    def play_hand(
+        self,
+        hand_id: int,
+        base_bet: float,
+        bonus_bet: float = 0.0,
+        context: StrategyContext | None = None,  # noqa: ARG002
+    ) -> GameHandResult:
+        """Sample and settle one hand.
+
+        Args:
+            hand_id: Unique identifier for this hand.
+            base_bet: The bet amount per circle (3 circles total).
+            bonus_bet: Optional bonus bet amount.
+            context: Strategy context (not used; the strategy's decisions
+                are part of the distribution).
+
+        Returns:
+            GameHandResult of the sampled outcome.
+
+        Raises:
+            ValueError: If base_bet is not positive or bonus_bet is negative.
+            ValueError: If bonus_bet > 0 but no bonus_paytable was configured.
+        """
+        if base_bet <= 0:
+            raise ValueError(f"base_bet must be positive, got {base_bet}")
+        if bonus_bet < 0:
+            raise ValueError(f"bonus_bet cannot be negative, got {bonus_bet}")
+        if bonus_bet > 0 and self._bonus_paytable is None:
+            raise ValueError("bonus_bet > 0 requires a bonus_paytable to be configured")
+
+        outcome = self._next_outcome()
+        result = settle_hand(
+            decision_bet1=outcome.decision_bet1,
+            decision_bet2=outcome.decision_bet2,
+            final_hand_rank=outcome.final_hand_rank,
+            bonus_hand_rank=outcome.bonus_hand_rank if bonus_bet > 0 else None,
+            main_paytable=self._main_paytable,
+            bonus_paytable=self._bonus_paytable,
+            base_bet=base_bet,
+            bonus_bet=bonus_bet,
+        )
+        p0, p1, p2 = outcome.player_codes
+        m0, m1 = outcome.community_codes
+        return GameHandResult(
+            hand_id=hand_id,
+            player_cards=(CARD_BY_CODE[p0], CARD_BY_CODE[p1], CARD_BY_CODE[p2]),
+            community_cards=(CARD_BY_CODE[m0], CARD_BY_CODE[m1]),
+            decision_bet1=result.decision_bet1,
+            decision_bet2=result.decision_bet2,
+            final_hand_rank=result.final_hand_rank,
+            base_bet=base_bet,
+            bets_at_risk=result.bets_at_risk,
+            main_payout=result.main_payout,
+            bonus_bet=bonus_bet,
+            bonus_hand_rank=result.bonus_hand_rank,
+            bonus_payout=result.bonus_payout,
+            net_result=result.net_result,
+        )
+
+
+class _OutcomeCounter:
+    """Accumulates weighted outcome counts and a representative deal each."""
+
+    def __init__(self) -> None:
+        self.counts = np.zeros(_NUM_OUTCOME_KEYS, dtype=np.int64)
+        self.deals: dict[int, NDArray[np.int8]] = {}
+
+    def add(
+        self,
+        batch: HandBatch,
+        bet2_rides: NDArray[np.bool_],
+        weights: NDArray[np.int64] | None = None,
+    ) -> None:
+        """Count the hands of a batch, with Bet 2 decisions given separately."""
+        ranks = batch.final_rank.astype(np.int64) * _BONUS_RANK_VALUES
+        keys = (ranks + batch.bonus_rank) * 4 + batch.bet1_rides * 2 + bet2_rides
+        # Weighted counts stay far below 2**53, so the float sums are exact
+        counts = np.bincount(keys, weights=weights, minlength=_NUM_OUTCOME_KEYS)
+        self.counts += counts.astype(np.int64)
+        for key in np.flatnonzero(counts).tolist():
+            if key not in self.deals:
+                self.deals[key] = batch.cards[int(np.argmax(keys == key))]
+
+    def distribution(self, exact: bool) -> OutcomeDistribution:
+        """Build the distribution of everything counted so far."""
+        hands = int(self.counts.sum())
+        outcomes = []
+        probabilities = []
+        for key in np.flatnonzero(self.counts).tolist():
+            cards = self.deals[key].tolist()
+            rank_key, rides = divmod(key, 4)
+            final_value, bonus_value = divmod(rank_key, _BONUS_RANK_VALUES)
+            outcomes.append(
+                HandOutcome(
+                    decision_bet1=Decision.RIDE if rides & 2 else Decision.PULL,
+                    decision_bet2=Decision.RIDE if rides & 1 else Decision.PULL,
+                    final_hand_rank=FiveCardHandRank(final_value),
+                    bonus_hand_rank=ThreeCardHandRank(bonus_value),
+                    player_codes=(cards[0], cards[1], cards[2]),
+                    community_codes=(cards[3], cards[4]),
+                )
+            )
+            probabilities.append(int(self.counts[key]) / hands)
+        return OutcomeDistribution(
+            outcomes=tuple(outcomes),
+            probabilities=tuple(probabilities),
+            hands=hands,
+            exact=exact,
+        )
+
+
+def exact_outcome_distribution(strategy: Strategy) -> OutcomeDistribution:
+    """Derive the exact outcome distribution of a strategy.
+
+    Plays every deal of every suit-isomorphic starting hand class (see
+    canonical_starting_hands()) with BatchGameEngine. Each unordered pair
+    of community cards is evaluated once and counted for both orders, which
+    differ only in the Bet 2 decision. Takes a few seconds.
+
+    Args:
+        strategy: Strategy that does not read StrategyContext.
+
+    Returns:
+        Exact OutcomeDistribution over all 22,100 x 49 x 48 deals.
+
+    Raises:
+        ValueError: If the strategy reads StrategyContext.
+    """
+    # Imported here to avoid circular imports (analytics imports simulation)
+    from let_it_ride.analytics.exact_ev import canonical_starting_hands
+
+    # The paytable only affects the net columns, which are not used
+    engine = BatchGameEngine(strategy, standard_main_paytable())
+    starting_hands = canonical_starting_hands()
+    counter = _OutcomeCounter()
+
+    for start in range(0, len(starting_hands), _STARTING_HANDS_PER_BATCH):
+        chunk = starting_hands[start : start + _STARTING_HANDS_PER_BATCH]
+        player = np.array([codes for codes, _ in chunk], dtype=np.int8)
+        weights = np.array([weight for _, weight in chunk], dtype=np.int64)
+        remaining = np.array(
+            [[code for code in range(52) if code not in codes] for codes, _ in chunk],
+            dtype=np.int8,
+        )
+
+        # Bet 2 decision for every (starting hand, first community card);
+        # the fifth card is a placeholder the decision does not look at
+        first_cards = np.concatenate(
+            [
+                np.repeat(player, 49, axis=0),
+                remaining.reshape(-1, 1),
+                np.roll(remaining, 1, axis=1).reshape(-1, 1),
+            ],
+            axis=1,
+        )
+        bet2_by_first = engine.play(first_cards).bet2_rides.reshape(len(chunk), 49)
+
+        pairs_per_hand = len(_PAIR_FIRST)
+        cards = np.concatenate(
+            [
+                np.repeat(player, pairs_per_hand, axis=0),
+                remaining[:, _PAIR_FIRST].reshape(-1, 1),
+                remaining[:, _PAIR_SECOND].reshape(-1, 1),
+            ],
+            axis=1,
+        )
+        batch = engine.play(cards)
+        pair_weights = np.repeat(weights, pairs_per_hand)
+        counter.add(batch, bet2_by_first[:, _PAIR_FIRST].ravel(), pair_weights)
+
+        # The same pairs dealt in the other order only change the Bet 2
+        # decision (and the representative deal)
+        swapped = replace(batch, cards=cards[:, [0, 1, 2, 4, 3]])
+        counter.add(swapped, bet2_by_first[:, _PAIR_SECOND].ravel(), pair_weights)
+
+    return counter.distribution(exact=True)
+
+
+def sampled_outcome_distribution(
+    strategy: Strategy, num_hands: int, seed: int | None = None
+) -> OutcomeDistribution:
+    """Estimate the outcome distribution of a strategy from a calibration run.
+
+    Args:
+        strategy: Strategy that does not read StrategyContext.
+        num_hands: Number of hands to deal with BatchGameEngine.
+        seed: Seed for the calibration run. None for a random seed.
+
+    Returns:
+        OutcomeDistribution of the outcomes seen in the run.
+
+    Raises:
+        ValueError: If the strategy reads StrategyContext or num_hands is
+            not positive.
+    """
+    if num_hands < 1:
+        raise ValueError(f"num_hands must be positive, got {num_hands}")
+    batch = BatchGameEngine(strategy, standard_main_paytable()).play_hands(
+        num_hands, seed
+    )
+    counter = _OutcomeCounter()
+    counter.add(batch, batch.bet2_rides)
+    return counter.distribution(exact=False)
@@ -2,31 +2,61 @@
 
 This module provides parallel execution support using multiprocessing:
 - ParallelExecutor: Manages worker pools for concurrent session execution
-- Worker function: Top-level function for pickling support
+- Worker functions: Top-level functions for pickling support
 
 Key design decisions:
 - Pre-generate ALL session seeds before parallel execution for determinism
-- Each worker creates fresh Strategy, Paytables, BettingSystem (not shared)
-- Progress reported at completion (per-session progress not available in parallel mode)
+- Each worker process creates its Strategy and Paytables once (not shared)
+  and a fresh BettingSystem per session
+- Sessions are dispatched in many small contiguous chunks through a work
+  queue, sized from the measured cost per session, so a chunk of long
+  sessions does not stall the run
+- Progress is reported as each chunk completes; results are placed by
+  session ID, so they do not depend on chunk sizes or completion order
+- Session rows are written by the workers straight into a shared memory
+  buffer at their result IDs (ParallelExecutor.run_session_table), so
+  results are never pickled on their way back to the parent
+- In reduction mode (ParallelExecutor.reduce_sessions) each chunk is folded
+  into an AggregateAccumulator in the worker, so only small mergeable
+  summaries cross process boundaries
+- With a SimulationCheckpoint, the completed prefix of sessions is saved
+  as chunks complete, and a resumed run only dispatches the sessions after it
 """
 
 from __future__ import annotations
 
 import os
+import queue
 import random
+import time
 from collections.abc import Callable
 from dataclasses import dataclass
 from math import ceil
 from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
 from typing import TYPE_CHECKING, Literal
 
+import numpy as np
+
 from let_it_ride.core.deck import Deck
-from let_it_ride.core.game_engine import GameEngine
+from let_it_ride.core.game_engine import GameEngine, HandEngine
+from let_it_ride.core.hand_evaluator import evaluate_five_card_rank
 from let_it_ride.core.table import Table
+from let_it_ride.simulation.aggregation import AggregateAccumulator
 from let_it_ride.simulation.controller import (
+    SessionSink,
     create_betting_system,
     create_strategy,
 )
+from let_it_ride.simulation.outcome_sampling import (
+    OutcomeDistribution,
+    OutcomeSamplingEngine,
+    exact_outcome_distribution,
+)
+from let_it_ride.simulation.result_table import (
+    SESSION_RESULT_DTYPE,
+    SessionResultTable,
+)
 from let_it_ride.simulation.rng import RNGManager
 from let_it_ride.simulation.session import Session, SessionConfig, SessionResult
 from let_it_ride.simulation.table_session import (
@@ -44,9 +74,14 @@ from let_it_ride.simulation.utils import (
 from let_it_ride.strategy.bonus import BonusStrategy, create_bonus_strategy
 
 if TYPE_CHECKING:
+    from multiprocessing.pool import Pool as PoolType
+
+    from numpy.typing import NDArray
+
     from let_it_ride.bankroll import BettingSystem
     from let_it_ride.config.models import FullConfig
     from let_it_ride.config.paytables import BonusPaytable, MainGamePaytable
+    from let_it_ride.simulation.checkpoint import SimulationCheckpoint
     from let_it_ride.strategy import Strategy
 
 
@@ -56,6 +91,22 @@ ProgressCallback = Callable[[int, int], None]
 # Maximum number of workers to prevent resource exhaustion
 MAX_WORKERS = 64
 
+# Target wall-clock time of one chunk of sessions: long enough to amortize
+# dispatch overhead, short enough for smooth progress and load balancing
+TARGET_CHUNK_SECONDS = 0.25
+
+# Sessions in the first chunks, before any session cost has been measured
+_INITIAL_CHUNK_SESSIONS = 4
+
+# Chunks queued per worker so that workers never wait on the parent
+_CHUNKS_IN_FLIGHT_PER_WORKER = 2
+
+# Weight of the newest measurement in the running per-session cost estimate
+_COST_SMOOTHING = 0.3
+
+# Outcome code of a shared result row that no worker has written
+_UNWRITTEN_ROW = -1
+
 
 @dataclass(frozen=True, slots=True)
 class WorkerTask:
@@ -66,27 +117,61 @@ class WorkerTask:
         session_ids: List of session IDs this worker will process.
         session_seeds: Mapping of session_id to RNG seed.
         config: Full simulation configuration (serializable).
+        outcome_distribution: Outcome distribution to sample hands from
+            (hand_model "sampled"), derived once by the executor.
     """
 
     worker_id: int
     session_ids: list[int]
     session_seeds: dict[int, int]
     config: FullConfig
+    outcome_distribution: OutcomeDistribution | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class SessionChunk:
+    """A contiguous range of sessions dispatched to whichever worker is free.
+
+    The configuration is sent once per worker process (see
+    _initialize_worker), so a chunk only carries session IDs and seeds.
+
+    Attributes:
+        chunk_id: Unique identifier for this chunk.
+        session_ids: List of session IDs in this chunk.
+        session_seeds: Mapping of session_id to RNG seed.
+        aggregate: Fold the chunk's sessions into an AggregateAccumulator.
+        exact_profits: Keep every session profit in the accumulator.
+        return_sessions: Send the per-session results back to the parent.
+        shared_rows: Write the per-session results into the worker's shared
+            result buffer instead of sending them back.
+    """
+
+    chunk_id: int
+    session_ids: list[int]
+    session_seeds: dict[int, int]
+    aggregate: bool = False
+    exact_profits: bool = False
+    return_sessions: bool = True
+    shared_rows: bool = False
 
 
 @dataclass(frozen=True, slots=True)
 class WorkerResult:
-    """Result from a single worker.
+    """Result from a single worker task or session chunk.
 
     Attributes:
-        worker_id: Identifier of the worker that produced this result.
+        worker_id: Identifier of the task or chunk that produced this result.
         session_results: List of (session_id, SessionResult) tuples.
         error: Error message if worker failed, None otherwise.
+        elapsed_seconds: Wall-clock time spent running the sessions.
+        aggregate: The sessions folded into an accumulator, if requested.
     """
 
     worker_id: int
     session_results: list[tuple[int, SessionResult]]
     error: str | None = None
+    elapsed_seconds: float = 0.0
+    aggregate: AggregateAccumulator | None = None
 
 
 def _run_single_session(
@@ -98,6 +183,7 @@ def _run_single_session(
     betting_system_factory: Callable[[], BettingSystem],
     bonus_strategy_factory: Callable[[], BonusStrategy],
     session_config: SessionConfig,
+    outcome_distribution: OutcomeDistribution | None = None,
 ) -> SessionResult:
     """Run a single session with the given seed.
 
@@ -110,21 +196,31 @@ def _run_single_session(
         betting_system_factory: Factory to create fresh betting system.
         bonus_strategy_factory: Factory to create fresh bonus strategy.
         session_config: Session configuration.
+        outcome_distribution: If given, hands are sampled from this
+            distribution instead of dealt.
 
     Returns:
         The SessionResult from running the session.
     """
     session_rng = random.Random(seed)
-    deck = Deck()
 
-    engine = GameEngine(
-        deck=deck,
-        strategy=strategy,
-        main_paytable=main_paytable,
-        bonus_paytable=bonus_paytable,
-        rng=session_rng,
-        dealer_config=config.dealer,
-    )
+    engine: HandEngine
+    if outcome_distribution is not None:
+        engine = OutcomeSamplingEngine(
+            outcome_distribution, main_paytable, bonus_paytable, session_rng
+        )
+    else:
+        deck = Deck(partial_shuffle=config.deck.partial_shuffle)
+        engine = GameEngine(
+            deck=deck,
+            strategy=strategy,
+            main_paytable=main_paytable,
+            bonus_paytable=bonus_paytable,
+            rng=session_rng,
+            dealer_config=config.dealer,
+            rank_evaluator=evaluate_five_card_rank,
+            compact_cards=True,
+        )
 
     betting_system = betting_system_factory()
     bonus_strategy = bonus_strategy_factory()
@@ -160,7 +256,7 @@ def _run_single_table_session(
         to SessionResult with table_session_id attached.
     """
     session_rng = random.Random(seed)
-    deck = Deck()
+    deck = Deck(partial_shuffle=config.deck.partial_shuffle)
 
     table = Table(
         deck=deck,
@@ -170,6 +266,7 @@ def _run_single_table_session(
         rng=session_rng,
         table_config=config.table,
         dealer_config=config.dealer,
+        rank_evaluator=evaluate_five_card_rank,
     )
 
     betting_system = betting_system_factory()
@@ -185,57 +282,80 @@ def _run_single_table_session(
     return list(table_result.seat_results)
 
 
-def run_worker_sessions(task: WorkerTask) -> WorkerResult:
-    """Execute sessions assigned to a worker.
+class _WorkerContext:
+    """Simulation components shared by every session a worker process runs."""
 
-    This is a top-level function (not a method) to support pickling
-    for multiprocessing.
+    __slots__ = (
+        "_config",
+        "_outcome_distribution",
+        "_strategy",
+        "_main_paytable",
+        "_bonus_paytable",
+        "_session_config",
+        "_table_session_config",
+    )
 
-    Args:
-        task: WorkerTask containing session IDs, seeds, and config.
+    def __init__(
+        self,
+        config: FullConfig,
+        outcome_distribution: OutcomeDistribution | None,
+        expected_hands: int,
+    ) -> None:
+        """Create the worker's strategy, paytables and session configs.
 
-    Returns:
-        WorkerResult containing session results or error information.
-    """
-    try:
-        # Create components fresh in this worker (not shared across processes)
-        strategy = create_strategy(task.config.strategy)
-        main_paytable = get_main_paytable(task.config)
-        bonus_paytable = get_bonus_paytable(task.config)
-        bonus_bet = calculate_bonus_bet(task.config)
-        session_config = create_session_config(task.config, bonus_bet)
+        Args:
+            config: Full simulation configuration.
+            outcome_distribution: Distribution to sample hands from, if any.
+            expected_hands: Hands this worker is expected to play, used to
+                decide whether to compile the strategy.
+        """
+        self._config = config
+        self._outcome_distribution = outcome_distribution
+        self._strategy = create_strategy(config.strategy, expected_hands=expected_hands)
+        self._main_paytable = get_main_paytable(config)
+        self._bonus_paytable = get_bonus_paytable(config)
+        bonus_bet = calculate_bonus_bet(config)
+        self._session_config = create_session_config(config, bonus_bet)
+        # Pre-compute table session config (constant for all sessions)
+        self._table_session_config: TableSessionConfig | None = None
+        if config.table.num_seats > 1:
+            self._table_session_config = create_table_session_config(config, bonus_bet)
+
+    def _create_betting_system(self) -> BettingSystem:
+        return create_betting_system(self._config.bankroll)
+
+    def _create_bonus_strategy(self) -> BonusStrategy:
+        return create_bonus_strategy(self._config.bonus_strategy)
 
-        def betting_system_factory() -> BettingSystem:
-            return create_betting_system(task.config.bankroll)
+    def run_sessions(
+        self, session_ids: list[int], session_seeds: dict[int, int]
+    ) -> list[tuple[int, SessionResult]]:
+        """Run the given sessions.
 
-        def bonus_strategy_factory() -> BonusStrategy:
-            return create_bonus_strategy(task.config.bonus_strategy)
+        Args:
+            session_ids: Session IDs to run, in order.
+            session_seeds: Mapping of session_id to RNG seed.
 
+        Returns:
+            List of (result_id, SessionResult) tuples. For multi-seat tables
+            there is one entry per seat.
+        """
         results: list[tuple[int, SessionResult]] = []
+        num_seats = self._config.table.num_seats
 
-        # Check if we should use multi-seat table sessions
-        num_seats = task.config.table.num_seats
-        use_table_session = num_seats > 1
-
-        # Pre-compute table session config (constant for all sessions in worker)
-        table_session_config: TableSessionConfig | None = None
-        if use_table_session:
-            table_session_config = create_table_session_config(task.config, bonus_bet)
-
-        for session_id in task.session_ids:
-            seed = task.session_seeds[session_id]
+        for session_id in session_ids:
+            seed = session_seeds[session_id]
 
-            if use_table_session:
-                assert table_session_config is not None
+            if self._table_session_config is not None:
                 # Multi-seat: run TableSession and collect per-seat results
                 seat_results = _run_single_table_session(
                     seed=seed,
-                    config=task.config,
-                    strategy=strategy,
-                    main_paytable=main_paytable,
-                    bonus_paytable=bonus_paytable,
-                    betting_system_factory=betting_system_factory,
-                    table_session_config=table_session_config,
+                    config=self._config,
+                    strategy=self._strategy,
+                    main_paytable=self._main_paytable,
+                    bonus_paytable=self._bonus_paytable,
+                    betting_system_factory=self._create_betting_system,
+                    table_session_config=self._table_session_config,
                 )
                 # Add each seat's result with a unique composite ID
                 # Composite ID scheme: session_id * num_seats + seat_idx
@@ -258,28 +378,276 @@ def run_worker_sessions(task: WorkerTask) -> WorkerResult:
                 # Single-seat: use Session for efficiency
                 result = _run_single_session(
                     seed=seed,
-                    config=task.config,
-                    strategy=strategy,
-                    main_paytable=main_paytable,
-                    bonus_paytable=bonus_paytable,
-                    betting_system_factory=betting_system_factory,
-                    bonus_strategy_factory=bonus_strategy_factory,
-                    session_config=session_config,
+                    config=self._config,
+                    strategy=self._strategy,
+                    main_paytable=self._main_paytable,
+                    bonus_paytable=self._bonus_paytable,
+                    betting_system_factory=self._create_betting_system,
+                    bonus_strategy_factory=self._create_bonus_strategy,
+                    session_config=self._session_config,
+                    outcome_distribution=self._outcome_distribution,
                 )
                 results.append((session_id, result))
 
-        return WorkerResult(
-            worker_id=task.worker_id,
-            session_results=results,
-            error=None,
-        )
+        return results
+
+
+def _run_timed(
+    task_id: int,
+    run: Callable[[], list[tuple[int, SessionResult]]],
+    aggregate: bool = False,
+    return_sessions: bool = True,
+    exact_profits: bool = False,
+) -> WorkerResult:
+    """Run sessions, capturing elapsed time and any exception.
 
+    Args:
+        task_id: Identifier of the task or chunk.
+        run: Function that runs the sessions.
+        aggregate: Fold the results into an AggregateAccumulator.
+        return_sessions: Include the per-session results.
+        exact_profits: Keep every session profit in the accumulator.
+
+    Returns:
+        WorkerResult containing session results or error information.
+    """
+    start = time.perf_counter()
+    try:
+        results = run()
+        accumulator: AggregateAccumulator | None = None
+        if aggregate:
+            accumulator = AggregateAccumulator(exact_profits=exact_profits)
+            accumulator.add_results(result for _, result in results)
     except Exception as e:
         return WorkerResult(
-            worker_id=task.worker_id,
+            worker_id=task_id,
             session_results=[],
             error=f"{type(e).__name__}: {e}",
         )
+    return WorkerResult(
+        worker_id=task_id,
+        session_results=results if return_sessions else [],
+        error=None,
+        elapsed_seconds=time.perf_counter() - start,
+        aggregate=accumulator,
+    )
+
+
+def run_worker_sessions(task: WorkerTask) -> WorkerResult:
+    """Execute sessions assigned to a worker.
+
+    This is a top-level function (not a method) to support pickling
+    for multiprocessing.
+
+    Args:
+        task: WorkerTask containing session IDs, seeds, and config.
+
+    Returns:
+        WorkerResult containing session results or error information.
+    """
+
+    def run() -> list[tuple[int, SessionResult]]:
+        # Create components fresh in this worker (not shared across processes)
+        context = _WorkerContext(
+            task.config,
+            task.outcome_distribution,
+            expected_hands=len(task.session_ids)
+            * task.config.table.num_seats
+            * task.config.simulation.hands_per_session,
+        )
+        return context.run_sessions(task.session_ids, task.session_seeds)
+
+    return _run_timed(task.worker_id, run)
+
+
+# Components of the current worker process, set by _initialize_worker
+_worker_context: _WorkerContext | None = None
+
+# Shared result buffer of the current worker process and its row view
+_worker_shared_memory: SharedMemory | None = None
+_worker_rows: NDArray[np.void] | None = None
+
+
+def _shared_rows(shared_memory: SharedMemory, num_rows: int) -> NDArray[np.void]:
+    """Return a structured array of session rows over a shared memory block.
+
+    Args:
+        shared_memory: Block of at least num_rows rows.
+        num_rows: Number of rows in the array.
+    """
+    rows: NDArray[np.void] = np.ndarray(
+        num_rows, dtype=SESSION_RESULT_DTYPE, buffer=shared_memory.buf
+    )
+    return rows
+
+
+def _initialize_worker(
+    config: FullConfig,
+    outcome_distribution: OutcomeDistribution | None,
+    expected_hands: int,
+    result_buffer: str | None = None,
+) -> None:
+    """Pool initializer: build this process's simulation components once.
+
+    Args:
+        config: Full simulation configuration.
+        outcome_distribution: Distribution to sample hands from, if any.
+        expected_hands: Hands each worker is expected to play.
+        result_buffer: Name of the shared memory block that chunks with
+            shared_rows set write their results into, if any. It holds
+            num_sessions * num_seats rows of SESSION_RESULT_DTYPE.
+    """
+    global _worker_context, _worker_shared_memory, _worker_rows
+    _worker_context = _WorkerContext(config, outcome_distribution, expected_hands)
+    _worker_shared_memory = None
+    _worker_rows = None
+    if result_buffer is not None:
+        # Pool workers share the parent's resource tracker, so attaching
+        # does not make this process responsible for unlinking the block
+        _worker_shared_memory = SharedMemory(name=result_buffer)
+        _worker_rows = _shared_rows(
+            _worker_shared_memory,
+            config.simulation.num_sessions * config.table.num_seats,
+        )
+
+
+def _write_shared_rows(results: list[tuple[int, SessionResult]]) -> None:
+    """Write results into this worker's shared result buffer.
+
+    Args:
+        results: List of (result_id, SessionResult) tuples; each row is
+            written at its result ID.
+
+    Raises:
+        RuntimeError: If the worker has no shared result buffer.
+    """
+    if _worker_rows is None:
+        raise RuntimeError("Worker process has no shared result buffer")
+    result_ids = np.fromiter(
+        (result_id for result_id, _ in results), dtype=np.intp, count=len(results)
+    )
+    table = SessionResultTable.from_results(result for _, result in results)
+    _worker_rows[result_ids] = table.rows
+
+
+def run_session_chunk(chunk: SessionChunk) -> WorkerResult:
+    """Execute a chunk of sessions in a worker set up by _initialize_worker.
+
+    This is a top-level function (not a method) to support pickling
+    for multiprocessing.
+
+    Args:
+        chunk: SessionChunk containing session IDs and seeds.
+
+    Returns:
+        WorkerResult containing session results or error information.
+    """
+
+    def run() -> list[tuple[int, SessionResult]]:
+        if _worker_context is None:
+            raise RuntimeError("Worker process was not initialized")
+        results = _worker_context.run_sessions(chunk.session_ids, chunk.session_seeds)
+        if chunk.shared_rows:
+            _write_shared_rows(results)
+        return results
+
+    return _run_timed(
+        chunk.chunk_id,
+        run,
+        chunk.aggregate,
+        chunk.return_sessions,
+        chunk.exact_profits,
+    )
+
+
+class _ChunkPlanner:
+    """Hands out contiguous session ranges sized from measured session cost.
+
+    Chunks aim for TARGET_CHUNK_SECONDS of work each, using a smoothed
+    estimate of the time per session, but never exceed a 1 / (2 * workers)
+    share of the sessions left (guided self-scheduling), so the last
+    chunks are small and all workers finish at about the same time.
+    """
+
+    __slots__ = (
+        "_num_sessions",
+        "_num_workers",
+        "_target_seconds",
+        "_next_session",
+        "_seconds_per_session",
+    )
+
+    def __init__(
+        self,
+        num_sessions: int,
+        num_workers: int,
+        target_seconds: float = TARGET_CHUNK_SECONDS,
+        first_session: int = 0,
+    ) -> None:
+        """Initialize the planner.
+
+        Args:
+            num_sessions: Total number of sessions.
+            num_workers: Number of worker processes.
+            target_seconds: Target wall-clock time per chunk.
+            first_session: First session ID to hand out; earlier sessions
+                were already run (resuming from a checkpoint).
+        """
+        self._num_sessions = num_sessions
+        self._num_workers = num_workers
+        self._target_seconds = target_seconds
+        self._next_session = first_session
+        self._seconds_per_session: float | None = None
+
+    @property
+    def remaining(self) -> int:
+        """Return the number of sessions not yet handed out."""
+        return self._num_sessions - self._next_session
+
+    def record(self, sessions: int, elapsed_seconds: float) -> None:
+        """Update the cost estimate with a completed chunk.
+
+        Args:
+            sessions: Number of sessions in the chunk.
+            elapsed_seconds: Wall-clock time the chunk took.
+        """
+        if sessions <= 0:
+            return
+        measured = elapsed_seconds / sessions
+        if self._seconds_per_session is None:
+            self._seconds_per_session = measured
+        else:
+            self._seconds_per_session += _COST_SMOOTHING * (
+                measured - self._seconds_per_session
+            )
+
+    def next_fixed_chunk(self, size: int) -> range | None:
+        """Return the next range of at most size session IDs, or None.
+
+        Args:
+            size: Maximum number of sessions in the chunk.
+        """
+        if self.remaining <= 0:
+            return None
+        start = self._next_session
+        self._next_session = min(start + size, self._num_sessions)
+        return range(start, self._next_session)
+
+    def next_chunk(self) -> range | None:
+        """Return the next range of session IDs, or None when all are out."""
+        remaining = self.remaining
+        if remaining <= 0:
+            return None
+        if self._seconds_per_session is None:
+            size = _INITIAL_CHUNK_SESSIONS
+        elif self._seconds_per_session > 0:
+            size = int(self._target_seconds / self._seconds_per_session)
+        else:
+            size = remaining
+        size = max(1, min(size, ceil(remaining / (2 * self._num_workers))))
+        start = self._next_session
+        self._next_session += size
+        return range(start, start + size)
 
 
 class ParallelExecutor:
@@ -289,17 +657,27 @@ class ParallelExecutor:
     while maintaining reproducibility through deterministic RNG seeding.
     """
 
-    __slots__ = ("_num_workers",)
+    __slots__ = ("_num_workers", "_chunk_size")
 
-    def __init__(self, num_workers: int | Literal["auto"]) -> None:
+    def __init__(
+        self, num_workers: int | Literal["auto"], chunk_size: int | None = None
+    ) -> None:
         """Initialize the parallel executor.
 
         Args:
             num_workers: Number of worker processes, or "auto" to use CPU count.
                 The value is bounded between 1 and MAX_WORKERS to prevent
                 resource exhaustion.
+            chunk_size: Fixed number of sessions per chunk, or None to size
+                chunks from the measured cost per session.
+
+        Raises:
+            ValueError: If chunk_size is less than 1.
         """
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
         self._num_workers = get_effective_worker_count(num_workers)
+        self._chunk_size = chunk_size
 
     @property
     def num_workers(self) -> int:
@@ -323,106 +701,295 @@ class ParallelExecutor:
         rng_manager = RNGManager(base_seed=base_seed)
         return rng_manager.create_session_seeds(num_sessions)
 
-    def _create_worker_tasks(
+    def _next_chunk(self, planner: _ChunkPlanner) -> range | None:
+        """Return the next range of session IDs to dispatch.
+
+        Args:
+            planner: Planner tracking the sessions not yet dispatched.
+
+        Returns:
+            A range of session IDs, or None when every session is dispatched.
+        """
+        if self._chunk_size is None:
+            return planner.next_chunk()
+        return planner.next_fixed_chunk(self._chunk_size)
+
+    def _dispatch_chunks(
         self,
+        pool: PoolType,
         num_sessions: int,
         session_seeds: dict[int, int],
-        config: FullConfig,
-    ) -> list[WorkerTask]:
-        """Create task specifications for each worker.
-
-        Distributes sessions evenly among workers.
+        progress_callback: ProgressCallback | None,
+        handle_result: Callable[[WorkerResult, range], None],
+        aggregate: bool = False,
+        exact_profits: bool = False,
+        return_sessions: bool = True,
+        shared_rows: bool = False,
+        first_session: int = 0,
+    ) -> None:
+        """Feed session chunks to the pool as workers become free.
+
+        A bounded number of chunks is kept in flight; each completed chunk
+        updates the cost estimate, reports progress and triggers the next
+        dispatch. After a failure no new chunks are dispatched, but the
+        chunks already in flight are still collected.
+
+        Chunk IDs are assigned in session order, starting at 0.
 
         Args:
+            pool: Pool whose workers were set up by _initialize_worker.
             num_sessions: Total number of sessions.
             session_seeds: Pre-generated seeds for all sessions.
-            config: Full simulation configuration.
+            progress_callback: Optional callback for progress reporting.
+            handle_result: Called with each successful chunk's WorkerResult
+                and range of session IDs, in completion order.
+            aggregate: Have workers fold each chunk into an accumulator.
+            exact_profits: Have the accumulators keep every session profit.
+            return_sessions: Have workers send back per-session results.
+            shared_rows: Have workers write per-session results into their
+                shared result buffer.
+            first_session: First session ID to dispatch; earlier sessions
+                count as completed for progress reporting.
 
-        Returns:
-            List of WorkerTask objects.
+        Raises:
+            RuntimeError: If any chunk failed.
         """
-        batch_size = ceil(num_sessions / self._num_workers)
-        tasks: list[WorkerTask] = []
-
-        for worker_id in range(self._num_workers):
-            start_idx = worker_id * batch_size
-            end_idx = min(start_idx + batch_size, num_sessions)
+        planner = _ChunkPlanner(
+            num_sessions, self._num_workers, first_session=first_session
+        )
+        finished: queue.SimpleQueue[WorkerResult | BaseException] = queue.SimpleQueue()
+        in_flight: dict[int, range] = {}
+        failures: list[WorkerResult] = []
+        completed_sessions = first_session
+
+        def dispatch(chunk_id: int) -> bool:
+            chunk = self._next_chunk(planner)
+            if chunk is None:
+                return False
+            pool.apply_async(
+                run_session_chunk,
+                (
+                    SessionChunk(
+                        chunk_id=chunk_id,
+                        session_ids=list(chunk),
+                        session_seeds={sid: session_seeds[sid] for sid in chunk},
+                        aggregate=aggregate,
+                        exact_profits=exact_profits,
+                        return_sessions=return_sessions,
+                        shared_rows=shared_rows,
+                    ),
+                ),
+                callback=finished.put,
+                error_callback=finished.put,
+            )
+            in_flight[chunk_id] = chunk
+            return True
 
-            if start_idx >= num_sessions:
-                # No more sessions to distribute
+        next_chunk_id = 0
+        while next_chunk_id < self._num_workers * _CHUNKS_IN_FLIGHT_PER_WORKER:
+            if not dispatch(next_chunk_id):
                 break
+            next_chunk_id += 1
+
+        while in_flight:
+            outcome = finished.get()
+            if isinstance(outcome, BaseException):
+                # Raised outside run_session_chunk, e.g. while unpickling
+                raise RuntimeError(
+                    f"Worker failures: {type(outcome).__name__}: {outcome}"
+                ) from outcome
+            chunk = in_flight.pop(outcome.worker_id)
+            if outcome.error is not None:
+                failures.append(outcome)
+                continue
+            handle_result(outcome, chunk)
+            planner.record(len(chunk), outcome.elapsed_seconds)
+            completed_sessions += len(chunk)
+            if progress_callback is not None:
+                progress_callback(completed_sessions, num_sessions)
+            if not failures and dispatch(next_chunk_id):
+                next_chunk_id += 1
+
+        _raise_worker_failures(failures)
+
+    def _run_chunked(
+        self,
+        config: FullConfig,
+        progress_callback: ProgressCallback | None,
+        handle_result: Callable[[WorkerResult, range], None],
+        aggregate: bool = False,
+        exact_profits: bool = False,
+        return_sessions: bool = True,
+        result_buffer: str | None = None,
+        rng_manager: RNGManager | None = None,
+        first_session: int = 0,
+    ) -> None:
+        """Run the sessions of the configuration in chunks on a worker pool.
 
-            session_ids = list(range(start_idx, end_idx))
-            worker_seeds = {sid: session_seeds[sid] for sid in session_ids}
+        Args:
+            config: Full simulation configuration.
+            progress_callback: Optional callback for progress reporting.
+            handle_result: Called with each successful chunk's WorkerResult
+                and range of session IDs.
+            aggregate: Have workers fold each chunk into an accumulator.
+            exact_profits: Have the accumulators keep every session profit.
+            return_sessions: Have workers send back per-session results.
+            result_buffer: Name of a shared memory block of num_sessions *
+                num_seats rows for the workers to write results into.
+            rng_manager: Manager to draw the session seeds from, instead of
+                one seeded with the configured random_seed.
+            first_session: Run only the sessions from this ID on.
 
-            tasks.append(
-                WorkerTask(
-                    worker_id=worker_id,
-                    session_ids=session_ids,
-                    session_seeds=worker_seeds,
-                    config=config,
-                )
+        Raises:
+            RuntimeError: If any worker fails.
+        """
+        num_sessions = config.simulation.num_sessions
+        if first_session >= num_sessions:
+            return
+
+        # Pre-generate all session seeds for determinism
+        if rng_manager is None:
+            session_seeds = self._generate_session_seeds(
+                num_sessions, config.simulation.random_seed
             )
+        else:
+            session_seeds = rng_manager.create_session_seeds(num_sessions)
+
+        # Derive the outcome distribution once rather than in every worker
+        outcome_distribution = None
+        if config.simulation.hand_model == "sampled":
+            outcome_distribution = exact_outcome_distribution(
+                create_strategy(config.strategy)
+            )
+
+        # Each process builds its components once, sized for an even share
+        # of the sessions (this only decides whether to compile the strategy)
+        expected_hands = (
+            ceil(num_sessions / self._num_workers)
+            * config.table.num_seats
+            * config.simulation.hands_per_session
+        )
 
-        return tasks
+        # Execute in parallel, reporting progress as chunks complete
+        with Pool(
+            processes=min(self._num_workers, num_sessions - first_session),
+            initializer=_initialize_worker,
+            initargs=(config, outcome_distribution, expected_hands, result_buffer),
+        ) as pool:
+            self._dispatch_chunks(
+                pool,
+                num_sessions,
+                session_seeds,
+                progress_callback,
+                handle_result,
+                aggregate=aggregate,
+                exact_profits=exact_profits,
+                return_sessions=return_sessions,
+                shared_rows=result_buffer is not None,
+                first_session=first_session,
+            )
 
-    def _merge_results(
+    def run_session_table(
         self,
-        worker_results: list[WorkerResult],
-        num_sessions: int,
-        num_seats: int = 1,
-    ) -> list[SessionResult]:
-        """Merge and order results from all workers.
+        config: FullConfig,
+        progress_callback: ProgressCallback | None = None,
+        checkpoint: SimulationCheckpoint | None = None,
+    ) -> SessionResultTable:
+        """Execute sessions in parallel, collecting rows through shared memory.
 
-        Uses a pre-allocated list for better memory efficiency than dict-based
-        collection, avoiding hash table overhead.
+        The parent allocates one shared buffer of num_sessions * num_seats
+        rows. Each worker writes its rows directly at their result IDs
+        (session_id * num_seats + seat_idx), so no per-session results are
+        pickled; chunks only report completion and timing.
 
         Args:
-            worker_results: Results from all workers.
-            num_sessions: Expected number of sessions.
-            num_seats: Number of seats per table (for multi-seat mode).
+            config: Full simulation configuration.
+            progress_callback: Optional callback for progress reporting,
+                called with (completed_sessions, total_sessions) as each
+                chunk of sessions completes.
+            checkpoint: Optional checkpoint to resume from and to save the
+                rows of the completed prefix of sessions to.
 
         Returns:
-            List of SessionResult objects ordered by result ID.
+            SessionResultTable with one row per session (per seat for
+            multi-seat tables), in result ID order.
 
         Raises:
-            RuntimeError: If any worker failed or results are missing.
+            RuntimeError: If any worker fails or results are missing.
+            ValueError: If the checkpoint belongs to another configuration.
         """
-        # Check for worker failures first
-        failed_workers = [wr for wr in worker_results if wr.error is not None]
-        if failed_workers:
-            errors = [f"Worker {wr.worker_id}: {wr.error}" for wr in failed_workers]
-            raise RuntimeError(f"Worker failures: {'; '.join(errors)}")
-
-        # For multi-seat, we have num_sessions * num_seats results
-        expected_results = num_sessions * num_seats
-
-        # Pre-allocate result list for O(1) direct assignment
-        results: list[SessionResult | None] = [None] * expected_results
-        for worker_result in worker_results:
-            for result_id, session_result in worker_result.session_results:
-                results[result_id] = session_result
-
-        # Verify we have all expected results
-        missing = [i for i, r in enumerate(results) if r is None]
-        if missing:
-            raise RuntimeError(
-                f"Missing results for {len(missing)} sessions: {missing[:10]}..."
+        num_sessions = config.simulation.num_sessions
+        num_seats = config.table.num_seats
+        rng_manager: RNGManager | None = None
+        first_session = 0
+        if checkpoint is not None:
+            rng_manager = checkpoint.start(config, "sessions")
+            first_session = checkpoint.completed_sessions
+
+        shared_memory = SharedMemory(
+            create=True,
+            size=max(1, num_sessions * num_seats * SESSION_RESULT_DTYPE.itemsize),
+        )
+        rows = _shared_rows(shared_memory, num_sessions * num_seats)
+        # Chunks complete out of order; track the completed prefix of sessions
+        completed = first_session
+        chunk_ends: dict[int, int] = {}
+
+        def save_rows(checkpoint: SimulationCheckpoint, stop: int) -> None:
+            # A temporary view, so that no reference outlives the buffer
+            start = checkpoint.completed_sessions * num_seats
+            saved = _shared_rows(shared_memory, stop * num_seats)[start:].copy()
+            checkpoint.save_rows(SessionResultTable(saved), stop)
+
+        def handle_result(_: WorkerResult, chunk: range) -> None:
+            nonlocal completed
+            if checkpoint is None:
+                return
+            chunk_ends[chunk.start] = chunk.stop
+            while completed in chunk_ends:
+                completed = chunk_ends.pop(completed)
+            if checkpoint.due():
+                save_rows(checkpoint, completed)
+
+        try:
+            rows["outcome"] = _UNWRITTEN_ROW
+            if checkpoint is not None and first_session:
+                rows[: first_session * num_seats] = checkpoint.load_rows().rows
+            self._run_chunked(
+                config,
+                progress_callback,
+                handle_result,
+                return_sessions=False,
+                result_buffer=shared_memory.name,
+                rng_manager=rng_manager,
+                first_session=first_session,
             )
-
-        # Type is now list[SessionResult] since we verified no None values
-        return results  # type: ignore[return-value]
+            _raise_missing_results(np.flatnonzero(rows["outcome"] == _UNWRITTEN_ROW))
+            if checkpoint is not None:
+                save_rows(checkpoint, num_sessions)
+            # The buffer is released below, so the table keeps its own copy
+            table = SessionResultTable(rows.copy())
+        finally:
+            # Views of the buffer must be gone before it can be closed
+            del rows
+            shared_memory.close()
+            shared_memory.unlink()
+        return table
 
     def run_sessions(
         self,
         config: FullConfig,
         progress_callback: ProgressCallback | None = None,
+        checkpoint: SimulationCheckpoint | None = None,
     ) -> list[SessionResult]:
         """Execute sessions in parallel.
 
         Args:
             config: Full simulation configuration.
-            progress_callback: Optional callback for progress reporting.
+            progress_callback: Optional callback for progress reporting,
+                called with (completed_sessions, total_sessions) as each
+                chunk of sessions completes.
+            checkpoint: Optional checkpoint to resume from and save to.
 
         Returns:
             List of SessionResult objects in session order.
@@ -430,27 +997,114 @@ class ParallelExecutor:
 
         Raises:
             RuntimeError: If any worker fails.
+            ValueError: If the checkpoint belongs to another configuration.
         """
-        num_sessions = config.simulation.num_sessions
-        num_seats = config.table.num_seats
-        base_seed = config.simulation.random_seed
+        return list(self.run_session_table(config, progress_callback, checkpoint))
 
-        # Pre-generate all session seeds for determinism
-        session_seeds = self._generate_session_seeds(num_sessions, base_seed)
+    def reduce_sessions(
+        self,
+        config: FullConfig,
+        progress_callback: ProgressCallback | None = None,
+        session_sink: SessionSink | None = None,
+        checkpoint: SimulationCheckpoint | None = None,
+        exact_profits: bool = False,
+    ) -> AggregateAccumulator:
+        """Execute sessions in parallel, reducing them in the workers.
+
+        Each worker folds its chunk into an AggregateAccumulator and sends
+        back only that summary (plus the chunk's rows if session_sink is
+        given). Summaries are merged in session order and keep their sums
+        and moments exactly, so the result does not depend on how the
+        sessions were split into chunks: it is identical from run to run
+        and to a sequential reduction.
+
+        Args:
+            config: Full simulation configuration.
+            progress_callback: Optional callback for progress reporting,
+                called with (completed_sessions, total_sessions) as each
+                chunk of sessions completes.
+            session_sink: Optional consumer of per-session rows, called with
+                each chunk's results in session order. When resuming, it only
+                receives the sessions run by this call.
+            checkpoint: Optional checkpoint to resume from and to save the
+                aggregate of the completed prefix of sessions to. A resumed
+                run is identical to an uninterrupted one.
+            exact_profits: Keep every session profit so the median and
+                standard deviation are exact (see AggregateAccumulator).
+
+        Returns:
+            AggregateAccumulator over all sessions (and seats).
+
+        Raises:
+            RuntimeError: If any worker fails.
+            ValueError: If the checkpoint belongs to another configuration.
+        """
+        total = AggregateAccumulator(exact_profits=exact_profits)
+        rng_manager: RNGManager | None = None
+        first_session = 0
+        if checkpoint is not None:
+            rng_manager = checkpoint.start(config, "aggregate")
+            first_session = checkpoint.completed_sessions
+            total = checkpoint.load_aggregate() or total
+        # Chunks complete out of order; hold them until their turn
+        pending: dict[int, tuple[WorkerResult, range]] = {}
+        next_chunk_id = 0
+
+        def handle_result(worker_result: WorkerResult, chunk: range) -> None:
+            nonlocal next_chunk_id
+            pending[worker_result.worker_id] = (worker_result, chunk)
+            while next_chunk_id in pending:
+                ready, ready_chunk = pending.pop(next_chunk_id)
+                assert ready.aggregate is not None
+                total.merge(ready.aggregate)
+                if session_sink is not None:
+                    session_sink([result for _, result in ready.session_results])
+                next_chunk_id += 1
+                if checkpoint is not None and checkpoint.due():
+                    checkpoint.save_aggregate(total, ready_chunk.stop)
+
+        self._run_chunked(
+            config,
+            progress_callback,
+            handle_result,
+            aggregate=True,
+            exact_profits=exact_profits,
+            return_sessions=session_sink is not None,
+            rng_manager=rng_manager,
+            first_session=first_session,
+        )
+        if checkpoint is not None:
+            checkpoint.save_aggregate(total, config.simulation.num_sessions)
+        return total
 
-        # Create worker tasks
-        tasks = self._create_worker_tasks(num_sessions, session_seeds, config)
 
-        # Execute in parallel
-        with Pool(processes=len(tasks)) as pool:
-            worker_results = pool.map(run_worker_sessions, tasks)
+def _raise_worker_failures(failures: list[WorkerResult]) -> None:
+    """Raise a RuntimeError listing every failed worker, if there are any.
 
-        # Report progress (all sessions complete)
-        if progress_callback is not None:
-            progress_callback(num_sessions, num_sessions)
+    Args:
+        failures: Worker results whose error is set.
+
+    Raises:
+        RuntimeError: If failures is not empty.
+    """
+    if failures:
+        errors = [f"Worker {wr.worker_id}: {wr.error}" for wr in failures]
+        raise RuntimeError(f"Worker failures: {'; '.join(errors)}")
 
-        # Merge and return ordered results
-        return self._merge_results(worker_results, num_sessions, num_seats)
+
+def _raise_missing_results(missing: NDArray[np.intp]) -> None:
+    """Raise a RuntimeError if any result rows were not written.
+
+    Args:
+        missing: Result IDs of the rows that no worker wrote.
+
+    Raises:
+        RuntimeError: If missing is not empty.
+    """
+    if missing.size:
+        raise RuntimeError(
+            f"Missing results for {missing.size} sessions: {missing[:10].tolist()}..."
+        )
 
 
 def get_effective_worker_count(workers: int | Literal["auto"]) -> int:
@@ -0,0 +1,316 @@
+"""Columnar storage of session results.
+
+This module provides a compact alternative to list[SessionResult]:
+- SESSION_RESULT_DTYPE: NumPy structured dtype of one session row
+- SessionResultTable: Immutable table of session results with column access
+- session_result_dicts(): Export dictionaries for a list or a table
+
+Money fields are float64, hands_played is int32, and outcome and stop
+reason are int8 codes (the enum definition order). A missing table
+session id is stored as -1 and a missing seat number as 0, so a row takes
+75 bytes instead of roughly 300 for a SessionResult object. Analytics
+functions that accept session results read a table's columns directly.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any, overload
+
+import numpy as np
+
+from let_it_ride.simulation.session import SessionOutcome, SessionResult, StopReason
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from numpy.typing import NDArray
+
+_OUTCOMES: tuple[SessionOutcome, ...] = tuple(SessionOutcome)
+_STOP_REASONS: tuple[StopReason, ...] = tuple(StopReason)
+_OUTCOME_CODES: dict[SessionOutcome, int] = {o: i for i, o in enumerate(_OUTCOMES)}
+_STOP_REASON_CODES: dict[StopReason, int] = {r: i for i, r in enumerate(_STOP_REASONS)}
+_WIN = _OUTCOME_CODES[SessionOutcome.WIN]
+_LOSS = _OUTCOME_CODES[SessionOutcome.LOSS]
+_PUSH = _OUTCOME_CODES[SessionOutcome.PUSH]
+
+# Stored in place of None
+NO_TABLE_SESSION = -1
+NO_SEAT = 0
+
+SESSION_RESULT_DTYPE = np.dtype(
+    [
+        ("outcome", np.int8),
+        ("stop_reason", np.int8),
+        ("hands_played", np.int32),
+        ("starting_bankroll", np.float64),
+        ("final_bankroll", np.float64),
+        ("session_profit", np.float64),
+        ("total_wagered", np.float64),
+        ("total_bonus_wagered", np.float64),
+        ("peak_bankroll", np.float64),
+        ("max_drawdown", np.float64),
+        ("max_drawdown_pct", np.float64),
+        ("table_session_id", np.int32),
+        ("seat_number", np.int8),
+    ]
+)
+
+_FIELD_NAMES = frozenset(SESSION_RESULT_DTYPE.names or ())
+
+# Rows converted to Python objects at a time when iterating
+_ITER_BLOCK_ROWS = 4096
+
+
+def _to_row(result: SessionResult) -> tuple[Any, ...]:
+    """Convert a SessionResult to a tuple matching SESSION_RESULT_DTYPE."""
+    return (
+        _OUTCOME_CODES[result.outcome],
+        _STOP_REASON_CODES[result.stop_reason],
+        result.hands_played,
+        result.starting_bankroll,
+        result.final_bankroll,
+        result.session_profit,
+        result.total_wagered,
+        result.total_bonus_wagered,
+        result.peak_bankroll,
+        result.max_drawdown,
+        result.max_drawdown_pct,
+        NO_TABLE_SESSION
+        if result.table_session_id is None
+        else result.table_session_id,
+        NO_SEAT if result.seat_number is None else result.seat_number,
+    )
+
+
+def _to_result(row: tuple[Any, ...]) -> SessionResult:
+    """Convert a row tuple (from ndarray.tolist()) to a SessionResult."""
+    (
+        outcome,
+        stop_reason,
+        hands_played,
+        starting_bankroll,
+        final_bankroll,
+        session_profit,
+        total_wagered,
+        total_bonus_wagered,
+        peak_bankroll,
+        max_drawdown,
+        max_drawdown_pct,
+        table_session_id,
+        seat_number,
+    ) = row
+    return SessionResult(
+        outcome=_OUTCOMES[outcome],
+        stop_reason=_STOP_REASONS[stop_reason],
+        hands_played=hands_played,
+        starting_bankroll=starting_bankroll,
+        final_bankroll=final_bankroll,
+        session_profit=session_profit,
+        total_wagered=total_wagered,
+        total_bonus_wagered=total_bonus_wagered,
+        peak_bankroll=peak_bankroll,
+        max_drawdown=max_drawdown,
+        max_drawdown_pct=max_drawdown_pct,
+        table_session_id=(
+            None if table_session_id == NO_TABLE_SESSION else table_session_id
+        ),
+        seat_number=None if seat_number == NO_SEAT else seat_number,
+    )
+
+
+class SessionResultTable(Sequence[SessionResult]):
+    """Immutable struct-of-arrays table of session results.
+
+    The table behaves as a sequence of SessionResult: indexing returns a
+    SessionResult built from the row, slicing returns a table sharing the
+    same memory, and iteration yields SessionResult objects in order.
+    Vectorized consumers should use column() and the tally methods, which
+    never create per-row objects.
+    """
+
+    __slots__ = ("_rows",)
+
+    def __init__(self, rows: NDArray[np.void]) -> None:
+        """Wrap a structured array of session rows.
+
+        The table keeps a read-only view of the array; use from_results()
+        to build one from SessionResult objects.
+
+        Args:
+            rows: One-dimensional array with dtype SESSION_RESULT_DTYPE.
+
+        Raises:
+            ValueError: If rows has the wrong dtype or shape.
+        """
+        if rows.dtype != SESSION_RESULT_DTYPE:
+            raise ValueError("rows must have dtype SESSION_RESULT_DTYPE")
+        if rows.ndim != 1:
+            raise ValueError(f"rows must be one-dimensional, got {rows.ndim}")
+        view = rows.view()
+        view.flags.writeable = False
+        self._rows: NDArray[np.void] = view
+
+    @classmethod
+    def from_results(cls, results: Iterable[SessionResult]) -> SessionResultTable:
+        """Build a table from session results.
+
+        Args:
+            results: Session results, in order. Consumed once.
+
+        Returns:
+            A new SessionResultTable.
+        """
+        if isinstance(results, SessionResultTable):
+            return results
+        return cls(
+            np.fromiter(
+                (_to_row(result) for result in results), dtype=SESSION_RESULT_DTYPE
+            )
+        )
+
+    @classmethod
+    def concatenate(cls, tables: Iterable[SessionResultTable]) -> SessionResultTable:
+        """Join tables end to end.
+
+        Args:
+            tables: Tables to join, in order.
+
+        Returns:
+            A new SessionResultTable with every row.
+        """
+        arrays = [table._rows for table in tables]
+        if not arrays:
+            return cls(np.empty(0, dtype=SESSION_RESULT_DTYPE))
+        return cls(np.concatenate(arrays))
+
+    @property
+    def rows(self) -> NDArray[np.void]:
+        """Return the read-only structured array of rows."""
+        return self._rows
+
+    @property
+    def nbytes(self) -> int:
+        """Return the memory used by the rows, in bytes."""
+        return self._rows.nbytes
+
+    def column(self, name: str) -> NDArray[Any]:
+        """Return one field of every row as a read-only array.
+
+        Outcome and stop reason are returned as their int8 codes; use
+        outcome_counts() and stop_reason_counts() to tally them.
+
+        Args:
+            name: A SessionResult field name.
+
+        Returns:
+            Array view of the column.
+
+        Raises:
+            ValueError: If name is not a SessionResult field.
+        """
+        if name not in _FIELD_NAMES:
+            raise ValueError(f"Unknown session result field: {name}")
+        column: NDArray[Any] = self._rows[name]
+        return column
+
+    def outcome_counts(self) -> dict[SessionOutcome, int]:
+        """Return the number of sessions with each outcome."""
+        counts = np.bincount(self._rows["outcome"], minlength=len(_OUTCOMES))
+        return dict(zip(_OUTCOMES, counts.tolist(), strict=True))
+
+    def stop_reason_counts(self) -> dict[StopReason, int]:
+        """Return the number of sessions per stop reason that occurred."""
+        counts = np.bincount(self._rows["stop_reason"], minlength=len(_STOP_REASONS))
+        return {
+            reason: count
+            for reason, count in zip(_STOP_REASONS, counts.tolist(), strict=True)
+            if count
+        }
+
+    def seat_tallies(self) -> dict[int, tuple[int, int, int, float]]:
+        """Return per-seat outcome counts and total profit.
+
+        Rows without a seat number are skipped.
+
+        Returns:
+            Dictionary mapping seat number to (wins, losses, pushes,
+            total_profit), for seats that have at least one row.
+        """
+        seats = self._rows["seat_number"]
+        seated = seats != NO_SEAT
+        if not seated.any():
+            return {}
+        seats = seats[seated].astype(np.intp)
+        outcomes = self._rows["outcome"][seated].astype(np.intp)
+        size = int(seats.max()) + 1
+        counts = np.bincount(
+            seats * len(_OUTCOMES) + outcomes, minlength=size * len(_OUTCOMES)
+        ).reshape(size, len(_OUTCOMES))
+        profits = np.bincount(
+            seats, weights=self._rows["session_profit"][seated], minlength=size
+        )
+        return {
+            seat: (
+                int(counts[seat, _WIN]),
+                int(counts[seat, _LOSS]),
+                int(counts[seat, _PUSH]),
+                float(profits[seat]),
+            )
+            for seat in np.flatnonzero(counts.sum(axis=1)).tolist()
+        }
+
+    def to_dicts(self) -> Iterator[dict[str, Any]]:
+        """Yield each row as SessionResult.to_dict() would return it."""
+        for start in range(0, len(self._rows), _ITER_BLOCK_ROWS):
+            for result in self._block(start):
+                yield result.to_dict()
+
+    def _block(self, start: int) -> list[SessionResult]:
+        """Convert the rows of one iteration block to SessionResult."""
+        block = self._rows[start : start + _ITER_BLOCK_ROWS].tolist()
+        return [_to_result(row) for row in block]
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    @overload
+    def __getitem__(self, index: int) -> SessionResult: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> SessionResultTable: ...
+
+    def __getitem__(self, index: int | slice) -> SessionResult | SessionResultTable:
+        if isinstance(index, slice):
+            return SessionResultTable(self._rows[index])
+        return _to_result(self._rows[index].tolist())
+
+    def __iter__(self) -> Iterator[SessionResult]:
+        for start in range(0, len(self._rows), _ITER_BLOCK_ROWS):
+            yield from self._block(start)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SessionResultTable):
+            return NotImplemented
+        return bool(np.array_equal(self._rows, other._rows))
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"SessionResultTable({len(self._rows)} rows)"
+
+
+def session_result_dicts(
+    results: Iterable[SessionResult],
+) -> Iterator[dict[str, Any]]:
+    """Yield export dictionaries for session results.
+
+    Args:
+        results: A SessionResultTable or any iterable of SessionResult.
+
+    Returns:
+        Iterator of dictionaries as returned by SessionResult.to_dict().
+    """
+    if isinstance(results, SessionResultTable):
+        return results.to_dicts()
+    return (result.to_dict() for result in results)
@@ -0,0 +1,346 @@
+"""Paytable what-if analysis without re-simulation.
+
+With flat betting, the cards dealt and the pull/ride decisions do not
+depend on the paytables, so a run can be re-scored under any other main
+or bonus paytable from per-session counts of what was dealt:
+- PaytableHistograms: Per-session counts of (hand rank, bets at risk)
+  and bonus hand ranks
+- PaytableHistogramRecorder: Hand callback that builds the histograms
+- record_paytable_histograms(): Run a configuration and record its histograms
+- reweight_paytables(): AggregateStatistics for alternative paytables
+
+Sessions keep the hands they were recorded with: stop conditions are not
+re-evaluated, so per-hand and total figures are exact while session-level
+figures are exact only for sessions that did not stop on a win or loss
+limit.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from let_it_ride.bankroll import FlatBetting
+from let_it_ride.core.hand_evaluator import FiveCardHandRank
+from let_it_ride.core.three_card_evaluator import ThreeCardHandRank
+from let_it_ride.simulation.accumulators import QuantileSketch, RunningMoments
+from let_it_ride.simulation.aggregation import AggregateStatistics
+from let_it_ride.simulation.controller import (
+    SimulationController,
+    SimulationResults,
+    create_betting_system,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from numpy.typing import NDArray
+
+    from let_it_ride.config.models import FullConfig
+    from let_it_ride.config.paytables import BonusPaytable, MainGamePaytable
+    from let_it_ride.core.game_engine import GameHandResult
+
+# Histogram axes: hand ranks in declaration order, 1 to 3 bets at risk
+_MAIN_RANKS: tuple[FiveCardHandRank, ...] = tuple(FiveCardHandRank)
+_BONUS_RANKS: tuple[ThreeCardHandRank, ...] = tuple(ThreeCardHandRank)
+_MAIN_RANK_INDEX = {rank: index for index, rank in enumerate(_MAIN_RANKS)}
+_BONUS_RANK_INDEX = {rank: index for index, rank in enumerate(_BONUS_RANKS)}
+_MAX_BETS_AT_RISK = 3
+
+
+@dataclass(frozen=True, slots=True)
+class PaytableHistograms:
+    """Per-session counts of the hands played in a flat-bet run.
+
+    Attributes:
+        main_counts: Array of shape (sessions, main ranks, 3). Entry
+            [s, r, k] counts hands of session s with the r-th
+            FiveCardHandRank and k + 1 base bets at risk.
+        bonus_counts: Array of shape (sessions, bonus ranks) counting the
+            ThreeCardHandRank of each hand with a bonus bet.
+        base_bet: The flat base bet per circle.
+        bonus_bet: The fixed bonus bet (0 if no bonus was played).
+    """
+
+    main_counts: NDArray[np.int64]
+    bonus_counts: NDArray[np.int64]
+    base_bet: float
+    bonus_bet: float
+
+    @property
+    def num_sessions(self) -> int:
+        """Return the number of sessions recorded."""
+        return int(self.main_counts.shape[0])
+
+    @property
+    def hands_played(self) -> NDArray[np.int64]:
+        """Return the number of hands played in each session."""
+        return self.main_counts.sum(axis=(1, 2))  # type: ignore[no-any-return]
+
+
+class PaytableHistogramRecorder:
+    """Hand callback that counts hands per session for reweighting.
+
+    Pass an instance as SimulationController's hand_callback. Every hand
+    must use the same base bet and bonus bet.
+    """
+
+    __slots__ = ("_num_sessions", "_rows", "_bonus_rows", "_base_bet", "_bonus_bet")
+
+    def __init__(self, num_sessions: int) -> None:
+        """Initialize the recorder.
+
+        Args:
+            num_sessions: Number of sessions in the run. Sessions without
+                any hands get all-zero counts.
+
+        Raises:
+            ValueError: If num_sessions is not positive.
+        """
+        if num_sessions <= 0:
+            raise ValueError(f"num_sessions must be positive, got {num_sessions}")
+        self._num_sessions = num_sessions
+        self._rows: dict[int, list[int]] = {}
+        self._bonus_rows: dict[int, list[int]] = {}
+        self._base_bet: float | None = None
+        self._bonus_bet: float | None = None
+
+    def __call__(
+        self,
+        session_id: int,
+        hand_id: int,  # noqa: ARG002
+        result: GameHandResult,
+    ) -> None:
+        """Count one hand.
+
+        Args:
+            session_id: The session the hand belongs to.
+            hand_id: The hand's identifier within the session.
+            result: The hand's result.
+
+        Raises:
+            ValueError: If the session id is out of range or the bets differ
+                from earlier hands.
+        """
+        if not 0 <= session_id < self._num_sessions:
+            raise ValueError(
+                f"session_id {session_id} out of range for "
+                f"{self._num_sessions} sessions"
+            )
+        if self._base_bet is None:
+            self._base_bet = result.base_bet
+            self._bonus_bet = result.bonus_bet
+        elif result.base_bet != self._base_bet or result.bonus_bet != self._bonus_bet:
+            raise ValueError(
+                "Paytable reweighting requires flat betting: hand bets "
+                f"({result.base_bet}, {result.bonus_bet}) differ from "
+                f"({self._base_bet}, {self._bonus_bet})"
+            )
+
+        row = self._rows.get(session_id)
+        if row is None:
+            row = self._rows[session_id] = [0] * (len(_MAIN_RANKS) * _MAX_BETS_AT_RISK)
+        bets_at_risk = round(result.bets_at_risk / result.base_bet)
+        row[
+            _MAIN_RANK_INDEX[result.final_hand_rank] * _MAX_BETS_AT_RISK
+            + bets_at_risk
+            - 1
+        ] += 1
+
+        if result.bonus_hand_rank is not None:
+            bonus_row = self._bonus_rows.get(session_id)
+            if bonus_row is None:
+                bonus_row = self._bonus_rows[session_id] = [0] * len(_BONUS_RANKS)
+            bonus_row[_BONUS_RANK_INDEX[result.bonus_hand_rank]] += 1
+
+    def histograms(self) -> PaytableHistograms:
+        """Return the counts recorded so far.
+
+        Returns:
+            PaytableHistograms with one row per session.
+        """
+        main_counts = np.zeros(
+            (self._num_sessions, len(_MAIN_RANKS) * _MAX_BETS_AT_RISK),
+            dtype=np.int64,
+        )
+        for session_id, row in self._rows.items():
+            main_counts[session_id] = row
+        bonus_counts = np.zeros((self._num_sessions, len(_BONUS_RANKS)), np.int64)
+        for session_id, row in self._bonus_rows.items():
+            bonus_counts[session_id] = row
+
+        return PaytableHistograms(
+            main_counts=main_counts.reshape(
+                self._num_sessions, len(_MAIN_RANKS), _MAX_BETS_AT_RISK
+            ),
+            bonus_counts=bonus_counts,
+            base_bet=self._base_bet if self._base_bet is not None else 0.0,
+            bonus_bet=self._bonus_bet if self._bonus_bet is not None else 0.0,
+        )
+
+
+def record_paytable_histograms(
+    config: FullConfig,
+) -> tuple[SimulationResults, PaytableHistograms]:
+    """Run a simulation and record the histograms for reweighting.
+
+    The simulation runs sequentially (the hand callback is not available
+    in parallel or lockstep mode), and otherwise exactly as configured.
+
+    Args:
+        config: Single-seat configuration with flat betting.
+
+    Returns:
+        Tuple of (simulation results, recorded histograms).
+
+    Raises:
+        ValueError: If the configuration has more than one seat or does not
+            use flat betting.
+    """
+    if config.table.num_seats != 1:
+        raise ValueError("Paytable reweighting requires a single seat")
+    if not isinstance(create_betting_system(config.bankroll), FlatBetting):
+        raise ValueError("Paytable reweighting requires flat betting")
+
+    sequential = config.model_copy(
+        update={
+            "simulation": config.simulation.model_copy(
+                update={"workers": 1, "lockstep": False}
+            )
+        }
+    )
+    recorder = PaytableHistogramRecorder(config.simulation.num_sessions)
+    results = SimulationController(sequential, hand_callback=recorder).run()
+    return results, recorder.histograms()
+
+
+def _main_payoffs(paytable: MainGamePaytable) -> NDArray[np.float64]:
+    """Return the net result in base bets of each main histogram cell."""
+    units = np.arange(1, _MAX_BETS_AT_RISK + 1, dtype=np.float64)
+    ratios = np.array([paytable.payouts[rank] for rank in _MAIN_RANKS], np.float64)
+    return np.where(ratios[:, None] > 0, ratios[:, None] * units, -units).ravel()
+
+
+def _bonus_payoffs(paytable: BonusPaytable) -> NDArray[np.float64]:
+    """Return the net result in bonus bets of each bonus histogram cell."""
+    ratios = np.array([paytable.payouts[rank] for rank in _BONUS_RANKS], np.float64)
+    return np.where(ratios > 0, ratios, -1.0)
+
+
+def reweight_paytables(
+    histograms: PaytableHistograms,
+    paytables: Sequence[tuple[MainGamePaytable, BonusPaytable | None]],
+) -> list[AggregateStatistics]:
+    """Compute aggregate statistics under alternative paytables.
+
+    Every paytable pair is scored in one matrix product of the session
+    histograms with the pairs' per-cell payoffs. Totals and per-hand EVs
+    are exact; session profits are those of the recorded sessions, which
+    would have stopped at different hands under win or loss limits.
+
+    The main/bonus breakdown follows aggregate_results, which assumes the
+    bonus breaks even, so the statistics compare field by field with a
+    normal run's. A bonus paytable's effect shows in net_result and
+    expected_value_per_hand.
+
+    Args:
+        histograms: Histograms recorded from a flat-bet run.
+        paytables: (main paytable, bonus paytable) pairs to evaluate. The
+            bonus paytable may be None when no bonus bet was played.
+
+    Returns:
+        One AggregateStatistics per paytable pair, in the same order.
+
+    Raises:
+        ValueError: If paytables is empty, or a bonus paytable is missing
+            for a run with bonus bets.
+    """
+    if not paytables:
+        raise ValueError("At least one paytable pair is required")
+    has_bonus = bool(histograms.bonus_counts.any())
+    if has_bonus and any(bonus is None for _, bonus in paytables):
+        raise ValueError("A bonus paytable is required for runs with bonus bets")
+
+    num_sessions = histograms.num_sessions
+    main_counts = histograms.main_counts.reshape(num_sessions, -1)
+    bonus_counts = histograms.bonus_counts
+
+    # Columns are paytable pairs: (sessions, cells) @ (cells, pairs)
+    main_payoffs = np.stack([_main_payoffs(main) for main, _ in paytables], axis=1)
+    main_profit = (main_counts @ main_payoffs) * histograms.base_bet
+    if has_bonus:
+        bonus_payoffs = np.stack(
+            [_bonus_payoffs(bonus) for _, bonus in paytables if bonus is not None],
+            axis=1,
+        )
+        bonus_profit = (bonus_counts @ bonus_payoffs) * histograms.bonus_bet
+    else:
+        bonus_profit = np.zeros_like(main_profit)
+    session_profit = main_profit + bonus_profit
+
+    # Quantities that do not depend on the paytables
+    hands_per_session = histograms.hands_played
+    total_hands = int(hands_per_session.sum())
+    units = np.arange(1, _MAX_BETS_AT_RISK + 1, dtype=np.float64)
+    main_wagered = float(
+        (histograms.main_counts.sum(axis=(0, 1)) * units).sum() * histograms.base_bet
+    )
+    bonus_wagered = float(bonus_counts.sum()) * histograms.bonus_bet
+    total_wagered = main_wagered + bonus_wagered
+    rank_totals = histograms.main_counts.sum(axis=(0, 2))
+    hand_frequencies = {
+        rank.name.lower(): int(count)
+        for rank, count in zip(_MAIN_RANKS, rank_totals, strict=True)
+        if count > 0
+    }
+    hand_frequency_pct = (
+        {rank: count / total_hands for rank, count in hand_frequencies.items()}
+        if total_hands > 0
+        else {}
+    )
+
+    statistics = []
+    for column in range(len(paytables)):
+        profits = session_profit[:, column]
+        net_result = float(main_profit[:, column].sum()) + float(
+            bonus_profit[:, column].sum()
+        )
+        ev_per_hand = net_result / total_hands if total_hands > 0 else 0.0
+        winning_sessions = int(np.count_nonzero(profits > 0))
+        losing_sessions = int(np.count_nonzero(profits < 0))
+
+        statistics.append(
+            AggregateStatistics(
+                total_sessions=num_sessions,
+                winning_sessions=winning_sessions,
+                losing_sessions=losing_sessions,
+                push_sessions=num_sessions - winning_sessions - losing_sessions,
+                session_win_rate=winning_sessions / num_sessions,
+                total_hands=total_hands,
+                total_wagered=total_wagered,
+                total_won=net_result + total_wagered,
+                net_result=net_result,
+                expected_value_per_hand=ev_per_hand,
+                main_wagered=main_wagered,
+                main_won=net_result + main_wagered,
+                main_ev_per_hand=ev_per_hand,
+                bonus_wagered=bonus_wagered,
+                bonus_won=bonus_wagered,  # Break-even assumption
+                bonus_ev_per_hand=0.0,
+                hand_frequencies=dict(hand_frequencies),
+                hand_frequency_pct=dict(hand_frequency_pct),
+                session_profit_mean=float(profits.mean()),
+                session_profit_std=(
+                    float(profits.std(ddof=1)) if num_sessions > 1 else 0.0
+                ),
+                session_profit_median=float(np.median(profits)),
+                session_profit_min=float(profits.min()),
+                session_profit_max=float(profits.max()),
+                session_profits=tuple(profits.tolist()),
+                profit_moments=RunningMoments.from_values(profits),
+                profit_sketch=QuantileSketch.from_values(profits),
+            )
+        )
+    return statistics
@@ -16,7 +16,7 @@ from typing import Any
 
 from let_it_ride.bankroll.betting_systems import BettingContext, BettingSystem
 from let_it_ride.bankroll.tracker import BankrollTracker
-from let_it_ride.core.game_engine import GameEngine, GameHandResult
+from let_it_ride.core.game_engine import GameHandResult, HandEngine
 from let_it_ride.strategy.base import StrategyContext
 from let_it_ride.strategy.bonus import BonusContext, BonusStrategy
 
@@ -318,7 +318,7 @@ class Session:
     def __init__(
         self,
         config: SessionConfig,
-        engine: GameEngine,
+        engine: HandEngine,
         betting_system: BettingSystem,
         bonus_strategy: BonusStrategy | None = None,
         hand_callback: HandCallback | None = None,
@@ -327,7 +327,7 @@ class Session:
 
         Args:
             config: Session configuration.
-            engine: GameEngine for playing hands.
+            engine: GameEngine (or another HandEngine) for playing hands.
             betting_system: BettingSystem for determining bet sizes.
             bonus_strategy: Optional BonusStrategy for dynamic bonus betting.
                 If provided, overrides config.bonus_bet with dynamic amounts.
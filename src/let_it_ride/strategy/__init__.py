@@ -5,7 +5,9 @@ This module contains strategy implementations for pull/ride decisions:
 - Baseline strategies (always ride, always pull)
 - Conservative and aggressive variants
 - Custom configurable strategies
+- Optimal strategy solved for any main game paytable
 - Bonus betting strategies
+- Decision-table compilation for stateless strategies
 """
 
 from let_it_ride.strategy.base import Decision, Strategy, StrategyContext
@@ -21,12 +23,14 @@ from let_it_ride.strategy.bonus import (
     StreakBasedBonusStrategy,
     create_bonus_strategy,
 )
+from let_it_ride.strategy.compiled import CompiledStrategy, compile_strategy
 from let_it_ride.strategy.custom import (
     ConditionParseError,
     CustomStrategy,
     InvalidFieldError,
     StrategyRule,
 )
+from let_it_ride.strategy.optimal import OptimalStrategy
 from let_it_ride.strategy.presets import aggressive_strategy, conservative_strategy
 
 __all__ = [
@@ -37,17 +41,20 @@ __all__ = [
     "BasicStrategy",
     "BonusContext",
     "BonusStrategy",
+    "CompiledStrategy",
     "ConditionParseError",
     "CustomStrategy",
     "Decision",
     "InvalidFieldError",
     "NeverBonusStrategy",
+    "OptimalStrategy",
     "StaticBonusStrategy",
     "StreakBasedBonusStrategy",
     "Strategy",
     "StrategyContext",
     "StrategyRule",
     "aggressive_strategy",
+    "compile_strategy",
     "conservative_strategy",
     "create_bonus_strategy",
 ]
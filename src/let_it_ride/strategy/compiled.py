@@ -0,0 +1,208 @@
+"""Decision-table compilation for stateless strategies.
+
+Most strategies (basic, baselines, presets and rule-only custom strategies)
+decide purely from the HandAnalysis and never look at StrategyContext. Their
+decisions can therefore be evaluated once for every canonical 3-card and
+4-card hand class and replayed by table lookup.
+
+compile_strategy() performs that enumeration and returns a CompiledStrategy,
+a drop-in Strategy. Strategies that read StrategyContext while deciding are
+detected during compilation and returned unchanged, so they keep their live
+evaluation.
+
+CompiledStrategy additionally offers decide_bet1_codes()/decide_bet2_codes()
+for hands in the integer card encoding. These map the dealt card codes
+straight to a decision through a bytearray, skipping hand analysis entirely.
+"""
+
+from collections.abc import Callable
+from typing import Any, cast
+
+from let_it_ride.core.hand_analysis import (
+    HandAnalysis,
+    analyze_four_card_codes,
+    analyze_three_card_codes,
+    canonical_four_card_analyses,
+    canonical_three_card_analyses,
+)
+from let_it_ride.strategy.base import Decision, Strategy, StrategyContext
+
+# Byte values stored in the code-indexed tables (0 = not yet filled)
+_PULL = 1
+_RIDE = 2
+_BYTE_TO_DECISION: tuple[Decision | None, ...] = (None, Decision.PULL, Decision.RIDE)
+
+
+class _ContextReadError(Exception):
+    """Raised by _ContextProbe when a strategy reads its context."""
+
+
+class _ContextProbe:
+    """Stand-in StrategyContext that raises on any attribute access."""
+
+    def __getattribute__(self, name: str) -> Any:
+        raise _ContextReadError(name)
+
+
+class CompiledStrategy:
+    """Table-driven strategy produced by compile_strategy().
+
+    Decisions are looked up by the identity of the shared HandAnalysis
+    instance of each canonical hand class. Analyses that did not come from
+    analyze_three_cards()/analyze_four_cards() (e.g., constructed by hand)
+    are decided by the wrapped strategy.
+
+    Attributes:
+        strategy: The original strategy that was compiled.
+    """
+
+    def __init__(
+        self,
+        strategy: Strategy,
+        bet1_decisions: dict[int, tuple[HandAnalysis, Decision]],
+        bet2_decisions: dict[int, tuple[HandAnalysis, Decision]],
+    ) -> None:
+        """Initialize from precomputed decision tables.
+
+        Use compile_strategy() rather than constructing this directly.
+
+        Args:
+            strategy: The original strategy.
+            bet1_decisions: Mapping from id() of each canonical 3-card analysis
+                to (analysis, decision). The analysis is kept so its id stays
+                valid and can be verified on lookup.
+            bet2_decisions: The same for canonical 4-card analyses.
+        """
+        self.strategy = strategy
+        self._bet1_decisions = bet1_decisions
+        self._bet2_decisions = bet2_decisions
+        # Decisions indexed by the ordered card codes, filled on first use:
+        # 52**3 entries for Bet 1 and 52**4 (about 7 MB) for Bet 2.
+        self._bet1_codes = bytearray(52**3)
+        self._bet2_codes = bytearray(52**4)
+
+    def decide_bet1(self, analysis: HandAnalysis, context: StrategyContext) -> Decision:
+        """Decide Bet 1 by table lookup.
+
+        Args:
+            analysis: Analysis of the player's 3-card hand.
+            context: Session context (only passed on to the wrapped strategy
+                for analyses outside the table).
+
+        Returns:
+            Decision.RIDE or Decision.PULL.
+        """
+        entry = self._bet1_decisions.get(id(analysis))
+        if entry is not None and entry[0] is analysis:
+            return entry[1]
+        return self.strategy.decide_bet1(analysis, context)
+
+    def decide_bet2(self, analysis: HandAnalysis, context: StrategyContext) -> Decision:
+        """Decide Bet 2 by table lookup.
+
+        Args:
+            analysis: Analysis of the 4-card hand (3 player + 1 community).
+            context: Session context (only passed on to the wrapped strategy
+                for analyses outside the table).
+
+        Returns:
+            Decision.RIDE or Decision.PULL.
+        """
+        entry = self._bet2_decisions.get(id(analysis))
+        if entry is not None and entry[0] is analysis:
+            return entry[1]
+        return self.strategy.decide_bet2(analysis, context)
+
+    def decide_bet1_codes(
+        self, codes: tuple[int, int, int], context: StrategyContext
+    ) -> Decision:
+        """Decide Bet 1 for a 3-card hand given as integer card codes.
+
+        Args:
+            codes: The player's 3 card codes, in dealt order.
+            context: Session context (see decide_bet1).
+
+        Returns:
+            Decision.RIDE or Decision.PULL.
+        """
+        c0, c1, c2 = codes
+        index = (c0 * 52 + c1) * 52 + c2
+        decision = _BYTE_TO_DECISION[self._bet1_codes[index]]
+        if decision is None:
+            decision = self.decide_bet1(analyze_three_card_codes(codes), context)
+            self._bet1_codes[index] = _RIDE if decision == Decision.RIDE else _PULL
+        return decision
+
+    def decide_bet2_codes(
+        self, codes: tuple[int, int, int, int], context: StrategyContext
+    ) -> Decision:
+        """Decide Bet 2 for a 4-card hand given as integer card codes.
+
+        Args:
+            codes: The 3 player card codes followed by the first community
+                card code, in dealt order.
+            context: Session context (see decide_bet2).
+
+        Returns:
+            Decision.RIDE or Decision.PULL.
+        """
+        c0, c1, c2, c3 = codes
+        index = ((c0 * 52 + c1) * 52 + c2) * 52 + c3
+        decision = _BYTE_TO_DECISION[self._bet2_codes[index]]
+        if decision is None:
+            decision = self.decide_bet2(analyze_four_card_codes(codes), context)
+            self._bet2_codes[index] = _RIDE if decision == Decision.RIDE else _PULL
+        return decision
+
+
+def _decision_table(
+    decide: Callable[[HandAnalysis, StrategyContext], Decision],
+    analyses: tuple[HandAnalysis, ...],
+    probe: StrategyContext,
+) -> dict[int, tuple[HandAnalysis, Decision]]:
+    """Evaluate decide() for each analysis, keyed by id(analysis).
+
+    Analyses for which decide() raises (e.g., a custom strategy without a
+    default rule) are left out so they raise again at play time.
+    """
+    table: dict[int, tuple[HandAnalysis, Decision]] = {}
+    for analysis in analyses:
+        try:
+            table[id(analysis)] = (analysis, decide(analysis, probe))
+        except _ContextReadError:
+            raise
+        except Exception:
+            continue
+    return table
+
+
+def compile_strategy(strategy: Strategy) -> Strategy:
+    """Compile a stateless strategy into a decision table.
+
+    Calls decide_bet1 for every canonical 3-card hand class and decide_bet2
+    for every canonical 4-card hand class, with a probe context that detects
+    any read of StrategyContext. The strategy must decide deterministically
+    from its arguments; internal mutable state is not detected.
+
+    Args:
+        strategy: The strategy to compile.
+
+    Returns:
+        A CompiledStrategy if the strategy never read its context, otherwise
+        the original strategy unchanged (live evaluation).
+    """
+    if isinstance(strategy, CompiledStrategy):
+        return strategy
+
+    probe = cast("StrategyContext", _ContextProbe())
+    try:
+        bet1_decisions = _decision_table(
+            strategy.decide_bet1, canonical_three_card_analyses(), probe
+        )
+        bet2_decisions = _decision_table(
+            strategy.decide_bet2, canonical_four_card_analyses(), probe
+        )
+    except _ContextReadError:
+        return strategy
+
+    return CompiledStrategy(strategy, bet1_decisions, bet2_decisions)
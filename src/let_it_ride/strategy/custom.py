@@ -12,9 +12,15 @@ Example configuration:
         action: "ride"
       - condition: "default"
         action: "pull"
+
+Conditions are parsed and compiled once, when a StrategyRule is created, into
+a chain of closures over HandAnalysis attributes. Deciding a hand only calls
+those closures; no tokenizing or parsing happens on the hot path.
 """
 
+import operator
 import re
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -55,6 +61,25 @@ _TOKEN_PATTERN = re.compile(
 )
 
 
+# Comparison operators supported in conditions
+_COMPARISON_OPERATORS: dict[str, Callable[[Any, Any], Any]] = {
+    ">=": operator.ge,
+    "<=": operator.le,
+    ">": operator.gt,
+    "<": operator.lt,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
+
+# A compiled condition, evaluated against a hand analysis
+_Predicate = Callable[[HandAnalysis], bool]
+
+
+def _match_all(analysis: HandAnalysis) -> bool:  # noqa: ARG001
+    """Predicate for the "default" condition, which matches every hand."""
+    return True
+
+
 class ConditionParseError(ValueError):
     """Raised when a condition string cannot be parsed."""
 
@@ -78,30 +103,33 @@ class StrategyRule:
 
     condition: str
     action: Decision
-    # Pre-tokenized condition for performance (computed in __post_init__)
-    _tokens: tuple[str, ...] = field(default=(), repr=False, compare=False)
+    # Compiled condition for performance (computed in __post_init__)
+    _predicate: _Predicate = field(default=_match_all, repr=False, compare=False)
 
     def __post_init__(self) -> None:
-        """Validate the rule after creation and pre-tokenize condition."""
+        """Validate the rule after creation and compile its condition."""
         # Validate action is a Decision
         if not isinstance(self.action, Decision):
             raise TypeError(f"action must be a Decision, got {type(self.action)}")
 
-        # Validate condition syntax and pre-tokenize (unless it's "default")
+        # Validate condition syntax and compile (unless it's "default")
         if self.condition != "default":
-            tokens = _validate_and_tokenize(self.condition)
             # Use object.__setattr__ since this is a frozen dataclass
-            object.__setattr__(self, "_tokens", tuple(tokens))
+            object.__setattr__(self, "_predicate", _compile_condition(self.condition))
 
+    def __reduce__(self) -> tuple[type["StrategyRule"], tuple[str, Decision]]:
+        """Pickle by condition and action; the closure is rebuilt on load."""
+        return (StrategyRule, (self.condition, self.action))
 
-def _validate_and_tokenize(condition: str) -> list[str]:
-    """Validate a condition string and return its tokens.
+
+def _compile_condition(condition: str) -> _Predicate:
+    """Validate a condition string and compile it.
 
     Args:
         condition: The condition string to validate.
 
     Returns:
-        List of validated tokens.
+        Predicate evaluating the condition against a hand analysis.
 
     Raises:
         ConditionParseError: If the condition has invalid syntax.
@@ -125,26 +153,8 @@ def _validate_and_tokenize(condition: str) -> list[str]:
                 f"Valid fields are: {sorted(_VALID_FIELDS)}"
             )
 
-    # Validate expression structure (catches syntax errors early)
-    _validate_expression_structure(tokens)
-
-    return tokens
-
-
-def _validate_expression_structure(tokens: list[str]) -> None:
-    """Validate that tokens form a valid expression structure.
-
-    This performs a dry-run parse to catch syntax errors like unclosed
-    parentheses, missing operands, or trailing tokens at rule creation time.
-
-    Args:
-        tokens: List of tokens to validate.
-
-    Raises:
-        ConditionParseError: If the expression structure is invalid.
-    """
-    validator = _ExpressionValidator(tokens)
-    validator.validate()
+    # Compiling validates the expression structure
+    return _compile_tokens(tokens)
 
 
 def _tokenize(condition: str) -> list[str]:
@@ -192,112 +202,25 @@ def _evaluate_rule(rule: StrategyRule, analysis: HandAnalysis) -> bool:
     """Evaluate a rule's condition against a hand analysis.
 
     This function safely evaluates condition expressions without using eval().
-    It uses pre-tokenized tokens from the rule for performance.
+    It calls the predicate compiled when the rule was created.
 
     Args:
-        rule: The strategy rule containing the condition and pre-tokenized tokens.
+        rule: The strategy rule containing the compiled condition.
         analysis: The hand analysis to evaluate against.
 
     Returns:
         True if the condition matches, False otherwise.
     """
-    if rule.condition == "default":
-        return True
-
-    # Use pre-tokenized tokens for performance
-    if not rule._tokens:
-        return False
-
-    # Build expression tree and evaluate
-    return _evaluate_tokens(list(rule._tokens), analysis)
-
-
-class _ExpressionValidator:
-    """Validates expression structure without evaluating.
-
-    This mirrors the parser structure but only checks syntax validity,
-    allowing early detection of malformed expressions at rule creation time.
-    """
+    return rule._predicate(analysis)
 
-    def __init__(self, tokens: list[str]) -> None:
-        self.tokens = tokens
-        self.pos = 0
 
-    def validate(self) -> None:
-        """Validate the full expression structure."""
-        self._or_expr()
-        # Ensure all tokens consumed
-        if self.pos < len(self.tokens):
-            raise ConditionParseError(
-                f"Unexpected token: {self.tokens[self.pos]} at position {self.pos}"
-            )
-
-    def _current(self) -> str | None:
-        """Get current token or None if exhausted."""
-        if self.pos < len(self.tokens):
-            return self.tokens[self.pos]
-        return None
-
-    def _advance(self) -> str | None:
-        """Advance to next token and return the previous one."""
-        token = self._current()
-        self.pos += 1
-        return token
-
-    def _or_expr(self) -> None:
-        """Validate OR expression: and_expr ('or' and_expr)*"""
-        self._and_expr()
-        while self._current() == "or":
-            self._advance()
-            self._and_expr()
-
-    def _and_expr(self) -> None:
-        """Validate AND expression: not_expr ('and' not_expr)*"""
-        self._not_expr()
-        while self._current() == "and":
-            self._advance()
-            self._not_expr()
-
-    def _not_expr(self) -> None:
-        """Validate NOT expression: 'not' not_expr | comparison"""
-        if self._current() == "not":
-            self._advance()
-            self._not_expr()
-        else:
-            self._comparison()
-
-    def _comparison(self) -> None:
-        """Validate comparison: primary (comp_op primary)?"""
-        self._primary()
-        comp_ops = (">=", "<=", ">", "<", "==", "!=")
-        if self._current() in comp_ops:
-            self._advance()
-            self._primary()
-
-    def _primary(self) -> None:
-        """Validate primary: field | number | '(' expression ')'"""
-        token = self._current()
-
-        if token is None:
-            raise ConditionParseError("Unexpected end of expression")
-
-        if token == "(":
-            self._advance()
-            self._or_expr()
-            if self._current() != ")":
-                raise ConditionParseError("Expected closing parenthesis")
-            self._advance()
-        elif token.isdigit() or token in _VALID_FIELDS:
-            self._advance()
-        else:
-            raise ConditionParseError(f"Unexpected token: {token}")
-
-
-def _evaluate_tokens(tokens: list[str], analysis: HandAnalysis) -> bool:
-    """Evaluate a list of tokens as a boolean expression.
+def _compile_tokens(tokens: list[str]) -> _Predicate:
+    """Compile a list of tokens into a predicate over HandAnalysis.
 
     Implements a simple recursive descent parser for boolean expressions
-    with support for and, or, not, and comparisons.
+    with support for and, or, not, and comparisons. Instead of evaluating,
+    each grammar rule returns a closure, so the expression is parsed once
+    and later evaluated by plain function calls.
 
     Grammar:
         expression -> or_expr
@@ -308,33 +231,40 @@ def _evaluate_tokens(tokens: list[str], analysis: HandAnalysis) -> bool:
         primary -> field | number | '(' expression ')'
 
     Args:
-        tokens: List of tokens to evaluate.
-        analysis: The hand analysis to evaluate against.
+        tokens: List of tokens to compile.
 
     Returns:
-        Boolean result of the expression.
+        Predicate returning the boolean result of the expression.
+
+    Raises:
+        ConditionParseError: If the expression structure is invalid.
     """
-    parser = _ExpressionParser(tokens, analysis)
-    return parser.parse()
+    compiler = _ExpressionCompiler(tokens)
+    return compiler.compile()
 
 
-class _ExpressionParser:
-    """Recursive descent parser for condition expressions."""
+class _ExpressionCompiler:
+    """Recursive descent compiler for condition expressions.
 
-    def __init__(self, tokens: list[str], analysis: HandAnalysis) -> None:
+    Operands of a comparison are represented as either a constant (number
+    literal) or a getter; every other node compiles to a predicate. Because
+    conditions have no side effects, and/or may short-circuit without
+    changing results.
+    """
+
+    def __init__(self, tokens: list[str]) -> None:
         self.tokens = tokens
-        self.analysis = analysis
         self.pos = 0
 
-    def parse(self) -> bool:
-        """Parse and evaluate the full expression."""
-        result = self._or_expr()
+    def compile(self) -> _Predicate:
+        """Compile the full expression."""
+        predicate = self._or_expr()
         # Ensure all tokens consumed
         if self.pos < len(self.tokens):
             raise ConditionParseError(
                 f"Unexpected token: {self.tokens[self.pos]} at position {self.pos}"
             )
-        return result
+        return predicate
 
     def _current(self) -> str | None:
         """Get current token or None if exhausted."""
@@ -348,62 +278,46 @@ class _ExpressionParser:
         self.pos += 1
         return token
 
-    def _or_expr(self) -> bool:
-        """Parse OR expression: and_expr ('or' and_expr)*"""
+    def _or_expr(self) -> _Predicate:
+        """Compile OR expression: and_expr ('or' and_expr)*"""
         left = self._and_expr()
         while self._current() == "or":
             self._advance()  # consume 'or'
             right = self._and_expr()
-            left = left or right
+            left = _or(left, right)
         return left
 
-    def _and_expr(self) -> bool:
-        """Parse AND expression: not_expr ('and' not_expr)*"""
+    def _and_expr(self) -> _Predicate:
+        """Compile AND expression: not_expr ('and' not_expr)*"""
         left = self._not_expr()
         while self._current() == "and":
             self._advance()  # consume 'and'
             right = self._not_expr()
-            left = left and right
+            left = _and(left, right)
         return left
 
-    def _not_expr(self) -> bool:
-        """Parse NOT expression: 'not' not_expr | comparison"""
+    def _not_expr(self) -> _Predicate:
+        """Compile NOT expression: 'not' not_expr | comparison"""
         if self._current() == "not":
             self._advance()  # consume 'not'
-            return not self._not_expr()
+            return _not(self._not_expr())
         return self._comparison()
 
-    def _comparison(self) -> bool:
-        """Parse comparison: primary (comp_op primary)?"""
+    def _comparison(self) -> _Predicate:
+        """Compile comparison: primary (comp_op primary)?"""
         left = self._primary()
 
-        comp_ops = (">=", "<=", ">", "<", "==", "!=")
-        if self._current() in comp_ops:
-            op = self._advance()
+        op = self._current()
+        if op in _COMPARISON_OPERATORS:
+            self._advance()
             right = self._primary()
-            return self._apply_comparison(left, op, right)
+            return _compare(left, _COMPARISON_OPERATORS[op], right)
 
         # If no comparison, treat as boolean
-        return bool(left)
-
-    def _apply_comparison(self, left: Any, op: str | None, right: Any) -> bool:
-        """Apply a comparison operator to two values."""
-        if op == ">=":
-            return bool(left >= right)
-        if op == "<=":
-            return bool(left <= right)
-        if op == ">":
-            return bool(left > right)
-        if op == "<":
-            return bool(left < right)
-        if op == "==":
-            return bool(left == right)
-        if op == "!=":
-            return bool(left != right)
-        raise ConditionParseError(f"Unknown comparison operator: {op}")
-
-    def _primary(self) -> Any:
-        """Parse primary: field | number | '(' expression ')'"""
+        return _truth(left)
+
+    def _primary(self) -> "_Operand":
+        """Compile primary: field | number | '(' expression ')'"""
         token = self._current()
 
         if token is None:
@@ -412,25 +326,77 @@ class _ExpressionParser:
         # Parenthesized expression
         if token == "(":
             self._advance()  # consume '('
-            result = self._or_expr()
+            predicate = self._or_expr()
             if self._current() != ")":
                 raise ConditionParseError("Expected closing parenthesis")
             self._advance()  # consume ')'
-            return result
+            return _Operand(getter=predicate)
 
         # Number literal
         if token.isdigit():
             self._advance()
-            return int(token)
+            return _Operand(constant=int(token))
 
         # Field reference
         if token in _VALID_FIELDS:
             self._advance()
-            return getattr(self.analysis, token)
+            return _Operand(getter=operator.attrgetter(token))
 
         raise ConditionParseError(f"Unexpected token: {token}")
 
 
+@dataclass(frozen=True, slots=True)
+class _Operand:
+    """A compiled comparison operand: a constant or a getter, never both."""
+
+    constant: int | None = None
+    getter: Callable[[HandAnalysis], Any] | None = None
+
+
+def _or(left: _Predicate, right: _Predicate) -> _Predicate:
+    """Combine two predicates with 'or'."""
+    return lambda analysis: left(analysis) or right(analysis)
+
+
+def _and(left: _Predicate, right: _Predicate) -> _Predicate:
+    """Combine two predicates with 'and'."""
+    return lambda analysis: left(analysis) and right(analysis)
+
+
+def _not(inner: _Predicate) -> _Predicate:
+    """Negate a predicate."""
+    return lambda analysis: not inner(analysis)
+
+
+def _truth(operand: _Operand) -> _Predicate:
+    """Compile a bare operand, interpreted by its truth value."""
+    getter = operand.getter
+    if getter is None:
+        constant = bool(operand.constant)
+        return lambda _analysis: constant
+    return lambda analysis: bool(getter(analysis))
+
+
+def _compare(
+    left: _Operand, op: Callable[[Any, Any], Any], right: _Operand
+) -> _Predicate:
+    """Compile a comparison, specializing on which sides are constant."""
+    if left.getter is None:
+        left_value = left.constant
+        if right.getter is None:
+            result = bool(op(left_value, right.constant))
+            return lambda _analysis: result
+        right_get = right.getter
+        return lambda analysis: bool(op(left_value, right_get(analysis)))
+
+    left_get = left.getter
+    if right.getter is None:
+        right_value = right.constant
+        return lambda analysis: bool(op(left_get(analysis), right_value))
+    right_getter = right.getter
+    return lambda analysis: bool(op(left_get(analysis), right_getter(analysis)))
+
+
 class CustomStrategy:
     """Strategy implementation that evaluates configurable rules.
 
@@ -0,0 +1,199 @@
+"""Optimal strategy solved exactly for any main game paytable.
+
+BasicStrategy encodes the published chart for the standard paytable.
+OptimalStrategy instead derives its decisions from the paytable itself:
+
+Every bet left riding is one more unit on the same final hand, so a bet
+should ride exactly when the expected net result per unit, given the cards
+seen so far, is positive.
+- Bet 2: average over the 48 possible final cards of each 4-card hand
+- Bet 1: average over the 1,176 possible pairs of community cards of each
+  3-card hand. Bet 2 is then decided optimally either way, so its value is
+  the same whether Bet 1 rides or not and cancels out of the comparison.
+
+Decisions are solved for every canonical hand class (see
+canonical_three_card_hands()) once per distinct set of payout ratios.
+"""
+
+from __future__ import annotations
+
+from fractions import Fraction
+from functools import cache
+from itertools import combinations
+from typing import TYPE_CHECKING, Any
+
+from let_it_ride.core.hand_analysis import (
+    HandAnalysis,
+    canonical_four_card_hands,
+    canonical_three_card_hands,
+)
+from let_it_ride.core.hand_evaluator import (
+    FiveCardHandRank,
+    evaluate_five_card_rank_codes,
+)
+from let_it_ride.strategy.base import Decision, StrategyContext
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from let_it_ride.config.paytables import MainGamePaytable
+
+# Decision table: id() of each canonical analysis -> (analysis, ride value,
+# decision). The analysis is kept so its id stays valid and can be verified.
+_DecisionTable = dict[int, tuple[HandAnalysis, Fraction, Decision]]
+
+
+class OptimalStrategy:
+    """Exact optimal pull/ride strategy for a main game paytable.
+
+    Analyses must be the shared instances returned by analyze_three_cards()
+    and analyze_four_cards() (or their integer-code variants). It never uses
+    session context.
+
+    Attributes:
+        main_paytable: The paytable the strategy is optimal for.
+    """
+
+    def __init__(self, main_paytable: MainGamePaytable) -> None:
+        """Solve (or fetch the cached solution) for a paytable.
+
+        Args:
+            main_paytable: The main game paytable.
+
+        Raises:
+            KeyError: If the paytable is missing a hand rank.
+        """
+        self.main_paytable = main_paytable
+        self._bet1_table, self._bet2_table = _solve(
+            tuple(main_paytable.payouts[rank] for rank in FiveCardHandRank)
+        )
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Pickle by paytable; tables are keyed by process-local instances."""
+        return (OptimalStrategy, (self.main_paytable,))
+
+    def bet1_ride_value(self, analysis: HandAnalysis) -> Fraction:
+        """Return the exact EV per unit of letting Bet 1 ride over pulling it.
+
+        Args:
+            analysis: Analysis of the player's 3-card hand.
+
+        Raises:
+            ValueError: If the analysis is not a shared canonical instance.
+        """
+        return _lookup(self._bet1_table, analysis)[1]
+
+    def bet2_ride_value(self, analysis: HandAnalysis) -> Fraction:
+        """Return the exact EV per unit of letting Bet 2 ride over pulling it.
+
+        Args:
+            analysis: Analysis of the 4-card hand (3 player + 1 community).
+
+        Raises:
+            ValueError: If the analysis is not a shared canonical instance.
+        """
+        return _lookup(self._bet2_table, analysis)[1]
+
+    def decide_bet1(
+        self,
+        analysis: HandAnalysis,
+        context: StrategyContext,  # noqa: ARG002
+    ) -> Decision:
+        """Ride Bet 1 if riding has positive expected value.
+
+        Args:
+            analysis: Analysis of the player's 3-card hand.
+            context: Session context (not used).
+
+        Returns:
+            Decision.RIDE or Decision.PULL.
+
+        Raises:
+            ValueError: If the analysis is not a shared canonical instance.
+        """
+        return _lookup(self._bet1_table, analysis)[2]
+
+    def decide_bet2(
+        self,
+        analysis: HandAnalysis,
+        context: StrategyContext,  # noqa: ARG002
+    ) -> Decision:
+        """Ride Bet 2 if riding has positive expected value.
+
+        Args:
+            analysis: Analysis of the 4-card hand (3 player + 1 community).
+            context: Session context (not used).
+
+        Returns:
+            Decision.RIDE or Decision.PULL.
+
+        Raises:
+            ValueError: If the analysis is not a shared canonical instance.
+        """
+        return _lookup(self._bet2_table, analysis)[2]
+
+
+def _lookup(
+    table: _DecisionTable, analysis: HandAnalysis
+) -> tuple[HandAnalysis, Fraction, Decision]:
+    """Find the table entry of a canonical analysis instance."""
+    entry = table.get(id(analysis))
+    if entry is None or entry[0] is not analysis:
+        raise ValueError(
+            "OptimalStrategy requires analyses from analyze_three_cards() "
+            "or analyze_four_cards()"
+        )
+    return entry
+
+
+@cache
+def _solve(ratios: tuple[int, ...]) -> tuple[_DecisionTable, _DecisionTable]:
+    """Solve Bet 1 and Bet 2 decisions for a set of payout ratios.
+
+    Args:
+        ratios: Payout ratios in FiveCardHandRank declaration order.
+
+    Returns:
+        Decision tables for Bet 1 (3-card classes) and Bet 2 (4-card classes).
+    """
+    unit_net = {
+        rank: ratio if ratio > 0 else -1
+        for rank, ratio in zip(FiveCardHandRank, ratios, strict=True)
+    }
+    # Flushes need every card suited, so suits matter only through that flag
+    ride_values: dict[tuple[tuple[int, ...], bool], Fraction] = {}
+
+    def solve_table(
+        hands: tuple[tuple[tuple[int, ...], HandAnalysis], ...],
+    ) -> _DecisionTable:
+        table: _DecisionTable = {}
+        for codes, analysis in hands:
+            key = (tuple(sorted(code >> 2 for code in codes)), _is_suited(codes))
+            value = ride_values.get(key)
+            if value is None:
+                value = ride_values[key] = _ride_value(codes, unit_net)
+            decision = Decision.RIDE if value > 0 else Decision.PULL
+            table[id(analysis)] = (analysis, value, decision)
+        return table
+
+    return solve_table(canonical_three_card_hands()), solve_table(
+        canonical_four_card_hands()
+    )
+
+
+def _is_suited(codes: Sequence[int]) -> bool:
+    """Check whether all card codes share a suit."""
+    return all((code ^ codes[0]) & 3 == 0 for code in codes)
+
+
+def _ride_value(
+    codes: Sequence[int], unit_net: dict[FiveCardHandRank, int]
+) -> Fraction:
+    """Average net result per unit over every completion to five cards."""
+    remaining = [code for code in range(52) if code not in codes]
+    completions = list(combinations(remaining, 5 - len(codes)))
+    total = sum(
+        unit_net[evaluate_five_card_rank_codes((*codes, *extra))]
+        for extra in completions
+    )
+    return Fraction(total, len(completions))
@@ -9,14 +9,21 @@ Tests the full CLI workflow including:
 
 from __future__ import annotations
 
+import csv
 import tempfile
+from multiprocessing import Process
 from pathlib import Path
+from statistics import median, stdev
 from typing import TYPE_CHECKING
+from unittest.mock import patch
 
 import pytest
 from typer.testing import CliRunner
 
 from let_it_ride.cli import app
+from let_it_ride.config.loader import load_config
+from let_it_ride.simulation import SimulationCheckpoint, SimulationController
+from let_it_ride.simulation.distributed import run_worker
 
 if TYPE_CHECKING:
     from collections.abc import Generator
@@ -209,6 +216,96 @@ class TestRunCommand:
             assert len(sessions_csv) == 1
             assert len(aggregate_csv) == 1
 
+    def test_run_without_session_rows(self) -> None:
+        """Test that csv.include_sessions: false skips the sessions file."""
+        config_content = """
+simulation:
+  num_sessions: 12
+  hands_per_session: 5
+  random_seed: 123
+  workers: 2
+output:
+  formats:
+    csv:
+      include_sessions: false
+"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / "config.yaml"
+            config_path.write_text(config_content)
+            output_path = Path(tmpdir) / "out"
+            result = runner.invoke(
+                app,
+                ["run", str(config_path), "--output", str(output_path)],
+            )
+            assert result.exit_code == 0
+            assert "Total Won" in result.stdout
+
+            assert list(output_path.glob("*_sessions.csv")) == []
+            assert len(list(output_path.glob("*_aggregate.csv"))) == 1
+
+    def test_streamed_sessions_match_verbose_run(self) -> None:
+        """Test that sessions streamed by a default run match a full run."""
+        config_content = """
+simulation:
+  num_sessions: 12
+  hands_per_session: 5
+  random_seed: 123
+  workers: 2
+"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / "config.yaml"
+            config_path.write_text(config_content)
+            streamed = Path(tmpdir) / "streamed"
+            full = Path(tmpdir) / "full"
+
+            with patch.object(
+                SimulationController, "run", side_effect=AssertionError("full run")
+            ):
+                result1 = runner.invoke(
+                    app, ["run", str(config_path), "--output", str(streamed)]
+                )
+            result2 = runner.invoke(
+                app, ["run", str(config_path), "--output", str(full), "--verbose"]
+            )
+
+            assert result1.exit_code == 0
+            assert result2.exit_code == 0
+            assert (streamed / "simulation_sessions.csv").read_text() == (
+                full / "simulation_sessions.csv"
+            ).read_text()
+
+    def test_small_run_reports_exact_median(self) -> None:
+        """Test that small default runs report the exact session median."""
+        config_content = """
+simulation:
+  num_sessions: 40
+  hands_per_session: 20
+  random_seed: 3
+  workers: 2
+"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / "config.yaml"
+            config_path.write_text(config_content)
+            output_dir = Path(tmpdir) / "output"
+
+            result = runner.invoke(
+                app, ["run", str(config_path), "--output", str(output_dir), "-q"]
+            )
+
+            assert result.exit_code == 0
+            with (output_dir / "simulation_sessions.csv").open(
+                encoding="utf-8-sig"
+            ) as f:
+                profits = [float(row["session_profit"]) for row in csv.DictReader(f)]
+            with (output_dir / "simulation_aggregate.csv").open(
+                encoding="utf-8-sig"
+            ) as f:
+                (aggregate,) = csv.DictReader(f)
+            assert float(aggregate["session_profit_median"]) == median(profits)
+            assert float(aggregate["session_profit_std"]) == pytest.approx(
+                stdev(profits)
+            )
+
 
 class TestValidateCommand:
     """Tests for the 'validate' command."""
@@ -251,6 +348,32 @@ class TestValidateCommand:
         assert "basic" in result.stdout  # default strategy
 
 
+class TestEVCommand:
+    """Tests for the 'ev' command."""
+
+    @pytest.mark.slow
+    def test_ev_minimal_config(self, minimal_config_file: Path) -> None:
+        """Test exact EV enumeration for the default basic strategy."""
+        result = runner.invoke(app, ["ev", str(minimal_config_file), "--workers", "1"])
+        assert result.exit_code == 0
+        assert "Exact Expected Value" in result.stdout
+        assert "51,979,200" in result.stdout
+        assert "Element of Risk" in result.stdout
+
+    def test_ev_nonexistent_file(self) -> None:
+        """Test error handling when config file doesn't exist."""
+        result = runner.invoke(app, ["ev", "nonexistent.yaml"])
+        assert result.exit_code == 1
+        assert "Error" in result.stdout or "error" in result.stdout.lower()
+
+    def test_ev_help(self) -> None:
+        """Test ev --help shows command options."""
+        result = runner.invoke(app, ["ev", "--help"])
+        assert result.exit_code == 0
+        assert "CONFIG" in result.stdout
+        assert "--workers" in result.stdout
+
+
 class TestCLIHelp:
     """Tests for CLI help and version information."""
 
@@ -266,6 +389,7 @@ class TestCLIHelp:
         assert result.exit_code == 0
         assert "Let It Ride Strategy Simulator" in result.stdout
         assert "run" in result.stdout
+        assert "ev" in result.stdout
         assert "validate" in result.stdout
 
     def test_run_help(self) -> None:
@@ -278,6 +402,16 @@ class TestCLIHelp:
         assert "--sessions" in result.stdout
         assert "--quiet" in result.stdout
         assert "--verbose" in result.stdout
+        assert "--resume" in result.stdout
+
+    def test_worker_help(self) -> None:
+        """Test worker --help shows command options."""
+        result = runner.invoke(app, ["worker", "--help"])
+        assert result.exit_code == 0
+        assert "ADDRESS" in result.stdout
+        assert "LET_IT_RIDE_AUTHKEY" in result.stdout
+        # The secret is never taken from the visible command line
+        assert "--authkey" not in result.stdout
 
     def test_validate_help(self) -> None:
         """Test validate --help shows command options."""
@@ -373,10 +507,196 @@ simulation:
             # (headers are same, but data rows should differ)
             assert sessions1 != sessions2
 
+    def test_resume_matches_uninterrupted_run(self) -> None:
+        """Test that --resume finishes an interrupted run with the same results."""
+        config_content = """
+simulation:
+  num_sessions: 8
+  hands_per_session: 10
+  random_seed: 7
+"""
+
+        def interrupt(completed: int, _total: int) -> None:
+            if completed >= 3:
+                raise KeyboardInterrupt
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / "config.yaml"
+            config_path.write_text(config_content)
+            checkpoint_dir = Path(tmpdir) / "checkpoint"
+
+            # Interrupt a checkpointed run partway through
+            controller = SimulationController(
+                load_config(config_path),
+                progress_callback=interrupt,
+                checkpoint=SimulationCheckpoint(checkpoint_dir, interval_seconds=0),
+            )
+            with pytest.raises(KeyboardInterrupt):
+                controller.run()
+            assert SimulationCheckpoint(checkpoint_dir).exists
+
+            output1 = Path(tmpdir) / "output1"
+            output2 = Path(tmpdir) / "output2"
+            result1 = runner.invoke(
+                app,
+                [
+                    "run",
+                    str(config_path),
+                    "--output",
+                    str(output1),
+                    "--resume",
+                    "--checkpoint-dir",
+                    str(checkpoint_dir),
+                ],
+            )
+            result2 = runner.invoke(
+                app,
+                ["run", str(config_path), "--output", str(output2), "--quiet"],
+            )
+
+            assert result1.exit_code == 0
+            assert result2.exit_code == 0
+            assert "Resuming from checkpoint" in result1.stdout
+            sessions1 = (output1 / "simulation_sessions.csv").read_text()
+            sessions2 = (output2 / "simulation_sessions.csv").read_text()
+            assert sessions1 == sessions2
+
+    def test_distributed_run_matches_local_run(self) -> None:
+        """Test that --listen with two workers reproduces a local run."""
+        config_content = """
+simulation:
+  num_sessions: 12
+  hands_per_session: 10
+  random_seed: 5
+"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / "config.yaml"
+            config_path.write_text(config_content)
+            socket_path = str(Path(tmpdir) / "coordinator.sock")
+
+            # Workers retry until the coordinator is listening
+            workers = [
+                Process(target=run_worker, args=(socket_path, b"secret"))
+                for _ in range(2)
+            ]
+            for worker in workers:
+                worker.start()
+
+            output1 = Path(tmpdir) / "output1"
+            output2 = Path(tmpdir) / "output2"
+            result1 = runner.invoke(
+                app,
+                [
+                    "run",
+                    str(config_path),
+                    "--output",
+                    str(output1),
+                    "--listen",
+                    f"unix:{socket_path}",
+                    "--chunk-size",
+                    "5",
+                    "--timeout",
+                    "60",
+                    "--quiet",
+                ],
+                env={"LET_IT_RIDE_AUTHKEY": "secret"},
+            )
+            for worker in workers:
+                worker.join(timeout=30)
+            result2 = runner.invoke(
+                app,
+                ["run", str(config_path), "--output", str(output2), "--quiet"],
+            )
+
+            assert result1.exit_code == 0
+            assert result2.exit_code == 0
+            assert [worker.exitcode for worker in workers] == [0, 0]
+            sessions1 = (output1 / "simulation_sessions.csv").read_text()
+            sessions2 = (output2 / "simulation_sessions.csv").read_text()
+            assert sessions1 == sessions2
+
 
 class TestCLIEdgeCases:
     """Tests for edge cases and boundary conditions."""
 
+    def test_listen_requires_authkey(
+        self, minimal_config_file: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that --listen without a shared secret exits with an error."""
+        monkeypatch.delenv("LET_IT_RIDE_AUTHKEY", raising=False)
+        result = runner.invoke(
+            app, ["run", str(minimal_config_file), "--listen", "127.0.0.1:0"]
+        )
+        assert result.exit_code == 1
+        assert "LET_IT_RIDE_AUTHKEY" in result.output
+
+    def test_distributed_options_require_listen(
+        self, minimal_config_file: Path
+    ) -> None:
+        """Test that --timeout and --chunk-size are rejected without --listen."""
+        result = runner.invoke(
+            app, ["run", str(minimal_config_file), "--timeout", "10"]
+        )
+        assert result.exit_code == 1
+        assert "need --listen" in result.output
+
+    def test_invalid_options_keep_checkpoint(
+        self, minimal_config_file: Path, tmp_path: Path
+    ) -> None:
+        """Test that rejected option combinations do not clear a checkpoint."""
+        checkpoint_dir = tmp_path / "checkpoint"
+        SimulationCheckpoint(checkpoint_dir).start(
+            load_config(minimal_config_file), "sessions"
+        )
+        lockstep_config = tmp_path / "lockstep.yaml"
+        lockstep_config.write_text(
+            minimal_config_file.read_text()
+            + "  hand_model: sampled\n  lockstep: true\n"
+        )
+        checkpoint_args = ["--checkpoint-dir", str(checkpoint_dir)]
+        run_args = ["run", str(minimal_config_file), *checkpoint_args]
+
+        results = [
+            runner.invoke(app, [*run_args, "--timeout", "10"]),
+            runner.invoke(
+                app,
+                [*run_args, "--listen", "127.0.0.1:0"],
+                env={"LET_IT_RIDE_AUTHKEY": "secret"},
+            ),
+            runner.invoke(app, ["run", str(lockstep_config), *checkpoint_args]),
+        ]
+
+        assert [result.exit_code for result in results] == [1, 1, 1]
+        assert "need --listen" in results[0].output
+        assert "not supported with --listen" in results[1].output
+        assert "lockstep" in results[2].output
+        assert SimulationCheckpoint(checkpoint_dir).exists
+
+    def test_listen_with_invalid_timeout(self, minimal_config_file: Path) -> None:
+        """Test that a non-positive --timeout exits with an error."""
+        result = runner.invoke(
+            app,
+            [
+                "run",
+                str(minimal_config_file),
+                "--listen",
+                "127.0.0.1:0",
+                "--timeout",
+                "0",
+            ],
+            env={"LET_IT_RIDE_AUTHKEY": "secret"},
+        )
+        assert result.exit_code == 1
+        assert "timeout" in result.output
+
+    def test_worker_with_malformed_address(self) -> None:
+        """Test that worker rejects an address without a port."""
+        result = runner.invoke(
+            app, ["worker", "localhost"], env={"LET_IT_RIDE_AUTHKEY": "secret"}
+        )
+        assert result.exit_code == 1
+        assert "host:port" in result.output
+
     def test_run_with_single_session(self) -> None:
         """Test running with a single session."""
         config_content = """
@@ -3,6 +3,8 @@
 Tests multi-session simulation runs, reproducibility, and progress reporting.
 """
 
+import pickle
+from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
@@ -15,6 +17,7 @@ from let_it_ride.config.models import (
     BettingSystemConfig,
     BonusStrategyConfig,
     ConservativeStrategyConfig,
+    DeckConfig,
     FullConfig,
     SimulationConfig,
     StaticBonusConfig,
@@ -24,6 +27,7 @@ from let_it_ride.config.models import (
 from let_it_ride.core.game_engine import GameHandResult
 from let_it_ride.simulation import (
     SessionOutcome,
+    SimulationCheckpoint,
     SimulationController,
     SimulationResults,
     StopReason,
@@ -222,6 +226,29 @@ class TestSimulationController:
                 "seat_number should be None in single-seat mode"
             )
 
+    def test_lockstep_mode(self) -> None:
+        """Test that lockstep runs all sessions together reproducibly."""
+        config = create_test_config(num_sessions=200, random_seed=2024)
+        lockstep = config.simulation.model_copy(
+            update={"hand_model": "sampled", "lockstep": True}
+        )
+        config = config.model_copy(update={"simulation": lockstep})
+        progress_calls: list[tuple[int, int]] = []
+
+        results = SimulationController(
+            config,
+            progress_callback=lambda done, total: progress_calls.append((done, total)),
+        ).run()
+        again = SimulationController(config).run()
+
+        assert len(results.session_results) == 200
+        assert results.session_results == again.session_results
+        assert results.total_hands == sum(
+            r.hands_played for r in results.session_results
+        )
+        assert all(r.hands_played <= 50 for r in results.session_results)
+        assert progress_calls == [(200, 200)]
+
 
 class TestProgressCallback:
     """Tests for progress reporting."""
@@ -324,6 +351,24 @@ class TestReproducibility:
         # Total hands should be identical
         assert results1.total_hands == results2.total_hands
 
+    def test_partial_shuffle_is_reproducible(self) -> None:
+        """Test that the partial shuffle mode is deterministic per seed."""
+        config = create_test_config(num_sessions=5, random_seed=12345)
+        partial_config = config.model_copy(
+            update={"deck": DeckConfig(shuffle_algorithm="partial_fisher_yates")}
+        )
+
+        results1 = SimulationController(partial_config).run()
+        results2 = SimulationController(partial_config).run()
+        full_results = SimulationController(config).run()
+
+        profits1 = [r.session_profit for r in results1.session_results]
+        profits2 = [r.session_profit for r in results2.session_results]
+        assert profits1 == profits2
+        assert results1.total_hands == results2.total_hands
+        # Fewer random draws per hand, so later hands follow another stream
+        assert profits1 != [r.session_profit for r in full_results.session_results]
+
     def test_different_seeds_produce_different_results(self) -> None:
         """Test that different seeds produce different results."""
         config1 = create_test_config(num_sessions=10, random_seed=111)
@@ -397,6 +442,117 @@ def _hands_are_identical(hand1: GameHandResult, hand2: GameHandResult) -> bool:
     )
 
 
+class _Interrupted(Exception):
+    """Raised by a progress callback to simulate a killed run."""
+
+
+def _interrupt_after(sessions: int) -> Mock:
+    """Create a progress callback that interrupts the run after sessions."""
+
+    def callback(completed: int, _total: int) -> None:
+        if completed >= sessions:
+            raise _Interrupted
+
+    return Mock(side_effect=callback)
+
+
+class TestCheckpointResume:
+    """Tests for saving progress to a checkpoint and resuming from it."""
+
+    def test_resumed_run_matches_uninterrupted(self, tmp_path: Path) -> None:
+        """A run resumed after an interruption should give identical results."""
+        config = create_test_config(num_sessions=12, random_seed=None)
+        with pytest.raises(_Interrupted):
+            SimulationController(
+                config,
+                progress_callback=_interrupt_after(5),
+                checkpoint=SimulationCheckpoint(tmp_path, interval_seconds=0),
+            ).run()
+
+        checkpoint = SimulationCheckpoint(tmp_path, interval_seconds=0)
+        progress = Mock()
+        resumed = SimulationController(
+            config, progress_callback=progress, checkpoint=checkpoint
+        ).run()
+        # The unseeded run picked a base seed that the checkpoint kept
+        base_seed = checkpoint.start(config, "sessions").base_seed
+        seeded = config.model_copy(
+            update={
+                "simulation": config.simulation.model_copy(
+                    update={"random_seed": base_seed}
+                )
+            }
+        )
+        uninterrupted = SimulationController(seeded).run()
+
+        assert resumed.session_results == uninterrupted.session_results
+        assert resumed.total_hands == uninterrupted.total_hands
+        assert progress.call_args_list[0].args == (6, 12)
+        assert checkpoint.completed_sessions == 12
+
+    def test_resumed_aggregate_is_bit_identical(self, tmp_path: Path) -> None:
+        """A resumed summary-only run should equal an uninterrupted one exactly."""
+        config = create_test_config(num_sessions=15, random_seed=8)
+        with pytest.raises(_Interrupted):
+            SimulationController(
+                config,
+                progress_callback=_interrupt_after(9),
+                checkpoint=SimulationCheckpoint(tmp_path, interval_seconds=0),
+            ).run_aggregated()
+
+        resumed = SimulationController(
+            config, checkpoint=SimulationCheckpoint(tmp_path)
+        ).run_aggregated()
+        uninterrupted = SimulationController(config).run_aggregated()
+
+        assert pickle.dumps(resumed.aggregate) == pickle.dumps(uninterrupted.aggregate)
+
+    def test_resumed_parallel_aggregate_is_bit_identical(self, tmp_path: Path) -> None:
+        """A resumed parallel summary-only run should not depend on its chunks."""
+        config = create_test_config(num_sessions=400, hands_per_session=20)
+        parallel = config.model_copy(
+            update={"simulation": config.simulation.model_copy(update={"workers": 4})}
+        )
+        with pytest.raises(_Interrupted):
+            SimulationController(
+                parallel,
+                progress_callback=_interrupt_after(150),
+                checkpoint=SimulationCheckpoint(tmp_path, interval_seconds=0),
+            ).run_aggregated()
+
+        saved = SimulationCheckpoint(tmp_path)
+        saved.start(parallel, "aggregate")
+        assert 0 < saved.completed_sessions < 400
+
+        checkpoint = SimulationCheckpoint(tmp_path)
+        resumed = SimulationController(parallel, checkpoint=checkpoint).run_aggregated()
+        uninterrupted = SimulationController(parallel).run_aggregated()
+        sequential = SimulationController(config).run_aggregated()
+
+        assert pickle.dumps(resumed.aggregate) == pickle.dumps(uninterrupted.aggregate)
+        assert pickle.dumps(resumed.aggregate) == pickle.dumps(sequential.aggregate)
+        assert checkpoint.completed_sessions == 400
+
+    def test_unsupported_combinations_rejected(self, tmp_path: Path) -> None:
+        """Checkpoints cannot be combined with lockstep runs or session sinks."""
+        config = create_test_config(num_sessions=5)
+        lockstep = config.model_copy(
+            update={
+                "simulation": config.simulation.model_copy(
+                    update={"lockstep": True, "hand_model": "sampled"}
+                )
+            }
+        )
+        checkpoint = SimulationCheckpoint(tmp_path)
+
+        with pytest.raises(ValueError, match="lockstep"):
+            SimulationController(lockstep, checkpoint=checkpoint).run()
+        with pytest.raises(ValueError, match="session_sink"):
+            SimulationController(config, checkpoint=checkpoint).run_aggregated(
+                session_sink=lambda _results: None
+            )
+
+
 class TestRNGIsolation:
     """Tests verifying RNG isolation between sessions.
 
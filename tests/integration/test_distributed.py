@@ -0,0 +1,414 @@
+"""Integration tests for distributed session execution.
+
+Tests run a coordinator and several worker processes on localhost and verify:
+- Results match a single-node run for the same seed
+- Aggregates match sequential and parallel reductions
+- Chunks of a worker that dies, sends a garbled message or goes silent
+  are run by another worker; busy workers are kept alive by heartbeats
+- Clients that stall in the handshake are dropped
+- Clients with a wrong authkey are turned away
+- Worker failures and timeouts fail the run
+- SimulationController integration
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import pickle
+import socket
+import threading
+import time
+from multiprocessing import Process
+from multiprocessing.connection import Client
+from typing import TYPE_CHECKING, Any
+from unittest.mock import patch
+
+import pytest
+
+from let_it_ride.config.models import (
+    BankrollConfig,
+    BettingSystemConfig,
+    FullConfig,
+    SimulationConfig,
+    StopConditionsConfig,
+    StrategyConfig,
+    TableConfig,
+)
+from let_it_ride.simulation import (
+    SimulationCheckpoint,
+    SimulationController,
+    parallel,
+)
+from let_it_ride.simulation.distributed import (
+    Address,
+    DistributedExecutor,
+    run_worker,
+)
+from let_it_ride.simulation.parallel import ParallelExecutor
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator
+    from pathlib import Path
+
+AUTHKEY = b"test-secret"
+
+
+def create_test_config(
+    num_sessions: int = 40, random_seed: int | None = 42, num_seats: int = 1
+) -> FullConfig:
+    """Create a test configuration for distributed simulation.
+
+    Args:
+        num_sessions: Number of sessions to run.
+        random_seed: Optional seed for reproducibility.
+        num_seats: Number of seats at the table.
+
+    Returns:
+        A FullConfig instance ready for simulation.
+    """
+    return FullConfig(
+        simulation=SimulationConfig(
+            num_sessions=num_sessions,
+            hands_per_session=30,
+            random_seed=random_seed,
+        ),
+        table=TableConfig(num_seats=num_seats),
+        bankroll=BankrollConfig(
+            starting_amount=500.0,
+            base_bet=5.0,
+            stop_conditions=StopConditionsConfig(win_limit=100.0, loss_limit=200.0),
+            betting_system=BettingSystemConfig(type="flat"),
+        ),
+        strategy=StrategyConfig(type="basic"),
+    )
+
+
+def _die_after_first_chunk(address: Address) -> None:
+    """Act as a worker that is killed after receiving its first chunk."""
+    connection = Client(address, authkey=AUTHKEY)
+    connection.recv()  # setup
+    connection.recv()  # chunk
+    os._exit(1)
+
+
+def _garble_first_result(address: Address) -> None:
+    """Act as a worker that answers its first chunk with a garbled message."""
+    connection = Client(address, authkey=AUTHKEY)
+    connection.recv()  # setup
+    connection.recv()  # chunk
+    connection.send("not a result")
+    with pytest.raises(EOFError):
+        while True:  # the second chunk in flight, then the closed connection
+            connection.recv()
+
+
+def _go_silent(address: Address) -> None:
+    """Act as a worker that takes chunks but never answers."""
+    connection = Client(address, authkey=AUTHKEY)
+    with pytest.raises(EOFError):
+        while True:  # setup, both chunks in flight, then the closed connection
+            connection.recv()
+
+
+def _connect_with_wrong_key(address: Address) -> None:
+    """Try to join the coordinator without the shared secret."""
+    with pytest.raises(Exception, match="digest"):
+        Client(address, authkey=b"wrong")
+
+
+def start_workers(
+    address: Address,
+    count: int = 2,
+    target: Callable[..., Any] = run_worker,
+) -> list[Process]:
+    """Start worker processes connecting to the coordinator.
+
+    Args:
+        address: Address of the DistributedExecutor.
+        count: Number of processes.
+        target: Function run by each process.
+
+    Returns:
+        The started processes.
+    """
+    args = (address, AUTHKEY) if target is run_worker else (address,)
+    processes = [Process(target=target, args=args) for _ in range(count)]
+    for process in processes:
+        process.start()
+    return processes
+
+
+def join_workers(processes: list[Process]) -> list[int | None]:
+    """Wait for worker processes, terminating any still running.
+
+    Returns:
+        Exit codes of the processes.
+    """
+    for process in processes:
+        process.join(timeout=30)
+        if process.is_alive():
+            process.terminate()
+            process.join()
+    return [process.exitcode for process in processes]
+
+
+@pytest.fixture
+def executor() -> Generator[DistributedExecutor, None, None]:
+    """Create a coordinator listening on a free localhost port."""
+    with DistributedExecutor(
+        ("127.0.0.1", 0), AUTHKEY, chunk_size=5, timeout=60
+    ) as executor:
+        yield executor
+
+
+class TestDistributedResults:
+    """Tests that distributed runs match single-node runs."""
+
+    def test_sessions_match_single_node(self, executor: DistributedExecutor) -> None:
+        """Rows from three workers should equal a parallel run's rows."""
+        config = create_test_config(num_seats=2)
+        workers = start_workers(executor.address, count=3)
+        progress: list[tuple[int, int]] = []
+
+        results = executor.run_sessions(
+            config, progress_callback=lambda done, total: progress.append((done, total))
+        )
+
+        assert join_workers(workers) == [0, 0, 0]
+        assert results == ParallelExecutor(num_workers=2).run_sessions(config)
+        assert len(progress) == 8
+        assert progress[-1] == (40, 40)
+
+    def test_reduction_is_bit_identical(self, executor: DistributedExecutor) -> None:
+        """The aggregate should equal a parallel reduction with other chunks."""
+        config = create_test_config(num_sessions=33, random_seed=8)
+        workers = start_workers(executor.address)
+
+        aggregate = executor.reduce_sessions(config)
+
+        assert join_workers(workers) == [0, 0]
+        expected = ParallelExecutor(num_workers=2).reduce_sessions(config)
+        assert pickle.dumps(aggregate) == pickle.dumps(expected)
+
+    def test_unix_socket(self, tmp_path: Path) -> None:
+        """Workers should also connect over a Unix socket."""
+        config = create_test_config(num_sessions=12)
+        path = str(tmp_path / "coordinator.sock")
+        with DistributedExecutor(path, AUTHKEY, timeout=60) as executor:
+            workers = start_workers(executor.address)
+            results = executor.run_sessions(config)
+
+        assert join_workers(workers) == [0, 0]
+        assert results == ParallelExecutor(num_workers=2).run_sessions(config)
+        assert not (tmp_path / "coordinator.sock").exists()
+
+
+class TestDistributedFailures:
+    """Tests for lost workers, rejected clients and failing runs."""
+
+    def test_chunks_of_dead_worker_are_requeued(
+        self, executor: DistributedExecutor
+    ) -> None:
+        """A worker killed mid-chunk should not lose or duplicate sessions."""
+        config = create_test_config()
+        results: list[Any] = []
+        run = threading.Thread(
+            target=lambda: results.extend(executor.run_sessions(config))
+        )
+        run.start()
+
+        # The dying worker takes chunks and exits before any other joins
+        assert join_workers(
+            start_workers(executor.address, target=_die_after_first_chunk, count=1)
+        ) == [1]
+        workers = start_workers(executor.address)
+        run.join()
+
+        assert join_workers(workers) == [0, 0]
+        assert results == ParallelExecutor(num_workers=2).run_sessions(config)
+
+    def test_chunks_of_garbling_worker_are_requeued(
+        self, executor: DistributedExecutor, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """An unexpected message should drop the worker but keep its chunks."""
+        config = create_test_config(num_sessions=20)
+        results: list[Any] = []
+        run = threading.Thread(
+            target=lambda: results.extend(executor.run_sessions(config))
+        )
+        run.start()
+
+        assert join_workers(
+            start_workers(executor.address, target=_garble_first_result, count=1)
+        ) == [0]
+        workers = start_workers(executor.address)
+        run.join()
+
+        assert join_workers(workers) == [0, 0]
+        assert results == ParallelExecutor(num_workers=2).run_sessions(config)
+        assert "re-queued 2 chunks" in caplog.text
+
+    def test_chunks_of_silent_worker_are_requeued(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """A worker that stops answering should be dropped after the timeout."""
+        caplog.set_level(logging.INFO, logger="let_it_ride.simulation.distributed")
+        config = create_test_config(num_sessions=20)
+        results: list[Any] = []
+        with DistributedExecutor(
+            ("127.0.0.1", 0), AUTHKEY, chunk_size=5, timeout=60, worker_timeout=0.5
+        ) as executor:
+            run = threading.Thread(
+                target=lambda: results.extend(executor.run_sessions(config))
+            )
+            run.start()
+
+            assert join_workers(
+                start_workers(executor.address, target=_go_silent, count=1)
+            ) == [0]
+            workers = start_workers(executor.address)
+            run.join()
+
+        assert join_workers(workers) == [0, 0]
+        assert results == ParallelExecutor(num_workers=2).run_sessions(config)
+        assert "TimeoutError" in caplog.text
+        assert "re-queued 2 chunks" in caplog.text
+
+    def test_stalled_handshake_is_dropped(self) -> None:
+        """A client that connects and sends nothing should be disconnected."""
+        config = create_test_config(num_sessions=10)
+        results: list[Any] = []
+        with DistributedExecutor(
+            ("127.0.0.1", 0), AUTHKEY, timeout=60, worker_timeout=0.5
+        ) as executor:
+            run = threading.Thread(
+                target=lambda: results.extend(executor.run_sessions(config))
+            )
+            run.start()
+            with socket.create_connection(executor.address, timeout=30) as client:
+                received = b""
+                while chunk := client.recv(1024):
+                    received += chunk
+            workers = start_workers(executor.address, count=1)
+            run.join()
+
+        assert received  # the challenge, then the closed connection
+        assert join_workers(workers) == [0]
+        assert len(results) == 10
+
+    def test_heartbeats_keep_slow_worker(self) -> None:
+        """Chunks slower than the worker timeout should not drop the worker."""
+        config = create_test_config(num_sessions=10)
+        run_sessions = parallel._WorkerContext.run_sessions
+
+        def run_slowly(*args: Any) -> Any:
+            time.sleep(1.0)
+            return run_sessions(*args)
+
+        with (
+            DistributedExecutor(
+                ("127.0.0.1", 0), AUTHKEY, chunk_size=5, timeout=60, worker_timeout=0.4
+            ) as executor,
+            patch.object(parallel._WorkerContext, "run_sessions", run_slowly),
+        ):
+            workers = start_workers(executor.address, count=1)
+            results = executor.run_sessions(config)
+
+        assert join_workers(workers) == [0]
+        assert results == ParallelExecutor(num_workers=2).run_sessions(config)
+
+    def test_wrong_authkey_is_rejected(self, executor: DistributedExecutor) -> None:
+        """A client with the wrong key should be refused without failing the run."""
+        config = create_test_config(num_sessions=10)
+        intruders = start_workers(executor.address, target=_connect_with_wrong_key)
+        workers = start_workers(executor.address, count=1)
+
+        results = executor.run_sessions(config)
+
+        assert join_workers(intruders) == [0, 0]
+        assert join_workers(workers) == [0]
+        assert len(results) == 10
+
+    def test_worker_failure_fails_run(self, executor: DistributedExecutor) -> None:
+        """An exception while running sessions should fail the run."""
+        config = create_test_config(num_sessions=10)
+        with patch.object(
+            parallel._WorkerContext,
+            "run_sessions",
+            side_effect=ValueError("boom"),
+        ):
+            workers = start_workers(executor.address)
+
+        with pytest.raises(RuntimeError, match=r"Worker failures.*boom"):
+            executor.run_sessions(config)
+        join_workers(workers)
+
+    def test_timeout_without_workers(self) -> None:
+        """A run without workers should fail once the timeout passes."""
+        with (
+            DistributedExecutor(("127.0.0.1", 0), AUTHKEY, timeout=0.5) as executor,
+            pytest.raises(RuntimeError, match=r"No chunk completed within 0\.5"),
+        ):
+            executor.run_sessions(create_test_config(num_sessions=5))
+
+
+class TestControllerIntegration:
+    """Tests for running SimulationController on distributed workers."""
+
+    def test_run_matches_sequential(self, executor: DistributedExecutor) -> None:
+        """Distributed runs should return the sequential run's sessions."""
+        config = create_test_config(num_sessions=15)
+        workers = start_workers(executor.address)
+
+        results = SimulationController(config, distributed=executor).run()
+
+        assert join_workers(workers) == [0, 0]
+        assert (
+            results.session_results
+            == SimulationController(config).run().session_results
+        )
+        assert results.total_hands == sum(
+            r.hands_played for r in results.session_results
+        )
+
+    def test_run_aggregated(self) -> None:
+        """Aggregated runs should match a single-node run's statistics."""
+        config = create_test_config(num_sessions=300, random_seed=5)
+        with DistributedExecutor(("127.0.0.1", 0), AUTHKEY, timeout=60) as executor:
+            workers = start_workers(executor.address)
+            results = SimulationController(
+                config, distributed=executor
+            ).run_aggregated()
+
+        assert join_workers(workers) == [0, 0]
+        expected = SimulationController(config).run_aggregated()
+        assert results.aggregate.total_sessions == 300
+        assert results.total_hands == expected.total_hands
+        assert results.aggregate.to_statistics() == expected.aggregate.to_statistics()
+        assert pickle.dumps(results.aggregate) == pickle.dumps(expected.aggregate)
+
+    def test_rejects_checkpoint_and_lockstep(
+        self, executor: DistributedExecutor, tmp_path: Path
+    ) -> None:
+        """Checkpoints and lockstep runs should be rejected before running."""
+        config = create_test_config(num_sessions=10)
+        checkpoint = SimulationCheckpoint(tmp_path)
+        with pytest.raises(ValueError, match="distributed execution"):
+            SimulationController(
+                config, checkpoint=checkpoint, distributed=executor
+            ).run()
+        with pytest.raises(ValueError, match="distributed execution"):
+            SimulationController(
+                config, checkpoint=checkpoint, distributed=executor
+            ).run_aggregated()
+
+        lockstep = config.model_copy(
+            update={
+                "simulation": config.simulation.model_copy(
+                    update={"lockstep": True, "hand_model": "sampled"}
+                )
+            }
+        )
+        with pytest.raises(ValueError, match="Distributed execution"):
+            SimulationController(lockstep, distributed=executor).run()
@@ -1009,6 +1009,83 @@ class TestCSVExporter:
         with pytest.raises(ValueError, match="No seat data found"):
             exporter.export_all(results, include_seat_aggregate=True, num_seats=2)
 
+    def test_export_sessions_from_table(
+        self, tmp_path: Path, sample_session_results: list[SessionResult]
+    ) -> None:
+        """Verify a SessionResultTable exports the same file as a list."""
+        from let_it_ride.simulation.result_table import SessionResultTable
+
+        exporter = CSVExporter(tmp_path, prefix="list")
+        expected = exporter.export_sessions(sample_session_results)
+        exporter = CSVExporter(tmp_path, prefix="table")
+        path = exporter.export_sessions(
+            SessionResultTable.from_results(sample_session_results)
+        )
+
+        assert path.read_bytes() == expected.read_bytes()
+
+    def test_open_sessions_writer_matches_export_sessions(
+        self, tmp_path: Path, sample_session_results: list[SessionResult]
+    ) -> None:
+        """Verify rows streamed in batches match a one-shot export."""
+        export_sessions_csv(sample_session_results, tmp_path / "expected.csv")
+        exporter = CSVExporter(tmp_path, prefix="stream")
+
+        with exporter.open_sessions_writer() as writer:
+            writer(sample_session_results[:1])
+            writer(sample_session_results[1:])
+
+        assert writer.path == tmp_path / "stream_sessions.csv"
+        assert writer.rows_written == len(sample_session_results)
+        assert writer.path.read_bytes() == (tmp_path / "expected.csv").read_bytes()
+
+    def test_export_aggregated(self, tmp_path: Path) -> None:
+        """Verify export_aggregated writes aggregate and seat aggregate files."""
+        from datetime import datetime
+
+        from let_it_ride.config.models import FullConfig, TableConfig
+        from let_it_ride.simulation.aggregation import AggregateAccumulator
+        from let_it_ride.simulation.controller import AggregatedSimulationResults
+
+        accumulator = AggregateAccumulator()
+        for i, profit in enumerate([100.0, -100.0, -50.0, 25.0]):
+            accumulator.add(
+                SessionResult(
+                    outcome=SessionOutcome.WIN if profit > 0 else SessionOutcome.LOSS,
+                    stop_reason=StopReason.MAX_HANDS,
+                    hands_played=50,
+                    starting_bankroll=500.0,
+                    final_bankroll=500.0 + profit,
+                    session_profit=profit,
+                    total_wagered=750.0,
+                    total_bonus_wagered=0.0,
+                    peak_bankroll=620.0,
+                    max_drawdown=50.0,
+                    max_drawdown_pct=0.08,
+                    seat_number=i % 2 + 1,
+                )
+            )
+        results = AggregatedSimulationResults(
+            config=FullConfig(table=TableConfig(num_seats=2)),
+            aggregate=accumulator,
+            start_time=datetime.now(),
+            end_time=datetime.now(),
+        )
+
+        exporter = CSVExporter(tmp_path, prefix="sim")
+        paths = exporter.export_aggregated(
+            results, include_seat_aggregate=True, num_seats=2
+        )
+
+        assert paths == [
+            tmp_path / "sim_aggregate.csv",
+            tmp_path / "sim_seat_aggregate.csv",
+        ]
+        with paths[1].open(encoding="utf-8-sig", newline="") as f:
+            rows = list(csv.DictReader(f))
+        assert [row["seat_number"] for row in rows] == ["1", "2", "SUMMARY"]
+        assert not (tmp_path / "sim_sessions.csv").exists()
+
 
 class TestSeatNumberInSessionResult:
     """Tests for seat_number field in SessionResult and CSV export."""
@@ -1225,10 +1302,10 @@ class TestSeatNumberInSessionResult:
     @pytest.mark.parametrize(
         "seat_number",
         [
-            0,   # Edge case: zero (invalid)
+            0,  # Edge case: zero (invalid)
             -1,  # Edge case: negative (invalid)
-            7,   # Edge case: above max (invalid)
-            100, # Edge case: large value (invalid)
+            7,  # Edge case: above max (invalid)
+            100,  # Edge case: large value (invalid)
         ],
     )
     def test_with_table_session_info_invalid_seat_numbers(
@@ -1249,15 +1326,13 @@ class TestSeatNumberInSessionResult:
             max_drawdown_pct=0.08,
         )
         with pytest.raises(ValueError, match="seat_number must be between 1 and 6"):
-            result.with_table_session_info(
-                table_session_id=0, seat_number=seat_number
-            )
+            result.with_table_session_info(table_session_id=0, seat_number=seat_number)
 
     @pytest.mark.parametrize(
         "table_session_id",
         [
-            -1,   # Edge case: negative (invalid)
-            -100, # Edge case: large negative (invalid)
+            -1,  # Edge case: negative (invalid)
+            -100,  # Edge case: large negative (invalid)
         ],
     )
     def test_with_table_session_info_invalid_table_session_id(
@@ -1551,9 +1626,9 @@ class TestSeatNumberE2EFlow:
         # Each seat (1, 2, 3) should appear num_sessions times
         for seat in range(1, num_seats + 1):
             count = seat_numbers.count(seat)
-            assert (
-                count == num_sessions
-            ), f"Seat {seat} should appear {num_sessions} times, got {count}"
+            assert count == num_sessions, (
+                f"Seat {seat} should appear {num_sessions} times, got {count}"
+            )
 
         # Verify table_session_id is the first column (then seat_number)
         keys = list(rows[0].keys())
@@ -8,6 +8,7 @@ import random
 
 import pytest
 
+from let_it_ride.config.models import DealerConfig
 from let_it_ride.config.paytables import (
     BonusPaytable,
     MainGamePaytable,
@@ -16,7 +17,7 @@ from let_it_ride.config.paytables import (
 )
 from let_it_ride.core.deck import Deck
 from let_it_ride.core.game_engine import GameEngine, GameHandResult
-from let_it_ride.core.hand_evaluator import FiveCardHandRank
+from let_it_ride.core.hand_evaluator import FiveCardHandRank, evaluate_five_card_rank
 from let_it_ride.core.three_card_evaluator import ThreeCardHandRank
 from let_it_ride.strategy.base import Decision, StrategyContext
 from let_it_ride.strategy.basic import BasicStrategy
@@ -564,6 +565,71 @@ class TestDeckManagement:
         assert result1.community_cards == result2.community_cards
         assert result1.final_hand_rank == result2.final_hand_rank
 
+    def test_rank_evaluator_selection_matches_default(
+        self, main_paytable: MainGamePaytable
+    ) -> None:
+        """Lookup-table rank evaluator produces identical hand results."""
+        default_engine = GameEngine(
+            deck=Deck(),
+            strategy=AlwaysRideStrategy(),
+            main_paytable=main_paytable,
+            bonus_paytable=None,
+            rng=random.Random(2024),
+        )
+        lookup_engine = GameEngine(
+            deck=Deck(),
+            strategy=AlwaysRideStrategy(),
+            main_paytable=main_paytable,
+            bonus_paytable=None,
+            rng=random.Random(2024),
+            rank_evaluator=evaluate_five_card_rank,
+        )
+
+        for hand_id in range(200):
+            result1 = default_engine.play_hand(hand_id=hand_id, base_bet=5.0)
+            result2 = lookup_engine.play_hand(hand_id=hand_id, base_bet=5.0)
+            assert result1 == result2
+
+    @pytest.mark.parametrize("discard_enabled", [False, True])
+    def test_compact_cards_matches_card_path(
+        self,
+        main_paytable: MainGamePaytable,
+        bonus_paytable: BonusPaytable,
+        discard_enabled: bool,
+    ) -> None:
+        """Integer card codes produce identical hands, decisions and payouts."""
+        dealer_config = DealerConfig(discard_enabled=discard_enabled)
+        card_engine = GameEngine(
+            deck=Deck(),
+            strategy=BasicStrategy(),
+            main_paytable=main_paytable,
+            bonus_paytable=bonus_paytable,
+            rng=random.Random(31337),
+            dealer_config=dealer_config,
+        )
+        compact_engine = GameEngine(
+            deck=Deck(),
+            strategy=BasicStrategy(),
+            main_paytable=main_paytable,
+            bonus_paytable=bonus_paytable,
+            rng=random.Random(31337),
+            dealer_config=dealer_config,
+            compact_cards=True,
+        )
+
+        for hand_id in range(500):
+            result1 = card_engine.play_hand(
+                hand_id=hand_id, base_bet=5.0, bonus_bet=1.0
+            )
+            result2 = compact_engine.play_hand(
+                hand_id=hand_id, base_bet=5.0, bonus_bet=1.0
+            )
+            assert result1 == result2
+            assert (
+                card_engine.last_discarded_cards()
+                == compact_engine.last_discarded_cards()
+            )
+
 
 class TestStrategyContext:
     """Test strategy context handling."""
@@ -4,8 +4,12 @@ Tests verify:
 - Parallel execution produces correct number of sessions
 - Same seed produces identical results (parallel vs sequential)
 - Different seeds produce different results
-- Progress callback invoked correctly
+- Progress callback invoked correctly as chunks complete
+- Chunk planning covers every session exactly once
 - Worker failure handling
+- Session rows collected through shared memory
+- Reductions independent of chunk sizes
+- Resuming from checkpoints
 - Auto worker count detection
 - Parallel vs sequential equivalence for reproducibility
 """
@@ -13,9 +17,12 @@ Tests verify:
 from __future__ import annotations
 
 import os
-from typing import Literal
+import pickle
+from multiprocessing.shared_memory import SharedMemory
+from typing import TYPE_CHECKING, Any, Literal
 from unittest.mock import patch
 
+import numpy as np
 import pytest
 
 from let_it_ride.config.models import (
@@ -31,17 +38,32 @@ from let_it_ride.config.models import (
 )
 from let_it_ride.simulation import (
     SessionOutcome,
+    SessionResult,
+    SessionResultTable,
+    SimulationCheckpoint,
     SimulationController,
     SimulationResults,
     StopReason,
+    parallel,
 )
+from let_it_ride.simulation.aggregation import aggregate_results
 from let_it_ride.simulation.parallel import (
     ParallelExecutor,
+    SessionChunk,
     WorkerResult,
     WorkerTask,
+    _ChunkPlanner,
+    _initialize_worker,
+    _raise_worker_failures,
     get_effective_worker_count,
+    run_session_chunk,
     run_worker_sessions,
 )
+from let_it_ride.simulation.result_table import SESSION_RESULT_DTYPE
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
 
 
 def create_test_config(
@@ -220,6 +242,26 @@ class TestParallelVsSequentialEquivalence:
         # Total hands should match
         assert results_seq.total_hands == results_par.total_hands
 
+    @pytest.mark.slow
+    def test_sampled_hand_model_identical_results(self) -> None:
+        """Test that sampled hands match between parallel and sequential."""
+        config = create_test_config(num_sessions=20, random_seed=777, workers=1)
+        sampled = config.simulation.model_copy(update={"hand_model": "sampled"})
+        config_seq = config.model_copy(update={"simulation": sampled})
+        config_par = config.model_copy(
+            update={"simulation": sampled.model_copy(update={"workers": 2})}
+        )
+
+        results_seq = SimulationController(config_seq).run()
+        results_par = SimulationController(config_par).run()
+        results_dealt = SimulationController(config).run()
+
+        profits_seq = [r.session_profit for r in results_seq.session_results]
+        assert profits_seq == [r.session_profit for r in results_par.session_results]
+        assert results_seq.total_hands == results_par.total_hands
+        # Sampling draws outcomes, not cards, so the sessions differ
+        assert profits_seq != [r.session_profit for r in results_dealt.session_results]
+
     def test_reproducibility_with_different_worker_counts(self) -> None:
         """Test reproducibility holds across different worker counts."""
         seed = 77777
@@ -276,8 +318,10 @@ class TestProgressCallback:
         controller = SimulationController(config, progress_callback=track_progress)
         controller.run()
 
-        # In parallel mode, callback is called once at completion
-        assert len(callback_calls) >= 1
+        # In parallel mode, callback is called as each chunk completes
+        assert len(callback_calls) >= 2
+        completed = [call[0] for call in callback_calls]
+        assert completed == sorted(completed)
         # Last call should indicate all sessions complete
         last_call = callback_calls[-1]
         assert last_call[0] == 20
@@ -337,53 +381,97 @@ class TestWorkerFunction:
 
 
 class TestSessionBatching:
-    """Tests for session distribution across workers."""
-
-    def test_sessions_distributed_evenly(self) -> None:
-        """Test sessions are distributed evenly across workers."""
-        config = create_test_config(num_sessions=100, workers=4)
-        executor = ParallelExecutor(num_workers=4)
-
-        # Generate seeds and tasks
-        seeds = executor._generate_session_seeds(100, 42)
-        tasks = executor._create_worker_tasks(100, seeds, config)
-
-        # Should have 4 tasks (one per worker)
-        assert len(tasks) == 4
-
-        # Each worker should have ~25 sessions
-        session_counts = [len(t.session_ids) for t in tasks]
-        assert sum(session_counts) == 100
-        # All workers should have 25 sessions (100 / 4)
-        assert session_counts == [25, 25, 25, 25]
-
-    def test_uneven_distribution_handled(self) -> None:
-        """Test uneven session counts are handled correctly."""
-        config = create_test_config(num_sessions=17, workers=4)
-        executor = ParallelExecutor(num_workers=4)
-
-        seeds = executor._generate_session_seeds(17, 42)
-        tasks = executor._create_worker_tasks(17, seeds, config)
-
-        # Should have 4 tasks
-        assert len(tasks) == 4
-
-        # Sessions should be distributed: 5, 5, 5, 2
-        session_counts = [len(t.session_ids) for t in tasks]
-        assert sum(session_counts) == 17
-
-    def test_fewer_sessions_than_workers(self) -> None:
-        """Test handling when fewer sessions than workers."""
-        config = create_test_config(num_sessions=3, workers=8)
-        executor = ParallelExecutor(num_workers=8)
-
-        seeds = executor._generate_session_seeds(3, 42)
-        tasks = executor._create_worker_tasks(3, seeds, config)
+    """Tests for splitting sessions into dynamically sized chunks."""
+
+    @staticmethod
+    def _drain(planner: _ChunkPlanner) -> list[range]:
+        chunks = []
+        while (chunk := planner.next_chunk()) is not None:
+            chunks.append(chunk)
+        return chunks
+
+    def test_chunks_cover_all_sessions_in_order(self) -> None:
+        """Chunks should be contiguous and cover each session exactly once."""
+        planner = _ChunkPlanner(num_sessions=1000, num_workers=4)
+        chunks = self._drain(planner)
+
+        assert [sid for chunk in chunks for sid in chunk] == list(range(1000))
+        assert planner.remaining == 0
+        assert planner.next_chunk() is None
+
+    def test_first_chunks_are_small(self) -> None:
+        """Before any cost is measured, chunks should be small."""
+        planner = _ChunkPlanner(num_sessions=1000, num_workers=4)
+        assert len(planner.next_chunk() or ()) == 4
+
+    def test_chunk_size_follows_measured_cost(self) -> None:
+        """Cheap sessions should give larger chunks than expensive ones."""
+        cheap = _ChunkPlanner(100_000, num_workers=4, target_seconds=0.25)
+        cheap.record(sessions=64, elapsed_seconds=0.0625)  # 1/1024 s per session
+        expensive = _ChunkPlanner(100_000, num_workers=4, target_seconds=0.25)
+        expensive.record(sessions=4, elapsed_seconds=0.25)  # 1/16 s per session
+
+        assert len(cheap.next_chunk() or ()) == 256
+        assert len(expensive.next_chunk() or ()) == 4
+
+    def test_tail_chunks_shrink(self) -> None:
+        """Chunks should never exceed a 1 / (2 * workers) share of what is left."""
+        planner = _ChunkPlanner(num_sessions=100, num_workers=4)
+        planner.record(sessions=1, elapsed_seconds=0.0)  # Effectively free
+        sizes = [len(chunk) for chunk in self._drain(planner)]
+
+        assert sizes[0] == 13  # ceil(100 / 8)
+        assert sizes == sorted(sizes, reverse=True)
+        assert sizes[-1] == 1
+        assert sum(sizes) == 100
+
+    def test_fixed_chunk_size(self) -> None:
+        """A fixed chunk size should be honored, with a short last chunk."""
+        planner = _ChunkPlanner(num_sessions=17, num_workers=4)
+        chunks = []
+        while (chunk := planner.next_fixed_chunk(5)) is not None:
+            chunks.append(chunk)
+        assert [len(c) for c in chunks] == [5, 5, 5, 2]
+
+    def test_invalid_chunk_size_raises(self) -> None:
+        """chunk_size below 1 should raise ValueError."""
+        with pytest.raises(ValueError, match="chunk_size"):
+            ParallelExecutor(num_workers=2, chunk_size=0)
+
+    def test_chunk_size_does_not_change_results(self) -> None:
+        """Results should not depend on how sessions were chunked."""
+        config = create_test_config(num_sessions=30, random_seed=7, workers=3)
+        dynamic = ParallelExecutor(num_workers=3).run_sessions(config)
+        single = ParallelExecutor(num_workers=3, chunk_size=1).run_sessions(config)
+        whole = ParallelExecutor(num_workers=3, chunk_size=30).run_sessions(config)
+
+        assert dynamic == single == whole
+
+    def test_run_session_chunk_uses_initialized_context(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Chunks should run against the process's initialized components."""
+        # Restore the module-level worker context after the test
+        monkeypatch.setattr(parallel, "_worker_context", None)
+        config = create_test_config(num_sessions=10, random_seed=42)
+        chunk = SessionChunk(
+            chunk_id=3, session_ids=[0, 1], session_seeds={0: 12345, 1: 23456}
+        )
+        _initialize_worker(config, None, expected_hands=100)
+        result = run_session_chunk(chunk)
+        task_result = run_worker_sessions(
+            WorkerTask(
+                worker_id=0,
+                session_ids=[0, 1],
+                session_seeds={0: 12345, 1: 23456},
+                config=config,
+            )
+        )
 
-        # Should only create 3 tasks (one per session)
-        assert len(tasks) == 3
-        for task in tasks:
-            assert len(task.session_ids) == 1
+        assert result.worker_id == 3
+        assert result.error is None
+        assert result.elapsed_seconds > 0
+        assert result.session_results == task_result.session_results
 
 
 class TestResultMerging:
@@ -407,6 +495,282 @@ class TestResultMerging:
             assert par.session_profit == seq.session_profit, f"Session {i} mismatch"
 
 
+class TestWorkerSideReduction:
+    """Tests for reducing sessions to aggregates in the workers."""
+
+    def test_reduced_aggregate_matches_session_results(self) -> None:
+        """Worker-side reduction should match aggregating the session list."""
+        config = create_test_config(num_sessions=40, random_seed=11, workers=2)
+        sessions = ParallelExecutor(num_workers=2).run_sessions(config)
+        reduced = ParallelExecutor(num_workers=2, chunk_size=3).reduce_sessions(config)
+        stats = reduced.to_statistics()
+        expected = aggregate_results(sessions)
+
+        assert reduced.total_sessions == 40
+        assert reduced.total_hands == expected.total_hands
+        assert stats.winning_sessions == expected.winning_sessions
+        assert stats.net_result == pytest.approx(expected.net_result)
+        assert stats.session_profit_mean == pytest.approx(expected.session_profit_mean)
+        assert stats.session_profit_max == expected.session_profit_max
+        assert sum(reduced.stop_reason_counts.values()) == 40
+        for reason, count in reduced.stop_reason_counts.items():
+            assert count == sum(r.stop_reason == reason for r in sessions)
+
+    def test_auto_sized_reduction_is_deterministic(self) -> None:
+        """Timing-driven chunking should not change the reduced aggregate."""
+        config = create_test_config(num_sessions=600, random_seed=5, workers=4)
+        first = ParallelExecutor(num_workers=4).reduce_sessions(config)
+        second = ParallelExecutor(num_workers=4).reduce_sessions(config)
+        fixed = ParallelExecutor(num_workers=4, chunk_size=7).reduce_sessions(config)
+        sequential = SimulationController(
+            create_test_config(num_sessions=600, random_seed=5, workers=1)
+        ).run_aggregated()
+
+        assert pickle.dumps(first) == pickle.dumps(second)
+        assert pickle.dumps(first) == pickle.dumps(fixed)
+        assert pickle.dumps(first) == pickle.dumps(sequential.aggregate)
+
+    def test_session_sink_receives_rows_in_order(self) -> None:
+        """Streamed rows should equal run_sessions() output, in order."""
+        config = create_test_config(num_sessions=25, random_seed=5, workers=3)
+        rows: list[SessionResult] = []
+        progress: list[tuple[int, int]] = []
+        ParallelExecutor(num_workers=3, chunk_size=2).reduce_sessions(
+            config,
+            progress_callback=lambda done, total: progress.append((done, total)),
+            session_sink=rows.extend,
+        )
+
+        assert rows == ParallelExecutor(num_workers=3).run_sessions(config)
+        assert progress[-1] == (25, 25)
+
+    def test_multi_seat_tallies(self) -> None:
+        """Per-seat tallies should be reduced in the workers."""
+        config = create_test_config(num_sessions=12, random_seed=3).model_copy(
+            update={"table": TableConfig(num_seats=3)}
+        )
+        sessions = ParallelExecutor(num_workers=2).run_sessions(config)
+        reduced = ParallelExecutor(num_workers=2).reduce_sessions(config)
+        seats = reduced.seat_aggregations
+
+        assert reduced.total_sessions == 36
+        assert sorted(seats) == [1, 2, 3]
+        for seat, tally in seats.items():
+            seat_results = [r for r in sessions if r.seat_number == seat]
+            assert tally.wins == sum(
+                r.outcome == SessionOutcome.WIN for r in seat_results
+            )
+            assert tally.total_profit == pytest.approx(
+                sum(r.session_profit for r in seat_results)
+            )
+
+    def test_worker_failure_raises_runtime_error(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A failing chunk should surface as a RuntimeError."""
+
+        def fail(*_args: object) -> list[tuple[int, SessionResult]]:
+            raise ValueError("boom")
+
+        monkeypatch.setattr(parallel._WorkerContext, "run_sessions", fail)
+        config = create_test_config(num_sessions=10)
+
+        with pytest.raises(RuntimeError, match="ValueError: boom"):
+            ParallelExecutor(num_workers=2).reduce_sessions(config)
+
+    def test_run_aggregated_parallel_matches_sequential(self) -> None:
+        """run_aggregated() should agree between sequential and parallel runs."""
+        parallel_run = SimulationController(
+            create_test_config(num_sessions=20, random_seed=9, workers=2)
+        ).run_aggregated()
+        sequential_run = SimulationController(
+            create_test_config(num_sessions=20, random_seed=9, workers=1)
+        ).run_aggregated()
+        par = parallel_run.aggregate.to_statistics()
+        seq = sequential_run.aggregate.to_statistics()
+
+        assert parallel_run.total_hands == sequential_run.total_hands
+        assert par.net_result == pytest.approx(seq.net_result)
+        assert par.session_profit_std == pytest.approx(seq.session_profit_std)
+        assert par.session_profit_median == seq.session_profit_median
+        assert (
+            parallel_run.aggregate.stop_reason_counts
+            == sequential_run.aggregate.stop_reason_counts
+        )
+
+    def test_run_aggregated_exact_profits(self) -> None:
+        """exact_profits should give a parallel run the exact statistics."""
+        config = create_test_config(num_sessions=30, random_seed=3, workers=2)
+        aggregated = SimulationController(config).run_aggregated(exact_profits=True)
+        expected = aggregate_results(SimulationController(config).run().session_results)
+        stats = aggregated.aggregate.to_statistics()
+
+        assert stats.session_profits == expected.session_profits
+        assert stats.session_profit_median == expected.session_profit_median
+        assert stats.session_profit_std == pytest.approx(expected.session_profit_std)
+
+
+class TestSharedMemoryTransport:
+    """Tests for collecting session rows through shared memory."""
+
+    def test_table_matches_sequential_run(self) -> None:
+        """Rows written by workers should equal a sequential run's results."""
+        config = create_test_config(num_sessions=30, random_seed=21, workers=3)
+        table = ParallelExecutor(num_workers=3).run_session_table(config)
+        sequential = SimulationController(
+            create_test_config(num_sessions=30, random_seed=21, workers=1)
+        ).run()
+
+        assert isinstance(table, SessionResultTable)
+        assert list(table) == sequential.session_results
+
+    def test_multi_seat_rows_at_composite_ids(self) -> None:
+        """Each seat's row should sit at session_id * num_seats + seat_idx."""
+        config = create_test_config(num_sessions=8, random_seed=4).model_copy(
+            update={"table": TableConfig(num_seats=3)}
+        )
+        table = ParallelExecutor(num_workers=2, chunk_size=3).run_session_table(config)
+
+        assert len(table) == 24
+        assert table.column("table_session_id").tolist() == [i // 3 for i in range(24)]
+        assert table.column("seat_number").tolist() == [i % 3 + 1 for i in range(24)]
+
+    def test_shared_chunks_return_no_rows(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Chunks with shared_rows should write rows instead of returning them."""
+        for name in ("_worker_context", "_worker_shared_memory", "_worker_rows"):
+            monkeypatch.setattr(parallel, name, None)
+        config = create_test_config(num_sessions=4, random_seed=42)
+        buffer = SharedMemory(create=True, size=4 * SESSION_RESULT_DTYPE.itemsize)
+        try:
+            _initialize_worker(config, None, 100, result_buffer=buffer.name)
+            seeds = {2: 12345, 3: 23456}
+            chunk = SessionChunk(
+                chunk_id=0,
+                session_ids=[2, 3],
+                session_seeds=seeds,
+                return_sessions=False,
+                shared_rows=True,
+            )
+            result = run_session_chunk(chunk)
+            expected = run_session_chunk(
+                SessionChunk(chunk_id=1, session_ids=[2, 3], session_seeds=seeds)
+            )
+            rows = np.ndarray(4, dtype=SESSION_RESULT_DTYPE, buffer=buffer.buf)
+            written = list(SessionResultTable(rows[2:].copy()))
+            del rows
+            monkeypatch.setattr(parallel, "_worker_rows", None)
+        finally:
+            buffer.close()
+            buffer.unlink()
+
+        assert result.error is None
+        assert result.session_results == []
+        assert written == [r for _, r in expected.session_results]
+
+    def test_buffer_unlinked_after_run(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """The shared block should be removed after success and failure."""
+        created: list[str] = []
+
+        class RecordingSharedMemory(SharedMemory):
+            def __init__(self, *args: Any, **kwargs: Any) -> None:
+                super().__init__(*args, **kwargs)
+                if kwargs.get("create"):
+                    created.append(self.name)
+
+        monkeypatch.setattr(parallel, "SharedMemory", RecordingSharedMemory)
+        config = create_test_config(num_sessions=6)
+        ParallelExecutor(num_workers=2).run_session_table(config)
+
+        def fail(*_args: object) -> list[tuple[int, SessionResult]]:
+            raise ValueError("boom")
+
+        monkeypatch.setattr(parallel._WorkerContext, "run_sessions", fail)
+        with pytest.raises(RuntimeError, match="ValueError: boom"):
+            ParallelExecutor(num_workers=2).run_session_table(config)
+
+        assert len(created) == 2
+        for name in created:
+            with pytest.raises(FileNotFoundError):
+                SharedMemory(name=name)
+
+
+class _Interrupted(Exception):
+    """Raised by a progress callback to simulate a killed run."""
+
+
+def _interrupt_after(sessions: int) -> Callable[[int, int], None]:
+    """Create a progress callback that interrupts the run after sessions."""
+
+    def callback(completed: int, _total: int) -> None:
+        if completed >= sessions:
+            raise _Interrupted
+
+    return callback
+
+
+class TestCheckpointResume:
+    """Tests for resuming parallel runs from a checkpoint."""
+
+    def test_resumed_sessions_match_uninterrupted(self, tmp_path: Path) -> None:
+        """Rows saved before an interruption plus the rest should match."""
+        config = create_test_config(num_sessions=30, random_seed=13).model_copy(
+            update={"table": TableConfig(num_seats=2)}
+        )
+        executor = ParallelExecutor(num_workers=2, chunk_size=4)
+        with pytest.raises(_Interrupted):
+            executor.run_sessions(
+                config,
+                progress_callback=_interrupt_after(12),
+                checkpoint=SimulationCheckpoint(tmp_path, interval_seconds=0),
+            )
+
+        checkpoint = SimulationCheckpoint(tmp_path, interval_seconds=0)
+        progress: list[tuple[int, int]] = []
+        resumed = ParallelExecutor(num_workers=3).run_sessions(
+            config,
+            progress_callback=lambda done, total: progress.append((done, total)),
+            checkpoint=checkpoint,
+        )
+
+        assert resumed == ParallelExecutor(num_workers=2).run_sessions(config)
+        assert progress[0][0] > 12
+        assert checkpoint.completed_sessions == 30
+
+    def test_resumed_reduction_is_bit_identical(self, tmp_path: Path) -> None:
+        """With auto-sized chunks the resumed aggregate should be identical."""
+        config = create_test_config(num_sessions=25, random_seed=6)
+        executor = ParallelExecutor(num_workers=2)
+        with pytest.raises(_Interrupted):
+            executor.reduce_sessions(
+                config,
+                progress_callback=_interrupt_after(10),
+                checkpoint=SimulationCheckpoint(tmp_path, interval_seconds=0),
+            )
+
+        resumed = ParallelExecutor(num_workers=3).reduce_sessions(
+            config, checkpoint=SimulationCheckpoint(tmp_path)
+        )
+
+        assert pickle.dumps(resumed) == pickle.dumps(executor.reduce_sessions(config))
+
+    def test_completed_checkpoint_runs_nothing(self, tmp_path: Path) -> None:
+        """Resuming a finished run should return its rows without a pool."""
+        config = create_test_config(num_sessions=10, random_seed=2)
+        first = ParallelExecutor(num_workers=2).run_sessions(
+            config, checkpoint=SimulationCheckpoint(tmp_path)
+        )
+
+        with patch.object(parallel, "Pool") as pool:
+            again = ParallelExecutor(num_workers=2).run_sessions(
+                config, checkpoint=SimulationCheckpoint(tmp_path)
+            )
+
+        pool.assert_not_called()
+        assert again == first
+
+
 class TestAutoWorkerDetection:
     """Tests for automatic worker count detection."""
 
@@ -472,29 +836,21 @@ class TestWorkerFailureHandling:
 
     def test_worker_failure_raises_runtime_error(self) -> None:
         """Test worker failure is reported via RuntimeError."""
-        executor = ParallelExecutor(num_workers=2)
-
-        # Create mock worker results with one failure
-        worker_results = [
-            WorkerResult(worker_id=0, session_results=[(0, None)], error=None),  # type: ignore[list-item]
-            WorkerResult(worker_id=1, session_results=[], error="Test error"),
-        ]
+        failures = [WorkerResult(worker_id=1, session_results=[], error="Test error")]
 
         with pytest.raises(RuntimeError, match="Worker failures"):
-            executor._merge_results(worker_results, num_sessions=10)
+            _raise_worker_failures(failures)
 
-    def test_missing_results_raises_runtime_error(self) -> None:
-        """Test missing session results raises RuntimeError."""
-        executor = ParallelExecutor(num_workers=2)
-
-        # Create worker results with missing sessions
-        worker_results: list[WorkerResult] = [
-            WorkerResult(worker_id=0, session_results=[], error=None),
-            WorkerResult(worker_id=1, session_results=[], error=None),
-        ]
+    def test_missing_results_raises_runtime_error(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test rows that no worker wrote raise RuntimeError."""
+        # Workers are forked from this process, so they see the patch
+        monkeypatch.setattr(parallel, "_write_shared_rows", lambda _results: None)
+        config = create_test_config(num_sessions=10)
 
-        with pytest.raises(RuntimeError, match="Missing results"):
-            executor._merge_results(worker_results, num_sessions=10)
+        with pytest.raises(RuntimeError, match="Missing results for 10 sessions"):
+            ParallelExecutor(num_workers=2).run_session_table(config)
 
 
 class TestLargeScaleParallel:
@@ -582,7 +938,7 @@ class TestBoundaryConditions:
         """Test exactly 10 sessions uses parallel execution.
 
         The boundary is _MIN_SESSIONS_FOR_PARALLEL = 10, so 10 sessions
-        should use parallel execution (single progress callback at end).
+        should use parallel execution (progress callbacks per chunk).
         """
         config = create_test_config(num_sessions=10, workers=4)
         callback_calls: list[tuple[int, int]] = []
@@ -593,9 +949,9 @@ class TestBoundaryConditions:
         controller = SimulationController(config, progress_callback=track)
         controller.run()
 
-        # Parallel: single callback at completion
-        assert len(callback_calls) == 1
-        assert callback_calls[0] == (10, 10)
+        # Parallel: one callback per completed chunk, ending at completion
+        assert len(callback_calls) < 10
+        assert callback_calls[-1] == (10, 10)
 
 
 class TestMultipleWorkerFailures:
@@ -603,20 +959,13 @@ class TestMultipleWorkerFailures:
 
     def test_multiple_worker_failures_reported(self) -> None:
         """Test error message contains all failed worker errors."""
-        executor = ParallelExecutor(num_workers=3)
-
-        worker_results = [
+        failures = [
             WorkerResult(worker_id=0, session_results=[], error="Error A"),
             WorkerResult(worker_id=1, session_results=[], error="Error B"),
-            WorkerResult(
-                worker_id=2,
-                session_results=[(0, None)],  # type: ignore[list-item]
-                error=None,
-            ),
         ]
 
         with pytest.raises(RuntimeError) as exc_info:
-            executor._merge_results(worker_results, num_sessions=10)
+            _raise_worker_failures(failures)
 
         error_message = str(exc_info.value)
         assert "Worker 0: Error A" in error_message
@@ -15,6 +15,7 @@ from let_it_ride.analytics.chair_position import (
     analyze_chair_positions,
     analyze_session_results_by_seat,
 )
+from let_it_ride.simulation.result_table import SessionResultTable
 from let_it_ride.simulation.session import SessionOutcome, SessionResult, StopReason
 from let_it_ride.simulation.table_session import SeatSessionResult, TableSessionResult
 
@@ -747,6 +748,22 @@ class TestAnalyzeSessionResultsBySeat:
         assert analysis.seat_statistics[1].wins == 1
         assert analysis.seat_statistics[1].losses == 1
 
+    def test_table_matches_list(self) -> None:
+        """A SessionResultTable should be analyzed like the equivalent list."""
+        results = [
+            create_session_result(profit=(i % 5 - 2) * 25.0).with_table_session_info(
+                i // 3, i % 3 + 1
+            )
+            for i in range(60)
+        ]
+
+        from_list = analyze_session_results_by_seat(results)
+        from_table = analyze_session_results_by_seat(
+            SessionResultTable.from_results(results)
+        )
+
+        assert from_table == from_list
+
     def test_empty_results_raises(self) -> None:
         """Test that empty results raises ValueError."""
         with pytest.raises(ValueError, match="Cannot analyze empty results list"):
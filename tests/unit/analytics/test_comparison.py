@@ -19,6 +19,7 @@ from let_it_ride.analytics.comparison import (
     compare_strategies,
     format_comparison_report,
 )
+from let_it_ride.simulation.result_table import SessionResultTable
 from let_it_ride.simulation.session import SessionOutcome, SessionResult, StopReason
 
 
@@ -519,6 +520,21 @@ class TestCompareStrategies:
         assert comp.win_rate_b == 0.4
         assert math.isclose(comp.win_rate_diff, 0.3)
 
+    def test_tables_match_lists(self) -> None:
+        """SessionResultTables should compare exactly like lists."""
+        results_a = create_results_with_profits([50.0, 40.0, -30.0, 20.0, -10.0] * 8)
+        results_b = create_results_with_profits([-50.0, 40.0, -30.0, -20.0, 10.0] * 8)
+
+        from_lists = compare_strategies(results_a, results_b, "a", "b")
+        from_tables = compare_strategies(
+            SessionResultTable.from_results(results_a),
+            SessionResultTable.from_results(results_b),
+            "a",
+            "b",
+        )
+
+        assert from_tables == from_lists
+
 
 class TestCompareMultipleStrategies:
     """Tests for compare_multiple_strategies function."""
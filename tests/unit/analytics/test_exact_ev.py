@@ -0,0 +1,174 @@
+"""Unit tests for the exact expected value calculator."""
+
+from __future__ import annotations
+
+from fractions import Fraction
+
+import pytest
+
+from let_it_ride.analytics.exact_ev import (
+    TOTAL_DEALS,
+    ExactEVResult,
+    calculate_exact_ev,
+    canonical_starting_hands,
+    format_exact_ev_report,
+)
+from let_it_ride.analytics.validation import THEORETICAL_HAND_PROBS
+from let_it_ride.config.paytables import (
+    bonus_paytable_a,
+    standard_main_paytable,
+)
+from let_it_ride.core.hand_evaluator import FiveCardHandRank
+from let_it_ride.strategy import AlwaysPullStrategy, BasicStrategy
+
+# Each 5-card hand is dealt 20 ways: C(5,3) starting hands x 2 card orders
+_DEALS_PER_FIVE_CARD_HAND = 20
+
+# Combinatorial counts of the two pair ranks (5 of 13 pair ranks pay)
+_PAIR_TENS_OR_BETTER_HANDS = 1098240 * 5 // 13
+_PAIR_BELOW_TENS_HANDS = 1098240 * 8 // 13
+
+
+@pytest.fixture(scope="module")
+def always_pull_result() -> ExactEVResult:
+    """Enumerate AlwaysPullStrategy once for the module."""
+    return calculate_exact_ev(
+        AlwaysPullStrategy(), standard_main_paytable(), bonus_paytable_a()
+    )
+
+
+@pytest.fixture(scope="module")
+def basic_result() -> ExactEVResult:
+    """Enumerate BasicStrategy once for the module."""
+    return calculate_exact_ev(BasicStrategy(), standard_main_paytable())
+
+
+class TestCanonicalStartingHands:
+    """Tests for suit-isomorphic starting hand classes."""
+
+    def test_class_count(self) -> None:
+        """Test that the 22,100 hands form 1,755 suit classes."""
+        assert len(canonical_starting_hands()) == 1755
+
+    def test_weights_cover_all_hands(self) -> None:
+        """Test that class weights add up to every starting hand."""
+        assert sum(weight for _, weight in canonical_starting_hands()) == 22100
+
+    def test_representatives_are_sorted_and_distinct(self) -> None:
+        """Test that each representative is three distinct sorted codes."""
+        for codes, _ in canonical_starting_hands():
+            assert codes[0] < codes[1] < codes[2]
+
+
+class TestCalculateExactEV:
+    """Tests for calculate_exact_ev()."""
+
+    def test_hand_rank_counts_match_combinatorics(
+        self, always_pull_result: ExactEVResult
+    ) -> None:
+        """Test the final hand distribution against exact 5-card counts."""
+        counts = always_pull_result.hand_rank_counts
+        expected = {
+            FiveCardHandRank.ROYAL_FLUSH: 4,
+            FiveCardHandRank.STRAIGHT_FLUSH: 36,
+            FiveCardHandRank.FOUR_OF_A_KIND: 624,
+            FiveCardHandRank.FULL_HOUSE: 3744,
+            FiveCardHandRank.FLUSH: 5108,
+            FiveCardHandRank.STRAIGHT: 10200,
+            FiveCardHandRank.THREE_OF_A_KIND: 54912,
+            FiveCardHandRank.TWO_PAIR: 123552,
+            FiveCardHandRank.PAIR_TENS_OR_BETTER: _PAIR_TENS_OR_BETTER_HANDS,
+            FiveCardHandRank.PAIR_BELOW_TENS: _PAIR_BELOW_TENS_HANDS,
+            FiveCardHandRank.HIGH_CARD: 1302540,
+        }
+
+        assert always_pull_result.total_deals == TOTAL_DEALS == sum(counts.values())
+        for rank, hands in expected.items():
+            assert counts[rank] == hands * _DEALS_PER_FIVE_CARD_HAND
+
+    def test_probabilities_match_validation_constants(
+        self, always_pull_result: ExactEVResult
+    ) -> None:
+        """Test that probabilities agree with THEORETICAL_HAND_PROBS."""
+        probabilities = always_pull_result.hand_rank_probabilities
+        assert probabilities[FiveCardHandRank.FLUSH] == pytest.approx(
+            THEORETICAL_HAND_PROBS["flush"]
+        )
+        assert probabilities[FiveCardHandRank.HIGH_CARD] == pytest.approx(
+            THEORETICAL_HAND_PROBS["high_card"]
+        )
+
+    def test_always_pull_ev_is_single_bet_ev(
+        self, always_pull_result: ExactEVResult
+    ) -> None:
+        """Test that pulling both bets leaves exactly one bet at risk."""
+        paytable = standard_main_paytable()
+        net = sum(
+            (ratio if (ratio := paytable.payouts[rank]) > 0 else -1) * count
+            for rank, count in always_pull_result.hand_rank_counts.items()
+        )
+
+        assert always_pull_result.bet1_ride_rate == 0.0
+        assert always_pull_result.bet2_ride_rate == 0.0
+        assert always_pull_result.average_bets_at_risk == 1.0
+        assert always_pull_result.expected_value == float(Fraction(net, TOTAL_DEALS))
+        assert always_pull_result.element_of_risk == pytest.approx(
+            -always_pull_result.expected_value
+        )
+
+    def test_bonus_expected_value(self, always_pull_result: ExactEVResult) -> None:
+        """Test the bonus EV against the three-card rank counts."""
+        # Paytable A: mini royal 50, SF 40, trips 30, straight 6, flush 3,
+        # pair 1 (suited A-K-Q are 4 of the 48 straight flushes)
+        net = (
+            4 * 50
+            + 44 * 40
+            + 52 * 30
+            + 720 * 6
+            + 1096 * 3
+            + 3744 * 1
+            - (22100 - 4 - 44 - 52 - 720 - 1096 - 3744)
+        )
+        assert always_pull_result.bonus_expected_value == pytest.approx(net / 22100)
+
+    def test_no_bonus_paytable(self, basic_result: ExactEVResult) -> None:
+        """Test that bonus EV is None without a bonus paytable."""
+        assert basic_result.bonus_expected_value is None
+
+    def test_basic_strategy_results(
+        self, basic_result: ExactEVResult, always_pull_result: ExactEVResult
+    ) -> None:
+        """Test that riding good hands improves on always pulling."""
+        assert 0.0 < basic_result.bet1_ride_rate < basic_result.bet2_ride_rate < 1.0
+        assert 1.0 < basic_result.average_bets_at_risk < 3.0
+        assert always_pull_result.expected_value < basic_result.expected_value < 0.0
+        # Decisions do not change the cards dealt
+        assert basic_result.hand_rank_counts == always_pull_result.hand_rank_counts
+
+    @pytest.mark.slow
+    def test_multiple_workers_match_single_worker(
+        self, basic_result: ExactEVResult
+    ) -> None:
+        """Test that the process pool gives identical results."""
+        result = calculate_exact_ev(
+            BasicStrategy(), standard_main_paytable(), workers=2
+        )
+        assert result == basic_result
+
+
+class TestFormatExactEVReport:
+    """Tests for format_exact_ev_report()."""
+
+    def test_report_contents(self, always_pull_result: ExactEVResult) -> None:
+        """Test that the report lists EV, bonus EV and the distribution."""
+        report = format_exact_ev_report(always_pull_result)
+
+        assert "Exact Expected Value" in report
+        assert "51,979,200" in report
+        assert "Bonus Expected Value" in report
+        assert "royal_flush" in report
+        assert "high_card" in report
+
+    def test_report_without_bonus(self, basic_result: ExactEVResult) -> None:
+        """Test that the bonus line is omitted without a bonus paytable."""
+        assert "Bonus" not in format_exact_ev_report(basic_result)
@@ -17,6 +17,7 @@ from let_it_ride.analytics.risk_of_ruin import (
     _validate_bankroll_units,
     _validate_confidence_level,
     _validate_session_results,
+    calculate_markov_risk_of_ruin,
     calculate_risk_of_ruin,
     format_risk_of_ruin_report,
 )
@@ -368,6 +369,58 @@ class TestMonteCarloSimulation:
 
         assert result1 == result2
 
+    def test_small_memory_budget_streams_chunks(self) -> None:
+        """A tiny memory budget should still simulate every trajectory."""
+        profits = np.array([-50.0, -50.0, 100.0, -25.0])
+
+        ruin, half, quarter, total = _run_monte_carlo_ruin_simulation(
+            session_profits=profits,
+            bankroll=500.0,
+            simulations=2_000,
+            rng=np.random.default_rng(3),
+            max_sessions_per_sim=500,
+            memory_budget=4096,
+        )
+
+        assert total == 2_000
+        assert 0 < ruin <= half <= quarter <= total
+
+    def test_workers_do_not_change_results(self) -> None:
+        """Spreading chunks over processes should reproduce serial results."""
+        profits = np.array([-20.0, -10.0, 50.0, -30.0, 20.0])
+        kwargs = {
+            "session_profits": profits,
+            "bankroll": 200.0,
+            "simulations": 3_000,
+            "memory_budget": 64 * 1024,
+        }
+
+        serial = _run_monte_carlo_ruin_simulation(
+            rng=np.random.default_rng(99), workers=1, **kwargs
+        )
+        parallel = _run_monte_carlo_ruin_simulation(
+            rng=np.random.default_rng(99), workers=2, **kwargs
+        )
+
+        assert serial == parallel
+
+    @pytest.mark.slow
+    def test_million_simulations_per_level(self) -> None:
+        """A million trajectories should run within the default budget."""
+        profits = np.array([-100.0, 50.0])
+
+        ruin, _, _, total = _run_monte_carlo_ruin_simulation(
+            session_profits=profits,
+            bankroll=200.0,
+            simulations=1_000_000,
+            rng=np.random.default_rng(1),
+            max_sessions_per_sim=1_000,
+        )
+
+        assert total == 1_000_000
+        # Negative drift: almost every trajectory is absorbed early
+        assert ruin / total > 0.99
+
 
 class TestCalculateRuinForBankrollLevel:
     """Tests for _calculate_ruin_for_bankroll_level."""
@@ -580,6 +633,14 @@ class TestCalculateRiskOfRuin:
                 confidence_level=1.5,
             )
 
+    def test_invalid_monte_carlo_resources_raise_error(self) -> None:
+        """Non-positive memory budget or worker count should raise ValueError."""
+        results = create_session_results(profits=[10.0] * 20)
+        with pytest.raises(ValueError, match="memory_budget"):
+            calculate_risk_of_ruin(session_results=results, memory_budget=0)
+        with pytest.raises(ValueError, match="workers"):
+            calculate_risk_of_ruin(session_results=results, workers=0)
+
     def test_negative_base_bet_raises_error(self) -> None:
         """Negative base bet should raise ValueError."""
         results = create_session_results(profits=[10.0] * 20)
@@ -1023,3 +1084,161 @@ class TestValidationLimits:
                 bankroll_units=too_many_levels,
                 simulations_per_level=100,
             )
+
+
+class TestMarkovRiskOfRuin:
+    """Tests for the absorbing Markov chain solver."""
+
+    @pytest.mark.parametrize("win_probability", [0.55, 0.6, 0.75])
+    def test_matches_gamblers_ruin(self, win_probability: float) -> None:
+        """A +-1 walk with positive drift is ruined with (q/p)^bankroll."""
+        report = calculate_markov_risk_of_ruin(
+            profit_values=[-10.0, 10.0],
+            profit_probabilities=[1 - win_probability, win_probability],
+            base_bet=10.0,
+            starting_bankroll=100.0,
+            bankroll_units=[4, 8, 20],
+        )
+
+        ratio = (1 - win_probability) / win_probability
+        for result in report.results:
+            units = result.bankroll_units
+            assert result.ruin_probability == pytest.approx(ratio**units, abs=1e-6)
+            assert result.half_bankroll_risk == pytest.approx(
+                ratio ** (units / 2), abs=1e-6
+            )
+        assert report.method == "markov"
+        assert report.convergence_tolerance is not None
+        assert report.convergence_tolerance < 1e-9
+
+    def test_fine_cent_grid_is_exact(self) -> None:
+        """Whole-cent profits are solved on their exact grid, however fine."""
+        win_probability = 0.6
+        report = calculate_markov_risk_of_ruin(
+            profit_values=[-10.01, 10.01],
+            profit_probabilities=[1 - win_probability, win_probability],
+            base_bet=10.0,
+            starting_bankroll=100.0,
+            bankroll_units=[4, 20],
+        )
+
+        # Losing 10 * units takes ceil(units * 10 / 10.01) = units net losses
+        ratio = (1 - win_probability) / win_probability
+        for result in report.results:
+            units = result.bankroll_units
+            assert result.ruin_probability == pytest.approx(ratio**units, abs=1e-6)
+            assert result.half_bankroll_risk == pytest.approx(
+                ratio ** (units / 2), abs=1e-6
+            )
+        assert report.grid_step == pytest.approx(0.01)
+        assert not report.grid_rounded
+
+    def test_reports_rounded_grid(self) -> None:
+        """Amounts that are not whole cents are rounded and reported as such."""
+        report = calculate_markov_risk_of_ruin(
+            profit_values=[-10.001, 10.0],
+            profit_probabilities=[0.4, 0.6],
+            base_bet=10.0,
+            starting_bankroll=100.0,
+            bankroll_units=[20],
+        )
+
+        assert report.grid_rounded
+        assert report.grid_step is not None
+        assert "approximate" in format_risk_of_ruin_report(report)
+
+    def test_agrees_with_monte_carlo(self) -> None:
+        """Markov and Monte Carlo estimates agree on empirical profits."""
+        rng = np.random.default_rng(7)
+        profits = (np.round(rng.normal(5.0, 60.0, 2000) / 5) * 5).tolist()
+        results = create_session_results(profits=profits)
+
+        monte_carlo = calculate_risk_of_ruin(
+            results,
+            bankroll_units=[20, 60],
+            base_bet=5.0,
+            simulations_per_level=4000,
+            random_seed=1,
+        )
+        markov = calculate_risk_of_ruin(
+            results, bankroll_units=[20, 60], base_bet=5.0, method="markov"
+        )
+
+        for sampled, solved in zip(monte_carlo.results, markov.results, strict=True):
+            assert solved.ruin_probability == pytest.approx(
+                sampled.ruin_probability, abs=0.03
+            )
+            assert solved.half_bankroll_risk == pytest.approx(
+                sampled.half_bankroll_risk, abs=0.03
+            )
+            assert solved.quarter_bankroll_risk == pytest.approx(
+                sampled.quarter_bankroll_risk, abs=0.03
+            )
+            assert solved.sessions_simulated == 0
+        assert markov.mean_session_profit == monte_carlo.mean_session_profit
+        assert markov.analytical_estimates == monte_carlo.analytical_estimates
+
+    def test_known_scenarios(self) -> None:
+        """Always losing is certain ruin; always winning never ruins."""
+        losing = calculate_risk_of_ruin(
+            create_session_results(profits=[-100.0] * 20),
+            bankroll_units=[20],
+            base_bet=10.0,
+            method="markov",
+        )
+        winning = calculate_risk_of_ruin(
+            create_session_results(profits=[100.0] * 20),
+            bankroll_units=[20],
+            base_bet=10.0,
+            method="markov",
+        )
+
+        assert losing.results[0].ruin_probability == pytest.approx(1.0)
+        assert winning.results[0].ruin_probability == 0.0
+        assert winning.results[0].quarter_bankroll_risk == 0.0
+
+    def test_max_sessions_limits_horizon(self) -> None:
+        """Only max_sessions sessions can contribute to ruin."""
+        report = calculate_markov_risk_of_ruin(
+            profit_values=[-10.0, 10.0],
+            profit_probabilities=[0.5, 0.5],
+            base_bet=10.0,
+            starting_bankroll=100.0,
+            bankroll_units=[2],
+            max_sessions=2,
+        )
+
+        assert report.results[0].ruin_probability == pytest.approx(0.25)
+        assert report.results[0].half_bankroll_risk == pytest.approx(0.5)
+
+    def test_validation(self) -> None:
+        """Invalid distributions and parameters are rejected."""
+        with pytest.raises(ValueError, match="profit_values"):
+            calculate_markov_risk_of_ruin([], [], 10.0, 100.0)
+        with pytest.raises(ValueError, match="sum to 1"):
+            calculate_markov_risk_of_ruin([-10.0, 10.0], [0.5, 0.6], 10.0, 100.0)
+        with pytest.raises(ValueError, match="tolerance"):
+            calculate_markov_risk_of_ruin(
+                [-10.0, 10.0], [0.5, 0.5], 10.0, 100.0, tolerance=0.0
+            )
+        with pytest.raises(ValueError, match="method"):
+            calculate_risk_of_ruin(
+                create_session_results(profits=[-10.0, 10.0] * 10),
+                method="exact",  # type: ignore[arg-type]
+            )
+
+    def test_format_report(self) -> None:
+        """Markov reports show the solver tolerance instead of CIs."""
+        report = calculate_risk_of_ruin(
+            create_session_results(profits=[-20.0, 25.0] * 10),
+            bankroll_units=[20],
+            base_bet=10.0,
+            method="markov",
+        )
+
+        output = format_risk_of_ruin_report(report)
+
+        assert "Markov Solver Tolerance" in output
+        assert "Markov Grid Step: $5 (exact)" in output
+        assert "CI:" not in output
+        assert "Simulations" not in output
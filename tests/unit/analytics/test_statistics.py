@@ -12,6 +12,7 @@ from let_it_ride.analytics.statistics import (
     DetailedStatistics,
     DistributionStats,
     _calculate_distribution_stats,
+    _calculate_distribution_stats_from_summaries,
     _calculate_kurtosis,
     _calculate_mean_confidence_interval,
     _calculate_percentiles,
@@ -20,7 +21,13 @@ from let_it_ride.analytics.statistics import (
     calculate_statistics,
     calculate_statistics_from_results,
 )
-from let_it_ride.simulation.aggregation import AggregateStatistics
+from let_it_ride.simulation.accumulators import QuantileSketch, RunningMoments
+from let_it_ride.simulation.aggregation import (
+    AggregateAccumulator,
+    AggregateStatistics,
+    aggregate_results,
+)
+from let_it_ride.simulation.result_table import SessionResultTable
 from let_it_ride.simulation.session import SessionOutcome, SessionResult, StopReason
 
 
@@ -644,6 +651,39 @@ class TestCalculateStatisticsFromResults:
         assert stats.total_sessions == 1
         assert stats.total_hands == 100
 
+    def test_table_matches_list(self) -> None:
+        """A SessionResultTable should give the same statistics as a list."""
+        results = [
+            create_session_result(
+                outcome=SessionOutcome.WIN if i % 3 else SessionOutcome.LOSS,
+                session_profit=(25.0 * i if i % 3 else -40.0 * i),
+                hands_played=20 + i % 7,
+                max_drawdown=float(10 * (i % 9)),
+            )
+            for i in range(40)
+        ]
+
+        from_list = calculate_statistics_from_results(results)
+        from_table = calculate_statistics_from_results(
+            SessionResultTable.from_results(results)
+        )
+
+        assert from_table.session_profit_distribution == (
+            from_list.session_profit_distribution
+        )
+        assert from_table.ev_per_hand_ci.lower == pytest.approx(
+            from_list.ev_per_hand_ci.lower
+        )
+        assert from_table.ev_per_hand_ci.upper == pytest.approx(
+            from_list.ev_per_hand_ci.upper
+        )
+        risk, expected_risk = from_table.risk_metrics, from_list.risk_metrics
+        assert risk.prob_any_loss == expected_risk.prob_any_loss
+        assert risk.prob_loss_50pct == expected_risk.prob_loss_50pct
+        assert risk.prob_loss_100pct == expected_risk.prob_loss_100pct
+        assert risk.max_drawdown_mean == pytest.approx(expected_risk.max_drawdown_mean)
+        assert risk.max_drawdown_std == pytest.approx(expected_risk.max_drawdown_std)
+
 
 class TestNumericalStability:
     """Tests for numerical stability with edge cases."""
@@ -781,6 +821,98 @@ class TestEmptySessionProfits:
             calculate_statistics(agg)
 
 
+class TestStatisticsFromSummaries:
+    """Tests for statistics computed from streamed profit summaries."""
+
+    @staticmethod
+    def _results(count: int) -> list[SessionResult]:
+        """Create sessions with a spread of profits, some of them ruinous."""
+        results = []
+        for i in range(count):
+            profit = float((i * 73) % 1601 - 1100)
+            outcome = SessionOutcome.WIN if profit > 0 else SessionOutcome.LOSS
+            results.append(
+                create_session_result(
+                    outcome=outcome,
+                    session_profit=profit,
+                    final_bankroll=1000.0 + profit,
+                )
+            )
+        return results
+
+    def test_distribution_matches_exact(self) -> None:
+        """Moments should be exact and percentiles close to the exact ones."""
+        data = tuple(float((i * 37) % 500 - 250) for i in range(2000))
+        exact = _calculate_distribution_stats(data)
+        approx = _calculate_distribution_stats_from_summaries(
+            RunningMoments.from_values(data), QuantileSketch.from_values(data)
+        )
+
+        assert approx.mean == pytest.approx(exact.mean)
+        assert approx.variance == pytest.approx(exact.variance)
+        assert approx.skewness == pytest.approx(exact.skewness, abs=1e-9)
+        assert approx.kurtosis == pytest.approx(exact.kurtosis)
+        assert (approx.min, approx.max) == (exact.min, exact.max)
+        for p in DEFAULT_PERCENTILES:
+            # One order statistic (spacing 1) apart, plus the sketch's 0.1% error
+            tolerance = 1.0 + 0.001 * abs(exact.percentiles[p])
+            assert abs(approx.percentiles[p] - exact.percentiles[p]) <= tolerance
+
+    def test_empty_summaries_raise_error(self) -> None:
+        """Empty summaries should raise ValueError."""
+        with pytest.raises(ValueError, match="empty data"):
+            _calculate_distribution_stats_from_summaries(
+                RunningMoments(), QuantileSketch()
+            )
+
+    def test_streamed_aggregate_matches_exact(self) -> None:
+        """calculate_statistics should accept aggregates without raw profits."""
+        results = self._results(1000)
+        accumulator = AggregateAccumulator()
+        accumulator.add_results(results)
+        streamed = calculate_statistics(
+            accumulator.to_statistics(), starting_bankroll=1000.0
+        )
+        exact = calculate_statistics(
+            aggregate_results(results), starting_bankroll=1000.0
+        )
+
+        streamed_dist = streamed.session_profit_distribution
+        exact_dist = exact.session_profit_distribution
+        assert streamed_dist.std == pytest.approx(exact_dist.std)
+        assert streamed_dist.percentiles[50] == pytest.approx(
+            exact_dist.percentiles[50], rel=0.001, abs=2.0
+        )
+        assert streamed.ev_per_hand_ci.lower == pytest.approx(
+            exact.ev_per_hand_ci.lower
+        )
+        assert streamed.ev_per_hand_ci.upper == pytest.approx(
+            exact.ev_per_hand_ci.upper
+        )
+        streamed_risk = streamed.risk_metrics
+        exact_risk = exact.risk_metrics
+        assert streamed_risk.prob_any_loss == exact_risk.prob_any_loss
+        assert streamed_risk.prob_loss_50pct == pytest.approx(
+            exact_risk.prob_loss_50pct, abs=0.002
+        )
+        assert streamed_risk.prob_loss_100pct == pytest.approx(
+            exact_risk.prob_loss_100pct, abs=0.002
+        )
+        assert exact_risk.prob_loss_100pct > 0
+
+    def test_risk_metrics_from_sketch(self) -> None:
+        """Loss probabilities should be read from the sketch."""
+        sketch = QuantileSketch.from_values([-1000.0, -600.0, -10.0, 0.0, 50.0])
+        metrics = _calculate_risk_metrics(
+            profit_sketch=sketch, starting_bankroll=1000.0
+        )
+
+        assert metrics.prob_any_loss == pytest.approx(0.6)
+        assert metrics.prob_loss_50pct == pytest.approx(0.4)
+        assert metrics.prob_loss_100pct == pytest.approx(0.2)
+        assert metrics.max_drawdown_mean == 0.0
+
+
 class TestScipyReferenceValidation:
     """Tests validating skewness and kurtosis match scipy implementations."""
 
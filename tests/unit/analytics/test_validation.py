@@ -465,6 +465,21 @@ class TestValidateSimulation:
         # EV theoretical should scale with base bet
         assert report_5.ev_theoretical == report_1.ev_theoretical * 5
 
+    def test_exact_ev_per_unit(self) -> None:
+        """Should compare against a given theoretical EV instead of the default."""
+        stats = create_aggregate_statistics(
+            total_hands=10000,
+            net_result=-250.0,
+        )
+
+        default_report = validate_simulation(stats)
+        exact_report = validate_simulation(stats, base_bet=5.0, ev_per_unit=-0.005)
+
+        assert exact_report.ev_theoretical == pytest.approx(-0.025)
+        assert exact_report.ev_deviation_pct == pytest.approx(0.0)
+        assert any("EV deviation" in w for w in default_report.warnings)
+        assert not any("EV deviation" in w for w in exact_report.warnings)
+
 
 class TestChiSquareResultDataclass:
     """Tests for ChiSquareResult dataclass."""
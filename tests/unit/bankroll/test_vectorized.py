@@ -0,0 +1,151 @@
+"""Unit tests for array-based betting systems."""
+
+import copy
+import random
+
+import numpy as np
+import pytest
+
+from let_it_ride.bankroll import (
+    BettingContext,
+    BettingSystem,
+    DAlembertBetting,
+    FibonacciBetting,
+    FlatBetting,
+    MartingaleBetting,
+    ParoliBetting,
+    ReverseMartingaleBetting,
+    StateTableBetting,
+    VectorizedDAlembertBetting,
+    vectorize_betting_system,
+)
+
+SCALAR_SYSTEMS = [
+    FlatBetting(10.0),
+    MartingaleBetting(5.0, loss_multiplier=2.5, max_bet=200.0, max_progressions=5),
+    ReverseMartingaleBetting(5.0, win_multiplier=1.5, profit_target_streak=4),
+    ParoliBetting(7.0, win_multiplier=3.0, wins_before_reset=2, max_bet=50.0),
+    DAlembertBetting(10.0, unit=2.5, min_bet=5.0, max_bet=30.0),
+    FibonacciBetting(3.0, win_regression=1, max_bet=100.0, max_position=12),
+]
+
+
+def _scalar_context(bankroll: float) -> BettingContext:
+    return BettingContext(
+        bankroll=bankroll,
+        starting_bankroll=500.0,
+        session_profit=bankroll - 500.0,
+        last_result=None,
+        streak=0,
+        hands_played=0,
+    )
+
+
+class TestVectorizeBettingSystem:
+    """Tests that vectorized systems bet exactly as scalar systems."""
+
+    @pytest.mark.parametrize("system", SCALAR_SYSTEMS, ids=repr)
+    def test_matches_scalar_system(self, system: BettingSystem) -> None:
+        """Test bets of many independent sessions against scalar copies."""
+        num_sessions = 40
+        rng = random.Random(7)
+        vectorized = vectorize_betting_system(system)
+        vectorized.reset(num_sessions)
+        scalars = [copy.copy(system) for _ in range(num_sessions)]
+        for scalar in scalars:
+            scalar.reset()
+
+        for _ in range(300):
+            sessions = np.array(
+                sorted(rng.sample(range(num_sessions), 25)), dtype=np.intp
+            )
+            bankrolls = np.array([rng.choice([0.0, 8.0, 1000.0]) for _ in sessions])
+            results = np.array([rng.choice([-20.0, 0.0, 15.0]) for _ in sessions])
+
+            bets = vectorized.get_bets(sessions, bankrolls)
+            expected = [
+                scalars[session].get_bet(_scalar_context(bankroll))
+                for session, bankroll in zip(sessions, bankrolls, strict=True)
+            ]
+            assert bets.tolist() == expected
+
+            vectorized.record_results(sessions, results)
+            for session, result in zip(sessions, results, strict=True):
+                scalars[session].record_result(float(result))
+
+    def test_starts_from_reset_state(self) -> None:
+        """Test that the scalar instance's current state is not copied."""
+        system = MartingaleBetting(5.0)
+        system.record_result(-5.0)
+        vectorized = vectorize_betting_system(system)
+        vectorized.reset(2)
+
+        bets = vectorized.get_bets(np.arange(2), np.array([100.0, 100.0]))
+        assert bets.tolist() == [5.0, 5.0]
+
+    def test_rejects_unknown_system(self) -> None:
+        """Test that systems without an array equivalent are rejected."""
+
+        class CustomBetting:
+            def get_bet(self, context: BettingContext) -> float:  # noqa: ARG002
+                return 1.0
+
+            def record_result(self, result: float) -> None:
+                pass
+
+            def reset(self) -> None:
+                pass
+
+        with pytest.raises(ValueError, match="CustomBetting"):
+            vectorize_betting_system(CustomBetting())
+
+
+class TestStateTableBetting:
+    """Tests for StateTableBetting."""
+
+    def test_transitions(self) -> None:
+        """Test win, loss and push transitions per session."""
+        betting = StateTableBetting([5.0, 10.0, 20.0], [0, 0, 0], [1, 2, 2])
+        betting.reset(3)
+        sessions = np.arange(3)
+        betting.record_results(sessions, np.array([-1.0, 0.0, 1.0]))
+        betting.record_results(sessions, np.array([-1.0, -1.0, -1.0]))
+
+        assert betting.states.tolist() == [2, 1, 1]
+        bets = betting.get_bets(sessions, np.array([100.0, 7.0, -3.0]))
+        assert bets.tolist() == [20.0, 7.0, 0.0]
+
+    @pytest.mark.parametrize(
+        ("bets", "on_win", "on_loss", "match"),
+        [
+            ([], [], [], "empty"),
+            ([5.0], [0, 0], [0], "same length"),
+            ([0.0], [0], [0], "positive"),
+            ([5.0, 10.0], [0, 2], [1, 1], "unknown state"),
+        ],
+    )
+    def test_invalid_tables(
+        self, bets: list[float], on_win: list[int], on_loss: list[int], match: str
+    ) -> None:
+        """Test validation of the state tables."""
+        with pytest.raises(ValueError, match=match):
+            StateTableBetting(bets, on_win, on_loss)
+
+
+class TestVectorizedDAlembertBetting:
+    """Tests for VectorizedDAlembertBetting."""
+
+    def test_clamps_between_limits(self) -> None:
+        """Test that bets stay within min_bet and max_bet."""
+        betting = VectorizedDAlembertBetting(10.0, 5.0, 5.0, 15.0)
+        betting.reset(2)
+        sessions = np.arange(2)
+        for _ in range(3):
+            betting.record_results(sessions, np.array([1.0, -1.0]))
+
+        assert betting.current_bets.tolist() == [5.0, 15.0]
+
+    def test_validates_like_scalar_system(self) -> None:
+        """Test that invalid parameters are rejected."""
+        with pytest.raises(ValueError, match="Min bet cannot exceed max bet"):
+            VectorizedDAlembertBetting(10.0, 5.0, 20.0, 15.0)
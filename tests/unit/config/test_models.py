@@ -79,6 +79,7 @@ class TestSimulationConfig:
         assert config.workers == "auto"
         assert config.progress_interval == 10000
         assert config.detailed_logging is False
+        assert config.hand_model == "dealt"
 
     def test_valid_values(self) -> None:
         """Test valid simulation config values."""
@@ -165,6 +166,13 @@ class TestDeckConfig:
         config = DeckConfig(shuffle_algorithm="fisher_yates")
         assert config.shuffle_algorithm == "fisher_yates"
 
+    def test_partial_fisher_yates(self) -> None:
+        """Test partial Fisher-Yates shuffle algorithm."""
+        config = DeckConfig(shuffle_algorithm="partial_fisher_yates")
+        assert config.shuffle_algorithm == "partial_fisher_yates"
+        assert config.partial_shuffle
+        assert not DeckConfig().partial_shuffle
+
     def test_cryptographic(self) -> None:
         """Test cryptographic shuffle algorithm."""
         config = DeckConfig(shuffle_algorithm="cryptographic")
@@ -1027,6 +1035,35 @@ class TestFullConfigWithTable:
         assert config.table.num_seats == 1
         assert config.bonus_strategy.type == "bankroll_conditional"
 
+    def test_sampled_hand_model_rejects_multi_seat(self) -> None:
+        """Test that sampled hands are only allowed with a single seat."""
+        config = FullConfig(simulation=SimulationConfig(hand_model="sampled"))
+        assert config.simulation.hand_model == "sampled"
+
+        with pytest.raises(ValidationError, match="hand_model 'sampled'"):
+            FullConfig(
+                simulation=SimulationConfig(hand_model="sampled"),
+                table=TableConfig(num_seats=2),
+            )
+
+    def test_lockstep_requires_sampled_fixed_bonus(self) -> None:
+        """Test that lockstep needs sampled hands and a fixed bonus bet."""
+        config = FullConfig(
+            simulation=SimulationConfig(hand_model="sampled", lockstep=True)
+        )
+        assert config.simulation.lockstep is True
+
+        with pytest.raises(ValidationError, match="hand_model 'sampled'"):
+            FullConfig(simulation=SimulationConfig(lockstep=True))
+        with pytest.raises(ValidationError, match="fixed bonus bet"):
+            FullConfig(
+                simulation=SimulationConfig(hand_model="sampled", lockstep=True),
+                bonus_strategy=BonusStrategyConfig(
+                    type="bankroll_conditional",
+                    bankroll_conditional={"base_amount": 5.0},
+                ),
+            )
+
     def test_total_results_validation_passes_under_limit(self) -> None:
         """Test total results under 100M limit passes validation."""
         # 50M sessions * 2 seats = 100M total (at limit)
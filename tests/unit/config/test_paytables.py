@@ -14,7 +14,10 @@ from let_it_ride.config.paytables import (
     standard_main_paytable,
 )
 from let_it_ride.core.hand_evaluator import FiveCardHandRank
-from let_it_ride.core.three_card_evaluator import ThreeCardHandRank
+from let_it_ride.core.three_card_evaluator import (
+    THREE_CARD_HAND_RANKS,
+    ThreeCardHandRank,
+)
 
 
 class TestMainGamePaytable:
@@ -321,6 +324,28 @@ class TestBonusPaytable:
 
         assert paytable.calculate_payout(ThreeCardHandRank.MINI_ROYAL, 5.0) == 1000.0
 
+    @pytest.mark.parametrize(
+        "factory", [bonus_paytable_a, bonus_paytable_b, bonus_paytable_c]
+    )
+    def test_payout_ratios_by_hand_index(
+        self, factory: Callable[[], BonusPaytable]
+    ) -> None:
+        """Ratio table should give each hand the ratio of its rank."""
+        paytable = factory()
+        ratios = paytable.payout_ratios_by_hand_index()
+
+        assert len(ratios) == 22_100
+        for rank, ratio in zip(THREE_CARD_HAND_RANKS, ratios, strict=True):
+            assert ratio == paytable.payouts[rank]
+
+    def test_payout_ratio_table_is_cached(self) -> None:
+        """Paytables with the same ratios should share one ratio table."""
+        paytable = bonus_paytable_b()
+        copy = BonusPaytable(name="copy", payouts=dict(paytable.payouts))
+        assert (
+            copy.payout_ratios_by_hand_index() is paytable.payout_ratios_by_hand_index()
+        )
+
 
 class TestPaytableImmutability:
     """Tests for paytable immutability."""
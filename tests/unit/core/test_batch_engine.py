@@ -0,0 +1,211 @@
+"""Unit tests for the vectorized batch game engine."""
+
+import numpy as np
+import pytest
+
+from let_it_ride.analytics.exact_ev import calculate_exact_ev
+from let_it_ride.analytics.validation import calculate_chi_square
+from let_it_ride.config.paytables import bonus_paytable_a, standard_main_paytable
+from let_it_ride.core.batch_engine import (
+    BatchGameEngine,
+    HandBatch,
+    deal_hands,
+    five_card_rank_values,
+)
+from let_it_ride.core.hand_analysis import (
+    HandAnalysis,
+    analyze_four_card_codes,
+    analyze_three_card_codes,
+)
+from let_it_ride.core.hand_evaluator import (
+    FiveCardHandRank,
+    evaluate_five_card_rank_codes,
+)
+from let_it_ride.core.three_card_evaluator import evaluate_three_card_hand_codes
+from let_it_ride.strategy import (
+    BasicStrategy,
+    Decision,
+    StrategyContext,
+)
+
+
+class BankrollStrategy:
+    """Strategy that rides Bet 1 only with a large bankroll."""
+
+    def decide_bet1(
+        self,
+        analysis: HandAnalysis,  # noqa: ARG002
+        context: StrategyContext,
+    ) -> Decision:
+        return Decision.RIDE if context.bankroll > 1000 else Decision.PULL
+
+    def decide_bet2(
+        self,
+        analysis: HandAnalysis,  # noqa: ARG002
+        context: StrategyContext,  # noqa: ARG002
+    ) -> Decision:
+        return Decision.PULL
+
+
+@pytest.fixture(scope="module")
+def engine() -> BatchGameEngine:
+    """Create a batch engine for basic strategy once for the module."""
+    return BatchGameEngine(
+        BasicStrategy(), standard_main_paytable(), bonus_paytable_a()
+    )
+
+
+@pytest.fixture(scope="module")
+def batch(engine: BatchGameEngine) -> HandBatch:
+    """Play a batch of hands once for the module."""
+    return engine.play_hands(20_000, seed=42)
+
+
+class TestDealHands:
+    """Tests for deal_hands()."""
+
+    def test_shape_and_distinct_cards(self) -> None:
+        """Test that every hand has 5 distinct valid card codes."""
+        cards = deal_hands(10_000, np.random.default_rng(1))
+
+        assert cards.shape == (10_000, 5)
+        assert cards.min() >= 0
+        assert cards.max() <= 51
+        assert (np.sort(cards, axis=1)[:, 1:] != np.sort(cards, axis=1)[:, :-1]).all()
+
+    def test_every_card_equally_likely(self) -> None:
+        """Test that each card appears at every position about equally."""
+        cards = deal_hands(52_000, np.random.default_rng(2))
+
+        for position in range(5):
+            counts = np.bincount(cards[:, position], minlength=52)
+            # Expected 1,000 per card; 6 standard deviations is about 190
+            assert np.abs(counts - 1000).max() < 190
+
+
+class TestFiveCardRankValues:
+    """Tests for five_card_rank_values()."""
+
+    def test_matches_scalar_evaluator(self) -> None:
+        """Test random hands against evaluate_five_card_rank_codes()."""
+        cards = deal_hands(20_000, np.random.default_rng(3))
+
+        expected = [
+            evaluate_five_card_rank_codes(hand).value for hand in cards.tolist()
+        ]
+        assert five_card_rank_values(cards).tolist() == expected
+
+    @pytest.mark.parametrize(
+        ("codes", "rank"),
+        [
+            ((32, 36, 40, 44, 48), FiveCardHandRank.ROYAL_FLUSH),
+            ((48, 0, 4, 8, 12), FiveCardHandRank.STRAIGHT_FLUSH),  # A-2-3-4-5
+            ((49, 0, 5, 10, 15), FiveCardHandRank.STRAIGHT),  # wheel, mixed suits
+            ((32, 33, 1, 6, 50), FiveCardHandRank.PAIR_TENS_OR_BETTER),
+            ((28, 29, 1, 6, 50), FiveCardHandRank.PAIR_BELOW_TENS),
+            ((0, 1, 2, 4, 5), FiveCardHandRank.FULL_HOUSE),
+            ((0, 1, 2, 3, 5), FiveCardHandRank.FOUR_OF_A_KIND),
+        ],
+    )
+    def test_known_hands(self, codes: tuple[int, ...], rank: FiveCardHandRank) -> None:
+        """Test hand types around the boundaries of each rule."""
+        assert five_card_rank_values(np.array([codes]))[0] == rank.value
+
+
+class TestBatchGameEngine:
+    """Tests for BatchGameEngine."""
+
+    def test_decisions_match_strategy(self, batch: HandBatch) -> None:
+        """Test that decisions equal live basic strategy decisions."""
+        strategy = BasicStrategy()
+        context = StrategyContext(
+            session_profit=0.0, hands_played=0, streak=0, bankroll=500.0
+        )
+        for i, hand in enumerate(batch.cards[:5000].tolist()):
+            bet1 = strategy.decide_bet1(analyze_three_card_codes(hand[:3]), context)
+            bet2 = strategy.decide_bet2(analyze_four_card_codes(hand[:4]), context)
+            assert batch.bet1_rides[i] == (bet1 == Decision.RIDE)
+            assert batch.bet2_rides[i] == (bet2 == Decision.RIDE)
+
+    def test_bonus_ranks_and_payouts(self, batch: HandBatch) -> None:
+        """Test bonus rank and net result against the scalar evaluator."""
+        paytable = bonus_paytable_a()
+        for i, hand in enumerate(batch.cards[:5000].tolist()):
+            rank = evaluate_three_card_hand_codes(hand[:3])
+            ratio = paytable.payouts[rank]
+            assert batch.bonus_rank[i] == rank.value
+            assert batch.bonus_net[i] == (ratio if ratio > 0 else -1)
+
+    def test_main_results(self, batch: HandBatch) -> None:
+        """Test bets at risk and main net result columns."""
+        paytable = standard_main_paytable()
+        expected_bets = 1 + batch.bet1_rides.astype(int) + batch.bet2_rides.astype(int)
+        assert (batch.bets_at_risk == expected_bets).all()
+
+        for i in range(2000):
+            ratio = paytable.payouts[FiveCardHandRank(int(batch.final_rank[i]))]
+            bets = int(batch.bets_at_risk[i])
+            assert batch.main_net[i] == (bets * ratio if ratio > 0 else -bets)
+
+    def test_reproducible_from_seed(self, engine: BatchGameEngine) -> None:
+        """Test that a seed reproduces the same hands."""
+        first = engine.play_hands(1000, seed=7)
+        second = engine.play_hands(1000, seed=7)
+        other = engine.play_hands(1000, seed=8)
+
+        assert np.array_equal(first.cards, second.cards)
+        assert np.array_equal(first.main_net, second.main_net)
+        assert not np.array_equal(first.cards, other.cards)
+
+    def test_chunks_are_concatenated(self, engine: BatchGameEngine) -> None:
+        """Test that batches larger than one chunk are returned whole."""
+        result = engine.play_hands(70_000, seed=9)
+
+        assert len(result) == 70_000
+        assert result.cards.shape == (70_000, 5)
+
+    def test_hand_distribution(self, engine: BatchGameEngine) -> None:
+        """Test final hand frequencies with a chi-square test."""
+        result = engine.play_hands(200_000, seed=10)
+        counts = np.bincount(result.final_rank, minlength=len(FiveCardHandRank))
+        frequencies = {
+            rank.name.lower(): int(counts[rank.value]) for rank in FiveCardHandRank
+        }
+        frequencies["pair"] = frequencies.pop("pair_tens_or_better") + frequencies.pop(
+            "pair_below_tens"
+        )
+
+        assert calculate_chi_square(frequencies, significance_level=0.001).is_valid
+
+    @pytest.mark.slow
+    def test_expected_value_matches_exact_ev(self, engine: BatchGameEngine) -> None:
+        """Test the sampled EV against full enumeration of the deals."""
+        exact = calculate_exact_ev(BasicStrategy(), standard_main_paytable())
+        result = engine.play_hands(2_000_000, seed=13)
+        standard_error = result.main_net.std() / np.sqrt(len(result))
+
+        assert abs(result.main_net.mean() - exact.expected_value) < 4 * standard_error
+        assert result.bets_at_risk.mean() == pytest.approx(
+            exact.average_bets_at_risk, abs=0.005
+        )
+
+    def test_without_bonus_paytable(self) -> None:
+        """Test that bonus net results are zero without a bonus paytable."""
+        engine = BatchGameEngine(BasicStrategy(), standard_main_paytable())
+        result = engine.play_hands(100, seed=11)
+
+        assert not result.bonus_net.any()
+
+    def test_zero_hands(self, engine: BatchGameEngine) -> None:
+        """Test that playing no hands returns an empty batch."""
+        assert len(engine.play_hands(0, seed=12)) == 0
+
+    def test_negative_hands_raises(self, engine: BatchGameEngine) -> None:
+        """Test that a negative hand count is rejected."""
+        with pytest.raises(ValueError, match="num_hands must be non-negative"):
+            engine.play_hands(-1)
+
+    def test_context_reading_strategy_raises(self) -> None:
+        """Test that strategies needing StrategyContext are rejected."""
+        with pytest.raises(ValueError, match="does not read StrategyContext"):
+            BatchGameEngine(BankrollStrategy(), standard_main_paytable())
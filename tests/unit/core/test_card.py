@@ -2,7 +2,14 @@
 
 import pytest
 
-from let_it_ride.core.card import Card, Rank, Suit
+from let_it_ride.core.card import (
+    CARD_BY_CODE,
+    Card,
+    Rank,
+    Suit,
+    card_to_int,
+    int_to_card,
+)
 
 
 class TestRank:
@@ -243,3 +250,32 @@ class TestCard:
         all_cards = [Card(rank, suit) for suit in Suit for rank in Rank]
         assert len(all_cards) == 52
         assert len(set(all_cards)) == 52
+
+
+class TestCardCodes:
+    """Tests for the compact integer card encoding."""
+
+    def test_round_trip_all_cards(self) -> None:
+        """Every card encodes to a unique code in 0..51 and decodes back."""
+        all_cards = [Card(rank, suit) for suit in Suit for rank in Rank]
+        codes = [card_to_int(card) for card in all_cards]
+        assert sorted(codes) == list(range(52))
+        for card, code in zip(all_cards, codes, strict=True):
+            assert int_to_card(code) == card
+
+    def test_bit_fields(self) -> None:
+        """Rank is stored in bits 2-5 and suit index in bits 0-1."""
+        code = card_to_int(Card(Rank.QUEEN, Suit.HEARTS))
+        assert (code >> 2) + 2 == Rank.QUEEN.value
+        assert code & 3 == list(Suit).index(Suit.HEARTS)
+
+    def test_decoded_cards_are_shared(self) -> None:
+        """Decoding returns the canonical instance rather than a new Card."""
+        assert int_to_card(7) is CARD_BY_CODE[7]
+        assert int_to_card(7) is int_to_card(7)
+
+    @pytest.mark.parametrize("code", [-1, 52, 100])
+    def test_out_of_range_code_raises(self, code: int) -> None:
+        """Codes outside 0..51 are rejected."""
+        with pytest.raises(ValueError, match="between 0 and 51"):
+            int_to_card(code)
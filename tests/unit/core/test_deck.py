@@ -6,7 +6,7 @@ from collections import Counter
 import pytest
 from scipy import stats
 
-from let_it_ride.core.card import Card, Rank, Suit
+from let_it_ride.core.card import Card, Rank, Suit, int_to_card
 from let_it_ride.core.deck import Deck, DeckEmptyError
 
 
@@ -343,3 +343,114 @@ class TestShuffleDistribution:
                 f"Position {pos} distribution not uniform "
                 f"(chi2={chi2:.2f}, p={p_value:.4f})"
             )
+
+
+class TestDeckDealCodes:
+    """Tests for dealing integer card codes."""
+
+    def test_deal_codes_matches_deal_for_same_seed(self) -> None:
+        """Codes and Cards dealt from the same seed describe the same cards."""
+        card_deck = Deck()
+        code_deck = Deck()
+        card_deck.shuffle(random.Random(99))
+        code_deck.shuffle(random.Random(99))
+
+        cards = card_deck.deal(7)
+        codes = code_deck.deal_codes(7)
+        assert [int_to_card(code) for code in codes] == cards
+
+    def test_deal_codes_tracks_dealt_cards(self, rng: random.Random) -> None:
+        """Cards dealt as codes are removed and reported by dealt_cards()."""
+        deck = Deck()
+        deck.shuffle(rng)
+
+        codes = deck.deal_codes(5)
+        assert len(deck) == 47
+        assert deck.dealt_cards() == [int_to_card(code) for code in codes]
+
+    def test_deal_codes_validates_count(self) -> None:
+        """deal_codes() applies the same count checks as deal()."""
+        deck = Deck()
+        with pytest.raises(ValueError, match="at least 1"):
+            deck.deal_codes(0)
+        with pytest.raises(DeckEmptyError):
+            deck.deal_codes(53)
+
+
+class TestDeckPartialShuffle:
+    """Tests for the deal-time (partial) Fisher-Yates shuffle."""
+
+    def test_first_deal_matches_full_shuffle(self) -> None:
+        """The first deal after a shuffle equals the full-shuffle deal."""
+        for seed in range(50):
+            full = Deck()
+            partial = Deck(partial_shuffle=True)
+            full.shuffle(random.Random(seed))
+            partial.shuffle(random.Random(seed))
+
+            assert partial.deal_codes(3) + partial.deal_codes(2) == (
+                full.deal_codes(3) + full.deal_codes(2)
+            )
+
+    def test_consumes_one_draw_per_card(self) -> None:
+        """Dealing 5 cards makes 5 random draws instead of 51."""
+        rng = random.Random(7)
+        deck = Deck(partial_shuffle=True)
+        deck.shuffle(rng)
+        deck.deal_codes(5)
+
+        expected = random.Random(7)
+        for size in range(52, 47, -1):
+            expected.randrange(size)
+        assert rng.getstate() == expected.getstate()
+
+    def test_same_seed_produces_same_hands(self) -> None:
+        """Repeated shuffle/deal cycles are reproducible per seed."""
+
+        def play(seed: int) -> list[list[int]]:
+            rng = random.Random(seed)
+            deck = Deck(partial_shuffle=True)
+            hands = []
+            for _ in range(20):
+                deck.reset()
+                deck.shuffle(rng)
+                hands.append(deck.deal_codes(5))
+            return hands
+
+        assert play(42) == play(42)
+        assert play(42) != play(43)
+
+    def test_deals_unique_cards_and_tracks_them(self, rng: random.Random) -> None:
+        """All 52 cards are dealt exactly once and tracked as dealt."""
+        deck = Deck(partial_shuffle=True)
+        deck.shuffle(rng)
+
+        cards = deck.deal(52)
+        assert len(set(cards)) == 52
+        assert deck.dealt_cards() == cards
+        assert len(deck) == 0
+
+    def test_reset_returns_to_unshuffled_state(self, rng: random.Random) -> None:
+        """Without a new shuffle() a reset deck deals in canonical order."""
+        deck = Deck(partial_shuffle=True)
+        deck.shuffle(rng)
+        deck.deal(5)
+        deck.reset()
+
+        assert deck.deal(5) == Deck().deal(5)
+
+    def test_distribution_is_uniform(self) -> None:
+        """Each card is equally likely in each of the first 5 positions."""
+        rng = random.Random(12345)
+        deck = Deck(partial_shuffle=True)
+        counts = [Counter[int]() for _ in range(5)]
+        for _ in range(26000):
+            deck.reset()
+            deck.shuffle(rng)
+            for position, code in enumerate(deck.deal_codes(5)):
+                counts[position][code] += 1
+
+        for position_counts in counts:
+            observed = [position_counts[code] for code in range(52)]
+            _, p_value = stats.chisquare(observed)
+            assert p_value > 0.01
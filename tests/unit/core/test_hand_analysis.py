@@ -1,11 +1,15 @@
 """Unit tests for hand analysis utilities."""
 
+from itertools import combinations
+
 import pytest
 
-from let_it_ride.core.card import Card, Rank, Suit
+from let_it_ride.core.card import CARD_BY_CODE, Card, Rank, Suit, card_to_int
 from let_it_ride.core.hand_analysis import (
     HandAnalysis,
+    analyze_four_card_codes,
     analyze_four_cards,
+    analyze_three_card_codes,
     analyze_three_cards,
 )
 from tests.fixtures.hand_analysis_samples import (
@@ -591,3 +595,65 @@ class TestEdgeCases:
         analysis = analyze_three_cards(make_hand("2h 7s Qd"))
         # No straight potential
         assert analysis.is_straight_draw is False
+
+
+class TestAnalyzeCardCodes:
+    """Integer-code analysis must match the Card-based analysis."""
+
+    def test_all_three_card_hands_match(self) -> None:
+        """Every 3-card combination analyzes identically as codes."""
+        for codes in combinations(range(52), 3):
+            cards = [CARD_BY_CODE[code] for code in codes]
+            assert analyze_three_card_codes(codes) == analyze_three_cards(cards)
+
+    @pytest.mark.slow
+    def test_all_four_card_hands_match(self) -> None:
+        """Every 4-card combination analyzes identically as codes."""
+        for codes in combinations(range(52), 4):
+            cards = [CARD_BY_CODE[code] for code in codes]
+            assert analyze_four_card_codes(codes) == analyze_four_cards(cards)
+
+    def test_sample_four_card_hand(self) -> None:
+        """A 4-card flush draw is detected from codes."""
+        cards = make_hand("Ah Kh 5h 2h")
+        codes = [card_to_int(card) for card in cards]
+        analysis = analyze_four_card_codes(codes)
+        assert analysis == analyze_four_cards(cards)
+        assert analysis.is_flush_draw is True
+
+    def test_wrong_count_raises(self) -> None:
+        """Code-based analysis validates the card count."""
+        with pytest.raises(ValueError, match="Expected 3 cards, got 4"):
+            analyze_three_card_codes([0, 1, 2, 3])
+        with pytest.raises(ValueError, match="Expected 4 cards, got 3"):
+            analyze_four_card_codes([0, 1, 2])
+
+
+class TestAnalysisCache:
+    """Analyses are shared between suit-isomorphic hands."""
+
+    def test_suit_permuted_hands_share_instance(self) -> None:
+        """Relabeling suits yields the same cached HandAnalysis object."""
+        first = analyze_three_cards(make_hand("Ah Kh 7s"))
+        second = analyze_three_cards(make_hand("Ad Kd 7c"))
+        assert first is second
+
+    def test_card_order_does_not_matter_without_suit_ties(self) -> None:
+        """Reordering cards yields the same cached HandAnalysis object."""
+        first = analyze_four_cards(make_hand("9h Th Jh 2c"))
+        second = analyze_four_cards(make_hand("2c Jh 9h Th"))
+        assert first is second
+
+    def test_suit_tie_break_is_preserved(self) -> None:
+        """With tied suit counts, the first-seen suit still decides suited_high_cards."""
+        hearts_first = analyze_four_cards(make_hand("Ah 2h Kd Qd"))
+        diamonds_first = analyze_four_cards(make_hand("Kd Qd Ah 2h"))
+        assert hearts_first.suited_high_cards == 1
+        assert diamonds_first.suited_high_cards == 2
+
+    def test_three_card_cache_is_bounded(self) -> None:
+        """All 22,100 3-card hands reduce to at most 2,483 cached classes."""
+        analyses = {
+            id(analyze_three_card_codes(codes)) for codes in combinations(range(52), 3)
+        }
+        assert len(analyses) <= 2_483
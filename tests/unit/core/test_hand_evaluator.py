@@ -1,14 +1,17 @@
 """Unit tests for five-card hand evaluation."""
 
 import time
+from itertools import combinations
 
 import pytest
 
-from let_it_ride.core.card import Card, Rank, Suit
+from let_it_ride.core.card import CARD_BY_CODE, Card, Rank, Suit, card_to_int
 from let_it_ride.core.hand_evaluator import (
     FiveCardHandRank,
     HandResult,
     evaluate_five_card_hand,
+    evaluate_five_card_rank,
+    evaluate_five_card_rank_codes,
 )
 from tests.fixtures.hand_samples import (
     ALL_HAND_SAMPLES,
@@ -526,3 +529,92 @@ class TestPerformance:
         assert (
             elapsed < 2.0
         ), f"Target <1s, got {elapsed:.3f}s for {total_evaluated} hands"
+
+
+class TestEvaluateFiveCardRank:
+    """Tests for the lookup-table rank evaluator."""
+
+    @pytest.mark.parametrize("hand,expected_rank,expected_primary", ALL_HAND_SAMPLES)
+    def test_all_samples(
+        self,
+        hand: list[Card],
+        expected_rank: FiveCardHandRank,
+        expected_primary: tuple[Rank, ...],
+    ) -> None:
+        """All sample hands should map to the same rank as the full evaluator."""
+        del expected_primary  # Rank-only evaluator
+        assert evaluate_five_card_rank(hand) == expected_rank
+
+    def test_card_order_does_not_matter(self) -> None:
+        """Rank should be independent of card order."""
+        hand = make_hand("Ah Kh Qh Jh Th")
+        assert evaluate_five_card_rank(hand) == FiveCardHandRank.ROYAL_FLUSH
+        assert evaluate_five_card_rank(hand[::-1]) == FiveCardHandRank.ROYAL_FLUSH
+
+    def test_steel_wheel_is_straight_flush(self) -> None:
+        """A-2-3-4-5 suited is a straight flush, not a royal flush."""
+        hand = make_hand("Ah 2h 3h 4h 5h")
+        assert evaluate_five_card_rank(hand) == FiveCardHandRank.STRAIGHT_FLUSH
+
+    def test_accepts_tuple(self) -> None:
+        """Evaluator should accept any sequence of cards."""
+        hand = tuple(make_hand("Ts Td 4c 7h 9s"))
+        assert evaluate_five_card_rank(hand) == FiveCardHandRank.PAIR_TENS_OR_BETTER
+
+    def test_wrong_card_count_raises(self) -> None:
+        """Non-five-card input should raise ValueError."""
+        with pytest.raises(ValueError, match="Expected 5 cards, got 4"):
+            evaluate_five_card_rank(make_hand("Ah Kh Qh Jh"))
+        with pytest.raises(ValueError, match="Expected 5 cards, got 6"):
+            evaluate_five_card_rank(make_hand("Ah Kh Qh Jh Th 9h"))
+
+    def test_impossible_hand_raises(self) -> None:
+        """Duplicates that form an impossible hand should raise ValueError."""
+        ace = Card(Rank.ACE, Suit.SPADES)
+        with pytest.raises(ValueError, match="Duplicate cards"):
+            evaluate_five_card_rank([ace] * 5)
+
+    @pytest.mark.slow
+    def test_matches_full_evaluator_on_all_hands(self) -> None:
+        """Lookup evaluator must match evaluate_five_card_hand on all 2,598,960 hands."""
+        all_cards = [Card(rank, suit) for suit in Suit for rank in Rank]
+
+        mismatches = 0
+        total = 0
+        for hand in combinations(all_cards, 5):
+            total += 1
+            if evaluate_five_card_rank(hand) != evaluate_five_card_hand(hand).rank:
+                mismatches += 1
+
+        assert total == 2_598_960
+        assert mismatches == 0
+
+
+class TestEvaluateFiveCardRankCodes:
+    """Tests for the integer-code lookup evaluator."""
+
+    @pytest.mark.parametrize("hand,expected_rank,expected_primary", ALL_HAND_SAMPLES)
+    def test_all_samples(
+        self,
+        hand: list[Card],
+        expected_rank: FiveCardHandRank,
+        expected_primary: tuple[Rank, ...],
+    ) -> None:
+        """Code evaluation matches the expected rank for all samples."""
+        del expected_primary  # Rank-only evaluator
+        codes = [card_to_int(card) for card in hand]
+        assert evaluate_five_card_rank_codes(codes) == expected_rank
+
+    def test_wrong_count_raises(self) -> None:
+        """Code evaluation validates the card count."""
+        with pytest.raises(ValueError, match="Expected 5 cards, got 4"):
+            evaluate_five_card_rank_codes([0, 1, 2, 3])
+
+    @pytest.mark.slow
+    def test_matches_card_evaluator_on_all_hands(self) -> None:
+        """Code evaluation must match evaluate_five_card_rank on all hands."""
+        for codes in combinations(range(52), 5):
+            cards = [CARD_BY_CODE[code] for code in codes]
+            assert evaluate_five_card_rank_codes(codes) == evaluate_five_card_rank(
+                cards
+            )
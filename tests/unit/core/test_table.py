@@ -13,6 +13,7 @@ from let_it_ride.config.paytables import (
 )
 from let_it_ride.core.deck import Deck
 from let_it_ride.core.game_engine import GameEngine
+from let_it_ride.core.hand_evaluator import evaluate_five_card_rank
 from let_it_ride.core.table import Table
 from let_it_ride.strategy.base import StrategyContext
 from let_it_ride.strategy.basic import BasicStrategy
@@ -435,6 +436,37 @@ class TestTableReproducibility:
             assert seat1.final_hand_rank == seat2.final_hand_rank
             assert seat1.net_result == seat2.net_result
 
+    def test_rank_evaluator_selection_matches_default(
+        self,
+        basic_setup: tuple[Deck, BasicStrategy, MainGamePaytable],
+    ) -> None:
+        """Verify the lookup-table evaluator produces identical round results."""
+        deck1, strategy, paytable = basic_setup
+        table_config = TableConfig(num_seats=6)
+
+        default_table = Table(
+            deck1,
+            strategy,
+            paytable,
+            None,
+            random.Random(777),
+            table_config=table_config,
+        )
+        lookup_table = Table(
+            Deck(),
+            strategy,
+            paytable,
+            None,
+            random.Random(777),
+            table_config=table_config,
+            rank_evaluator=evaluate_five_card_rank,
+        )
+
+        for round_id in range(50):
+            result1 = default_table.play_round(round_id=round_id, base_bet=5.0)
+            result2 = lookup_table.play_round(round_id=round_id, base_bet=5.0)
+            assert result1 == result2
+
 
 class TestTableDeckUsage:
     """Tests for correct deck usage in Table."""
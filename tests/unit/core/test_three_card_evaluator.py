@@ -1,13 +1,17 @@
 """Unit tests for three-card hand evaluation (bonus bet)."""
 
+from collections import Counter
 from itertools import combinations
 
 import pytest
 
-from let_it_ride.core.card import Card, Rank, Suit
+from let_it_ride.core.card import CARD_BY_CODE, Card, Rank, Suit
 from let_it_ride.core.three_card_evaluator import (
+    THREE_CARD_HAND_RANKS,
     ThreeCardHandRank,
     evaluate_three_card_hand,
+    evaluate_three_card_hand_codes,
+    three_card_hand_index,
 )
 from tests.fixtures.three_card_samples import (
     ALL_THREE_CARD_SAMPLES,
@@ -378,3 +382,55 @@ class TestProbabilityValidation:
         # C(52,3) = 52! / (3! * 49!) = 52 * 51 * 50 / 6 = 22100
         expected = 52 * 51 * 50 // 6
         assert expected == 22100
+
+
+class TestEvaluateThreeCardHandCodes:
+    """Integer-code evaluation must match the Card-based evaluator."""
+
+    def test_all_combinations_match(self) -> None:
+        """Every 3-card combination evaluates identically as codes."""
+        for codes in combinations(range(52), 3):
+            cards = [CARD_BY_CODE[code] for code in codes]
+            assert evaluate_three_card_hand_codes(codes) == evaluate_three_card_hand(
+                cards
+            )
+
+    def test_wrong_count_raises(self) -> None:
+        """Code-based evaluation validates the card count."""
+        with pytest.raises(ValueError, match="Expected 3 cards, got 2"):
+            evaluate_three_card_hand_codes([0, 1])
+
+
+class TestThreeCardHandIndex:
+    """Tests for the combinatorial hand index and precomputed rank table."""
+
+    def test_index_is_bijection(self) -> None:
+        """Every 3-card combination maps to a distinct index in 0..22,099."""
+        indices = {three_card_hand_index(codes) for codes in combinations(range(52), 3)}
+        assert indices == set(range(22_100))
+
+    def test_index_ignores_card_order(self) -> None:
+        """Permutations of the same hand share one index."""
+        assert (
+            three_card_hand_index((40, 3, 17))
+            == three_card_hand_index((3, 17, 40))
+            == three_card_hand_index((17, 40, 3))
+        )
+
+    def test_first_and_last_index(self) -> None:
+        """The lowest and highest codes bound the index range."""
+        assert three_card_hand_index((0, 1, 2)) == 0
+        assert three_card_hand_index((49, 50, 51)) == 22_099
+
+    def test_table_distribution(self) -> None:
+        """The precomputed table has the exact 3-card hand distribution."""
+        counts = Counter(THREE_CARD_HAND_RANKS)
+
+        assert len(THREE_CARD_HAND_RANKS) == 22_100
+        assert counts[ThreeCardHandRank.MINI_ROYAL] == 4
+        assert counts[ThreeCardHandRank.STRAIGHT_FLUSH] == 44
+        assert counts[ThreeCardHandRank.THREE_OF_A_KIND] == 52
+        assert counts[ThreeCardHandRank.STRAIGHT] == 720
+        assert counts[ThreeCardHandRank.FLUSH] == 1096
+        assert counts[ThreeCardHandRank.PAIR] == 3744
+        assert counts[ThreeCardHandRank.HIGH_CARD] == 16440
@@ -0,0 +1,180 @@
+"""Unit tests for mergeable online accumulators."""
+
+import math
+import pickle
+import statistics
+
+import numpy as np
+import pytest
+from scipy import stats
+
+from let_it_ride.simulation.accumulators import (
+    ExactSum,
+    QuantileSketch,
+    RunningMoments,
+)
+
+
+@pytest.fixture
+def values() -> np.ndarray:
+    """Skewed sample resembling session profits."""
+    rng = np.random.default_rng(17)
+    return np.round(rng.gamma(2.0, 40.0, size=5_000) - 100.0, 2)
+
+
+class TestExactSum:
+    """Tests for ExactSum."""
+
+    def test_rounds_once(self) -> None:
+        """The sum should be the exact sum rounded once, like math.fsum."""
+        values = [0.1] * 10 + [1e16, 1.0, -1e16]
+        total = ExactSum()
+        for value in values:
+            total.add(value)
+
+        assert total.value == math.fsum(values)
+        assert total.value != sum(values)
+
+    def test_order_and_batching_do_not_matter(self, values: np.ndarray) -> None:
+        """Any split and merge order should give an identical sum."""
+        forward = ExactSum()
+        forward.add_array(values)
+        backward = ExactSum()
+        for chunk in reversed(np.array_split(values, 9)):
+            part = ExactSum()
+            for value in reversed(chunk.tolist()):
+                part.add(value)
+            backward.merge(part)
+
+        assert backward == forward
+        assert pickle.dumps(backward) == pickle.dumps(forward)
+        assert forward.value == math.fsum(values.tolist())
+        assert ExactSum().value == 0.0
+
+
+class TestRunningMoments:
+    """Tests for RunningMoments."""
+
+    def test_matches_reference_statistics(self, values: np.ndarray) -> None:
+        """Moments should match statistics and scipy on the same data."""
+        moments = RunningMoments()
+        for value in values.tolist():
+            moments.add(value)
+
+        assert moments.count == len(values)
+        assert moments.mean == pytest.approx(statistics.mean(values.tolist()))
+        assert moments.std == pytest.approx(statistics.stdev(values.tolist()))
+        assert moments.skewness == pytest.approx(stats.skew(values, bias=False))
+        assert moments.kurtosis == pytest.approx(stats.kurtosis(values, bias=False))
+        assert moments.min == values.min()
+        assert moments.max == values.max()
+
+    def test_merge_matches_single_pass(self, values: np.ndarray) -> None:
+        """Merging partial moments should equal one accumulator over all data."""
+        whole = RunningMoments.from_values(values)
+        merged = RunningMoments()
+        for chunk in np.array_split(values, 7):
+            part = RunningMoments()
+            part.add_array(chunk)
+            merged.merge(part)
+
+        assert merged.count == whole.count
+        assert merged.mean == pytest.approx(whole.mean)
+        assert merged.variance == pytest.approx(whole.variance)
+        assert merged.skewness == pytest.approx(whole.skewness)
+        assert merged.kurtosis == pytest.approx(whole.kurtosis)
+
+    def test_merge_order_does_not_matter(self, values: np.ndarray) -> None:
+        """Partial moments merged in any order should be bit-identical."""
+        whole = RunningMoments.from_values(values)
+        merged = RunningMoments()
+        for chunk in reversed(np.array_split(values, 13)):
+            merged.merge(RunningMoments.from_values(chunk))
+
+        assert merged == whole
+        assert pickle.dumps(merged) == pickle.dumps(whole)
+        assert whole.mean == statistics.mean(values.tolist())
+        assert whole.variance == statistics.variance(values.tolist())
+
+    def test_empty_and_small(self) -> None:
+        """Undefined statistics should be reported as zero."""
+        moments = RunningMoments()
+        assert (moments.count, moments.mean, moments.std) == (0, 0.0, 0.0)
+        assert (moments.min, moments.max) == (0.0, 0.0)
+        moments.add(5.0)
+        assert moments.std == 0.0
+        assert moments.skewness == 0.0
+        assert moments.kurtosis == 0.0
+
+
+class TestQuantileSketch:
+    """Tests for QuantileSketch."""
+
+    @pytest.mark.parametrize("q", [0.01, 0.1, 0.25, 0.5, 0.75, 0.9, 0.99])
+    def test_relative_error_bound(self, values: np.ndarray, q: float) -> None:
+        """Estimates should be within the relative accuracy of the exact value."""
+        sketch = QuantileSketch.from_values(values, relative_accuracy=0.01)
+        exact = float(np.sort(values)[int(np.floor(q * (len(values) - 1)))])
+
+        assert abs(sketch.quantile(q) - exact) <= 0.01 * abs(exact) + 1e-12
+
+    def test_merge_equals_single_sketch(self, values: np.ndarray) -> None:
+        """Merged sketches should be identical to one sketch of all values."""
+        whole = QuantileSketch.from_values(values)
+        merged = QuantileSketch()
+        for chunk in np.array_split(values, 5):
+            merged.merge(QuantileSketch.from_values(chunk))
+
+        assert merged == whole
+        assert merged.count == len(values)
+
+    def test_scalar_and_array_updates_agree(self, values: np.ndarray) -> None:
+        """Adding values one by one should equal adding the array."""
+        scalar = QuantileSketch()
+        for value in values.tolist():
+            scalar.add(value)
+        assert scalar == QuantileSketch.from_values(values)
+
+    def test_zero_and_extremes(self) -> None:
+        """Zeros are kept exactly and the extremes are the observed values."""
+        sketch = QuantileSketch.from_values([-50.0, 0.0, 0.0, 0.0, 75.0])
+        assert sketch.quantile(0.5) == 0.0
+        assert sketch.quantile(0.0) == -50.0
+        assert sketch.quantile(1.0) == 75.0
+        assert sketch.num_buckets == 3
+
+    def test_memory_is_bounded(self) -> None:
+        """The number of buckets should not grow with the number of values."""
+        rng = np.random.default_rng(3)
+        sketch = QuantileSketch()
+        for _ in range(20):
+            sketch.add_array(rng.normal(0.0, 100.0, size=50_000).round())
+        assert sketch.count == 1_000_000
+        assert sketch.num_buckets < 10_000
+
+    def test_pickle_round_trip(self, values: np.ndarray) -> None:
+        """Sketches should survive pickling for transfer between processes."""
+        sketch = QuantileSketch.from_values(values)
+        assert pickle.loads(pickle.dumps(sketch)) == sketch
+
+    def test_validation(self) -> None:
+        """Invalid parameters should raise ValueError."""
+        with pytest.raises(ValueError, match="relative_accuracy"):
+            QuantileSketch(relative_accuracy=0.0)
+        with pytest.raises(ValueError, match="q must be between"):
+            QuantileSketch().quantile(1.5)
+        with pytest.raises(ValueError, match="different relative accuracies"):
+            QuantileSketch(0.01).merge(QuantileSketch(0.02))
+        assert QuantileSketch().quantile(0.5) == 0.0
+
+    def test_count_below(self) -> None:
+        """Threshold counts should respect signs and inclusivity."""
+        sketch = QuantileSketch.from_values([-100.0, -50.0, -50.0, 0.0, 25.0, 80.0])
+        assert sketch.count_below(0.0) == 3
+        assert sketch.count_below(0.0, inclusive=True) == 4
+        assert sketch.count_below(-50.0) == 1
+        assert sketch.count_below(-50.0, inclusive=True) == 3
+        assert sketch.count_below(-200.0) == 0
+        assert sketch.count_below(80.0) == 5
+        assert sketch.count_below(80.0, inclusive=True) == 6
+        assert QuantileSketch().count_below(1.0) == 0
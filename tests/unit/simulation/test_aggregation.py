@@ -1,12 +1,16 @@
 """Tests for simulation results aggregation."""
 
+from dataclasses import replace
+
 import pytest
 
 from let_it_ride.simulation.aggregation import (
+    AggregateAccumulator,
     aggregate_results,
     aggregate_with_hand_frequencies,
     merge_aggregates,
 )
+from let_it_ride.simulation.result_table import SessionResultTable
 from let_it_ride.simulation.session import SessionOutcome, SessionResult, StopReason
 
 
@@ -792,3 +796,165 @@ class TestReviewFindings:
         assert stats.total_sessions == 10000
         assert stats.total_hands == 1000000  # 10000 * 100
         assert elapsed < 1.0  # Should complete in under 1 second
+
+
+class TestStreamingAggregation:
+    """Tests for AggregateAccumulator and merging streamed aggregates."""
+
+    @staticmethod
+    def _results(count: int, offset: int = 0) -> list[SessionResult]:
+        """Create sessions with a spread of profits."""
+        results = []
+        for i in range(count):
+            profit = float(((i + offset) * 37) % 401 - 200)
+            outcome = (
+                SessionOutcome.WIN
+                if profit > 0
+                else SessionOutcome.LOSS
+                if profit < 0
+                else SessionOutcome.PUSH
+            )
+            results.append(
+                create_session_result(outcome=outcome, session_profit=profit)
+            )
+        return results
+
+    def test_streaming_matches_exact(self) -> None:
+        """Streaming statistics should match exact ones within sketch accuracy."""
+        results = self._results(1000)
+        accumulator = AggregateAccumulator()
+        accumulator.add_results(results)
+        streamed = accumulator.to_statistics()
+        exact = aggregate_results(results)
+
+        assert streamed.session_profits == ()
+        assert not streamed.is_exact
+        assert exact.is_exact
+        assert streamed.total_sessions == exact.total_sessions
+        assert streamed.winning_sessions == exact.winning_sessions
+        assert streamed.net_result == pytest.approx(exact.net_result)
+        assert streamed.session_profit_mean == pytest.approx(exact.session_profit_mean)
+        assert streamed.session_profit_std == pytest.approx(exact.session_profit_std)
+        assert streamed.session_profit_min == exact.session_profit_min
+        assert streamed.session_profit_max == exact.session_profit_max
+        assert streamed.session_profit_median == pytest.approx(
+            exact.session_profit_median, rel=0.01, abs=1.0
+        )
+
+    def test_merge_streamed_aggregates(self) -> None:
+        """Merging streamed aggregates should match streaming everything at once."""
+        first, second = self._results(600), self._results(400, offset=600)
+        parts = []
+        for chunk in (first, second):
+            accumulator = AggregateAccumulator()
+            accumulator.add_results(chunk)
+            parts.append(accumulator.to_statistics())
+        whole = AggregateAccumulator()
+        whole.add_results(first + second)
+        expected = whole.to_statistics()
+
+        merged = merge_aggregates(parts[0], parts[1])
+        assert merged.session_profits == ()
+        assert merged.total_sessions == 1000
+        assert merged.session_profit_mean == pytest.approx(expected.session_profit_mean)
+        assert merged.session_profit_std == pytest.approx(expected.session_profit_std)
+        assert merged.session_profit_median == expected.session_profit_median
+
+    def test_merge_exact_with_streamed_drops_profits(self) -> None:
+        """Merging an exact aggregate with a streamed one keeps no raw profits."""
+        exact = aggregate_results(self._results(10))
+        accumulator = AggregateAccumulator()
+        accumulator.add_results(self._results(10, offset=10))
+
+        merged = merge_aggregates(exact, accumulator.to_statistics())
+        assert merged.session_profits == ()
+        assert merged.total_sessions == 20
+
+    def test_accumulator_merge_and_exact_mode(self) -> None:
+        """Merged exact accumulators should equal aggregate_results."""
+        results = self._results(50)
+        left = AggregateAccumulator(exact_profits=True)
+        right = AggregateAccumulator(exact_profits=True)
+        left.add_results(results[:20])
+        right.add_results(results[20:])
+        left.merge(right)
+
+        stats = left.to_statistics()
+        expected = aggregate_results(results)
+        assert left.total_sessions == 50
+        assert stats.session_profits == expected.session_profits
+        assert stats.session_profit_median == expected.session_profit_median
+        assert stats.session_profit_std == pytest.approx(expected.session_profit_std)
+
+    def test_empty_accumulator_raises(self) -> None:
+        """An accumulator without sessions cannot produce statistics."""
+        with pytest.raises(ValueError):
+            AggregateAccumulator().to_statistics()
+
+    def test_stop_reason_and_seat_tallies_merge(self) -> None:
+        """Stop reasons and seat tallies should survive merging accumulators."""
+        results = [
+            replace(
+                result,
+                stop_reason=StopReason.WIN_LIMIT
+                if i % 3 == 0
+                else StopReason.MAX_HANDS,
+                seat_number=i % 2 + 1,
+            )
+            for i, result in enumerate(self._results(30))
+        ]
+        left = AggregateAccumulator()
+        right = AggregateAccumulator()
+        left.add_results(results[:11])
+        right.add_results(results[11:])
+        left.merge(right)
+
+        assert left.stop_reason_counts == {
+            StopReason.WIN_LIMIT: 10,
+            StopReason.MAX_HANDS: 20,
+        }
+        assert left.total_hands == 30 * 100
+        seats = left.seat_aggregations
+        assert sorted(seats) == [1, 2]
+        for seat in (1, 2):
+            seat_results = [r for r in results if r.seat_number == seat]
+            assert seats[seat].wins == sum(
+                r.outcome == SessionOutcome.WIN for r in seat_results
+            )
+            assert seats[seat].pushes == sum(
+                r.outcome == SessionOutcome.PUSH for r in seat_results
+            )
+            assert seats[seat].total_profit == pytest.approx(
+                sum(r.session_profit for r in seat_results)
+            )
+
+    def test_table_matches_list(self) -> None:
+        """Column-wise aggregation of a table should match the row path."""
+        results = [
+            replace(result, seat_number=i % 3 + 1)
+            for i, result in enumerate(self._results(200))
+        ]
+        expected = AggregateAccumulator(exact_profits=True)
+        expected.add_results(results)
+        accumulator = AggregateAccumulator(exact_profits=True)
+        accumulator.add_results(SessionResultTable.from_results(results))
+        stats = accumulator.to_statistics()
+        expected_stats = expected.to_statistics()
+
+        assert stats.session_profits == expected_stats.session_profits
+        assert stats.winning_sessions == expected_stats.winning_sessions
+        assert stats.push_sessions == expected_stats.push_sessions
+        assert stats.total_hands == expected_stats.total_hands
+        assert stats.net_result == pytest.approx(expected_stats.net_result)
+        assert stats.main_wagered == pytest.approx(expected_stats.main_wagered)
+        assert stats.session_profit_median == expected_stats.session_profit_median
+        assert stats.profit_sketch == expected_stats.profit_sketch
+        assert accumulator.stop_reason_counts == expected.stop_reason_counts
+        seats = accumulator.seat_aggregations
+        for seat, tally in expected.seat_aggregations.items():
+            assert (seats[seat].wins, seats[seat].losses, seats[seat].pushes) == (
+                tally.wins,
+                tally.losses,
+                tally.pushes,
+            )
+            assert seats[seat].total_profit == pytest.approx(tally.total_profit)
@@ -0,0 +1,167 @@
+"""Unit tests for simulation checkpoints."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from let_it_ride.config.models import FullConfig, SimulationConfig
+from let_it_ride.simulation.aggregation import AggregateAccumulator
+from let_it_ride.simulation.checkpoint import SimulationCheckpoint, config_fingerprint
+from let_it_ride.simulation.result_table import SessionResultTable
+from let_it_ride.simulation.rng import RNGManager
+from let_it_ride.simulation.session import SessionOutcome, SessionResult, StopReason
+
+
+def create_config(num_sessions: int = 10, random_seed: int | None = 42) -> FullConfig:
+    """Create a configuration with the given session count and seed."""
+    return FullConfig(
+        simulation=SimulationConfig(num_sessions=num_sessions, random_seed=random_seed)
+    )
+
+
+def create_results(count: int) -> list[SessionResult]:
+    """Create sessions with distinct profits."""
+    return [
+        SessionResult(
+            outcome=SessionOutcome.WIN if i % 2 else SessionOutcome.LOSS,
+            stop_reason=StopReason.MAX_HANDS,
+            hands_played=10 + i,
+            starting_bankroll=500.0,
+            final_bankroll=500.0 + (i if i % 2 else -i),
+            session_profit=float(i if i % 2 else -i),
+            total_wagered=150.0,
+            total_bonus_wagered=0.0,
+            peak_bankroll=510.0,
+            max_drawdown=5.0,
+            max_drawdown_pct=0.01,
+        )
+        for i in range(count)
+    ]
+
+
+class TestSimulationCheckpoint:
+    """Tests for SimulationCheckpoint."""
+
+    def test_start_creates_manifest(self, tmp_path: Path) -> None:
+        """Starting a new checkpoint should write a manifest with no progress."""
+        checkpoint = SimulationCheckpoint(tmp_path / "checkpoint")
+        assert not checkpoint.exists
+
+        rng_manager = checkpoint.start(create_config(), "sessions")
+
+        assert checkpoint.exists
+        assert checkpoint.completed_sessions == 0
+        assert rng_manager.create_session_seeds(5) == RNGManager(
+            base_seed=42
+        ).create_session_seeds(5)
+
+    def test_unseeded_run_keeps_its_seed(self, tmp_path: Path) -> None:
+        """A resumed unseeded run should draw the same session seeds."""
+        config = create_config(random_seed=None)
+        first = SimulationCheckpoint(tmp_path).start(config, "sessions")
+        resumed = SimulationCheckpoint(tmp_path).start(config, "sessions")
+
+        assert first.base_seed == resumed.base_seed
+        assert first.create_session_seeds(20) == resumed.create_session_seeds(20)
+
+    def test_rows_round_trip(self, tmp_path: Path) -> None:
+        """Saved rows should load back in order across several saves."""
+        results = create_results(9)
+        checkpoint = SimulationCheckpoint(tmp_path)
+        checkpoint.start(create_config(), "sessions")
+        checkpoint.save_rows(SessionResultTable.from_results(results[:4]), 4)
+        checkpoint.save_rows(SessionResultTable.from_results(results[4:]), 9)
+
+        resumed = SimulationCheckpoint(tmp_path)
+        resumed.start(create_config(), "sessions")
+
+        assert resumed.completed_sessions == 9
+        assert list(resumed.load_rows()) == results
+
+    def test_aggregate_round_trip(self, tmp_path: Path) -> None:
+        """The saved aggregate should load back equal."""
+        aggregate = AggregateAccumulator()
+        aggregate.add_results(create_results(6))
+        checkpoint = SimulationCheckpoint(tmp_path)
+        checkpoint.start(create_config(), "aggregate")
+        assert checkpoint.load_aggregate() is None
+        checkpoint.save_aggregate(aggregate, 6)
+
+        resumed = SimulationCheckpoint(tmp_path)
+        resumed.start(create_config(), "aggregate")
+        loaded = resumed.load_aggregate()
+
+        assert resumed.completed_sessions == 6
+        assert loaded is not None
+        assert loaded.to_statistics() == aggregate.to_statistics()
+
+    def test_crash_before_manifest_keeps_previous_aggregate(
+        self, tmp_path: Path
+    ) -> None:
+        """An aggregate saved without its manifest should not be resumed."""
+        results = create_results(9)
+        first = AggregateAccumulator()
+        first.add_results(results[:4])
+        second = AggregateAccumulator()
+        second.add_results(results)
+        checkpoint = SimulationCheckpoint(tmp_path)
+        checkpoint.start(create_config(), "aggregate")
+        checkpoint.save_aggregate(first, 4)
+
+        # Kill the run between writing the aggregate and the manifest
+        with (
+            patch.object(
+                SimulationCheckpoint, "_write_manifest", side_effect=KeyboardInterrupt
+            ),
+            pytest.raises(KeyboardInterrupt),
+        ):
+            checkpoint.save_aggregate(second, 9)
+
+        resumed = SimulationCheckpoint(tmp_path)
+        resumed.start(create_config(), "aggregate")
+        loaded = resumed.load_aggregate()
+
+        assert resumed.completed_sessions == 4
+        assert loaded is not None
+        assert loaded.to_statistics() == first.to_statistics()
+
+        resumed.save_aggregate(second, 9)
+
+        assert sorted(path.name for path in tmp_path.glob("aggregate-*")) == [
+            "aggregate-9.pkl"
+        ]
+
+    def test_rejects_other_config_and_mode(self, tmp_path: Path) -> None:
+        """Resuming with a different configuration or mode should fail."""
+        SimulationCheckpoint(tmp_path).start(create_config(), "sessions")
+
+        with pytest.raises(ValueError, match="different configuration"):
+            SimulationCheckpoint(tmp_path).start(create_config(20), "sessions")
+        with pytest.raises(ValueError, match="holds sessions results"):
+            SimulationCheckpoint(tmp_path).start(create_config(), "aggregate")
+
+    def test_fingerprint_ignores_output(self) -> None:
+        """Only settings that change the sessions should affect the fingerprint."""
+        config = create_config()
+        moved = config.model_copy(
+            update={"output": config.output.model_copy(update={"directory": "/x"})}
+        )
+
+        assert config_fingerprint(moved) == config_fingerprint(config)
+        assert config_fingerprint(create_config(11)) != config_fingerprint(config)
+
+    def test_clear_and_due(self, tmp_path: Path) -> None:
+        """clear() should remove the checkpoint; due() should follow the interval."""
+        checkpoint = SimulationCheckpoint(tmp_path, interval_seconds=3600)
+        checkpoint.start(create_config(), "sessions")
+        checkpoint.save_rows(SessionResultTable.from_results(create_results(2)), 2)
+        assert not checkpoint.due()
+        assert SimulationCheckpoint(tmp_path, interval_seconds=0).due()
+
+        checkpoint.clear()
+
+        assert not checkpoint.exists
+        assert list(tmp_path.iterdir()) == []
+        with pytest.raises(ValueError, match="interval_seconds"):
+            SimulationCheckpoint(tmp_path, interval_seconds=-1)
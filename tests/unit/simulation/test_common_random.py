@@ -0,0 +1,205 @@
+"""Unit tests for the common-random-numbers runner."""
+
+import random
+
+import pytest
+
+from let_it_ride.config.models import (
+    BankrollConfig,
+    BettingSystemConfig,
+    BonusStrategyConfig,
+    DealerConfig,
+    FullConfig,
+    SimulationConfig,
+    StaticBonusConfig,
+    StopConditionsConfig,
+    StrategyConfig,
+    TableConfig,
+)
+from let_it_ride.config.paytables import bonus_paytable_a, standard_main_paytable
+from let_it_ride.core.deck import Deck
+from let_it_ride.core.game_engine import GameEngine
+from let_it_ride.simulation import SimulationController
+from let_it_ride.simulation.common_random import (
+    SharedDealEngine,
+    SharedDealer,
+    run_common_random_sessions,
+)
+from let_it_ride.strategy import AlwaysRideStrategy, BasicStrategy
+
+
+def create_config(
+    strategy_type: str = "basic",
+    betting_type: str = "flat",
+    bonus_ratio: float | None = None,
+    num_sessions: int = 20,
+    random_seed: int | None = 7,
+) -> FullConfig:
+    """Create a small single-seat configuration."""
+    betting_system = (
+        BettingSystemConfig(type="martingale", martingale={"max_progressions": 4})
+        if betting_type == "martingale"
+        else BettingSystemConfig(type="flat")
+    )
+    bonus_strategy = (
+        BonusStrategyConfig(
+            enabled=True,
+            type="static",
+            static=StaticBonusConfig(amount=None, ratio=bonus_ratio),
+        )
+        if bonus_ratio is not None
+        else BonusStrategyConfig(enabled=False)
+    )
+    return FullConfig(
+        simulation=SimulationConfig(
+            num_sessions=num_sessions,
+            hands_per_session=60,
+            random_seed=random_seed,
+        ),
+        bankroll=BankrollConfig(
+            starting_amount=500.0,
+            base_bet=5.0,
+            stop_conditions=StopConditionsConfig(win_limit=100.0, loss_limit=200.0),
+            betting_system=betting_system,
+        ),
+        strategy=StrategyConfig(type=strategy_type),
+        bonus_strategy=bonus_strategy,
+    )
+
+
+class TestSharedDealEngine:
+    """Tests for SharedDealer and SharedDealEngine."""
+
+    def test_matches_game_engine(self) -> None:
+        """Engines sharing a dealer should settle hands like GameEngine."""
+        main_paytable = standard_main_paytable()
+        bonus_paytable = bonus_paytable_a()
+        dealer = SharedDealer(Deck(), random.Random(3), DealerConfig())
+        shared_engines = [
+            SharedDealEngine(dealer, strategy, main_paytable, bonus_paytable)
+            for strategy in (BasicStrategy(), AlwaysRideStrategy())
+        ]
+        game_engines = [
+            GameEngine(
+                Deck(),
+                strategy,
+                main_paytable,
+                bonus_paytable,
+                random.Random(3),
+                compact_cards=True,
+            )
+            for strategy in (BasicStrategy(), AlwaysRideStrategy())
+        ]
+
+        for hand_id in range(200):
+            dealer.deal()
+            for shared, game in zip(shared_engines, game_engines, strict=True):
+                assert shared.play_hand(hand_id, 5.0, 1.0) == game.play_hand(
+                    hand_id, 5.0, 1.0
+                )
+
+    def test_requires_dealt_hand(self) -> None:
+        """Playing before the first deal should raise RuntimeError."""
+        dealer = SharedDealer(Deck(), random.Random(1), DealerConfig())
+        engine = SharedDealEngine(
+            dealer, BasicStrategy(), standard_main_paytable(), None
+        )
+        with pytest.raises(RuntimeError, match="No hand has been dealt"):
+            engine.play_hand(0, 5.0)
+
+    def test_validates_bets(self) -> None:
+        """Invalid bets should raise ValueError like GameEngine."""
+        dealer = SharedDealer(Deck(), random.Random(1), DealerConfig())
+        dealer.deal()
+        engine = SharedDealEngine(
+            dealer, BasicStrategy(), standard_main_paytable(), None
+        )
+        with pytest.raises(ValueError, match="base_bet must be positive"):
+            engine.play_hand(0, 0.0)
+        with pytest.raises(ValueError, match="bonus_paytable"):
+            engine.play_hand(0, 5.0, 1.0)
+
+
+class TestRunCommonRandomSessions:
+    """Tests for run_common_random_sessions()."""
+
+    def test_single_variant_matches_controller(self) -> None:
+        """One variant should reproduce the sequential controller exactly."""
+        config = create_config(bonus_ratio=0.2)
+
+        (results,) = run_common_random_sessions([config])
+        expected = SimulationController(config).run()
+
+        assert results.session_results == expected.session_results
+        assert results.total_hands == expected.total_hands
+        assert results.config is config
+
+    def test_variants_match_their_own_runs(self) -> None:
+        """Each variant should match its standalone run on the same seed."""
+        configs = [
+            create_config(),
+            create_config(strategy_type="always_ride"),
+            create_config(betting_type="martingale"),
+            create_config(bonus_ratio=0.2),
+        ]
+
+        results = run_common_random_sessions(configs)
+
+        assert len(results) == len(configs)
+        for config, variant in zip(configs, results, strict=True):
+            expected = SimulationController(config).run()
+            assert variant.session_results == expected.session_results
+
+    def test_identical_variants_identical_results(self) -> None:
+        """Duplicated configurations should see exactly the same sessions."""
+        first, second = run_common_random_sessions(
+            [create_config(random_seed=None), create_config(random_seed=None)]
+        )
+        assert first.session_results == second.session_results
+
+    def test_progress_callback(self) -> None:
+        """Progress should be reported once per session for all variants."""
+        calls: list[tuple[int, int]] = []
+        run_common_random_sessions(
+            [
+                create_config(num_sessions=5),
+                create_config(strategy_type="always_ride", num_sessions=5),
+            ],
+            progress_callback=lambda done, total: calls.append((done, total)),
+        )
+        assert calls == [(i, 5) for i in range(1, 6)]
+
+    def test_rejects_incompatible_configs(self) -> None:
+        """Configurations that would deal different cards should be rejected."""
+        base = create_config()
+        with pytest.raises(ValueError, match="At least one"):
+            run_common_random_sessions([])
+        with pytest.raises(ValueError, match="num_sessions"):
+            run_common_random_sessions([base, create_config(num_sessions=10)])
+        with pytest.raises(ValueError, match="random_seed"):
+            run_common_random_sessions([base, create_config(random_seed=8)])
+        with pytest.raises(ValueError, match="dealer"):
+            run_common_random_sessions(
+                [
+                    base,
+                    base.model_copy(
+                        update={"dealer": DealerConfig(discard_enabled=True)}
+                    ),
+                ]
+            )
+        with pytest.raises(ValueError, match="single seat"):
+            run_common_random_sessions(
+                [base.model_copy(update={"table": TableConfig(num_seats=2)})]
+            )
+        with pytest.raises(ValueError, match="hand_model"):
+            run_common_random_sessions(
+                [
+                    base.model_copy(
+                        update={
+                            "simulation": base.simulation.model_copy(
+                                update={"hand_model": "sampled"}
+                            )
+                        }
+                    )
+                ]
+            )
@@ -0,0 +1,52 @@
+"""Unit tests for distributed execution helpers."""
+
+import pytest
+
+from let_it_ride.simulation.distributed import (
+    DistributedExecutor,
+    _default_chunk_size,
+    parse_address,
+)
+
+
+class TestParseAddress:
+    """Tests for parse_address."""
+
+    def test_tcp_and_unix_addresses(self) -> None:
+        """host:port should give a TCP address and unix:/path a path."""
+        assert parse_address("10.0.0.5:7420") == ("10.0.0.5", 7420)
+        assert parse_address(":7420") == ("", 7420)
+        assert parse_address("unix:/tmp/lir.sock") == "/tmp/lir.sock"
+
+    @pytest.mark.parametrize("text", ["localhost", "host:port", "host:70000", "unix:"])
+    def test_rejects_malformed_addresses(self, text: str) -> None:
+        """Addresses without a valid port or path should be rejected."""
+        with pytest.raises(ValueError):
+            parse_address(text)
+
+
+class TestDistributedExecutor:
+    """Tests for DistributedExecutor setup."""
+
+    def test_default_chunk_size(self) -> None:
+        """Default chunks should depend only on the session count."""
+        assert _default_chunk_size(1) == 1
+        assert _default_chunk_size(2560) == 10
+        assert _default_chunk_size(10**9) == 10_000
+
+    def test_listens_on_free_port(self) -> None:
+        """Port 0 should be replaced by the port actually listened on."""
+        with DistributedExecutor(("127.0.0.1", 0), b"key") as executor:
+            host, port = executor.address
+        assert host == "127.0.0.1"
+        assert port > 0
+
+    def test_rejects_invalid_arguments(self) -> None:
+        """Empty keys and non-positive chunk sizes or timeouts should fail."""
+        address = ("127.0.0.1", 0)
+        with pytest.raises(ValueError, match="authkey"):
+            DistributedExecutor(address, b"")
+        with pytest.raises(ValueError, match="chunk_size"):
+            DistributedExecutor(address, b"key", chunk_size=0)
+        with pytest.raises(ValueError, match="timeout"):
+            DistributedExecutor(address, b"key", timeout=0)
@@ -0,0 +1,285 @@
+"""Unit tests for exact session statistics by dynamic programming."""
+
+import numpy as np
+import pytest
+
+from let_it_ride.bankroll import FlatBetting, vectorize_betting_system
+from let_it_ride.config.models import (
+    BankrollConfig,
+    BettingSystemConfig,
+    FullConfig,
+    SimulationConfig,
+    StopConditionsConfig,
+)
+from let_it_ride.config.paytables import bonus_paytable_b, standard_main_paytable
+from let_it_ride.core.hand_evaluator import FiveCardHandRank
+from let_it_ride.core.three_card_evaluator import ThreeCardHandRank
+from let_it_ride.simulation import SessionConfig, StopReason
+from let_it_ride.simulation.exact_session import (
+    calculate_exact_session_statistics,
+    calculate_session_distribution,
+)
+from let_it_ride.simulation.lockstep import run_lockstep_sessions
+from let_it_ride.simulation.outcome_sampling import (
+    HandOutcome,
+    OutcomeDistribution,
+    sampled_outcome_distribution,
+)
+from let_it_ride.strategy import BasicStrategy, Decision
+
+
+def coin_flip_distribution(win_probability: float) -> OutcomeDistribution:
+    """Create a distribution that wins or loses one base bet per hand."""
+
+    def outcome(rank: FiveCardHandRank) -> HandOutcome:
+        return HandOutcome(
+            decision_bet1=Decision.PULL,
+            decision_bet2=Decision.PULL,
+            final_hand_rank=rank,
+            bonus_hand_rank=ThreeCardHandRank.HIGH_CARD,
+            player_codes=(0, 1, 2),
+            community_codes=(3, 4),
+        )
+
+    return OutcomeDistribution(
+        outcomes=(
+            outcome(FiveCardHandRank.HIGH_CARD),
+            outcome(FiveCardHandRank.PAIR_TENS_OR_BETTER),
+        ),
+        probabilities=(1 - win_probability, win_probability),
+        hands=2,
+        exact=True,
+    )
+
+
+@pytest.fixture(scope="module")
+def distribution() -> OutcomeDistribution:
+    """Calibrate a basic strategy distribution once for the module."""
+    return sampled_outcome_distribution(BasicStrategy(), 100_000, seed=5)
+
+
+class TestGamblersRuin:
+    """Tests against the closed-form gambler's ruin."""
+
+    @pytest.mark.parametrize("win_probability", [0.5, 0.4, 0.6])
+    def test_matches_closed_form(self, win_probability: float) -> None:
+        """Test win probability and duration of a +-1 unit walk from 4 to 0/8."""
+        config = SessionConfig(
+            starting_bankroll=100.0, base_bet=5.0, win_limit=20.0, loss_limit=20.0
+        )
+        stats = calculate_session_distribution(
+            config,
+            coin_flip_distribution(win_probability),
+            standard_main_paytable(),
+            None,
+        )
+
+        p = win_probability
+        if p == 0.5:
+            expected_win = 0.5
+            expected_hands = 16.0
+        else:
+            ratio = (1 - p) / p
+            expected_win = (1 - ratio**4) / (1 - ratio**8)
+            expected_hands = (4 - 8 * expected_win) / (1 - 2 * p)
+        assert stats.session_win_rate == pytest.approx(expected_win, abs=1e-9)
+        assert stats.session_loss_rate == pytest.approx(1 - expected_win, abs=1e-9)
+        assert stats.session_push_rate == 0.0
+        assert stats.expected_hands == pytest.approx(expected_hands, rel=1e-9)
+        assert stats.profit_values == (-20.0, 20.0)
+        assert stats.stop_reason_probabilities[StopReason.WIN_LIMIT] == pytest.approx(
+            expected_win, abs=1e-9
+        )
+        assert stats.residual_probability < 1e-12
+
+    def test_max_hands_cuts_walk(self) -> None:
+        """Test that sessions still running at max_hands stop there."""
+        config = SessionConfig(
+            starting_bankroll=100.0,
+            base_bet=5.0,
+            win_limit=20.0,
+            loss_limit=20.0,
+            max_hands=2,
+        )
+        stats = calculate_session_distribution(
+            config, coin_flip_distribution(0.5), standard_main_paytable(), None
+        )
+
+        assert stats.profit_values == (-10.0, 0.0, 10.0)
+        assert stats.profit_probabilities == (0.25, 0.5, 0.25)
+        assert stats.stop_reason_probabilities == {StopReason.MAX_HANDS: 1.0}
+        assert stats.expected_hands == 2.0
+        assert stats.session_profit_median == 0.0
+        assert stats.session_profit_std == pytest.approx(np.sqrt(50.0))
+
+
+class TestCalculateSessionDistribution:
+    """Tests for calculate_session_distribution()."""
+
+    @pytest.mark.parametrize(
+        ("config", "with_bonus"),
+        [
+            (
+                SessionConfig(
+                    starting_bankroll=500.0,
+                    base_bet=5.0,
+                    win_limit=100.0,
+                    loss_limit=200.0,
+                    max_hands=300,
+                ),
+                False,
+            ),
+            (
+                SessionConfig(
+                    starting_bankroll=250.0,
+                    base_bet=5.0,
+                    win_limit=75.0,
+                    max_hands=100,
+                    bonus_bet=1.0,
+                ),
+                True,
+            ),
+        ],
+    )
+    def test_matches_lockstep_sessions(
+        self,
+        distribution: OutcomeDistribution,
+        config: SessionConfig,
+        with_bonus: bool,
+    ) -> None:
+        """Test exact statistics against many sampled sessions."""
+        bonus_paytable = bonus_paytable_b() if with_bonus else None
+        stats = calculate_session_distribution(
+            config, distribution, standard_main_paytable(), bonus_paytable
+        )
+        sessions = run_lockstep_sessions(
+            config,
+            distribution,
+            standard_main_paytable(),
+            bonus_paytable,
+            vectorize_betting_system(FlatBetting(config.base_bet)),
+            num_sessions=40_000,
+            rng=np.random.default_rng(11),
+        )
+
+        win_rate = float(np.mean(sessions.session_profit > 0))
+        assert stats.session_win_rate == pytest.approx(win_rate, abs=0.015)
+        assert stats.expected_hands == pytest.approx(
+            sessions.hands_played.mean(), rel=0.02
+        )
+        assert stats.expected_wagered == pytest.approx(
+            sessions.total_wagered.mean(), rel=0.02
+        )
+        assert stats.expected_bonus_wagered == pytest.approx(
+            sessions.total_bonus_wagered.mean(), rel=0.02
+        )
+        # Within about three standard errors of the sampled mean
+        standard_error = stats.session_profit_std / np.sqrt(len(sessions))
+        assert stats.session_profit_mean == pytest.approx(
+            sessions.session_profit.mean(), abs=3 * standard_error
+        )
+        assert stats.session_profit_min <= sessions.session_profit.min()
+        assert stats.session_profit_max >= sessions.session_profit.max()
+
+    def test_consistent_totals(self, distribution: OutcomeDistribution) -> None:
+        """Test that probabilities sum to one and Wald's identity holds."""
+        config = SessionConfig(
+            starting_bankroll=300.0,
+            base_bet=10.0,
+            win_limit=150.0,
+            loss_limit=300.0,
+            bonus_bet=5.0,
+        )
+        stats = calculate_session_distribution(
+            config, distribution, standard_main_paytable(), bonus_paytable_b()
+        )
+
+        assert sum(stats.profit_probabilities) == pytest.approx(1.0, abs=1e-9)
+        assert sum(stats.stop_reason_probabilities.values()) == pytest.approx(
+            1.0, abs=1e-9
+        )
+        assert (
+            stats.session_win_rate + stats.session_loss_rate + stats.session_push_rate
+        ) == pytest.approx(1.0, abs=1e-9)
+        # E[profit] = E[hands] * E[net per hand] for independent hands
+        assert stats.session_profit_mean == pytest.approx(
+            stats.expected_hands * stats.expected_value_per_hand, rel=1e-6
+        )
+        assert stats.expected_value_per_hand == pytest.approx(
+            stats.main_ev_per_hand + stats.bonus_ev_per_hand
+        )
+        assert stats.profit_values == tuple(sorted(stats.profit_values))
+
+    def test_validation(self, distribution: OutcomeDistribution) -> None:
+        """Test rejected configurations."""
+        paytable = standard_main_paytable()
+        bonus_config = SessionConfig(
+            starting_bankroll=300.0, base_bet=5.0, win_limit=50.0, bonus_bet=5.0
+        )
+        with pytest.raises(ValueError, match="bonus_paytable"):
+            calculate_session_distribution(bonus_config, distribution, paytable, None)
+
+        unbounded = SessionConfig(
+            starting_bankroll=300.0,
+            base_bet=5.0,
+            loss_limit=100.0,
+            stop_on_insufficient_funds=False,
+        )
+        with pytest.raises(ValueError, match="win_limit or max_hands"):
+            calculate_session_distribution(unbounded, distribution, paytable, None)
+
+        shrinking_bets = SessionConfig(
+            starting_bankroll=98.0,
+            base_bet=5.0,
+            win_limit=50.0,
+            loss_limit=100.0,
+            stop_on_insufficient_funds=False,
+        )
+        with pytest.raises(ValueError, match="below base_bet"):
+            calculate_session_distribution(shrinking_bets, distribution, paytable, None)
+
+        fine_grid = SessionConfig(
+            starting_bankroll=1_000_000.0,
+            base_bet=0.01,
+            win_limit=100_000.0,
+        )
+        with pytest.raises(ValueError, match="bankroll states"):
+            calculate_session_distribution(fine_grid, distribution, paytable, None)
+
+        with pytest.raises(ValueError, match="tolerance"):
+            calculate_session_distribution(
+                bonus_config, distribution, paytable, bonus_paytable_b(), tolerance=0
+            )
+
+
+class TestCalculateExactSessionStatistics:
+    """Tests for calculate_exact_session_statistics()."""
+
+    def test_rejects_progressive_betting(self) -> None:
+        """Test that only flat betting is supported."""
+        config = FullConfig(
+            bankroll=BankrollConfig(
+                betting_system=BettingSystemConfig(
+                    type="martingale", martingale={"max_progressions": 3}
+                )
+            )
+        )
+        with pytest.raises(ValueError, match="flat betting"):
+            calculate_exact_session_statistics(config)
+
+    @pytest.mark.slow
+    def test_full_config(self) -> None:
+        """Test statistics from a full configuration."""
+        config = FullConfig(
+            simulation=SimulationConfig(hands_per_session=200),
+            bankroll=BankrollConfig(
+                starting_amount=500.0,
+                base_bet=5.0,
+                stop_conditions=StopConditionsConfig(win_limit=100.0, loss_limit=200.0),
+            ),
+        )
+        stats = calculate_exact_session_statistics(config)
+
+        assert 0.0 < stats.session_win_rate < 1.0
+        assert stats.expected_hands <= 200
+        assert stats.main_ev_per_hand < 0
@@ -49,6 +49,7 @@ from let_it_ride.config.paytables import (
 )
 from let_it_ride.simulation.controller import (
     _BETTING_SYSTEM_FACTORIES,
+    _MIN_HANDS_FOR_COMPILED_STRATEGY,
     _STRATEGY_FACTORIES,
     _action_to_decision,
     create_betting_system,
@@ -64,6 +65,7 @@ from let_it_ride.strategy import (
     AlwaysPullStrategy,
     AlwaysRideStrategy,
     BasicStrategy,
+    CompiledStrategy,
     CustomStrategy,
 )
 from let_it_ride.strategy.base import Decision
@@ -271,6 +273,23 @@ class TestCreateStrategy:
             assert callable(strategy.decide_bet1)
             assert callable(strategy.decide_bet2)
 
+    def test_small_runs_are_not_compiled(self) -> None:
+        """Test that strategies for short runs keep live evaluation."""
+        config = StrategyConfig(type="basic")
+        strategy = create_strategy(
+            config, expected_hands=_MIN_HANDS_FOR_COMPILED_STRATEGY - 1
+        )
+        assert isinstance(strategy, BasicStrategy)
+
+    def test_large_runs_are_compiled(self) -> None:
+        """Test that strategies for long runs are compiled to a decision table."""
+        config = StrategyConfig(type="basic")
+        strategy = create_strategy(
+            config, expected_hands=_MIN_HANDS_FOR_COMPILED_STRATEGY
+        )
+        assert isinstance(strategy, CompiledStrategy)
+        assert isinstance(strategy.strategy, BasicStrategy)
+
 
 class TestBettingSystemRegistry:
     """Tests for betting system factory registry."""
@@ -0,0 +1,241 @@
+"""Unit tests for lockstep session simulation."""
+
+import copy
+
+import numpy as np
+import pytest
+
+from let_it_ride.bankroll import (
+    BettingSystem,
+    DAlembertBetting,
+    FibonacciBetting,
+    FlatBetting,
+    MartingaleBetting,
+    ParoliBetting,
+    ReverseMartingaleBetting,
+    vectorize_betting_system,
+)
+from let_it_ride.config.paytables import (
+    BonusPaytable,
+    MainGamePaytable,
+    bonus_paytable_b,
+    standard_main_paytable,
+)
+from let_it_ride.core.game_engine import GameHandResult
+from let_it_ride.core.hand_processing import settle_hand
+from let_it_ride.simulation import Session, SessionConfig, StopReason
+from let_it_ride.simulation.lockstep import run_lockstep_sessions
+from let_it_ride.simulation.outcome_sampling import (
+    AliasTable,
+    OutcomeDistribution,
+    sampled_outcome_distribution,
+)
+from let_it_ride.strategy import BasicStrategy, StrategyContext
+
+
+class ArraySamplingEngine:
+    """Samples outcomes one hand at a time from a NumPy stream.
+
+    With a single session, run_lockstep_sessions draws its outcomes from the
+    same stream, so Session with this engine must reproduce it exactly.
+    """
+
+    def __init__(
+        self,
+        distribution: OutcomeDistribution,
+        main_paytable: MainGamePaytable,
+        bonus_paytable: BonusPaytable | None,
+        seed: int,
+    ) -> None:
+        self._distribution = distribution
+        self._table = AliasTable(distribution.probabilities)
+        self._main_paytable = main_paytable
+        self._bonus_paytable = bonus_paytable
+        self._rng = np.random.default_rng(seed)
+
+    def play_hand(
+        self,
+        hand_id: int,
+        base_bet: float,
+        bonus_bet: float = 0.0,
+        context: StrategyContext | None = None,  # noqa: ARG002
+    ) -> GameHandResult:
+        if base_bet <= 0:
+            raise ValueError(f"base_bet must be positive, got {base_bet}")
+        index = int(self._table.sample_array(self._rng, 1)[0])
+        outcome = self._distribution.outcomes[index]
+        result = settle_hand(
+            decision_bet1=outcome.decision_bet1,
+            decision_bet2=outcome.decision_bet2,
+            final_hand_rank=outcome.final_hand_rank,
+            bonus_hand_rank=outcome.bonus_hand_rank if bonus_bet > 0 else None,
+            main_paytable=self._main_paytable,
+            bonus_paytable=self._bonus_paytable,
+            base_bet=base_bet,
+            bonus_bet=bonus_bet,
+        )
+        return GameHandResult(
+            hand_id=hand_id,
+            player_cards=(),  # type: ignore[arg-type]
+            community_cards=(),  # type: ignore[arg-type]
+            decision_bet1=result.decision_bet1,
+            decision_bet2=result.decision_bet2,
+            final_hand_rank=result.final_hand_rank,
+            base_bet=base_bet,
+            bets_at_risk=result.bets_at_risk,
+            main_payout=result.main_payout,
+            bonus_bet=bonus_bet,
+            bonus_hand_rank=result.bonus_hand_rank,
+            bonus_payout=result.bonus_payout,
+            net_result=result.net_result,
+        )
+
+
+@pytest.fixture(scope="module")
+def distribution() -> OutcomeDistribution:
+    """Calibrate a basic strategy distribution once for the module."""
+    return sampled_outcome_distribution(BasicStrategy(), 100_000, seed=3)
+
+
+CONFIGS = [
+    SessionConfig(
+        starting_bankroll=500.0,
+        base_bet=5.0,
+        win_limit=100.0,
+        loss_limit=200.0,
+        max_hands=300,
+    ),
+    SessionConfig(starting_bankroll=300.0, base_bet=10.0, max_hands=150, bonus_bet=5.0),
+    SessionConfig(
+        starting_bankroll=250.0, base_bet=5.0, win_limit=75.0, loss_limit=250.0
+    ),
+]
+
+SYSTEMS = [
+    FlatBetting(5.0),
+    MartingaleBetting(5.0, max_bet=100.0),
+    ReverseMartingaleBetting(5.0),
+    ParoliBetting(5.0, wins_before_reset=2),
+    DAlembertBetting(5.0, unit=2.5, min_bet=5.0, max_bet=50.0),
+    FibonacciBetting(5.0),
+]
+
+
+class TestLockstepParity:
+    """Tests that lockstep sessions reproduce Session exactly."""
+
+    @pytest.mark.parametrize("config", CONFIGS)
+    @pytest.mark.parametrize("system", SYSTEMS, ids=repr)
+    def test_matches_session(
+        self,
+        distribution: OutcomeDistribution,
+        config: SessionConfig,
+        system: BettingSystem,
+    ) -> None:
+        """Test one session per seed against Session on the same stream."""
+        for seed in range(8):
+            lockstep = run_lockstep_sessions(
+                config,
+                distribution,
+                standard_main_paytable(),
+                bonus_paytable_b(),
+                vectorize_betting_system(system),
+                num_sessions=1,
+                rng=np.random.default_rng(seed),
+            )
+            engine = ArraySamplingEngine(
+                distribution, standard_main_paytable(), bonus_paytable_b(), seed
+            )
+            expected = Session(config, engine, copy.copy(system)).run_to_completion()
+
+            assert lockstep.to_session_results() == [expected]
+
+
+class TestRunLockstepSessions:
+    """Tests for run_lockstep_sessions()."""
+
+    def test_columns(self, distribution: OutcomeDistribution) -> None:
+        """Test that columns are consistent with the stop conditions."""
+        config = CONFIGS[0]
+        results = run_lockstep_sessions(
+            config,
+            distribution,
+            standard_main_paytable(),
+            None,
+            vectorize_betting_system(FlatBetting(5.0)),
+            num_sessions=2000,
+            rng=np.random.default_rng(1),
+        )
+        session_results = results.to_session_results()
+
+        assert len(results) == len(session_results) == 2000
+        np.testing.assert_array_equal(
+            results.session_profit, results.final_bankroll - 500.0
+        )
+        assert np.all(results.peak_bankroll >= results.final_bankroll)
+        reasons = {result.stop_reason for result in session_results}
+        assert reasons == {
+            StopReason.WIN_LIMIT,
+            StopReason.LOSS_LIMIT,
+            StopReason.MAX_HANDS,
+        }
+        for result in session_results:
+            if result.stop_reason == StopReason.WIN_LIMIT:
+                assert result.session_profit >= 100.0
+            elif result.stop_reason == StopReason.LOSS_LIMIT:
+                assert result.session_profit <= -200.0
+            else:
+                assert result.hands_played == 300
+
+    def test_reproducible_per_seed(self, distribution: OutcomeDistribution) -> None:
+        """Test that the same seed reproduces the same sessions."""
+
+        def run(seed: int) -> list[float]:
+            results = run_lockstep_sessions(
+                CONFIGS[1],
+                distribution,
+                standard_main_paytable(),
+                bonus_paytable_b(),
+                vectorize_betting_system(MartingaleBetting(10.0)),
+                num_sessions=50,
+                rng=np.random.default_rng(seed),
+            )
+            return results.session_profit.tolist()
+
+        assert run(4) == run(4)
+        assert run(4) != run(5)
+
+    def test_validation(self, distribution: OutcomeDistribution) -> None:
+        """Test rejected arguments."""
+        betting = vectorize_betting_system(FlatBetting(5.0))
+        rng = np.random.default_rng(1)
+        paytable = standard_main_paytable()
+        with pytest.raises(ValueError, match="num_sessions"):
+            run_lockstep_sessions(
+                CONFIGS[0], distribution, paytable, None, betting, 0, rng
+            )
+        with pytest.raises(ValueError, match="bonus_paytable"):
+            run_lockstep_sessions(
+                CONFIGS[1], distribution, paytable, None, betting, 1, rng
+            )
+
+    def test_rejects_hand_without_bankroll(
+        self, distribution: OutcomeDistribution
+    ) -> None:
+        """Test that a broke session without a stop condition is an error."""
+        config = SessionConfig(
+            starting_bankroll=15.0,
+            base_bet=5.0,
+            max_hands=10_000,
+            stop_on_insufficient_funds=False,
+        )
+        with pytest.raises(ValueError, match="base_bet must be positive"):
+            run_lockstep_sessions(
+                config,
+                distribution,
+                standard_main_paytable(),
+                None,
+                vectorize_betting_system(FlatBetting(5.0)),
+                num_sessions=10,
+                rng=np.random.default_rng(1),
+            )
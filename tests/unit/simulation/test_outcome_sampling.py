@@ -0,0 +1,292 @@
+"""Unit tests for outcome-distribution sampling of hands."""
+
+import random
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from let_it_ride.analytics.exact_ev import calculate_exact_ev
+from let_it_ride.bankroll import FlatBetting, MartingaleBetting
+from let_it_ride.config.paytables import bonus_paytable_a, standard_main_paytable
+from let_it_ride.core.hand_analysis import HandAnalysis
+from let_it_ride.core.hand_processing import process_hand_code_decisions_and_payouts
+from let_it_ride.core.three_card_evaluator import evaluate_three_card_hand_codes
+from let_it_ride.simulation import Session, SessionConfig, StopReason
+from let_it_ride.simulation.outcome_sampling import (
+    AliasTable,
+    OutcomeDistribution,
+    OutcomeSamplingEngine,
+    exact_outcome_distribution,
+    sampled_outcome_distribution,
+)
+from let_it_ride.strategy import (
+    AlwaysPullStrategy,
+    BasicStrategy,
+    Decision,
+    StrategyContext,
+)
+
+
+class StreakStrategy:
+    """Strategy that rides Bet 1 only on a winning streak."""
+
+    def decide_bet1(
+        self,
+        analysis: HandAnalysis,  # noqa: ARG002
+        context: StrategyContext,
+    ) -> Decision:
+        return Decision.RIDE if context.streak > 0 else Decision.PULL
+
+    def decide_bet2(
+        self,
+        analysis: HandAnalysis,  # noqa: ARG002
+        context: StrategyContext,  # noqa: ARG002
+    ) -> Decision:
+        return Decision.PULL
+
+
+@pytest.fixture(scope="module")
+def distribution() -> OutcomeDistribution:
+    """Calibrate a basic strategy distribution once for the module."""
+    return sampled_outcome_distribution(BasicStrategy(), 200_000, seed=42)
+
+
+class TestAliasTable:
+    """Tests for Walker's alias method."""
+
+    def test_scalar_frequencies_match_probabilities(self) -> None:
+        """Test that scalar draws follow the given weights."""
+        table = AliasTable([0.5, 0.25, 0.125, 0.125, 0.0])
+        rng = random.Random(1)
+        counts = Counter(table.sample(rng) for _ in range(80_000))
+
+        assert counts[4] == 0
+        assert counts[0] / 80_000 == pytest.approx(0.5, abs=0.01)
+        assert counts[1] / 80_000 == pytest.approx(0.25, abs=0.01)
+        assert counts[3] / 80_000 == pytest.approx(0.125, abs=0.01)
+
+    def test_array_frequencies_match_probabilities(self) -> None:
+        """Test that batch draws follow the given (unnormalized) weights."""
+        table = AliasTable([3.0, 1.0])
+        draws = table.sample_array(np.random.default_rng(1), 100_000)
+
+        assert len(table) == 2
+        assert np.mean(draws == 0) == pytest.approx(0.75, abs=0.01)
+
+    @pytest.mark.parametrize("weights", [[], [1.0, -0.5], [0.0, 0.0]])
+    def test_invalid_weights(self, weights: list[float]) -> None:
+        """Test that empty, negative or all-zero weights are rejected."""
+        with pytest.raises(ValueError, match="probabilities"):
+            AliasTable(weights)
+
+
+class TestOutcomeDistribution:
+    """Tests for deriving outcome distributions."""
+
+    def test_representative_deals_match_outcomes(
+        self, distribution: OutcomeDistribution
+    ) -> None:
+        """Test that each outcome's deal really plays out as that outcome."""
+        context = StrategyContext(
+            session_profit=0.0, hands_played=0, streak=0, bankroll=0.0
+        )
+        for outcome in distribution.outcomes:
+            result = process_hand_code_decisions_and_payouts(
+                player_codes=outcome.player_codes,
+                community_codes=outcome.community_codes,
+                strategy=BasicStrategy(),
+                main_paytable=standard_main_paytable(),
+                bonus_paytable=None,
+                base_bet=1.0,
+                bonus_bet=0.0,
+                context=context,
+            )
+            assert result.decision_bet1 == outcome.decision_bet1
+            assert result.decision_bet2 == outcome.decision_bet2
+            assert result.final_hand_rank == outcome.final_hand_rank
+            assert (
+                evaluate_three_card_hand_codes(outcome.player_codes)
+                == outcome.bonus_hand_rank
+            )
+
+    def test_sampled_distribution(self, distribution: OutcomeDistribution) -> None:
+        """Test calibration metadata and EV close to the exact value."""
+        assert not distribution.exact
+        assert distribution.hands == 200_000
+        assert sum(distribution.probabilities) == pytest.approx(1.0)
+        assert distribution.expected_value(standard_main_paytable()) == (
+            pytest.approx(-0.0375, abs=0.03)
+        )
+
+    def test_always_pull_bets_one_unit(self) -> None:
+        """Test that outcomes of an always-pull strategy risk one bet."""
+        distribution = sampled_outcome_distribution(AlwaysPullStrategy(), 1000, 1)
+        assert {outcome.bets_at_risk for outcome in distribution.outcomes} == {1}
+
+    def test_rejects_context_reading_strategy(self) -> None:
+        """Test that strategies reading StrategyContext are rejected."""
+        with pytest.raises(ValueError, match="StrategyContext"):
+            sampled_outcome_distribution(StreakStrategy(), 1000)
+
+    def test_rejects_non_positive_hands(self) -> None:
+        """Test that a calibration run needs at least one hand."""
+        with pytest.raises(ValueError, match="num_hands"):
+            sampled_outcome_distribution(BasicStrategy(), 0)
+
+    @pytest.mark.slow
+    def test_exact_distribution_matches_exact_ev(self) -> None:
+        """Test the exact distribution against full enumeration."""
+        paytable = standard_main_paytable()
+        distribution = exact_outcome_distribution(BasicStrategy())
+        exact = calculate_exact_ev(BasicStrategy(), paytable)
+
+        assert distribution.exact
+        assert distribution.hands == exact.total_deals
+        assert distribution.expected_value(paytable) == pytest.approx(
+            exact.expected_value, abs=1e-12
+        )
+        bonus_units = distribution.bonus_net_units(bonus_paytable_a())
+        bonus_ev = float(np.dot(distribution.probabilities, bonus_units))
+        assert bonus_ev == pytest.approx(
+            calculate_exact_ev(
+                AlwaysPullStrategy(), paytable, bonus_paytable_a()
+            ).bonus_expected_value,
+            abs=1e-12,
+        )
+
+
+class TestOutcomeSamplingEngine:
+    """Tests for OutcomeSamplingEngine."""
+
+    def test_settles_like_game_engine(self, distribution: OutcomeDistribution) -> None:
+        """Test that sampled hands settle consistently with their outcome."""
+        engine = OutcomeSamplingEngine(
+            distribution, standard_main_paytable(), bonus_paytable_a(), random.Random(3)
+        )
+        for hand_id in range(500):
+            result = engine.play_hand(hand_id, base_bet=5.0, bonus_bet=2.0)
+            units = (
+                1
+                + (result.decision_bet1 == Decision.RIDE)
+                + (result.decision_bet2 == Decision.RIDE)
+            )
+            assert result.hand_id == hand_id
+            assert result.bets_at_risk == 5.0 * units
+            assert result.bonus_hand_rank is not None
+            main_net = result.main_payout or -result.bets_at_risk
+            bonus_net = result.bonus_payout or -2.0
+            assert result.net_result == main_net + bonus_net
+
+    def test_no_bonus_rank_without_bonus_bet(
+        self, distribution: OutcomeDistribution
+    ) -> None:
+        """Test that the bonus is only settled when a bonus bet is placed."""
+        engine = OutcomeSamplingEngine(
+            distribution, standard_main_paytable(), None, random.Random(3)
+        )
+        result = engine.play_hand(0, base_bet=5.0)
+        assert result.bonus_hand_rank is None
+        assert result.bonus_payout == 0.0
+
+    @pytest.mark.parametrize("batch_size", [0, 64])
+    def test_reproducible_per_seed(
+        self, distribution: OutcomeDistribution, batch_size: int
+    ) -> None:
+        """Test that scalar and batched sampling are deterministic."""
+
+        def play(seed: int) -> list[float]:
+            engine = OutcomeSamplingEngine(
+                distribution,
+                standard_main_paytable(),
+                None,
+                random.Random(seed),
+                batch_size=batch_size,
+            )
+            return [engine.play_hand(i, 1.0).net_result for i in range(200)]
+
+        assert play(7) == play(7)
+        assert play(7) != play(8)
+
+    def test_frequencies_follow_distribution(
+        self, distribution: OutcomeDistribution
+    ) -> None:
+        """Test that batched draws reproduce the expected value."""
+        engine = OutcomeSamplingEngine(
+            distribution,
+            standard_main_paytable(),
+            None,
+            random.Random(5),
+            batch_size=4096,
+        )
+        mean = np.mean([engine.play_hand(i, 1.0).net_result for i in range(100_000)])
+        assert mean == pytest.approx(
+            distribution.expected_value(standard_main_paytable()), abs=0.03
+        )
+
+    def test_validates_bets(self, distribution: OutcomeDistribution) -> None:
+        """Test the same bet validation as GameEngine."""
+        engine = OutcomeSamplingEngine(
+            distribution, standard_main_paytable(), None, random.Random(1)
+        )
+        with pytest.raises(ValueError, match="base_bet"):
+            engine.play_hand(0, base_bet=0.0)
+        with pytest.raises(ValueError, match="bonus_bet"):
+            engine.play_hand(0, base_bet=1.0, bonus_bet=-1.0)
+        with pytest.raises(ValueError, match="bonus_paytable"):
+            engine.play_hand(0, base_bet=1.0, bonus_bet=1.0)
+        with pytest.raises(ValueError, match="batch_size"):
+            OutcomeSamplingEngine(
+                distribution, standard_main_paytable(), None, random.Random(1), -1
+            )
+
+
+class TestSampledSessions:
+    """Tests for Session driven by OutcomeSamplingEngine."""
+
+    def test_session_stop_conditions(self, distribution: OutcomeDistribution) -> None:
+        """Test that sessions stop exactly as with dealt hands."""
+        config = SessionConfig(
+            starting_bankroll=500.0,
+            base_bet=5.0,
+            win_limit=100.0,
+            loss_limit=200.0,
+            max_hands=200,
+        )
+        for seed in range(20):
+            engine = OutcomeSamplingEngine(
+                distribution, standard_main_paytable(), None, random.Random(seed)
+            )
+            result = Session(config, engine, FlatBetting(5.0)).run_to_completion()
+
+            assert result.stop_reason in (
+                StopReason.WIN_LIMIT,
+                StopReason.LOSS_LIMIT,
+                StopReason.MAX_HANDS,
+            )
+            if result.stop_reason == StopReason.WIN_LIMIT:
+                assert result.session_profit >= 100.0
+            elif result.stop_reason == StopReason.LOSS_LIMIT:
+                assert result.session_profit <= -200.0
+            else:
+                assert result.hands_played == 200
+
+    def test_session_with_betting_system(
+        self, distribution: OutcomeDistribution
+    ) -> None:
+        """Test that betting systems size the sampled hands."""
+        bets: list[float] = []
+        config = SessionConfig(starting_bankroll=1000.0, base_bet=5.0, max_hands=50)
+        engine = OutcomeSamplingEngine(
+            distribution, standard_main_paytable(), None, random.Random(11)
+        )
+        session = Session(
+            config,
+            engine,
+            MartingaleBetting(base_bet=5.0),
+            hand_callback=lambda _hand_id, result: bets.append(result.base_bet),
+        )
+        session.run_to_completion()
+
+        assert len(bets) == 50
+        assert max(bets) > 5.0
@@ -0,0 +1,153 @@
+"""Unit tests for the columnar session result table."""
+
+import pickle
+
+import numpy as np
+import pytest
+
+from let_it_ride.simulation.result_table import (
+    SESSION_RESULT_DTYPE,
+    SessionResultTable,
+    session_result_dicts,
+)
+from let_it_ride.simulation.session import SessionOutcome, SessionResult, StopReason
+
+
+def create_results(count: int, seats: int = 0) -> list[SessionResult]:
+    """Create sessions with varied outcomes, stop reasons and seats."""
+    results = []
+    reasons = (StopReason.WIN_LIMIT, StopReason.LOSS_LIMIT, StopReason.MAX_HANDS)
+    for i in range(count):
+        profit = float((i * 37) % 201 - 100) + 0.25 * (i % 4)
+        outcome = (
+            SessionOutcome.WIN
+            if profit > 0
+            else SessionOutcome.LOSS
+            if profit < 0
+            else SessionOutcome.PUSH
+        )
+        result = SessionResult(
+            outcome=outcome,
+            stop_reason=reasons[i % 3],
+            hands_played=20 + i % 30,
+            starting_bankroll=500.0,
+            final_bankroll=500.0 + profit,
+            session_profit=profit,
+            total_wagered=300.0 + i,
+            total_bonus_wagered=float(i % 5),
+            peak_bankroll=500.0 + max(profit, 0.0) + 10.0,
+            max_drawdown=float(i % 60),
+            max_drawdown_pct=(i % 60) / 510.0,
+        )
+        if seats:
+            result = result.with_table_session_info(i // seats, i % seats + 1)
+        results.append(result)
+    return results
+
+
+class TestSessionResultTable:
+    """Tests for SessionResultTable."""
+
+    def test_rows_round_trip(self) -> None:
+        """Rows should convert back to equal SessionResults, including None."""
+        results = create_results(10) + create_results(9, seats=3)
+        table = SessionResultTable.from_results(results)
+
+        assert len(table) == 19
+        assert list(table) == results
+        assert table[0] == results[0]
+        assert table[-1] == results[-1]
+        assert table[0].seat_number is None
+        assert table[0].table_session_id is None
+        assert table[12].seat_number == 3
+
+    def test_iteration_spans_blocks(self) -> None:
+        """Iteration should be complete across block boundaries."""
+        results = create_results(10_000)
+        table = SessionResultTable.from_results(results)
+
+        assert list(table) == results
+        assert list(table.to_dicts()) == [r.to_dict() for r in results]
+
+    def test_slices_share_memory(self) -> None:
+        """Slices should be tables viewing the same rows."""
+        results = create_results(20)
+        table = SessionResultTable.from_results(results)
+        part = table[5:15:2]
+
+        assert isinstance(part, SessionResultTable)
+        assert list(part) == results[5:15:2]
+        assert np.shares_memory(part.rows, table.rows)
+
+    def test_columns_are_read_only(self) -> None:
+        """Columns should be views that cannot be written through."""
+        results = create_results(8)
+        table = SessionResultTable.from_results(results)
+        profits = table.column("session_profit")
+
+        assert profits.tolist() == [r.session_profit for r in results]
+        assert table.column("hands_played").dtype == np.int32
+        with pytest.raises(ValueError):
+            profits[0] = 1.0
+        with pytest.raises(ValueError, match="Unknown session result field"):
+            table.column("bankroll")
+
+    def test_tallies_match_rows(self) -> None:
+        """Outcome, stop reason and seat tallies should match the rows."""
+        results = create_results(60, seats=4)
+        table = SessionResultTable.from_results(results)
+
+        assert table.outcome_counts() == {
+            outcome: sum(r.outcome == outcome for r in results)
+            for outcome in SessionOutcome
+        }
+        assert table.stop_reason_counts() == {
+            StopReason.WIN_LIMIT: 20,
+            StopReason.LOSS_LIMIT: 20,
+            StopReason.MAX_HANDS: 20,
+        }
+        tallies = table.seat_tallies()
+        assert sorted(tallies) == [1, 2, 3, 4]
+        for seat, (wins, losses, pushes, profit) in tallies.items():
+            seat_results = [r for r in results if r.seat_number == seat]
+            assert wins == sum(r.outcome == SessionOutcome.WIN for r in seat_results)
+            assert losses == sum(r.outcome == SessionOutcome.LOSS for r in seat_results)
+            assert pushes == sum(r.outcome == SessionOutcome.PUSH for r in seat_results)
+            assert profit == pytest.approx(sum(r.session_profit for r in seat_results))
+        assert SessionResultTable.from_results(create_results(5)).seat_tallies() == {}
+
+    def test_compact_and_picklable(self) -> None:
+        """Rows should be small and tables should survive pickling."""
+        table = SessionResultTable.from_results(create_results(100))
+
+        assert table.nbytes == 100 * SESSION_RESULT_DTYPE.itemsize
+        assert SESSION_RESULT_DTYPE.itemsize < 100
+        assert pickle.loads(pickle.dumps(table)) == table
+
+    def test_concatenate_and_empty(self) -> None:
+        """Tables should join in order; empty inputs give empty tables."""
+        results = create_results(12)
+        joined = SessionResultTable.concatenate(
+            [
+                SessionResultTable.from_results(results[:5]),
+                SessionResultTable.from_results(results[5:]),
+            ]
+        )
+
+        assert joined == SessionResultTable.from_results(results)
+        assert len(SessionResultTable.concatenate([])) == 0
+        assert len(SessionResultTable.from_results([])) == 0
+
+    def test_rejects_wrong_dtype(self) -> None:
+        """Arrays that are not session rows should be rejected."""
+        with pytest.raises(ValueError, match="SESSION_RESULT_DTYPE"):
+            SessionResultTable(np.zeros(3))
+        with pytest.raises(ValueError, match="one-dimensional"):
+            SessionResultTable(np.zeros((2, 2), dtype=SESSION_RESULT_DTYPE))
+
+    def test_session_result_dicts(self) -> None:
+        """Lists and tables should export identical dictionaries."""
+        results = create_results(7, seats=2)
+        table = SessionResultTable.from_results(results)
+
+        assert list(session_result_dicts(table)) == list(session_result_dicts(results))
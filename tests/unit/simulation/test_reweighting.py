@@ -0,0 +1,188 @@
+"""Unit tests for paytable what-if reweighting."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from typing import TYPE_CHECKING
+
+import pytest
+
+from let_it_ride.config.models import (
+    BankrollConfig,
+    BettingSystemConfig,
+    BonusPaytableConfig,
+    BonusStrategyConfig,
+    FullConfig,
+    PaytablesConfig,
+    SimulationConfig,
+    StaticBonusConfig,
+    StopConditionsConfig,
+)
+from let_it_ride.config.paytables import (
+    MainGamePaytable,
+    bonus_paytable_a,
+    bonus_paytable_b,
+    standard_main_paytable,
+)
+from let_it_ride.simulation import SimulationController, aggregate_results
+from let_it_ride.simulation.reweighting import (
+    PaytableHistogramRecorder,
+    record_paytable_histograms,
+    reweight_paytables,
+)
+
+if TYPE_CHECKING:
+    from let_it_ride.core.game_engine import GameHandResult
+
+
+def create_config(
+    bonus_paytable: str = "paytable_b",
+    win_limit: float | None = None,
+    loss_limit: float | None = None,
+    betting_system: BettingSystemConfig | None = None,
+) -> FullConfig:
+    """Create a small flat-bet configuration with a fixed bonus bet."""
+    return FullConfig(
+        simulation=SimulationConfig(
+            num_sessions=30, hands_per_session=40, random_seed=21
+        ),
+        bankroll=BankrollConfig(
+            starting_amount=5000.0,
+            base_bet=5.0,
+            stop_conditions=StopConditionsConfig(
+                win_limit=win_limit, loss_limit=loss_limit
+            ),
+            betting_system=betting_system or BettingSystemConfig(type="flat"),
+        ),
+        bonus_strategy=BonusStrategyConfig(
+            enabled=True, type="static", static=StaticBonusConfig(amount=1.0)
+        ),
+        paytables=PaytablesConfig(bonus=BonusPaytableConfig(type=bonus_paytable)),
+    )
+
+
+class TestReweightPaytables:
+    """Tests for record_paytable_histograms() and reweight_paytables()."""
+
+    def test_recorded_paytables_reproduce_run(self) -> None:
+        """Reweighting with the run's own paytables should reproduce it."""
+        results, histograms = record_paytable_histograms(
+            create_config(win_limit=100.0, loss_limit=150.0)
+        )
+        (stats,) = reweight_paytables(
+            histograms, [(standard_main_paytable(), bonus_paytable_b())]
+        )
+        expected = aggregate_results(results.session_results)
+
+        assert stats.session_profits == pytest.approx(expected.session_profits)
+        assert stats.total_hands == expected.total_hands
+        assert stats.main_wagered == pytest.approx(expected.main_wagered)
+        assert stats.bonus_wagered == pytest.approx(expected.bonus_wagered)
+        assert stats.net_result == pytest.approx(expected.net_result)
+        assert stats.total_won == pytest.approx(expected.total_won)
+        assert stats.main_won == pytest.approx(expected.main_won)
+        assert stats.bonus_won == pytest.approx(expected.bonus_won)
+        assert stats.expected_value_per_hand == pytest.approx(
+            expected.expected_value_per_hand
+        )
+        assert stats.main_ev_per_hand == pytest.approx(expected.main_ev_per_hand)
+        assert stats.bonus_ev_per_hand == expected.bonus_ev_per_hand == 0.0
+        assert stats.winning_sessions == expected.winning_sessions
+        assert sum(stats.hand_frequencies.values()) == stats.total_hands
+        assert histograms.hands_played.tolist() == [
+            r.hands_played for r in results.session_results
+        ]
+
+    def test_alternative_bonus_paytable_matches_new_run(self) -> None:
+        """Without profit limits, a what-if should equal re-simulating."""
+        _, histograms = record_paytable_histograms(create_config())
+        stats_b, stats_a = reweight_paytables(
+            histograms,
+            [
+                (standard_main_paytable(), bonus_paytable_b()),
+                (standard_main_paytable(), bonus_paytable_a()),
+            ],
+        )
+        rerun = SimulationController(create_config("paytable_a")).run()
+
+        assert stats_a.session_profits == pytest.approx(
+            tuple(r.session_profit for r in rerun.session_results)
+        )
+        assert stats_a.main_wagered == stats_b.main_wagered
+        assert stats_a.expected_value_per_hand != stats_b.expected_value_per_hand
+        assert stats_a.bonus_ev_per_hand == stats_b.bonus_ev_per_hand == 0.0
+
+    def test_custom_main_paytables(self) -> None:
+        """Custom main paytables should rescale only the winning hands."""
+        _, histograms = record_paytable_histograms(create_config())
+        standard = standard_main_paytable()
+        doubled = MainGamePaytable(
+            name="doubled",
+            payouts={rank: ratio * 2 for rank, ratio in standard.payouts.items()},
+        )
+        nothing = MainGamePaytable(
+            name="nothing", payouts=dict.fromkeys(standard.payouts, 0)
+        )
+        base, boosted, losing = reweight_paytables(
+            histograms,
+            [
+                (standard, bonus_paytable_b()),
+                (doubled, bonus_paytable_b()),
+                (nothing, bonus_paytable_b()),
+            ],
+        )
+
+        assert boosted.main_wagered == base.main_wagered
+        assert boosted.bonus_won == pytest.approx(base.bonus_won)
+        # The bonus net is the same for every pair; without payouts every
+        # main stake is lost
+        bonus_net = losing.net_result + losing.main_wagered
+        # Net main = winnings - losing stakes; doubling adds the winnings again
+        base_net = base.net_result - bonus_net
+        winnings = boosted.net_result - base.net_result
+        losing_stakes = winnings - base_net
+        assert winnings > 0
+        assert 0 < losing_stakes < base.main_wagered
+
+    def test_validation(self) -> None:
+        """Invalid inputs should raise ValueError."""
+        _, histograms = record_paytable_histograms(create_config())
+        with pytest.raises(ValueError, match="At least one"):
+            reweight_paytables(histograms, [])
+        with pytest.raises(ValueError, match="bonus paytable is required"):
+            reweight_paytables(histograms, [(standard_main_paytable(), None)])
+        with pytest.raises(ValueError, match="flat betting"):
+            record_paytable_histograms(
+                create_config(
+                    betting_system=BettingSystemConfig(
+                        type="martingale", martingale={"max_progressions": 3}
+                    )
+                )
+            )
+
+
+class TestPaytableHistogramRecorder:
+    """Tests for PaytableHistogramRecorder."""
+
+    def test_rejects_changing_bets(self) -> None:
+        """Hands with a different base bet should be rejected."""
+        hands: list[tuple[int, int, GameHandResult]] = []
+        config = create_config()
+        SimulationController(
+            config,
+            hand_callback=lambda sid, hid, result: hands.append((sid, hid, result)),
+        ).run()
+        recorder = PaytableHistogramRecorder(config.simulation.num_sessions)
+        recorder(*hands[0])
+        session_id, hand_id, result = hands[1]
+
+        with pytest.raises(ValueError, match="flat betting"):
+            recorder(session_id, hand_id, replace(result, base_bet=10.0))
+        with pytest.raises(ValueError, match="out of range"):
+            recorder(config.simulation.num_sessions, 0, result)
+
+    def test_sessions_without_hands(self) -> None:
+        """Sessions that never record a hand should have zero counts."""
+        histograms = PaytableHistogramRecorder(3).histograms()
+        assert histograms.hands_played.tolist() == [0, 0, 0]
+        assert histograms.num_sessions == 3
@@ -0,0 +1,172 @@
+"""Unit tests for decision-table strategy compilation."""
+
+import random
+from dataclasses import replace
+
+import pytest
+
+from let_it_ride.core.card import card_to_int
+from let_it_ride.core.hand_analysis import (
+    HandAnalysis,
+    analyze_four_card_codes,
+    analyze_four_cards,
+    analyze_three_card_codes,
+    analyze_three_cards,
+    canonical_four_card_analyses,
+    canonical_three_card_analyses,
+)
+from let_it_ride.strategy import (
+    AlwaysRideStrategy,
+    BasicStrategy,
+    CompiledStrategy,
+    CustomStrategy,
+    Decision,
+    StrategyContext,
+    StrategyRule,
+    compile_strategy,
+)
+from tests.fixtures.hand_analysis_samples import make_hand
+
+
+class ProfitStrategy:
+    """Strategy whose Bet 2 decision depends on session profit."""
+
+    def decide_bet1(
+        self,
+        analysis: HandAnalysis,  # noqa: ARG002
+        context: StrategyContext,  # noqa: ARG002
+    ) -> Decision:
+        return Decision.PULL
+
+    def decide_bet2(
+        self,
+        analysis: HandAnalysis,  # noqa: ARG002
+        context: StrategyContext,
+    ) -> Decision:
+        return Decision.RIDE if context.session_profit > 0 else Decision.PULL
+
+
+@pytest.fixture
+def context() -> StrategyContext:
+    """Create a default StrategyContext for testing."""
+    return StrategyContext(
+        session_profit=0.0,
+        hands_played=0,
+        streak=0,
+        bankroll=1000.0,
+        deck_composition=None,
+    )
+
+
+@pytest.fixture(scope="module")
+def compiled_basic() -> CompiledStrategy:
+    """Compile BasicStrategy once for the module."""
+    compiled = compile_strategy(BasicStrategy())
+    assert isinstance(compiled, CompiledStrategy)
+    return compiled
+
+
+class TestCompileStrategy:
+    """Tests for compile_strategy()."""
+
+    def test_matches_live_decisions_for_all_classes(
+        self, compiled_basic: CompiledStrategy, context: StrategyContext
+    ) -> None:
+        """Test that every canonical class decides as the wrapped strategy."""
+        basic = BasicStrategy()
+        for analysis in canonical_three_card_analyses():
+            assert compiled_basic.decide_bet1(analysis, context) == (
+                basic.decide_bet1(analysis, context)
+            )
+        for analysis in canonical_four_card_analyses():
+            assert compiled_basic.decide_bet2(analysis, context) == (
+                basic.decide_bet2(analysis, context)
+            )
+
+    def test_compiles_custom_strategy(self, context: StrategyContext) -> None:
+        """Test that rule-only custom strategies are compiled."""
+        custom = CustomStrategy(
+            bet1_rules=[
+                StrategyRule("has_paying_hand", Decision.RIDE),
+                StrategyRule("default", Decision.PULL),
+            ],
+            bet2_rules=[
+                StrategyRule("is_flush_draw", Decision.RIDE),
+                StrategyRule("default", Decision.PULL),
+            ],
+        )
+        compiled = compile_strategy(custom)
+
+        assert isinstance(compiled, CompiledStrategy)
+        assert compiled.strategy is custom
+        hand = analyze_four_cards(make_hand("2h 7h Jh Kh"))
+        assert compiled.decide_bet2(hand, context) == Decision.RIDE
+
+    def test_unmatched_classes_still_raise(self, context: StrategyContext) -> None:
+        """Test that hands a strategy cannot decide raise at play time."""
+        custom = CustomStrategy(
+            bet1_rules=[StrategyRule("has_paying_hand", Decision.RIDE)],
+            bet2_rules=[StrategyRule("default", Decision.PULL)],
+        )
+        compiled = compile_strategy(custom)
+
+        assert isinstance(compiled, CompiledStrategy)
+        pair = analyze_three_cards(make_hand("Th Ts 4c"))
+        assert compiled.decide_bet1(pair, context) == Decision.RIDE
+        trash = analyze_three_cards(make_hand("2h 7d 9c"))
+        with pytest.raises(ValueError, match="No rule matched"):
+            compiled.decide_bet1(trash, context)
+
+    def test_context_reading_strategy_is_returned_unchanged(self) -> None:
+        """Test that strategies reading StrategyContext are not compiled."""
+        strategy = ProfitStrategy()
+        assert compile_strategy(strategy) is strategy
+
+    def test_compiled_strategy_is_returned_unchanged(
+        self, compiled_basic: CompiledStrategy
+    ) -> None:
+        """Test that compiling twice is a no-op."""
+        assert compile_strategy(compiled_basic) is compiled_basic
+
+    def test_unlisted_analysis_falls_back_to_strategy(
+        self, context: StrategyContext
+    ) -> None:
+        """Test that analyses outside the table use the wrapped strategy."""
+        compiled = compile_strategy(AlwaysRideStrategy())
+        assert isinstance(compiled, CompiledStrategy)
+        cached = analyze_three_cards(make_hand("Ah Kh Qh"))
+        # An equal but distinct instance is not in the identity-keyed table
+        copy = replace(cached)
+
+        assert compiled.decide_bet1(copy, context) == Decision.RIDE
+
+
+class TestDecideWithCodes:
+    """Tests for CompiledStrategy code-based decisions."""
+
+    def test_code_decisions_match_analysis_decisions(
+        self, compiled_basic: CompiledStrategy, context: StrategyContext
+    ) -> None:
+        """Test decisions from card codes against the analysis path."""
+        rng = random.Random(42)
+        for _ in range(2000):
+            codes = tuple(rng.sample(range(52), 4))
+            three = (codes[0], codes[1], codes[2])
+            four = (codes[0], codes[1], codes[2], codes[3])
+            for _repeat in range(2):  # second pass reads the filled table
+                assert compiled_basic.decide_bet1_codes(three, context) == (
+                    compiled_basic.decide_bet1(analyze_three_card_codes(three), context)
+                )
+                assert compiled_basic.decide_bet2_codes(four, context) == (
+                    compiled_basic.decide_bet2(analyze_four_card_codes(four), context)
+                )
+
+    def test_known_hands(
+        self, compiled_basic: CompiledStrategy, context: StrategyContext
+    ) -> None:
+        """Test basic strategy decisions for well-known hands."""
+        c0, c1, c2 = (card_to_int(card) for card in make_hand("Th Ts 4c"))
+        assert compiled_basic.decide_bet1_codes((c0, c1, c2), context) == Decision.RIDE
+
+        c0, c1, c2 = (card_to_int(card) for card in make_hand("2h 7d 9c"))
+        assert compiled_basic.decide_bet1_codes((c0, c1, c2), context) == Decision.PULL
@@ -11,6 +11,9 @@ capabilities, including:
 - Error handling for invalid conditions
 """
 
+import pickle
+from typing import Any
+
 import pytest
 
 from let_it_ride.core.card import Card, Rank, Suit
@@ -22,6 +25,7 @@ from let_it_ride.strategy import (
     InvalidFieldError,
     StrategyContext,
     StrategyRule,
+    custom,
 )
 
 
@@ -668,3 +672,77 @@ class TestStrategyProtocol:
         )
         assert hasattr(strategy, "decide_bet2")
         assert callable(strategy.decide_bet2)
+
+
+class TestCompiledConditions:
+    """Tests for conditions compiled once at rule creation."""
+
+    def test_decisions_do_not_retokenize(
+        self, default_context: StrategyContext, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Deciding a hand uses the compiled condition, not the tokenizer."""
+        strategy = CustomStrategy(
+            bet1_rules=[
+                StrategyRule(
+                    condition="high_cards >= 2 and not has_pair", action=Decision.RIDE
+                ),
+                StrategyRule(condition="default", action=Decision.PULL),
+            ],
+            bet2_rules=[StrategyRule(condition="default", action=Decision.PULL)],
+        )
+
+        def fail(condition: str) -> list[str]:
+            raise AssertionError(f"condition re-tokenized: {condition}")
+
+        monkeypatch.setattr("let_it_ride.strategy.custom._tokenize", fail)
+        analysis = analyze_three_cards(make_hand("Ah Kd 5c"))
+        assert strategy.decide_bet1(analysis, default_context) == Decision.RIDE
+
+    def test_condition_is_compiled_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Creating a rule validates and compiles its condition in one pass."""
+        compile_tokens = custom._compile_tokens
+        calls: list[list[str]] = []
+
+        def record(tokens: list[str]) -> Any:
+            calls.append(tokens)
+            return compile_tokens(tokens)
+
+        monkeypatch.setattr(custom, "_compile_tokens", record)
+        StrategyRule(condition="high_cards >= 2", action=Decision.RIDE)
+
+        assert calls == [["high_cards", ">=", "2"]]
+
+    def test_parenthesized_operand_compares_as_boolean(
+        self, default_context: StrategyContext
+    ) -> None:
+        """A parenthesized field is a boolean, so (high_cards) >= 2 never matches."""
+        strategy = CustomStrategy(
+            bet1_rules=[
+                StrategyRule(condition="(high_cards) >= 2", action=Decision.RIDE),
+                StrategyRule(condition="default", action=Decision.PULL),
+            ],
+            bet2_rules=[StrategyRule(condition="default", action=Decision.PULL)],
+        )
+        analysis = analyze_three_cards(make_hand("Ah Kd Qc"))
+        assert strategy.decide_bet1(analysis, default_context) == Decision.PULL
+
+    def test_constant_comparison(self, default_context: StrategyContext) -> None:
+        """Comparisons between number literals are folded correctly."""
+        strategy = CustomStrategy(
+            bet1_rules=[
+                StrategyRule(condition="1 > 2", action=Decision.RIDE),
+                StrategyRule(condition="2 > 1", action=Decision.PULL),
+            ],
+            bet2_rules=[StrategyRule(condition="default", action=Decision.PULL)],
+        )
+        analysis = analyze_three_cards(make_hand("2h 7d 9c"))
+        assert strategy.decide_bet1(analysis, default_context) == Decision.PULL
+
+    def test_rule_pickle_round_trip(self) -> None:
+        """Rules pickle by condition and action and recompile on load."""
+        rule = StrategyRule(condition="suited_cards >= 3", action=Decision.RIDE)
+        restored = pickle.loads(pickle.dumps(rule))
+
+        assert restored == rule
+        analysis = analyze_three_cards(make_hand("2h 7h 9h"))
+        assert restored._predicate(analysis) is True
@@ -0,0 +1,153 @@
+"""Unit tests for the exact optimal strategy solver."""
+
+import pickle
+from dataclasses import replace
+from fractions import Fraction
+
+import pytest
+
+from let_it_ride.analytics.exact_ev import calculate_exact_ev
+from let_it_ride.config.paytables import MainGamePaytable, standard_main_paytable
+from let_it_ride.core.hand_analysis import analyze_four_cards, analyze_three_cards
+from let_it_ride.core.hand_evaluator import FiveCardHandRank
+from let_it_ride.strategy import (
+    BasicStrategy,
+    Decision,
+    OptimalStrategy,
+    StrategyContext,
+)
+from tests.fixtures.hand_analysis_samples import make_hand
+
+
+@pytest.fixture
+def context() -> StrategyContext:
+    """Create a default StrategyContext for testing."""
+    return StrategyContext(
+        session_profit=0.0,
+        hands_played=0,
+        streak=0,
+        bankroll=1000.0,
+        deck_composition=None,
+    )
+
+
+@pytest.fixture(scope="module")
+def optimal() -> OptimalStrategy:
+    """Solve the standard paytable once for the module."""
+    return OptimalStrategy(standard_main_paytable())
+
+
+def royal_only_paytable() -> MainGamePaytable:
+    """Create a paytable where only a royal flush pays."""
+    payouts = dict.fromkeys(FiveCardHandRank, 0)
+    payouts[FiveCardHandRank.ROYAL_FLUSH] = 1000
+    return MainGamePaytable(name="royal_only", payouts=payouts)
+
+
+class TestStandardPaytable:
+    """Tests for the strategy solved for the standard paytable."""
+
+    def test_rides_paying_hands(
+        self, optimal: OptimalStrategy, context: StrategyContext
+    ) -> None:
+        """Test that made paying hands ride."""
+        pair = analyze_three_cards(make_hand("Th Ts 4c"))
+        two_pair = analyze_four_cards(make_hand("Kh Ks 4c 4d"))
+
+        assert optimal.decide_bet1(pair, context) == Decision.RIDE
+        assert optimal.decide_bet2(two_pair, context) == Decision.RIDE
+
+    def test_pulls_nothing_hands(
+        self, optimal: OptimalStrategy, context: StrategyContext
+    ) -> None:
+        """Test that hands without a paying hand or draw are pulled."""
+        three = analyze_three_cards(make_hand("2h 7d 9c"))
+        four = analyze_four_cards(make_hand("2h 7d 9c Js"))
+
+        assert optimal.decide_bet1(three, context) == Decision.PULL
+        assert optimal.decide_bet2(four, context) == Decision.PULL
+
+    def test_royal_draw_ride_value(self, optimal: OptimalStrategy) -> None:
+        """Test the exact ride value of four to a royal flush."""
+        analysis = analyze_four_cards(make_hand("Th Jh Qh Kh"))
+        # 48 final cards: royal, straight flush, 7 flushes, 6 straights,
+        # 12 high pairs and 21 losers
+        total = 1000 + 200 + 7 * 8 + 6 * 5 + 12 * 1 - 21
+
+        assert optimal.bet2_ride_value(analysis) == Fraction(total, 48)
+
+    def test_ride_value_sign_matches_decision(
+        self, optimal: OptimalStrategy, context: StrategyContext
+    ) -> None:
+        """Test that decisions ride exactly when the ride value is positive."""
+        for notation in ("Ah Kh 3c", "5h 6h 7h", "2c 3d 5h", "Jh Qs 9d"):
+            analysis = analyze_three_cards(make_hand(notation))
+            expected = (
+                Decision.RIDE
+                if optimal.bet1_ride_value(analysis) > 0
+                else Decision.PULL
+            )
+            assert optimal.decide_bet1(analysis, context) == expected
+
+    def test_matches_published_house_edge(self, optimal: OptimalStrategy) -> None:
+        """Test the exact EV against the published 3.51% house edge."""
+        result = calculate_exact_ev(optimal, standard_main_paytable())
+        basic = calculate_exact_ev(BasicStrategy(), standard_main_paytable())
+
+        assert result.expected_value == pytest.approx(-0.0351, abs=5e-5)
+        assert result.element_of_risk == pytest.approx(0.0286, abs=5e-5)
+        assert result.expected_value >= basic.expected_value
+
+
+class TestCustomPaytables:
+    """Tests for solving other paytables."""
+
+    def test_royal_only_paytable(self, context: StrategyContext) -> None:
+        """Test that only royal draws ride when only a royal pays."""
+        strategy = OptimalStrategy(royal_only_paytable())
+        royal_draw = analyze_four_cards(make_hand("Th Jh Qh Kh"))
+        kings = analyze_four_cards(make_hand("Kh Ks 4c 9d"))
+
+        assert strategy.decide_bet2(royal_draw, context) == Decision.RIDE
+        assert strategy.decide_bet2(kings, context) == Decision.PULL
+        assert strategy.bet2_ride_value(kings) == -1
+
+    def test_solutions_cached_per_payouts(self) -> None:
+        """Test that equal payout ratios share one solved table."""
+        first = OptimalStrategy(standard_main_paytable())
+        renamed = replace(standard_main_paytable(), name="renamed")
+        second = OptimalStrategy(renamed)
+
+        assert second._bet1_table is first._bet1_table
+        assert second._bet2_table is first._bet2_table
+
+    def test_missing_rank_raises(self) -> None:
+        """Test that incomplete paytables are rejected."""
+        paytable = MainGamePaytable(
+            name="incomplete", payouts={FiveCardHandRank.ROYAL_FLUSH: 1000}
+        )
+        with pytest.raises(KeyError):
+            OptimalStrategy(paytable)
+
+
+class TestOptimalStrategyInstances:
+    """Tests for lookups and pickling."""
+
+    def test_foreign_analysis_raises(
+        self, optimal: OptimalStrategy, context: StrategyContext
+    ) -> None:
+        """Test that analyses not from the shared cache are rejected."""
+        copy = replace(analyze_three_cards(make_hand("Ah Kh Qh")))
+
+        with pytest.raises(ValueError, match="analyze_three_cards"):
+            optimal.decide_bet1(copy, context)
+
+    def test_pickle_round_trip(
+        self, optimal: OptimalStrategy, context: StrategyContext
+    ) -> None:
+        """Test that unpickled strategies decide on this process's analyses."""
+        restored = pickle.loads(pickle.dumps(optimal))
+        analysis = analyze_three_cards(make_hand("Qh Kh Ah"))
+
+        assert restored.main_paytable == optimal.main_paytable
+        assert restored.decide_bet1(analysis, context) == Decision.RIDE
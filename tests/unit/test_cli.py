@@ -15,6 +15,7 @@ from typer.testing import CliRunner
 
 from let_it_ride import __version__
 from let_it_ride.cli import _load_config_with_errors, app
+from let_it_ride.simulation import AggregatedSimulationResults
 
 runner = CliRunner()
 
@@ -163,9 +164,14 @@ strategy:
             )
             f.flush()
 
-            with patch("let_it_ride.cli.app.SimulationController") as mock_controller:
+            with (
+                patch("let_it_ride.cli.app.SimulationController") as mock_controller,
+                patch("let_it_ride.cli.app.CSVExporter"),
+            ):
                 mock_instance = MagicMock()
-                mock_instance.run.side_effect = RuntimeError("Simulation failed")
+                mock_instance.run_aggregated.side_effect = RuntimeError(
+                    "Simulation failed"
+                )
                 mock_controller.return_value = mock_instance
 
                 result = runner.invoke(app, ["run", f.name, "--quiet"])
@@ -197,19 +203,18 @@ strategy:
                 patch("let_it_ride.cli.app.CSVExporter") as mock_exporter,
             ):
                 mock_sim_instance = MagicMock()
-                mock_results = MagicMock()
+                mock_results = MagicMock(spec=AggregatedSimulationResults)
                 mock_results.total_hands = 100
                 mock_results.start_time = MagicMock()
                 mock_results.end_time = MagicMock()
                 mock_results.end_time.__sub__ = MagicMock(
                     return_value=MagicMock(total_seconds=MagicMock(return_value=1.0))
                 )
-                mock_results.session_results = [MagicMock(session_profit=10.0)]
-                mock_sim_instance.run.return_value = mock_results
+                mock_sim_instance.run_aggregated.return_value = mock_results
                 mock_controller.return_value = mock_sim_instance
 
                 mock_export_instance = MagicMock()
-                mock_export_instance.export_all.side_effect = OSError(
+                mock_export_instance.export_aggregated.side_effect = OSError(
                     "Permission denied"
                 )
                 mock_exporter.return_value = mock_export_instance